@@ -0,0 +1,27 @@
+"""Per-plant revision counters used for cross-worker cache invalidation."""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261016_01_entity_versions"
+down_revision = "20251201_01_initial_schema"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "entity_versions",
+        sa.Column("plant_id", sa.Integer(), primary_key=True, autoincrement=False),
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default="1"),
+    )
+    op.execute(
+        "INSERT INTO entity_versions (plant_id, version) SELECT id, 1 FROM plants"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("entity_versions")
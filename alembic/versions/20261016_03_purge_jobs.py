@@ -0,0 +1,37 @@
+"""Deferred plant deletion: soft-hide marker and batched purge jobs."""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261016_03_purge_jobs"
+down_revision = "20261016_02_change_log"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("plants", sa.Column("deleted_at", sa.DateTime(), nullable=True))
+    op.create_table(
+        "purge_jobs",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("plant_id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("systems_deleted", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "equipment_deleted", sa.Integer(), nullable=False, server_default="0"
+        ),
+        sa.Column("areas_deleted", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.Column("error", sa.String(length=255), nullable=True),
+    )
+    op.create_index("ix_purge_jobs_plant_id", "purge_jobs", ["plant_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_purge_jobs_plant_id", table_name="purge_jobs")
+    op.drop_table("purge_jobs")
+    op.drop_column("plants", "deleted_at")
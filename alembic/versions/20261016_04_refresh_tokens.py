@@ -0,0 +1,30 @@
+"""Rotating refresh tokens: one row per login session (token family)."""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261016_04_refresh_tokens"
+down_revision = "20261016_03_purge_jobs"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "refresh_tokens",
+        sa.Column("family", sa.String(length=32), primary_key=True),
+        sa.Column("username", sa.String(length=100), nullable=False),
+        sa.Column("generation", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index(
+        "ix_refresh_tokens_expires_at", "refresh_tokens", ["expires_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_refresh_tokens_expires_at", table_name="refresh_tokens")
+    op.drop_table("refresh_tokens")
@@ -0,0 +1,19 @@
+"""Punto de entrada para servir la API con FastAPI (uvicorn)."""
+
+import uvicorn
+
+from src.shared.config import get_env
+
+
+def main() -> None:
+    "Inicia la aplicación FastAPI."
+    uvicorn.run(
+        "src.infrastructure.fastapi.app:create_app",
+        factory=True,
+        host="0.0.0.0",
+        port=int(get_env("FASTAPI_PORT", "8000")),
+    )
+
+
+if __name__ == "__main__":
+    main()
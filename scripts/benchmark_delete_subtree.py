@@ -0,0 +1,129 @@
+"""Benchmark del borrado de un subárbol grande (tiempo y memoria pico).
+
+Compara el borrado anterior (`db.get` + `Session.delete`, con las cascadas de
+las relaciones ORM) con el borrado por conjuntos del repositorio (un único
+`DELETE` que delega los hijos en `ON DELETE CASCADE`).
+
+Uso:
+    python scripts/benchmark_delete_subtree.py [--areas 50 --equipos 100 --sistemas 9]
+        [--url sqlite:///var/bench.db]
+
+Por defecto usa un SQLite temporal con claves foráneas activas; con `--url`
+se puede apuntar a un MySQL de pruebas (la base debe estar vacía).
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from sqlalchemy import create_engine, event, func, insert, select
+
+from src.infrastructure.sqlalchemy.models import (
+    AreaModel,
+    Base,
+    EquipmentModel,
+    PlantModel,
+    SystemModel,
+)
+from src.infrastructure.sqlalchemy.plant_repository import SqlAlchemyPlantRepository
+from src.infrastructure.sqlalchemy.session import build_session_factory
+
+
+def _seed(session_factory, areas: int, equipment: int, systems: int) -> int:
+    """Inserta una planta con `areas * equipment * systems` hojas."""
+    with session_factory() as db, db.begin():
+        plant_id = db.execute(
+            insert(PlantModel).values(name="Planta benchmark").returning(PlantModel.id)
+        ).scalar_one()
+        db.execute(
+            insert(AreaModel),
+            [{"plant_id": plant_id, "name": f"Área {a}"} for a in range(areas)],
+        )
+        area_ids = db.execute(
+            select(AreaModel.id).where(AreaModel.plant_id == plant_id)
+        ).scalars().all()
+        db.execute(
+            insert(EquipmentModel),
+            [
+                {"area_id": area_id, "name": f"Equipo {e}"}
+                for area_id in area_ids
+                for e in range(equipment)
+            ],
+        )
+        equipment_ids = db.execute(
+            select(EquipmentModel.id).where(EquipmentModel.area_id.in_(area_ids))
+        ).scalars().all()
+        db.execute(
+            insert(SystemModel),
+            [
+                {"equipment_id": equipment_id, "name": f"Sistema {s}"}
+                for equipment_id in equipment_ids
+                for s in range(systems)
+            ],
+        )
+    return plant_id
+
+
+def _orm_delete(session_factory, plant_id: int) -> None:
+    with session_factory() as db, db.begin():
+        plant = db.get(PlantModel, plant_id)
+        db.delete(plant)
+
+
+def _set_based_delete(session_factory, plant_id: int) -> None:
+    SqlAlchemyPlantRepository(session_factory).delete_plant(plant_id)
+
+
+def _measure(label: str, delete, session_factory, counts: tuple[int, int, int]) -> None:
+    plant_id = _seed(session_factory, *counts)
+    tracemalloc.start()
+    started = time.perf_counter()
+    delete(session_factory, plant_id)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    with session_factory() as db:
+        remaining = db.scalar(select(func.count()).select_from(SystemModel))
+    print(
+        f"{label:<12} {elapsed * 1000:>10.1f} ms {peak / 1024:>12.1f} KiB"
+        f"   sistemas restantes: {remaining}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--areas", type=int, default=50)
+    parser.add_argument("--equipos", type=int, default=100)
+    parser.add_argument("--sistemas", type=int, default=9)
+    parser.add_argument("--url", default=None)
+    args = parser.parse_args()
+
+    url = args.url or f"sqlite:///{tempfile.mkdtemp()}/benchmark.db"
+    engine = create_engine(url, future=True)
+    if engine.dialect.name == "sqlite":
+
+        @event.listens_for(engine, "connect")
+        def _enable_foreign_keys(dbapi_connection, _record):
+            dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+    Base.metadata.create_all(engine)
+    session_factory = build_session_factory(engine)
+
+    counts = (args.areas, args.equipos, args.sistemas)
+    nodes = 1 + args.areas * (1 + args.equipos * (1 + args.sistemas))
+    print(f"Subárbol de {nodes} nodos en {engine.dialect.name}")
+    print(f"{'modo':<12} {'tiempo':>13} {'memoria pico':>16}")
+    _measure("orm", _orm_delete, session_factory, counts)
+    _measure("conjuntos", _set_based_delete, session_factory, counts)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""Benchmark de throughput: servidor de desarrollo contra `serve.py` (pre-fork).
+
+Levanta cada servidor en un subproceso y lo carga con `--clientes` hilos que
+repiten `GET /api/plantas` sobre conexiones keep-alive durante `--segundos`.
+Reporta peticiones por segundo y latencias p50/p99.
+
+Uso:
+    python scripts/benchmark_server.py [--clientes 32 --segundos 10]
+        [--workers 4 --threads 8] [--io-ms 5] [--real]
+
+Por defecto sirve una app con el repositorio en memoria (sin MySQL) y
+`--io-ms` simula la espera de la base en cada petición. Con `--real` se usa
+`create_app()` con la configuración `DB_*` del entorno.
+"""
+
+import argparse
+import http.client
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+PATH = "/api/plantas"
+
+
+def _demo_app(io_ms: float):
+    """App Flask con las rutas reales sobre el repositorio en memoria."""
+    from flask import Flask
+    from flask_jwt_extended import JWTManager
+
+    from src.infrastructure.http.auth import AuthService
+    from src.infrastructure.flask.routes import build_blueprint
+    from src.interface_adapters.gateways.in_memory_plant_repository import (
+        InMemoryPlantRepository,
+    )
+
+    class _NoopUnitOfWork:
+        session = None
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def commit(self):
+            return None
+
+        def rollback(self):
+            return None
+
+    auth_service = AuthService(secret_key="benchmark-secret-key-of-at-least-32-bytes", token_ttl_seconds=3600)
+    app = Flask(__name__)
+    app.config["JWT_SECRET_KEY"] = auth_service.secret_key
+    app.config["JWT_ACCESS_TOKEN_EXPIRES"] = timedelta(seconds=3600)
+    JWTManager(app)
+    app.register_blueprint(
+        build_blueprint(
+            InMemoryPlantRepository(), _NoopUnitOfWork, auth_service=auth_service
+        )
+    )
+    if io_ms > 0:
+
+        @app.before_request
+        def simulate_database_wait():
+            time.sleep(io_ms / 1000)
+
+    return app
+
+
+def _app_factory(args):
+    def factory():
+        if not args.real:
+            return _demo_app(args.io_ms)
+        from src.infrastructure.flask.app import create_app
+        from src.infrastructure.sqlalchemy.config import load_db_config
+
+        db_config = load_db_config()
+        if args.serve == "prefork":
+            db_config = db_config.for_worker(args.threads)
+        return create_app(db_config=db_config)
+
+    return factory
+
+
+def _serve(args) -> None:
+    """Modo interno: corre un servidor en este proceso hasta recibir SIGTERM."""
+    import logging
+
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+    factory = _app_factory(args)
+    if args.serve == "dev":
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+        # Igual que run.py pero sin debug: el reloader duplicaría el proceso.
+        factory().run(host="127.0.0.1", port=args.port, threaded=True)
+        return
+
+    from src.infrastructure.flask.server import serve
+
+    serve(
+        factory,
+        host="127.0.0.1",
+        port=args.port,
+        workers=args.workers,
+        threads=args.threads,
+        graceful_timeout=5,
+    )
+
+
+def _free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def _login(port: int, timeout: float = 30.0) -> str:
+    body = json.dumps({"username": "superadmin", "password": "superadmin"})
+    deadline = time.monotonic() + timeout
+    while True:
+        connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+        try:
+            connection.request(
+                "POST",
+                "/api/auth/login",
+                body=body,
+                headers={"Content-Type": "application/json"},
+            )
+            response = connection.getresponse()
+            payload = json.loads(response.read())
+            return payload["token"]
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.1)
+        finally:
+            connection.close()
+
+
+def _load(port: int, token: str, clients: int, seconds: float) -> tuple[int, int, list]:
+    headers = {"Authorization": f"Bearer {token}"}
+    latencies: list[float] = []
+    errors = 0
+    lock = threading.Lock()
+    stop_at = time.perf_counter() + seconds
+
+    def client() -> None:
+        nonlocal errors
+        local: list[float] = []
+        failed = 0
+        connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+        while time.perf_counter() < stop_at:
+            started = time.perf_counter()
+            try:
+                connection.request("GET", PATH, headers=headers)
+                response = connection.getresponse()
+                response.read()
+                if response.status != 200:
+                    failed += 1
+                    continue
+            except (OSError, http.client.HTTPException):
+                failed += 1
+                connection.close()
+                connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+                continue
+            local.append(time.perf_counter() - started)
+        connection.close()
+        with lock:
+            latencies.extend(local)
+            errors += failed
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return len(latencies), errors, sorted(latencies)
+
+
+def _measure(label: str, serve_args: list[str], args) -> None:
+    port = _free_port()
+    server = subprocess.Popen(
+        [sys.executable, __file__, "--serve", *serve_args, "--port", str(port)]
+        + (["--real"] if args.real else [])
+        + ["--io-ms", str(args.io_ms)],
+        cwd=PROJECT_ROOT,
+        # Sin logs DEBUG por petición, como en producción.
+        env={**os.environ, "IS_DEBUG": "false", "LOG_LEVEL": "WARNING"},
+    )
+    try:
+        token = _login(port)
+        ok, errors, latencies = _load(port, token, args.clientes, args.segundos)
+    finally:
+        server.send_signal(signal.SIGTERM)
+        try:
+            server.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            server.kill()
+            server.wait()
+
+    p50 = latencies[len(latencies) // 2] * 1000 if latencies else 0.0
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000 if latencies else 0.0
+    print(
+        f"{label:<24} {ok / args.segundos:>10.1f} req/s"
+        f" {p50:>9.1f} ms {p99:>9.1f} ms {errors:>8}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clientes", type=int, default=32)
+    parser.add_argument("--segundos", type=float, default=10.0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--io-ms", type=float, default=0.0)
+    parser.add_argument("--real", action="store_true")
+    parser.add_argument("--serve", choices=("dev", "prefork"), help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        _serve(args)
+        return
+
+    print(
+        f"GET {PATH}: {args.clientes} clientes, {args.segundos:g} s,"
+        f" espera simulada {args.io_ms:g} ms, {os.cpu_count()} CPU"
+    )
+    print(f"{'servidor':<24} {'throughput':>16} {'p50':>12} {'p99':>12} {'errores':>8}")
+    _measure("desarrollo (threaded)", ["dev"], args)
+    _measure(
+        f"pre-fork {args.workers}x{args.threads}",
+        ["prefork", "--workers", str(args.workers), "--threads", str(args.threads)],
+        args,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Benchmark del arranque: imports y construcción de la app en frío.
+
+Cada medición corre en un intérprete nuevo, así que incluye el costo que paga
+un worker recién forkeado o una sesión de pytest: importar los módulos y
+construir `AuthService`, el blueprint con repositorios en memoria y
+`create_app()` de Flask y FastAPI.
+
+Uso:
+    python scripts/benchmark_startup.py [--runs 5] [--importtime 15]
+
+`--importtime N` agrega el desglose de `python -X importtime` al importar
+`src.infrastructure.flask.app`: el total en frío y las N dependencias
+externas más caras que importa directamente el código de `src`.
+
+`create_app()` no abre conexiones, pero necesita el driver de MySQL
+(`pymysql`) para crear el engine; sin él esa fila se informa como no
+disponible.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+_TIMER = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+started = time.perf_counter()
+{imports}
+imported = time.perf_counter()
+{build}
+built = time.perf_counter()
+print(json.dumps([imported - started, built - imported]))
+"""
+
+STAGES = {
+    "AuthService()": (
+        "from src.infrastructure.http.auth import AuthService",
+        "AuthService().issue_token('admin', 'admin')",
+    ),
+    "build_blueprint": (
+        "from src.infrastructure.flask.routes import build_blueprint\n"
+        "from src.interface_adapters.gateways.in_memory_plant_repository import "
+        "InMemoryPlantRepository",
+        "build_blueprint(InMemoryPlantRepository(), lambda: None)",
+    ),
+    "create_app (Flask)": (
+        "from src.infrastructure.flask.app import create_app\n"
+        "from src.infrastructure.sqlalchemy.config import DBConfig",
+        "create_app(DBConfig())",
+    ),
+    "create_app (FastAPI)": (
+        "from src.infrastructure.fastapi.app import create_app\n"
+        "from src.infrastructure.sqlalchemy.config import DBConfig",
+        "create_app(DBConfig())",
+    ),
+}
+
+
+def _run_once(imports: str, build: str) -> tuple[float, float]:
+    code = _TIMER.format(root=str(PROJECT_ROOT), imports=imports, build=build)
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT,
+        check=False,
+    )
+    if result.returncode != 0:
+        last_line = (result.stderr.strip().splitlines() or ["error"])[-1]
+        raise RuntimeError(last_line)
+    import_seconds, build_seconds = json.loads(result.stdout.strip().splitlines()[-1])
+    return import_seconds, build_seconds
+
+
+def _parse_importtime(stderr: str) -> list[tuple[int, int, str]]:
+    """Filas (microsegundos acumulados, profundidad, módulo) en orden de salida."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((int(cumulative), depth, name.strip()))
+    return rows
+
+
+def _report_importtime(module: str, top: int) -> None:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT,
+        check=False,
+    )
+    rows = _parse_importtime(result.stderr)
+    if result.returncode != 0 or not rows:
+        last_line = (result.stderr.strip().splitlines() or ["error"])[-1]
+        print(f"importtime no disponible: {last_line}")
+        return
+
+    # `-X importtime` lista cada módulo antes que quien lo importó.
+    heaviest = []
+    for index, (cumulative, depth, name) in enumerate(rows):
+        parent = next(
+            (row[2] for row in rows[index + 1 :] if row[1] < depth), None
+        )
+        if parent and parent.startswith("src.") and not name.startswith("src."):
+            heaviest.append((cumulative, name, parent))
+
+    print()
+    print(f"python -X importtime: import {module} = {rows[-1][0] / 1000:.1f} ms")
+    for cumulative, name, parent in sorted(heaviest, reverse=True)[:top]:
+        print(f"{cumulative / 1000:>9.1f} ms  {name:<36} <- {parent}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--importtime", type=int, default=0, metavar="N")
+    args = parser.parse_args()
+
+    print(f"Mediana de {args.runs} intérpretes nuevos por fila")
+    print(f"{'etapa':<22} {'imports':>12} {'construcción':>14}")
+    for label, (imports, build) in STAGES.items():
+        try:
+            samples = [_run_once(imports, build) for _ in range(args.runs)]
+        except RuntimeError as exc:
+            print(f"{label:<22} no disponible: {exc}")
+            continue
+        import_ms = statistics.median(sample[0] for sample in samples) * 1000
+        build_ms = statistics.median(sample[1] for sample in samples) * 1000
+        print(f"{label:<22} {import_ms:>9.1f} ms {build_ms:>11.1f} ms")
+
+    if args.importtime:
+        _report_importtime("src.infrastructure.flask.app", args.importtime)
+
+
+if __name__ == "__main__":
+    main()
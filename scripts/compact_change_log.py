@@ -0,0 +1,35 @@
+"""Script para compactar `change_log` (pensado para ejecutarse desde cron)."""
+
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.infrastructure.sqlalchemy.config import load_db_config
+from src.infrastructure.sqlalchemy.plant_repository import SqlAlchemyPlantRepository
+from src.infrastructure.sqlalchemy.session import (
+    build_session_factory,
+    create_engine_from_config,
+)
+from src.shared.config import get_change_log_retention_days
+from src.use_cases.compact_change_log import CompactChangeLogUseCase
+
+
+def main() -> None:
+    """Elimina entradas más antiguas que `CHANGE_LOG_RETENTION_DAYS`."""
+
+    config = load_db_config()
+    engine = create_engine_from_config(config)
+    session_factory = build_session_factory(engine)
+
+    repo = SqlAlchemyPlantRepository(session_factory)
+    retention = timedelta(days=get_change_log_retention_days())
+    removed = CompactChangeLogUseCase(repo).execute(retention)
+    print(f"Entradas de change_log eliminadas: {removed}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Punto de entrada de producción: workers pre-forkeados sobre Werkzeug.
+
+Uso:
+    python serve.py [--workers 4 --threads 8 --port 8000]
+
+Los valores por defecto salen de `SERVER_*` (ver `.env.example`). Sirve HTTP
+plano: TLS se termina en el proxy de delante. `run.py` sigue siendo el
+servidor de desarrollo.
+"""
+
+import argparse
+
+from src.infrastructure.flask.server import serve
+from src.shared.config import get_server_config, load_env
+
+
+def main() -> None:
+    "Inicia la API con varios procesos."
+    load_env()
+    config = get_server_config()
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default=config["host"])
+    parser.add_argument("--port", type=int, default=config["port"])
+    parser.add_argument("--workers", type=int, default=config["workers"])
+    parser.add_argument("--threads", type=int, default=config["threads"])
+    parser.add_argument(
+        "--no-reuse-port", dest="reuse_port", action="store_false",
+        default=config["reuse_port"],
+    )
+    parser.add_argument(
+        "--graceful-timeout", type=float, default=config["graceful_timeout"]
+    )
+    args = parser.parse_args()
+
+    def app_factory():
+        # Se importa dentro del worker: el engine y su pool nacen después del
+        # fork, con el tamaño que corresponde a los hilos de cada proceso.
+        from src.infrastructure.flask.app import create_app
+        from src.infrastructure.sqlalchemy.config import load_db_config
+
+        return create_app(db_config=load_db_config().for_worker(args.threads))
+
+    def worker_exit(app) -> None:
+        for engine in app.extensions.get("sqlalchemy_engines", ()):
+            engine.dispose()
+
+    serve(
+        app_factory,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        threads=args.threads,
+        reuse_port=args.reuse_port,
+        graceful_timeout=args.graceful_timeout,
+        worker_exit=worker_exit,
+    )
+
+
+if __name__ == "__main__":
+    main()
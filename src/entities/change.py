@@ -0,0 +1,39 @@
+"""Domain structures describing entries of the hierarchy change log."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from src.entities.area import Area
+from src.entities.equipment import Equipment
+from src.entities.plant import Plant
+from src.entities.system import System
+
+CHANGE_ENTITY_TYPES = ("planta", "area", "equipo", "sistema")
+CHANGE_ACTIONS = ("creado", "actualizado", "eliminado")
+
+
+def utc_now() -> datetime:
+    """Naive UTC timestamp, matching the `DATETIME` columns of the log."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+@dataclass(slots=True)
+class ChangeEntry:
+    """A single create/update/delete recorded together with its write.
+
+    Ancestor ids are kept so the entry can be scope-filtered without loading
+    the (possibly deleted) entity. `snapshot` holds the entity as it was after
+    the write and is `None` for deletions.
+    """
+
+    id: int
+    entity_type: str
+    entity_id: int
+    action: str
+    plant_id: int
+    area_id: int | None
+    equipment_id: int | None
+    recorded_at: datetime
+    snapshot: Plant | Area | Equipment | System | None = None
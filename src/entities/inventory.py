@@ -0,0 +1,86 @@
+"""Flat representation of the hierarchy used by bulk exports."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True, frozen=True)
+class InventoryRow:
+    """One plant, area, equipment or system with its ancestor ids.
+
+    The id column of the entity's own level repeats `id` (for plants,
+    `plant_id == id`) and the levels below it are `None`. Only plants carry a
+    `location`.
+    """
+
+    entity_type: str
+    id: int
+    name: str
+    status: str
+    plant_id: int
+    area_id: int | None = None
+    equipment_id: int | None = None
+    location: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class InventoryScope:
+    """Part of the inventory a caller may export.
+
+    `None` leaves a dimension unrestricted. `area_ids` limits areas and
+    everything below them, `equipment_ids` limits equipment and their
+    systems; plants are only limited by `entity_types`.
+    """
+
+    entity_types: frozenset[str] | None = None
+    area_ids: frozenset[int] | None = None
+    equipment_ids: frozenset[int] | None = None
+
+    def includes(self, row: InventoryRow) -> bool:
+        if self.entity_types is not None and row.entity_type not in self.entity_types:
+            return False
+        if row.entity_type == "planta":
+            return True
+        if self.area_ids is not None and row.area_id not in self.area_ids:
+            return False
+        if row.entity_type == "area":
+            return True
+        return self.equipment_ids is None or row.equipment_id in self.equipment_ids
+
+
+@dataclass(slots=True, frozen=True)
+class ImportRow:
+    """One entity to create or update, with its parents given by name.
+
+    `line` is the 1-based position in the source file and is echoed back in
+    error reports. Parent names not needed by `entity_type` are ignored and a
+    missing `status` means the entity's default.
+    """
+
+    line: int
+    entity_type: str
+    name: str
+    status: str | None = None
+    plant_name: str | None = None
+    area_name: str | None = None
+    equipment_name: str | None = None
+    location: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class ImportRowError:
+    """A row that could not be imported and the reason."""
+
+    line: int
+    message: str
+
+
+@dataclass(slots=True)
+class ImportReport:
+    """Outcome of a bulk import."""
+
+    processed: int = 0
+    saved: dict[str, int] = field(default_factory=dict)
+    errors: list[ImportRowError] = field(default_factory=list)
+    error_count: int = 0
@@ -0,0 +1,34 @@
+"""Domain structures describing a plant together with its full hierarchy."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from src.entities.area import Area
+from src.entities.equipment import Equipment
+from src.entities.plant import Plant
+from src.entities.system import System
+
+
+@dataclass(slots=True)
+class EquipmentNode:
+    """Equipment with the systems attached to it."""
+
+    equipment: Equipment
+    systems: list[System] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class AreaNode:
+    """Area with its equipment subtree."""
+
+    area: Area
+    equipment: list[EquipmentNode] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class PlantTree:
+    """Plant with every area, equipment and system beneath it."""
+
+    plant: Plant
+    areas: list[AreaNode] = field(default_factory=list)
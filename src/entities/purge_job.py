@@ -0,0 +1,32 @@
+"""Progress of a deferred, batched deletion of a plant subtree."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+
+# Levels are purged leaves first so every batch only removes childless rows.
+PURGE_LEVELS = ("sistema", "equipo", "area", "planta")
+
+PURGE_STATUSES = ("pendiente", "en_curso", "completado", "fallido")
+
+
+@dataclass(slots=True, frozen=True)
+class PurgeJob:
+    """A hidden plant whose descendants are being removed in batches.
+
+    `deleted` counts removed rows per level. The job is `pendiente` until the
+    first batch runs and `completado` once the plant row itself is gone.
+    """
+
+    id: int
+    plant_id: int
+    status: str
+    created_at: datetime
+    deleted: dict[str, int] = field(default_factory=dict)
+    finished_at: datetime | None = None
+    error: str | None = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("completado", "fallido")
@@ -0,0 +1,57 @@
+"""Status propagation down the plant hierarchy."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+HIERARCHY_LEVELS = ("planta", "area", "equipo", "sistema")
+
+# Each mapping is one logical state spelled as every level expects it.
+_EQUIVALENT_STATUSES: tuple[dict[str, str], ...] = (
+    {
+        "planta": "operativa",
+        "area": "operativa",
+        "equipo": "operativo",
+        "sistema": "operativo",
+    },
+    {
+        "planta": "mantenimiento",
+        "area": "mantenimiento",
+        "equipo": "mantenimiento",
+        "sistema": "mantenimiento",
+    },
+    {"planta": "inactiva"},
+)
+
+
+def cascade_statuses(
+    entity_type: str, status: str, *, cascade: bool = True
+) -> dict[str, str]:
+    """Translate `status` for `entity_type` into the status of each level.
+
+    Without `cascade` only the level of `entity_type` is returned. Raises
+    ValueError when the status is not valid for that level or has no
+    equivalent in some descendant level.
+    """
+    levels = HIERARCHY_LEVELS[HIERARCHY_LEVELS.index(entity_type) :]
+    if not cascade:
+        levels = levels[:1]
+
+    for forms in _EQUIVALENT_STATUSES:
+        if forms.get(entity_type) != status:
+            continue
+        missing = [level for level in levels if level not in forms]
+        if missing:
+            raise ValueError(
+                f"El estado {status} no se puede propagar a: {', '.join(missing)}"
+            )
+        return {level: forms[level] for level in levels}
+    raise ValueError(f"Estado inválido para {entity_type}: {status}")
+
+
+@dataclass(slots=True, frozen=True)
+class StatusCascade:
+    """Rows whose status changed, per level, inside one plant."""
+
+    plant_id: int
+    updated: dict[str, int] = field(default_factory=dict)
@@ -0,0 +1,166 @@
+"""
+Path: src/infrastructure/fastapi/app.py
+"""
+
+from __future__ import annotations
+
+from fastapi import FastAPI
+from fastapi.responses import RedirectResponse
+
+from src.infrastructure.fastapi.error_handlers import register_error_handlers
+from src.infrastructure.fastapi.middleware import (
+    CorsMiddleware,
+    ProxyHeadersMiddleware,
+    RemoteChangesMiddleware,
+)
+from src.infrastructure.fastapi.routes import build_router
+from src.infrastructure.http.auth import AuthService
+from src.infrastructure.sqlalchemy import (
+    SqlAlchemyPlantRepository,
+    SqlAlchemyRefreshTokenStore,
+    SqlAlchemyUnitOfWork,
+    SqlAlchemyUserRepository,
+)
+from src.infrastructure.sqlalchemy.change_watcher import PlantVersionWatcher
+from src.infrastructure.sqlalchemy.config import DBConfig, load_db_config
+from src.infrastructure.sqlalchemy.session import (
+    ReplicaSet,
+    SessionFactory,
+    build_session_factory,
+    create_engine_from_config,
+    create_replica_engines,
+    run_after_commit,
+)
+from src.interface_adapters.gateways.caching_plant_repository import (
+    CachingPlantRepository,
+)
+from src.interface_adapters.gateways.change_broadcaster import ChangeBroadcaster
+from src.interface_adapters.gateways.purge_runner import PurgeRunner
+from src.shared.config import (
+    get_cors_origins,
+    get_env,
+    get_event_stream_config,
+    get_plant_cache_config,
+    get_purge_config,
+    get_trusted_proxy_hops,
+)
+from src.shared.logger import get_logger
+from src.use_cases.ports.plant_repository import PlantDataRepository
+from src.use_cases.purge_plant import PurgePlantUseCase
+
+logger = get_logger("fastapi-app")
+
+
+def create_app(db_config: DBConfig | None = None) -> FastAPI:
+    """Bootstrap FastAPI application with the same wiring as the Flask one.
+
+    Without a request-scoped session each repository call and each unit of
+    work opens its own session from the pool.
+    """
+    fastapi_app = FastAPI(docs_url=None, redoc_url=None, openapi_url=None)
+    cors_origins = get_cors_origins()
+
+    config = db_config
+    if config is None:
+        try:
+            config = load_db_config()
+        except RuntimeError as exc:
+            logger.error(
+                "No se pudo cargar la configuración de base de datos (revisa .env y variables DB_*).",
+                exc_info=exc,
+            )
+            raise
+
+    engine = create_engine_from_config(config)
+    replica_engines = create_replica_engines(config)
+    replicas = None
+    if replica_engines:
+        replicas = ReplicaSet(
+            replica_engines, check_interval_seconds=config.replica_check_seconds
+        )
+    # Para que quien sirve la app pueda liberar los pools al apagar.
+    fastapi_app.state.sqlalchemy_engines = [engine, *replica_engines]
+    session_factory: SessionFactory = build_session_factory(engine, replicas=replicas)
+    sql_repository = SqlAlchemyPlantRepository(session_factory)
+    repository: PlantDataRepository = sql_repository
+    cache_config = get_plant_cache_config()
+    if cache_config["enabled"]:
+        caching_repository = CachingPlantRepository(
+            repository,
+            max_entries=cache_config["max_entries"],
+            ttl_seconds=cache_config["ttl_seconds"],
+            after_commit=run_after_commit,
+        )
+        repository = caching_repository
+        version_watcher = PlantVersionWatcher(
+            session_factory, min_interval_seconds=cache_config["poll_seconds"]
+        )
+        fastapi_app.add_middleware(
+            RemoteChangesMiddleware,
+            poll=version_watcher.poll,
+            invalidate=caching_repository.invalidate_plants,
+        )
+    user_repository = SqlAlchemyUserRepository(session_factory)
+
+    def make_uow() -> SqlAlchemyUnitOfWork:
+        return SqlAlchemyUnitOfWork(session_factory)
+
+    auth_service = AuthService(
+        user_repository=user_repository,
+        refresh_store=SqlAlchemyRefreshTokenStore(session_factory),
+    )
+    events_config = get_event_stream_config()
+    change_broadcaster = ChangeBroadcaster(
+        sql_repository,
+        poll_seconds=events_config["poll_seconds"],
+        queue_size=events_config["queue_size"],
+        max_subscribers=events_config["max_clients"],
+    )
+
+    purge_config = get_purge_config()
+    purge_runner = PurgeRunner(
+        PurgePlantUseCase(
+            repository,
+            make_uow,
+            batch_size=purge_config["batch_size"],
+            pause_seconds=purge_config["pause_seconds"],
+        )
+    )
+    # Retoma en segundo plano los borrados que un reinicio o un lote fallido
+    # dejaron a medias; las plantas ocultas no quedan así para siempre.
+    purge_runner.resume()
+
+    fastapi_app.include_router(
+        build_router(
+            repository,
+            make_uow,
+            auth_service=auth_service,
+            change_log=sql_repository,
+            change_broadcaster=change_broadcaster,
+            event_heartbeat_seconds=events_config["heartbeat_seconds"],
+            inventory=sql_repository,
+            inventory_import=repository,
+            purge_runner=purge_runner,
+        )
+    )
+    register_error_handlers(fastapi_app)
+    fastapi_app.add_middleware(CorsMiddleware, cors_origins=cors_origins)
+    proxy_hops = get_trusted_proxy_hops()
+    if proxy_hops:
+        # El throttle de login cuenta por IP: debe ver la del cliente, no la
+        # del proxy.
+        fastapi_app.add_middleware(ProxyHeadersMiddleware, hops=proxy_hops)
+
+    @fastapi_app.get("/api/health")
+    def health_check() -> dict[str, str]:
+        return {"status": "ok"}
+
+    @fastapi_app.get("/api/cors")
+    def cors_info():
+        return {"cors_origins": cors_origins}
+
+    @fastapi_app.get("/")
+    def forward_to_web():
+        return RedirectResponse(get_env("WEB_URL"), status_code=302)
+
+    return fastapi_app
@@ -0,0 +1,173 @@
+"""Router con rutas relacionadas a áreas y sus equipos."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import Response
+from werkzeug.exceptions import BadRequest, NotFound
+
+from src.infrastructure.fastapi.helpers import (
+    _Body,
+    _claims_dependency,
+    _entity_tag,
+    _flag_arg,
+    _json,
+    _not_modified,
+    _pagination_args,
+    _request_body,
+    _with_etag,
+)
+from src.infrastructure.http.auth import AuthClaims, AuthService, ScopeAuthorizer
+from src.infrastructure.http.helpers import (
+    _paginated_body,
+    _validate_batch,
+    _validate_payload,
+)
+from src.interface_adapters.presenters.area_presenter import present as present_area
+from src.interface_adapters.presenters.equipment_presenter import (
+    present as present_equipment,
+    present_many as present_equipment_list,
+)
+from src.interface_adapters.presenters.status_presenter import (
+    present as present_status,
+)
+from src.interface_adapters.schemas import (
+    AreaUpdate,
+    EquipmentCreate,
+    StatusChange,
+)
+from src.use_cases.change_status import ChangeStatusUseCase
+from src.use_cases.create_equipment import CreateEquipmentUseCase
+from src.use_cases.delete_area import DeleteAreaUseCase
+from src.use_cases.get_area import GetAreaUseCase
+from src.use_cases.get_subtree_revision import GetSubtreeRevisionUseCase
+from src.use_cases.list_area_equipment import ListAreaEquipmentUseCase
+from src.use_cases.update_area import UpdateAreaUseCase
+
+
+def build_areas_router(
+    get_area_use_case: GetAreaUseCase,
+    update_area_use_case: UpdateAreaUseCase,
+    delete_area_use_case: DeleteAreaUseCase,
+    list_area_equipment_use_case: ListAreaEquipmentUseCase,
+    create_equipment_use_case: CreateEquipmentUseCase,
+    change_status_use_case: ChangeStatusUseCase,
+    get_subtree_revision_use_case: GetSubtreeRevisionUseCase,
+    auth_service: AuthService,
+    scope_authorizer: ScopeAuthorizer,
+) -> APIRouter:
+    """Crea un router específico para las rutas de áreas."""
+
+    router = APIRouter(prefix="/areas")
+    require_claims = _claims_dependency(auth_service)
+
+    @router.api_route("/{area_id:int}", methods=["PUT", "PATCH"])
+    def update_area(
+        area_id: int,
+        claims: AuthClaims = Depends(require_claims),
+        body: _Body = Depends(_request_body),
+    ):
+        area = scope_authorizer.ensure_can_manage_area(claims, area_id)
+
+        update_data = _validate_payload(body.json(), AreaUpdate)
+        updated = update_area_use_case.execute(area.id, **update_data)
+        if updated is None:
+            raise NotFound("Área no encontrada")
+
+        return _json(present_area(updated))
+
+    @router.delete("/{area_id:int}")
+    def delete_area(area_id: int, claims: AuthClaims = Depends(require_claims)):
+        area = scope_authorizer.ensure_can_manage_area(claims, area_id)
+
+        deleted = delete_area_use_case.execute(area.id)
+        if not deleted:
+            raise NotFound("Área no encontrada")
+        return Response(status_code=204)
+
+    @router.get("/{area_id:int}/equipos")
+    def list_area_equipment(
+        area_id: int, request: Request, claims: AuthClaims = Depends(require_claims)
+    ):
+        pagination = _pagination_args(request)
+        revision = get_subtree_revision_use_case.for_area(area_id)
+        if revision is None:
+            raise NotFound("Área no encontrada")
+
+        etag = _entity_tag(request, claims, revision)
+        cached = _not_modified(request, etag)
+        if cached is not None:
+            return cached
+
+        if pagination is None:
+            equipment = list_area_equipment_use_case.execute(area_id)
+            scoped = scope_authorizer.filter_equipment(claims, area_id, equipment)
+            return _with_etag(_json(present_equipment_list(scoped)), etag)
+
+        limit, after = pagination
+        page = list_area_equipment_use_case.execute_page(
+            area_id,
+            limit=limit,
+            after=after,
+            ids=scope_authorizer.equipment_ids_in_scope(claims, area_id),
+        )
+        body = _paginated_body(present_equipment_list(page.items), page.next_after)
+        return _with_etag(_json(body), etag)
+
+    @router.post("/{area_id:int}/equipos")
+    def create_equipment(
+        area_id: int,
+        claims: AuthClaims = Depends(require_claims),
+        body: _Body = Depends(_request_body),
+    ):
+        scope_authorizer.ensure_can_create_equipment(claims, area_id)
+
+        data = _validate_payload(body.json(), EquipmentCreate)
+
+        area = get_area_use_case.execute(area_id)
+        if area is None:
+            raise NotFound("Área no encontrada")
+
+        created = create_equipment_use_case.execute(area_id, **data)
+        if created is None:
+            raise NotFound("No se pudo crear el equipo")
+
+        return _json(present_equipment(created), 201)
+
+    @router.post("/{area_id:int}/equipos:lote")
+    def create_equipment_batch(
+        area_id: int,
+        claims: AuthClaims = Depends(require_claims),
+        body: _Body = Depends(_request_body),
+    ):
+        scope_authorizer.ensure_can_create_equipment(claims, area_id)
+
+        items = _validate_batch(body.json(), EquipmentCreate)
+        created = create_equipment_use_case.execute_many(area_id, items)
+        if created is None:
+            raise NotFound("Área no encontrada")
+
+        return _json(present_equipment_list(created), 201)
+
+    @router.put("/{area_id:int}/estado")
+    def change_status(
+        area_id: int,
+        request: Request,
+        claims: AuthClaims = Depends(require_claims),
+        body: _Body = Depends(_request_body),
+    ):
+        scope_authorizer.ensure_can_manage_area(claims, area_id)
+
+        data = _validate_payload(body.json(), StatusChange)
+        try:
+            result = change_status_use_case.for_area(
+                area_id, data["status"], cascade=_flag_arg(request, "cascada")
+            )
+        except ValueError as exc:
+            raise BadRequest(str(exc)) from exc
+        if result is None:
+            raise NotFound("Área no encontrada")
+
+        return _json(present_status(result))
+
+    return router
@@ -0,0 +1,45 @@
+"""Router de autenticación para emisión de tokens demo."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Request
+
+from src.infrastructure.fastapi.helpers import _Body, _json, _request_body
+from src.infrastructure.http.auth import AuthService
+from src.infrastructure.http.helpers import _session_payload, _validate_payload
+from src.interface_adapters.schemas import LoginRequest, RefreshRequest
+
+
+def build_auth_router(auth_service: AuthService) -> APIRouter:
+    router = APIRouter(prefix="/auth")
+
+    @router.post("/login")
+    def login(request: Request, body: _Body = Depends(_request_body)):
+        data = _validate_payload(body.json(), LoginRequest)
+
+        session = auth_service.login(
+            data["username"],
+            data["password"],
+            client_ip=request.client.host if request.client else None,
+        )
+
+        claims = session.claims
+        return _json(
+            {
+                **_session_payload(session),
+                "user": {
+                    "username": claims.username,
+                    "role": claims.role,
+                    "areas": sorted(claims.areas),
+                    "equipos": sorted(claims.equipos),
+                },
+            }
+        )
+
+    @router.post("/refresh")
+    def refresh(body: _Body = Depends(_request_body)):
+        data = _validate_payload(body.json(), RefreshRequest)
+
+        return _json(_session_payload(auth_service.refresh(data["refresh_token"])))
+
+    return router
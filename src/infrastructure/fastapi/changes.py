@@ -0,0 +1,50 @@
+"""Router con el feed incremental de cambios de la jerarquía."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Request
+from werkzeug.exceptions import Gone
+
+from src.infrastructure.fastapi.helpers import _claims_dependency, _json, _limit_arg
+from src.infrastructure.http.auth import AuthClaims, AuthService, ScopeAuthorizer
+from src.infrastructure.http.helpers import _decode_cursor, _encode_cursor
+from src.interface_adapters.presenters.change_presenter import (
+    present_many as present_changes,
+)
+from src.use_cases.list_changes import ListChangesUseCase
+
+
+def build_changes_router(
+    list_changes_use_case: ListChangesUseCase,
+    auth_service: AuthService,
+    scope_authorizer: ScopeAuthorizer,
+) -> APIRouter:
+    """Crea un router específico para el feed de cambios."""
+
+    router = APIRouter(prefix="/cambios")
+    require_claims = _claims_dependency(auth_service)
+
+    @router.get("")
+    def list_changes(request: Request, claims: AuthClaims = Depends(require_claims)):
+        limit = _limit_arg(request)
+        cursor = request.query_params.get("desde")
+        if not cursor:
+            current = list_changes_use_case.current_cursor()
+            return _json(
+                {"items": [], "siguiente": _encode_cursor(current or 0), "hayMas": False}
+            )
+
+        feed = list_changes_use_case.execute(after=_decode_cursor(cursor), limit=limit)
+        if feed is None:
+            raise Gone("El cursor ya fue compactado; recarga la jerarquía completa")
+
+        scoped = scope_authorizer.filter_changes(claims, feed.items)
+        return _json(
+            {
+                "items": present_changes(scoped),
+                "siguiente": _encode_cursor(feed.cursor),
+                "hayMas": feed.has_more,
+            }
+        )
+
+    return router
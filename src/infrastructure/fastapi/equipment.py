@@ -0,0 +1,179 @@
+"""Router con rutas relacionadas a equipos y sus sistemas."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import Response
+from werkzeug.exceptions import BadRequest, NotFound
+
+from src.infrastructure.fastapi.helpers import (
+    _Body,
+    _claims_dependency,
+    _entity_tag,
+    _flag_arg,
+    _json,
+    _not_modified,
+    _pagination_args,
+    _request_body,
+    _with_etag,
+)
+from src.infrastructure.http.auth import AuthClaims, AuthService, ScopeAuthorizer
+from src.infrastructure.http.helpers import (
+    _paginated_body,
+    _validate_batch,
+    _validate_payload,
+)
+from src.interface_adapters.presenters.equipment_presenter import (
+    present as present_equipment,
+)
+from src.interface_adapters.presenters.status_presenter import (
+    present as present_status,
+)
+from src.interface_adapters.presenters.system_presenter import (
+    present as present_system,
+    present_many as present_systems,
+)
+from src.interface_adapters.schemas import (
+    EquipmentUpdate,
+    StatusChange,
+    SystemCreate,
+)
+from src.use_cases.change_status import ChangeStatusUseCase
+from src.use_cases.create_system import CreateSystemUseCase
+from src.use_cases.delete_equipment import DeleteEquipmentUseCase
+from src.use_cases.get_equipment import GetEquipmentUseCase
+from src.use_cases.get_subtree_revision import GetSubtreeRevisionUseCase
+from src.use_cases.list_equipment_systems import ListEquipmentSystemsUseCase
+from src.use_cases.update_equipment import UpdateEquipmentUseCase
+
+
+def build_equipment_router(
+    get_equipment_use_case: GetEquipmentUseCase,
+    update_equipment_use_case: UpdateEquipmentUseCase,
+    delete_equipment_use_case: DeleteEquipmentUseCase,
+    list_equipment_systems_use_case: ListEquipmentSystemsUseCase,
+    create_system_use_case: CreateSystemUseCase,
+    change_status_use_case: ChangeStatusUseCase,
+    get_subtree_revision_use_case: GetSubtreeRevisionUseCase,
+    auth_service: AuthService,
+    scope_authorizer: ScopeAuthorizer,
+) -> APIRouter:
+    """Crea un router específico para las rutas de equipos."""
+
+    router = APIRouter(prefix="/equipos")
+    require_claims = _claims_dependency(auth_service)
+
+    @router.api_route("/{equipment_id:int}", methods=["PUT", "PATCH"])
+    def update_equipment(
+        equipment_id: int,
+        claims: AuthClaims = Depends(require_claims),
+        body: _Body = Depends(_request_body),
+    ):
+        equipment = scope_authorizer.ensure_can_manage_equipment(claims, equipment_id)
+
+        update_data = _validate_payload(body.json(), EquipmentUpdate)
+        updated = update_equipment_use_case.execute(equipment.id, **update_data)
+        if updated is None:
+            raise NotFound("Equipo no encontrado")
+
+        return _json(present_equipment(updated))
+
+    @router.delete("/{equipment_id:int}")
+    def delete_equipment(
+        equipment_id: int, claims: AuthClaims = Depends(require_claims)
+    ):
+        equipment = scope_authorizer.ensure_can_manage_equipment(claims, equipment_id)
+
+        deleted = delete_equipment_use_case.execute(equipment.id)
+        if not deleted:
+            raise NotFound("Equipo no encontrado")
+        return Response(status_code=204)
+
+    @router.get("/{equipment_id:int}/sistemas")
+    def list_equipment_systems(
+        equipment_id: int,
+        request: Request,
+        claims: AuthClaims = Depends(require_claims),
+    ):
+        pagination = _pagination_args(request)
+        revision = get_subtree_revision_use_case.for_equipment(equipment_id)
+        if revision is None:
+            raise NotFound("Equipo no encontrado")
+
+        etag = _entity_tag(request, claims, revision)
+        cached = _not_modified(request, etag)
+        if cached is not None:
+            return cached
+
+        if pagination is None:
+            systems = list_equipment_systems_use_case.execute(equipment_id)
+            scoped = scope_authorizer.filter_systems(claims, equipment_id, systems)
+            return _with_etag(_json(present_systems(scoped)), etag)
+
+        if not scope_authorizer.can_list_systems(claims, equipment_id):
+            return _with_etag(_json(_paginated_body([], None)), etag)
+
+        limit, after = pagination
+        page = list_equipment_systems_use_case.execute_page(
+            equipment_id, limit=limit, after=after
+        )
+        body = _paginated_body(present_systems(page.items), page.next_after)
+        return _with_etag(_json(body), etag)
+
+    @router.post("/{equipment_id:int}/sistemas")
+    def create_system(
+        equipment_id: int,
+        claims: AuthClaims = Depends(require_claims),
+        body: _Body = Depends(_request_body),
+    ):
+        scope_authorizer.ensure_can_create_system(claims, equipment_id)
+
+        data = _validate_payload(body.json(), SystemCreate)
+
+        equipment = get_equipment_use_case.execute(equipment_id)
+        if equipment is None:
+            raise NotFound("Equipo no encontrado")
+
+        created = create_system_use_case.execute(equipment_id, **data)
+        if created is None:
+            raise NotFound("No se pudo crear el sistema")
+
+        return _json(present_system(created), 201)
+
+    @router.post("/{equipment_id:int}/sistemas:lote")
+    def create_system_batch(
+        equipment_id: int,
+        claims: AuthClaims = Depends(require_claims),
+        body: _Body = Depends(_request_body),
+    ):
+        scope_authorizer.ensure_can_create_system(claims, equipment_id)
+
+        items = _validate_batch(body.json(), SystemCreate)
+        created = create_system_use_case.execute_many(equipment_id, items)
+        if created is None:
+            raise NotFound("Equipo no encontrado")
+
+        return _json(present_systems(created), 201)
+
+    @router.put("/{equipment_id:int}/estado")
+    def change_status(
+        equipment_id: int,
+        request: Request,
+        claims: AuthClaims = Depends(require_claims),
+        body: _Body = Depends(_request_body),
+    ):
+        scope_authorizer.ensure_can_manage_equipment(claims, equipment_id)
+
+        data = _validate_payload(body.json(), StatusChange)
+        try:
+            result = change_status_use_case.for_equipment(
+                equipment_id, data["status"], cascade=_flag_arg(request, "cascada")
+            )
+        except ValueError as exc:
+            raise BadRequest(str(exc)) from exc
+        if result is None:
+            raise NotFound("Equipo no encontrado")
+
+        return _json(present_status(result))
+
+    return router
@@ -0,0 +1,63 @@
+"""Handlers de error JSON para FastAPI, con el formato de la API Flask."""
+
+from __future__ import annotations
+
+from fastapi import FastAPI, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from werkzeug.exceptions import HTTPException, default_exceptions
+
+from src.infrastructure.http.errors import error_message, response_headers
+from src.infrastructure.http.helpers import _format_validation_errors
+from src.shared.logger import get_logger
+
+logger = get_logger("fastapi-app")
+
+
+async def handle_http_exception(_request: Request, error: HTTPException):
+    """Errores de los casos de uso y de `AuthService`/`ScopeAuthorizer`."""
+    return JSONResponse(
+        {"message": error_message(error)},
+        status_code=error.code or 500,
+        headers=response_headers(error),
+    )
+
+
+async def handle_routing_exception(_request: Request, error: StarletteHTTPException):
+    """404 y 405 del ruteo de Starlette, con el mensaje que daría Werkzeug."""
+    equivalent = default_exceptions.get(error.status_code)
+    message = error_message(equivalent()) if equivalent else str(error.detail)
+    return JSONResponse(
+        {"message": message},
+        status_code=error.status_code,
+        headers=getattr(error, "headers", None),
+    )
+
+
+async def handle_validation_exception(_request: Request, error: RequestValidationError):
+    return JSONResponse(
+        {"message": f"Payload inválido: {_format_validation_errors(error)}"},
+        status_code=400,
+    )
+
+
+async def handle_unexpected_exception(_request: Request, error: Exception):
+    logger.exception("Unhandled exception", exc_info=error)
+    return JSONResponse({"message": "Error interno del servidor"}, status_code=500)
+
+
+def register_error_handlers(app: FastAPI) -> None:
+    app.add_exception_handler(HTTPException, handle_http_exception)
+    app.add_exception_handler(StarletteHTTPException, handle_routing_exception)
+    app.add_exception_handler(RequestValidationError, handle_validation_exception)
+    app.add_exception_handler(Exception, handle_unexpected_exception)
+
+
+__all__ = [
+    "handle_http_exception",
+    "handle_routing_exception",
+    "handle_unexpected_exception",
+    "handle_validation_exception",
+    "register_error_handlers",
+]
@@ -0,0 +1,131 @@
+"""Router con el stream de eventos (Server-Sent Events) de la jerarquía."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from werkzeug.exceptions import ServiceUnavailable
+
+from src.entities.change import ChangeEntry
+from src.infrastructure.fastapi.helpers import _claims_dependency
+from src.infrastructure.http.auth import AuthClaims, AuthService, ScopeAuthorizer
+from src.infrastructure.http.events import RETRY_MILLISECONDS, _format_events, _replay
+from src.infrastructure.http.helpers import _decode_cursor
+from src.interface_adapters.gateways.change_broadcaster import (
+    ChangeBroadcaster,
+    Subscription,
+)
+from src.use_cases.list_changes import ListChangesUseCase
+
+def _listen(subscription: Subscription) -> asyncio.Event:
+    """Evento del loop actual que el hilo del broadcaster activa al recibir."""
+    loop = asyncio.get_running_loop()
+    ready = asyncio.Event()
+
+    def notify() -> None:
+        try:
+            loop.call_soon_threadsafe(ready.set)
+        except RuntimeError:  # loop ya cerrado: la conexión se está cerrando
+            pass
+
+    subscription.set_listener(notify)
+    return ready
+
+
+async def _receive(
+    subscription: Subscription, ready: asyncio.Event, timeout: float
+) -> list[ChangeEntry]:
+    """`Subscription.receive` sin bloquear el event loop ni ocupar un hilo."""
+    changes = subscription.receive(0)
+    if changes or subscription.overflowed:
+        return changes
+    ready.clear()
+    # Lo que llegó antes del `clear` no volverá a avisar: se revisa otra vez.
+    changes = subscription.receive(0)
+    if changes or subscription.overflowed:
+        return changes
+    try:
+        await asyncio.wait_for(ready.wait(), timeout)
+    except asyncio.TimeoutError:
+        return []
+    return subscription.receive(0)
+
+
+def build_events_router(
+    broadcaster: ChangeBroadcaster,
+    list_changes_use_case: ListChangesUseCase,
+    auth_service: AuthService,
+    scope_authorizer: ScopeAuthorizer,
+    *,
+    heartbeat_seconds: float = 15.0,
+) -> APIRouter:
+    """Crea un router específico para el stream de eventos.
+
+    A diferencia de Flask, las conexiones abiertas esperan en el event loop:
+    sólo las relecturas de `change_log` pasan por el pool de hilos.
+    """
+
+    router = APIRouter(prefix="/eventos")
+    require_claims = _claims_dependency(auth_service)
+
+    @router.get("")
+    async def stream_events(
+        request: Request, claims: AuthClaims = Depends(require_claims)
+    ):
+        raw_cursor = (
+            request.headers.get("Last-Event-ID") or request.query_params.get("desde")
+        )
+        after = _decode_cursor(raw_cursor) if raw_cursor else None
+
+        subscription = await run_in_threadpool(broadcaster.subscribe, after)
+        if subscription is None:
+            raise ServiceUnavailable(
+                "Demasiadas conexiones de eventos abiertas; reintentar más tarde"
+            )
+
+        def replay() -> list[str | None]:
+            return list(
+                _replay(list_changes_use_case, scope_authorizer, claims, subscription)
+            )
+
+        async def generate() -> AsyncIterator[str]:
+            ready = _listen(subscription)
+            try:
+                yield f"retry: {RETRY_MILLISECONDS}\n\n"
+                needs_replay = after is not None
+                while True:
+                    if needs_replay:
+                        needs_replay = False
+                        for chunk in await run_in_threadpool(replay):
+                            if chunk is None:
+                                yield "event: reinicio\ndata: {}\n\n"
+                                return
+                            yield chunk
+
+                    changes = await _receive(subscription, ready, heartbeat_seconds)
+                    if changes:
+                        scoped = scope_authorizer.filter_changes(claims, changes)
+                        if scoped:
+                            yield _format_events(scoped)
+                    else:
+                        yield ": ping\n\n"
+
+                    if subscription.overflowed:
+                        # Cliente lento: se descartó su cola y se relee el log.
+                        subscription.resume()
+                        needs_replay = True
+            finally:
+                subscription.set_listener(None)
+                broadcaster.unsubscribe(subscription)
+
+        return StreamingResponse(
+            generate(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    return router
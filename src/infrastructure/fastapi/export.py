@@ -0,0 +1,47 @@
+"""Router con la exportación completa del inventario."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+from werkzeug.exceptions import BadRequest
+
+from src.infrastructure.fastapi.helpers import _claims_dependency
+from src.infrastructure.http.auth import AuthClaims, AuthService, ScopeAuthorizer
+from src.infrastructure.http.inventory import _MIMETYPES, _csv_chunks, _ndjson_chunks
+from src.interface_adapters.presenters.inventory_presenter import present as present_row
+from src.use_cases.export_inventory import ExportInventoryUseCase
+
+
+def build_export_router(
+    export_inventory_use_case: ExportInventoryUseCase,
+    auth_service: AuthService,
+    scope_authorizer: ScopeAuthorizer,
+) -> APIRouter:
+    """Crea un router específico para la exportación del inventario.
+
+    Starlette recorre el generador en el pool de hilos, así que el cursor de
+    la base no bloquea el event loop.
+    """
+
+    router = APIRouter(prefix="/export")
+    require_claims = _claims_dependency(auth_service)
+
+    @router.get("")
+    def export_inventory(request: Request, claims: AuthClaims = Depends(require_claims)):
+        fmt = request.query_params.get("formato", "ndjson")
+        if fmt not in _MIMETYPES:
+            raise BadRequest("El parámetro formato debe ser ndjson o csv")
+
+        scope = scope_authorizer.inventory_scope(claims)
+        rows = (present_row(row) for row in export_inventory_use_case.execute(scope))
+        body = _ndjson_chunks(rows) if fmt == "ndjson" else _csv_chunks(rows)
+        return StreamingResponse(
+            body,
+            media_type=_MIMETYPES[fmt],
+            headers={
+                "Content-Disposition": f'attachment; filename="inventario.{fmt}"'
+            },
+        )
+
+    return router
@@ -0,0 +1,109 @@
+"""Funciones auxiliares compartidas para rutas de FastAPI.
+
+Aplican las de `src.infrastructure.http.helpers` sobre la petición de
+Starlette, igual que `src.infrastructure.flask.helpers` sobre la de Flask.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+from werkzeug.exceptions import BadRequest
+from werkzeug.http import parse_etags, parse_options_header, quote_etag
+
+from src.infrastructure.http.auth import AuthClaims, AuthService
+from src.infrastructure.http.helpers import (
+    _CACHE_CONTROL,
+    _parse_flag,
+    _parse_limit,
+    _parse_pagination,
+    _tag_for,
+)
+
+
+def _claims_dependency(auth_service: AuthService) -> Callable[[Request], AuthClaims]:
+    """Dependencia que valida el header `Authorization` (401 si falta)."""
+
+    def require_claims(request: Request) -> AuthClaims:
+        return auth_service.claims_from_header(
+            request.headers.get("Authorization", ""),
+            method=request.method,
+            path=request.url.path,
+            header_names=request.headers.keys(),
+        )
+
+    return require_claims
+
+
+def _mimetype(request: Request) -> str:
+    return parse_options_header(request.headers.get("Content-Type", ""))[0].lower()
+
+
+class _Body:
+    """Cuerpo de la petición ya leído.
+
+    `json()` aplica los criterios de `_require_json` en Flask: exige
+    `Content-Type: application/json` (o `+json`) y un cuerpo ausente, inválido
+    o `null` es un 400. Se invoca después de autorizar, como en Flask.
+    """
+
+    def __init__(self, mimetype: str, raw: bytes) -> None:
+        self._mimetype = mimetype
+        self._raw = raw
+
+    def json(self) -> Any:
+        is_json = self._mimetype == "application/json" or (
+            self._mimetype.startswith("application/")
+            and self._mimetype.endswith("+json")
+        )
+        data = None
+        if is_json:
+            try:
+                data = json.loads(self._raw)
+            except ValueError:
+                data = None
+        if data is None:
+            raise BadRequest("Cuerpo JSON inválido o ausente")
+        return data
+
+
+async def _request_body(request: Request) -> _Body:
+    """Dependencia que lee el cuerpo sin bloquear el event loop."""
+    return _Body(_mimetype(request), await request.body())
+
+
+def _pagination_args(request: Request) -> tuple[int, int | None] | None:
+    """Lee `limite` y `despues`; `None` si no se pidió paginación."""
+    return _parse_pagination(request.query_params)
+
+
+def _flag_arg(request: Request, name: str) -> bool:
+    return _parse_flag(request.query_params, name)
+
+
+def _limit_arg(request: Request) -> int:
+    return _parse_limit(request.query_params)
+
+
+def _entity_tag(request: Request, claims: AuthClaims, revision: object) -> str:
+    return _tag_for(f"{request.url.path}?{request.url.query}", claims, revision)
+
+
+def _not_modified(request: Request, etag: str) -> Response | None:
+    """Devuelve un 304 si el cliente ya tiene la versión `etag`."""
+    if not parse_etags(request.headers.get("If-None-Match")).contains(etag):
+        return None
+    return _with_etag(Response(status_code=304), etag)
+
+
+def _with_etag(response: Response, etag: str) -> Response:
+    response.headers["ETag"] = quote_etag(etag)
+    response.headers["Cache-Control"] = _CACHE_CONTROL
+    return response
+
+
+def _json(content: Any, status_code: int = 200) -> JSONResponse:
+    return JSONResponse(content, status_code=status_code)
@@ -0,0 +1,83 @@
+"""Router con la importación masiva del inventario."""
+
+from __future__ import annotations
+
+import io
+from collections.abc import AsyncIterator
+
+import anyio.from_thread
+from fastapi import APIRouter, Depends, Request
+from starlette.concurrency import run_in_threadpool
+from werkzeug.exceptions import BadRequest
+
+from src.infrastructure.fastapi.helpers import _claims_dependency, _json, _mimetype
+from src.infrastructure.http.auth import AuthClaims, AuthService, ScopeAuthorizer
+from src.infrastructure.http.inventory import (
+    _FORMATS,
+    _csv_rows,
+    _decoded,
+    _ndjson_rows,
+)
+from src.interface_adapters.presenters.inventory_presenter import present_report
+from src.use_cases.import_inventory import ImportInventoryUseCase
+
+
+class _BodyStream(io.RawIOBase):
+    """Cuerpo ASGI leído a demanda desde un hilo del pool.
+
+    Cada `readinto` pide el siguiente fragmento al event loop, de modo que el
+    caso de uso (síncrono) consume el stream sin cargarlo entero en memoria.
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        self._chunks = chunks
+        self._pending = b""
+        self._done = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending and not self._done:
+            try:
+                self._pending = anyio.from_thread.run(self._chunks.__anext__)
+            except StopAsyncIteration:
+                self._done = True
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def build_import_router(
+    import_inventory_use_case: ImportInventoryUseCase,
+    auth_service: AuthService,
+    scope_authorizer: ScopeAuthorizer,
+) -> APIRouter:
+    """Crea un router específico para la importación del inventario."""
+
+    router = APIRouter(prefix="/import")
+    require_claims = _claims_dependency(auth_service)
+
+    @router.post("")
+    async def import_inventory(
+        request: Request, claims: AuthClaims = Depends(require_claims)
+    ):
+        scope_authorizer.ensure_superadmin(claims)
+
+        fmt = request.query_params.get("formato")
+        if fmt is None:
+            fmt = "csv" if _mimetype(request) == "text/csv" else "ndjson"
+        if fmt not in _FORMATS:
+            raise BadRequest("El parámetro formato debe ser ndjson o csv")
+
+        def run():
+            raw = io.BufferedReader(_BodyStream(request.stream().__aiter__()))
+            text = io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+            rows = _ndjson_rows(text) if fmt == "ndjson" else _csv_rows(text)
+            return import_inventory_use_case.execute(_decoded(rows))
+
+        report = await run_in_threadpool(run)
+        return _json(present_report(report))
+
+    return router
@@ -0,0 +1,120 @@
+"""Middlewares ASGI de la app FastAPI."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Collection, Iterable
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.shared.logger import get_logger
+
+logger = get_logger("fastapi-app")
+
+
+class CorsMiddleware:
+    """Agrega los mismos headers CORS que `add_cors_headers` en Flask.
+
+    Los preflight (`OPTIONS`) se responden aquí con 200, igual que Flask,
+    sin pasar por el ruteo.
+    """
+
+    def __init__(self, app: ASGIApp, cors_origins: Collection[str]) -> None:
+        self.app = app
+        self.cors_origins = cors_origins
+
+    def _apply(self, headers: MutableHeaders, origin: str | None) -> None:
+        if "*" in self.cors_origins:
+            headers["Access-Control-Allow-Origin"] = "*"
+        elif origin in self.cors_origins:
+            headers["Access-Control-Allow-Origin"] = origin
+            headers["Vary"] = "Origin"
+
+        headers["Access-Control-Allow-Headers"] = "Content-Type, Authorization"
+        headers["Access-Control-Allow-Methods"] = "GET,POST,PUT,PATCH,DELETE,OPTIONS"
+        headers["Access-Control-Allow-Credentials"] = "true"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = Headers(scope=scope).get("origin")
+
+        if scope["method"] == "OPTIONS":
+            headers = MutableHeaders()
+            headers["Content-Length"] = "0"
+            self._apply(headers, origin)
+            await send(
+                {"type": "http.response.start", "status": 200, "headers": headers.raw}
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                self._apply(MutableHeaders(scope=message), origin)
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
+class ProxyHeadersMiddleware:
+    """Equivalente de `ProxyFix(x_for=hops, x_proto=hops)` de Werkzeug.
+
+    Toma la IP del cliente y el esquema de `X-Forwarded-For` y
+    `X-Forwarded-Proto`, contando `hops` proxies de confianza desde la
+    derecha; si el header trae menos valores se deja la conexión tal cual.
+    """
+
+    def __init__(self, app: ASGIApp, hops: int) -> None:
+        self.app = app
+        self.hops = hops
+
+    def _forwarded(self, value: str | None) -> str | None:
+        if not value:
+            return None
+        values = [part.strip() for part in value.split(",")]
+        if len(values) < self.hops:
+            return None
+        return values[-self.hops] or None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] in {"http", "websocket"}:
+            headers = Headers(scope=scope)
+            client = self._forwarded(headers.get("x-forwarded-for"))
+            scheme = self._forwarded(headers.get("x-forwarded-proto"))
+            if client or scheme:
+                scope = dict(scope)
+                if client:
+                    scope["client"] = (client, 0)
+                if scheme:
+                    scope["scheme"] = scheme
+        await self.app(scope, receive, send)
+
+
+class RemoteChangesMiddleware:
+    """Antes de cada petición descarta del caché las plantas que cambió otro
+    worker (`drop_remote_changes` en Flask).
+
+    `poll` consulta la base, así que corre en el pool de hilos.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        poll: Callable[[], Iterable[int]],
+        invalidate: Callable[[Iterable[int]], None],
+    ) -> None:
+        self.app = app
+        self.poll = poll
+        self.invalidate = invalidate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            changed = await run_in_threadpool(self.poll)
+            if changed:
+                logger.debug("Plantas modificadas por otro worker: %s", sorted(changed))
+                self.invalidate(changed)
+        await self.app(scope, receive, send)
@@ -0,0 +1,269 @@
+"""Router con rutas relacionadas a plantas y sus áreas."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import Response
+from werkzeug.exceptions import BadRequest, NotFound
+
+from src.infrastructure.fastapi.helpers import (
+    _Body,
+    _claims_dependency,
+    _entity_tag,
+    _flag_arg,
+    _json,
+    _not_modified,
+    _pagination_args,
+    _request_body,
+    _with_etag,
+)
+from src.infrastructure.http.auth import AuthClaims, AuthService, ScopeAuthorizer
+from src.infrastructure.http.helpers import (
+    _paginated_body,
+    _validate_batch,
+    _validate_payload,
+)
+from src.interface_adapters.gateways.purge_runner import PurgeRunner
+from src.interface_adapters.presenters.area_presenter import (
+    present as present_area,
+    present_many as present_areas,
+)
+from src.interface_adapters.presenters.plant_presenter import (
+    present as present_plant,
+    present_many as present_plants,
+)
+from src.interface_adapters.presenters.plant_tree_presenter import (
+    present as present_plant_tree,
+)
+from src.interface_adapters.presenters.purge_job_presenter import (
+    present as present_purge_job,
+)
+from src.interface_adapters.presenters.status_presenter import (
+    present as present_status,
+)
+from src.interface_adapters.schemas import (
+    AreaCreate,
+    PlantCreate,
+    PlantUpdate,
+    StatusChange,
+)
+from src.use_cases.change_status import ChangeStatusUseCase
+from src.use_cases.create_area import CreateAreaUseCase
+from src.use_cases.create_plant import CreatePlantUseCase
+from src.use_cases.delete_plant import DeletePlantUseCase
+from src.use_cases.get_plant import GetPlantUseCase
+from src.use_cases.get_plant_tree import GetPlantTreeUseCase
+from src.use_cases.get_subtree_revision import GetSubtreeRevisionUseCase
+from src.use_cases.list_plant_areas import ListPlantAreasUseCase
+from src.use_cases.list_plants import ListPlantsUseCase
+from src.use_cases.update_plant import UpdatePlantUseCase
+
+
+def build_plants_router(
+    list_plants_use_case: ListPlantsUseCase,
+    get_plant_use_case: GetPlantUseCase,
+    create_plant_use_case: CreatePlantUseCase,
+    update_plant_use_case: UpdatePlantUseCase,
+    delete_plant_use_case: DeletePlantUseCase,
+    purge_runner: PurgeRunner,
+    list_plant_areas_use_case: ListPlantAreasUseCase,
+    create_area_use_case: CreateAreaUseCase,
+    change_status_use_case: ChangeStatusUseCase,
+    get_plant_tree_use_case: GetPlantTreeUseCase,
+    get_subtree_revision_use_case: GetSubtreeRevisionUseCase,
+    auth_service: AuthService,
+    scope_authorizer: ScopeAuthorizer,
+) -> APIRouter:
+    """Crea un router específico para las rutas de plantas."""
+
+    router = APIRouter(prefix="/plantas")
+    require_claims = _claims_dependency(auth_service)
+
+    @router.get("")
+    def list_plants(request: Request, claims: AuthClaims = Depends(require_claims)):
+        pagination = _pagination_args(request)
+        versions = get_subtree_revision_use_case.for_all_plants()
+        etag = _entity_tag(request, claims, sorted(versions.items()))
+        cached = _not_modified(request, etag)
+        if cached is not None:
+            return cached
+
+        if pagination is None:
+            plants = list_plants_use_case.execute()
+            return _with_etag(_json(present_plants(plants)), etag)
+
+        limit, after = pagination
+        page = list_plants_use_case.execute_page(limit=limit, after=after)
+        body = _paginated_body(present_plants(page.items), page.next_after)
+        return _with_etag(_json(body), etag)
+
+    @router.post("")
+    def create_plant(
+        claims: AuthClaims = Depends(require_claims),
+        body: _Body = Depends(_request_body),
+    ):
+        scope_authorizer.ensure_superadmin(claims)
+
+        data = _validate_payload(body.json(), PlantCreate)
+        created = create_plant_use_case.execute(**data)
+        return _json(present_plant(created), 201)
+
+    @router.get("/{plant_id:int}")
+    def get_plant(
+        plant_id: int, request: Request, claims: AuthClaims = Depends(require_claims)
+    ):
+        etag = _entity_tag(
+            request, claims, get_subtree_revision_use_case.for_plant(plant_id)
+        )
+        cached = _not_modified(request, etag)
+        if cached is not None:
+            return cached
+
+        plant = get_plant_use_case.execute(plant_id)
+        if plant is None:
+            raise NotFound("Planta no encontrada")
+        return _with_etag(_json(present_plant(plant)), etag)
+
+    @router.api_route("/{plant_id:int}", methods=["PUT", "PATCH"])
+    def update_plant(
+        plant_id: int,
+        claims: AuthClaims = Depends(require_claims),
+        body: _Body = Depends(_request_body),
+    ):
+        scope_authorizer.ensure_superadmin(claims)
+
+        update_data = _validate_payload(body.json(), PlantUpdate)
+        updated = update_plant_use_case.execute(plant_id, **update_data)
+        if updated is None:
+            raise NotFound("Planta no encontrada")
+
+        return _json(present_plant(updated))
+
+    @router.delete("/{plant_id:int}")
+    def delete_plant(
+        plant_id: int, request: Request, claims: AuthClaims = Depends(require_claims)
+    ):
+        scope_authorizer.ensure_superadmin(claims)
+
+        if _flag_arg(request, "async"):
+            # Subárboles grandes: se ocultan ya y se purgan por lotes.
+            job = purge_runner.start(plant_id)
+            if job is None:
+                raise NotFound("Planta no encontrada")
+            response = _json(present_purge_job(job), 202)
+            response.headers["Location"] = str(
+                request.app.url_path_for("get_purge_job", job_id=job.id)
+            )
+            return response
+
+        deleted = delete_plant_use_case.execute(plant_id)
+        if not deleted:
+            raise NotFound("Planta no encontrada")
+        return Response(status_code=204)
+
+    @router.get("/{plant_id:int}/arbol")
+    def get_plant_tree(
+        plant_id: int, request: Request, claims: AuthClaims = Depends(require_claims)
+    ):
+        etag = _entity_tag(
+            request, claims, get_subtree_revision_use_case.for_plant(plant_id)
+        )
+        cached = _not_modified(request, etag)
+        if cached is not None:
+            return cached
+
+        tree = get_plant_tree_use_case.execute(plant_id)
+        if tree is None:
+            raise NotFound("Planta no encontrada")
+
+        scoped = scope_authorizer.filter_tree(claims, tree)
+        return _with_etag(_json(present_plant_tree(scoped)), etag)
+
+    @router.get("/{plant_id:int}/areas")
+    def list_plant_areas(
+        plant_id: int, request: Request, claims: AuthClaims = Depends(require_claims)
+    ):
+        pagination = _pagination_args(request)
+        etag = _entity_tag(
+            request, claims, get_subtree_revision_use_case.for_plant(plant_id)
+        )
+        cached = _not_modified(request, etag)
+        if cached is not None:
+            return cached
+
+        plant = get_plant_use_case.execute(plant_id)
+        if plant is None:
+            raise NotFound("Planta no encontrada")
+
+        if pagination is None:
+            areas = list_plant_areas_use_case.execute(plant_id)
+            scoped = scope_authorizer.filter_areas(claims, plant_id, areas)
+            return _with_etag(_json(present_areas(scoped)), etag)
+
+        limit, after = pagination
+        page = list_plant_areas_use_case.execute_page(
+            plant_id,
+            limit=limit,
+            after=after,
+            ids=scope_authorizer.area_ids_in_scope(claims),
+        )
+        body = _paginated_body(present_areas(page.items), page.next_after)
+        return _with_etag(_json(body), etag)
+
+    @router.post("/{plant_id:int}/areas")
+    def create_area(
+        plant_id: int,
+        claims: AuthClaims = Depends(require_claims),
+        body: _Body = Depends(_request_body),
+    ):
+        scope_authorizer.ensure_can_create_area(claims, plant_id)
+
+        data = _validate_payload(body.json(), AreaCreate)
+
+        plant = get_plant_use_case.execute(plant_id)
+        if plant is None:
+            raise NotFound("Planta no encontrada")
+
+        created = create_area_use_case.execute(plant_id, **data)
+        if created is None:
+            raise NotFound("No se pudo crear el área")
+
+        return _json(present_area(created), 201)
+
+    @router.post("/{plant_id:int}/areas:lote")
+    def create_area_batch(
+        plant_id: int,
+        claims: AuthClaims = Depends(require_claims),
+        body: _Body = Depends(_request_body),
+    ):
+        scope_authorizer.ensure_can_create_area(claims, plant_id)
+
+        items = _validate_batch(body.json(), AreaCreate)
+        created = create_area_use_case.execute_many(plant_id, items)
+        if created is None:
+            raise NotFound("Planta no encontrada")
+
+        return _json(present_areas(created), 201)
+
+    @router.put("/{plant_id:int}/estado")
+    def change_status(
+        plant_id: int,
+        request: Request,
+        claims: AuthClaims = Depends(require_claims),
+        body: _Body = Depends(_request_body),
+    ):
+        scope_authorizer.ensure_superadmin(claims)
+
+        data = _validate_payload(body.json(), StatusChange)
+        try:
+            result = change_status_use_case.for_plant(
+                plant_id, data["status"], cascade=_flag_arg(request, "cascada")
+            )
+        except ValueError as exc:
+            raise BadRequest(str(exc)) from exc
+        if result is None:
+            raise NotFound("Planta no encontrada")
+
+        return _json(present_status(result))
+
+    return router
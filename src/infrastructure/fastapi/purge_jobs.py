@@ -0,0 +1,35 @@
+"""Router con el estado de los borrados diferidos de plantas."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends
+from werkzeug.exceptions import NotFound
+
+from src.infrastructure.fastapi.helpers import _claims_dependency, _json
+from src.infrastructure.http.auth import AuthClaims, AuthService, ScopeAuthorizer
+from src.interface_adapters.presenters.purge_job_presenter import (
+    present as present_purge_job,
+)
+from src.use_cases.purge_plant import PurgePlantUseCase
+
+
+def build_purge_jobs_router(
+    purge_plant_use_case: PurgePlantUseCase,
+    auth_service: AuthService,
+    scope_authorizer: ScopeAuthorizer,
+) -> APIRouter:
+    """Crea un router específico para consultar borrados en curso."""
+
+    router = APIRouter(prefix="/borrados")
+    require_claims = _claims_dependency(auth_service)
+
+    @router.get("/{job_id:int}")
+    def get_purge_job(job_id: int, claims: AuthClaims = Depends(require_claims)):
+        scope_authorizer.ensure_superadmin(claims)
+
+        job = purge_plant_use_case.get(job_id)
+        if job is None:
+            raise NotFound("Borrado no encontrado")
+        return _json(present_purge_job(job))
+
+    return router
@@ -0,0 +1,214 @@
+"""Rutas HTTP basadas en FastAPI ubicadas en infraestructura."""
+
+from __future__ import annotations
+
+from typing import Callable
+
+from fastapi import APIRouter, Depends, Request
+
+from src.infrastructure.fastapi.areas import build_areas_router
+from src.infrastructure.fastapi.auth_routes import build_auth_router
+from src.infrastructure.fastapi.changes import build_changes_router
+from src.infrastructure.fastapi.equipment import build_equipment_router
+from src.infrastructure.fastapi.events import build_events_router
+from src.infrastructure.fastapi.export import build_export_router
+from src.infrastructure.fastapi.inventory_import import build_import_router
+from src.infrastructure.fastapi.plants import build_plants_router
+from src.infrastructure.fastapi.purge_jobs import build_purge_jobs_router
+from src.infrastructure.fastapi.systems import build_systems_router
+from src.infrastructure.http.auth import AuthService, ScopeAuthorizer
+from src.interface_adapters.gateways.change_broadcaster import ChangeBroadcaster
+from src.interface_adapters.gateways.purge_runner import PurgeRunner
+from src.use_cases.change_status import ChangeStatusUseCase
+from src.use_cases.create_area import CreateAreaUseCase
+from src.use_cases.create_equipment import CreateEquipmentUseCase
+from src.use_cases.create_plant import CreatePlantUseCase
+from src.use_cases.create_system import CreateSystemUseCase
+from src.use_cases.delete_area import DeleteAreaUseCase
+from src.use_cases.delete_equipment import DeleteEquipmentUseCase
+from src.use_cases.delete_plant import DeletePlantUseCase
+from src.use_cases.delete_system import DeleteSystemUseCase
+from src.use_cases.export_inventory import ExportInventoryUseCase
+from src.use_cases.get_area import GetAreaUseCase
+from src.use_cases.get_equipment import GetEquipmentUseCase
+from src.use_cases.get_plant import GetPlantUseCase
+from src.use_cases.get_plant_tree import GetPlantTreeUseCase
+from src.use_cases.get_subtree_revision import GetSubtreeRevisionUseCase
+from src.use_cases.list_area_equipment import ListAreaEquipmentUseCase
+from src.use_cases.list_changes import ListChangesUseCase
+from src.use_cases.list_equipment_systems import ListEquipmentSystemsUseCase
+from src.use_cases.list_plant_areas import ListPlantAreasUseCase
+from src.use_cases.list_plants import ListPlantsUseCase
+from src.use_cases.get_system import GetSystemUseCase
+from src.use_cases.import_inventory import ImportInventoryUseCase
+from src.use_cases.purge_plant import PurgePlantUseCase
+from src.use_cases.ports.change_log import ChangeLogRepository
+from src.use_cases.ports.inventory import (
+    InventoryImportRepository,
+    InventoryRepository,
+)
+from src.use_cases.ports.plant_repository import PlantDataRepository
+from src.use_cases.ports.unit_of_work import UnitOfWork
+from src.use_cases.update_area import UpdateAreaUseCase
+from src.use_cases.update_equipment import UpdateEquipmentUseCase
+from src.use_cases.update_plant import UpdatePlantUseCase
+from src.use_cases.update_system import UpdateSystemUseCase
+
+
+
+
+def build_router(
+    repository: PlantDataRepository,
+    uow_factory: Callable[[], UnitOfWork],
+    *,
+    auth_service: AuthService | None = None,
+    scope_authorizer: ScopeAuthorizer | None = None,
+    change_log: ChangeLogRepository | None = None,
+    change_broadcaster: ChangeBroadcaster | None = None,
+    event_heartbeat_seconds: float = 15.0,
+    inventory: InventoryRepository | None = None,
+    inventory_import: InventoryImportRepository | None = None,
+    purge_runner: PurgeRunner | None = None,
+) -> APIRouter:
+    """Construye el router de FastAPI con las rutas de la API.
+
+    Recibe los mismos puertos que `build_blueprint` en Flask y arma los mismos
+    casos de uso; sólo cambia la capa HTTP.
+    """
+    list_plants_use_case = ListPlantsUseCase(repository)
+    get_plant_use_case = GetPlantUseCase(repository)
+    create_plant_use_case = CreatePlantUseCase(repository, uow_factory)
+    update_plant_use_case = UpdatePlantUseCase(repository, uow_factory)
+    delete_plant_use_case = DeletePlantUseCase(repository, uow_factory)
+    purge_plant_use_case = PurgePlantUseCase(repository, uow_factory)
+    purge_runner = purge_runner or PurgeRunner(purge_plant_use_case)
+    list_plant_areas_use_case = ListPlantAreasUseCase(repository)
+    create_area_use_case = CreateAreaUseCase(repository, uow_factory)
+    get_plant_tree_use_case = GetPlantTreeUseCase(repository)
+    get_subtree_revision_use_case = GetSubtreeRevisionUseCase(repository)
+    change_status_use_case = ChangeStatusUseCase(repository, uow_factory)
+
+    get_area_use_case = GetAreaUseCase(repository)
+    update_area_use_case = UpdateAreaUseCase(repository, uow_factory)
+    delete_area_use_case = DeleteAreaUseCase(repository, uow_factory)
+    list_area_equipment_use_case = ListAreaEquipmentUseCase(repository)
+    create_equipment_use_case = CreateEquipmentUseCase(repository, uow_factory)
+
+    get_equipment_use_case = GetEquipmentUseCase(repository)
+    update_equipment_use_case = UpdateEquipmentUseCase(repository, uow_factory)
+    delete_equipment_use_case = DeleteEquipmentUseCase(repository, uow_factory)
+    list_equipment_systems_use_case = ListEquipmentSystemsUseCase(repository)
+    create_system_use_case = CreateSystemUseCase(repository, uow_factory)
+
+    get_system_use_case = GetSystemUseCase(repository)
+    update_system_use_case = UpdateSystemUseCase(repository, uow_factory)
+    delete_system_use_case = DeleteSystemUseCase(repository, uow_factory)
+
+    auth_service = auth_service or AuthService()
+    scope = scope_authorizer or ScopeAuthorizer(
+        get_area=get_area_use_case.execute,
+        get_equipment=get_equipment_use_case.execute,
+        get_system=get_system_use_case.execute,
+        get_areas=get_area_use_case.execute_many,
+        get_equipment_many=get_equipment_use_case.execute_many,
+    )
+
+    routers = [
+        build_plants_router(
+            list_plants_use_case,
+            get_plant_use_case,
+            create_plant_use_case,
+            update_plant_use_case,
+            delete_plant_use_case,
+            purge_runner,
+            list_plant_areas_use_case,
+            create_area_use_case,
+            change_status_use_case,
+            get_plant_tree_use_case,
+            get_subtree_revision_use_case,
+            auth_service,
+            scope,
+        ),
+        build_areas_router(
+            get_area_use_case,
+            update_area_use_case,
+            delete_area_use_case,
+            list_area_equipment_use_case,
+            create_equipment_use_case,
+            change_status_use_case,
+            get_subtree_revision_use_case,
+            auth_service,
+            scope,
+        ),
+        build_equipment_router(
+            get_equipment_use_case,
+            update_equipment_use_case,
+            delete_equipment_use_case,
+            list_equipment_systems_use_case,
+            create_system_use_case,
+            change_status_use_case,
+            get_subtree_revision_use_case,
+            auth_service,
+            scope,
+        ),
+        build_systems_router(
+            get_system_use_case,
+            update_system_use_case,
+            delete_system_use_case,
+            auth_service,
+            scope,
+        ),
+        build_purge_jobs_router(purge_plant_use_case, auth_service, scope),
+        build_auth_router(auth_service),
+    ]
+
+    if inventory is None and isinstance(repository, InventoryRepository):
+        inventory = repository
+    if inventory is not None:
+        routers.append(
+            build_export_router(ExportInventoryUseCase(inventory), auth_service, scope)
+        )
+
+    if inventory_import is None and isinstance(repository, InventoryImportRepository):
+        inventory_import = repository
+    if inventory_import is not None:
+        routers.append(
+            build_import_router(
+                ImportInventoryUseCase(inventory_import, uow_factory),
+                auth_service,
+                scope,
+            )
+        )
+
+    dependencies = []
+    if change_log is None and isinstance(repository, ChangeLogRepository):
+        change_log = repository
+    if change_log is not None:
+        list_changes_use_case = ListChangesUseCase(change_log)
+        broadcaster = change_broadcaster or ChangeBroadcaster(change_log)
+        routers.append(
+            build_changes_router(list_changes_use_case, auth_service, scope)
+        )
+        routers.append(
+            build_events_router(
+                broadcaster,
+                list_changes_use_case,
+                auth_service,
+                scope,
+                heartbeat_seconds=event_heartbeat_seconds,
+            )
+        )
+
+        def wake_event_stream(request: Request):
+            # Las escrituras ya quedaron en change_log; se adelanta la lectura.
+            # Un error en la ruta se propaga en el `yield` y no despierta.
+            yield
+            if request.method not in {"GET", "HEAD", "OPTIONS"}:
+                broadcaster.wake()
+
+        dependencies.append(Depends(wake_event_stream))
+
+    api_router = APIRouter(prefix="/api")
+    for router in routers:
+        api_router.include_router(router, dependencies=dependencies)
+    return api_router
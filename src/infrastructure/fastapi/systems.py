@@ -0,0 +1,60 @@
+"""Router con rutas relacionadas a sistemas."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import Response
+from werkzeug.exceptions import NotFound
+
+from src.infrastructure.fastapi.helpers import (
+    _Body,
+    _claims_dependency,
+    _json,
+    _request_body,
+)
+from src.infrastructure.http.auth import AuthClaims, AuthService, ScopeAuthorizer
+from src.infrastructure.http.helpers import _validate_payload
+from src.interface_adapters.presenters.system_presenter import present as present_system
+from src.interface_adapters.schemas import SystemUpdate
+from src.use_cases.delete_system import DeleteSystemUseCase
+from src.use_cases.get_system import GetSystemUseCase
+from src.use_cases.update_system import UpdateSystemUseCase
+
+
+def build_systems_router(
+    get_system_use_case: GetSystemUseCase,
+    update_system_use_case: UpdateSystemUseCase,
+    delete_system_use_case: DeleteSystemUseCase,
+    auth_service: AuthService,
+    scope_authorizer: ScopeAuthorizer,
+) -> APIRouter:
+    """Crea un router específico para las rutas de sistemas."""
+
+    router = APIRouter(prefix="/sistemas")
+    require_claims = _claims_dependency(auth_service)
+
+    @router.api_route("/{system_id:int}", methods=["PUT", "PATCH"])
+    def update_system(
+        system_id: int,
+        claims: AuthClaims = Depends(require_claims),
+        body: _Body = Depends(_request_body),
+    ):
+        system = scope_authorizer.ensure_can_manage_system(claims, system_id)
+
+        update_data = _validate_payload(body.json(), SystemUpdate)
+        updated = update_system_use_case.execute(system.id, **update_data)
+        if updated is None:
+            raise NotFound("Sistema no encontrado")
+
+        return _json(present_system(updated))
+
+    @router.delete("/{system_id:int}")
+    def delete_system(system_id: int, claims: AuthClaims = Depends(require_claims)):
+        system = scope_authorizer.ensure_can_manage_system(claims, system_id)
+
+        deleted = delete_system_use_case.execute(system.id)
+        if not deleted:
+            raise NotFound("Sistema no encontrado")
+        return Response(status_code=204)
+
+    return router
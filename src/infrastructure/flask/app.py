@@ -11,8 +11,10 @@ from flask_jwt_extended import JWTManager
 from flask_injector import FlaskInjector
 from injector import Binder, singleton
 from werkzeug.exceptions import HTTPException
+from werkzeug.middleware.proxy_fix import ProxyFix
 
-from src.infrastructure.flask.auth import AuthService, mask_authorization_header
+from src.infrastructure.http.auth import AuthService, mask_authorization_header
+from src.infrastructure.flask.db_session import RequestSessionScope
 from src.infrastructure.flask.routes import build_blueprint
 from src.infrastructure.flask.error_handlers import (
     handle_http_exception,
@@ -20,18 +22,36 @@ from src.infrastructure.flask.error_handlers import (
 )
 from src.infrastructure.sqlalchemy import (
     SqlAlchemyPlantRepository,
+    SqlAlchemyRefreshTokenStore,
     SqlAlchemyUnitOfWork,
     SqlAlchemyUserRepository,
 )
-from src.infrastructure.sqlalchemy.config import load_db_config
+from src.infrastructure.sqlalchemy.change_watcher import PlantVersionWatcher
+from src.infrastructure.sqlalchemy.config import DBConfig, load_db_config
 from src.infrastructure.sqlalchemy.session import (
+    ReplicaSet,
     SessionFactory,
     build_session_factory,
     create_engine_from_config,
+    create_replica_engines,
+    run_after_commit,
+)
+from src.interface_adapters.gateways.caching_plant_repository import (
+    CachingPlantRepository,
+)
+from src.interface_adapters.gateways.change_broadcaster import ChangeBroadcaster
+from src.interface_adapters.gateways.purge_runner import PurgeRunner
+from src.shared.config import (
+    get_cors_origins,
+    get_env,
+    get_event_stream_config,
+    get_plant_cache_config,
+    get_purge_config,
+    get_trusted_proxy_hops,
 )
-from src.shared.config import get_cors_origins, get_env
 from src.shared.logger import get_logger
 from src.use_cases.ports.plant_repository import PlantDataRepository
+from src.use_cases.purge_plant import PurgePlantUseCase
 
 UnitOfWorkFactory = Callable[[], SqlAlchemyUnitOfWork]
 from src.use_cases.ports.plant_repository import PlantDataRepository
@@ -39,31 +59,103 @@ from src.use_cases.ports.plant_repository import PlantDataRepository
 logger = get_logger("flask-app")
 
 
-def create_app() -> Flask:
-    "Bootstrap Flask application with shared repository and routes."
+def create_app(db_config: DBConfig | None = None) -> Flask:
+    """Bootstrap Flask application with shared repository and routes.
+
+    `db_config` defaults to `load_db_config()`; the production launcher passes
+    one with the pool sized for each worker.
+
+    The module has no import-time side effects: entry points (`run.py`,
+    `serve.py`, the WSGI file) call this factory. Engines connect lazily, on
+    the first checkout; the only query at startup, the scan for unfinished
+    purge jobs, runs on the purge thread and never blocks the factory.
+    """
     flask_app = Flask(__name__)
     cors_origins = get_cors_origins()
 
-    try:
-        config = load_db_config()
-    except RuntimeError as exc:
-        logger.error(
-            "No se pudo cargar la configuración de base de datos (revisa .env y variables DB_*).",
-            exc_info=exc,
-        )
-        raise
+    config = db_config
+    if config is None:
+        try:
+            config = load_db_config()
+        except RuntimeError as exc:
+            logger.error(
+                "No se pudo cargar la configuración de base de datos (revisa .env y variables DB_*).",
+                exc_info=exc,
+            )
+            raise
 
     engine = create_engine_from_config(config)
-    session_factory: SessionFactory = build_session_factory(engine)
-    repository = SqlAlchemyPlantRepository(session_factory)
-    user_repository = SqlAlchemyUserRepository(session_factory)
+    replica_engines = create_replica_engines(config)
+    replicas = None
+    if replica_engines:
+        replicas = ReplicaSet(
+            replica_engines, check_interval_seconds=config.replica_check_seconds
+        )
+    # Para que quien sirve la app pueda liberar los pools al apagar.
+    flask_app.extensions["sqlalchemy_engines"] = [engine, *replica_engines]
+    session_factory: SessionFactory = build_session_factory(engine, replicas=replicas)
+    request_sessions = RequestSessionScope(session_factory)
+    request_sessions.init_app(flask_app)
+    sql_repository = SqlAlchemyPlantRepository(
+        session_factory, current_session=request_sessions.current
+    )
+    repository: PlantDataRepository = sql_repository
+    cache_config = get_plant_cache_config()
+    if cache_config["enabled"]:
+        caching_repository = CachingPlantRepository(
+            repository,
+            max_entries=cache_config["max_entries"],
+            ttl_seconds=cache_config["ttl_seconds"],
+            after_commit=run_after_commit,
+        )
+        repository = caching_repository
+        version_watcher = PlantVersionWatcher(
+            session_factory, min_interval_seconds=cache_config["poll_seconds"]
+        )
+
+        @flask_app.before_request
+        def drop_remote_changes():
+            changed = version_watcher.poll()
+            if changed:
+                logger.debug("Plantas modificadas por otro worker: %s", sorted(changed))
+                caching_repository.invalidate_plants(changed)
+    user_repository = SqlAlchemyUserRepository(
+        session_factory, current_session=request_sessions.current
+    )
 
     def make_uow() -> SqlAlchemyUnitOfWork:
-        return SqlAlchemyUnitOfWork(session_factory)
+        return SqlAlchemyUnitOfWork(
+            session_factory, current_session=request_sessions.current
+        )
 
     uow_factory = make_uow
 
-    auth_service = AuthService(user_repository=user_repository)
+    auth_service = AuthService(
+        user_repository=user_repository,
+        refresh_store=SqlAlchemyRefreshTokenStore(
+            session_factory, current_session=request_sessions.current
+        ),
+    )
+    events_config = get_event_stream_config()
+    change_broadcaster = ChangeBroadcaster(
+        sql_repository,
+        poll_seconds=events_config["poll_seconds"],
+        queue_size=events_config["queue_size"],
+        max_subscribers=events_config["max_clients"],
+    )
+
+    purge_config = get_purge_config()
+    purge_runner = PurgeRunner(
+        PurgePlantUseCase(
+            repository,
+            uow_factory,
+            batch_size=purge_config["batch_size"],
+            pause_seconds=purge_config["pause_seconds"],
+        )
+    )
+    # Retoma en segundo plano los borrados que un reinicio o un lote fallido
+    # dejaron a medias; las plantas ocultas no quedan así para siempre.
+    purge_runner.resume()
 
     flask_app.config["JWT_SECRET_KEY"] = auth_service.secret_key
     flask_app.config["JWT_ACCESS_TOKEN_EXPIRES"] = timedelta(
@@ -72,10 +164,27 @@ def create_app() -> Flask:
     JWTManager(flask_app)
 
     flask_app.register_blueprint(
-        build_blueprint(repository, uow_factory, auth_service=auth_service)
+        build_blueprint(
+            repository,
+            uow_factory,
+            auth_service=auth_service,
+            change_log=sql_repository,
+            change_broadcaster=change_broadcaster,
+            event_heartbeat_seconds=events_config["heartbeat_seconds"],
+            inventory=sql_repository,
+            inventory_import=repository,
+            purge_runner=purge_runner,
+        )
     )
     flask_app.register_error_handler(HTTPException, handle_http_exception)
     flask_app.register_error_handler(Exception, handle_unexpected_exception)
+    proxy_hops = get_trusted_proxy_hops()
+    if proxy_hops:
+        # El throttle de login cuenta por IP: `remote_addr` debe ser la del
+        # cliente, no la del proxy.
+        flask_app.wsgi_app = ProxyFix(
+            flask_app.wsgi_app, x_for=proxy_hops, x_proto=proxy_hops
+        )
 
     @flask_app.before_request
     def log_request_context():
@@ -142,5 +251,3 @@ def create_app() -> Flask:
 
     return flask_app
 
-
-app = create_app()
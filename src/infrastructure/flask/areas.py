@@ -5,17 +5,39 @@ from __future__ import annotations
 from flask import Blueprint, jsonify, request
 from werkzeug.exceptions import BadRequest, NotFound
 
-from src.infrastructure.flask.auth import AuthService, ScopeAuthorizer
-from src.infrastructure.flask.helpers import _require_json, _validate_payload
+from src.infrastructure.flask.helpers import (
+    _entity_tag,
+    _flag_arg,
+    _not_modified,
+    _pagination_args,
+    _require_json,
+    _with_etag,
+)
+from src.infrastructure.http.auth import AuthService, ScopeAuthorizer
+from src.infrastructure.http.helpers import (
+    _paginated_body,
+    _validate_batch,
+    _validate_payload,
+)
 from src.interface_adapters.presenters.area_presenter import present as present_area
 from src.interface_adapters.presenters.equipment_presenter import (
     present as present_equipment,
     present_many as present_equipment_list,
 )
-from src.interface_adapters.schemas import AreaCreate, AreaUpdate, EquipmentCreate
+from src.interface_adapters.presenters.status_presenter import (
+    present as present_status,
+)
+from src.interface_adapters.schemas import (
+    AreaCreate,
+    AreaUpdate,
+    EquipmentCreate,
+    StatusChange,
+)
 from src.use_cases.create_equipment import CreateEquipmentUseCase
+from src.use_cases.change_status import ChangeStatusUseCase
 from src.use_cases.delete_area import DeleteAreaUseCase
 from src.use_cases.get_area import GetAreaUseCase
+from src.use_cases.get_subtree_revision import GetSubtreeRevisionUseCase
 from src.use_cases.list_area_equipment import ListAreaEquipmentUseCase
 from src.use_cases.update_area import UpdateAreaUseCase
 
@@ -26,6 +48,8 @@ def build_areas_blueprint(
     delete_area_use_case: DeleteAreaUseCase,
     list_area_equipment_use_case: ListAreaEquipmentUseCase,
     create_equipment_use_case: CreateEquipmentUseCase,
+    change_status_use_case: ChangeStatusUseCase,
+    get_subtree_revision_use_case: GetSubtreeRevisionUseCase,
     auth_service: AuthService,
     scope_authorizer: ScopeAuthorizer,
 ) -> Blueprint:
@@ -33,7 +57,7 @@ def build_areas_blueprint(
 
     areas_bp = Blueprint("areas", __name__, url_prefix="/areas")
 
-    @areas_bp.put("/<int:area_id>")
+    @areas_bp.route("/<int:area_id>", methods=["PUT", "PATCH"])
     def update_area(area_id: int):
         claims = auth_service.require_claims(request)
         area = scope_authorizer.ensure_can_manage_area(claims, area_id)
@@ -59,13 +83,30 @@ def build_areas_blueprint(
     @areas_bp.get("/<int:area_id>/equipos")
     def list_area_equipment(area_id: int):
         claims = auth_service.require_claims(request)
-        area = get_area_use_case.execute(area_id)
-        if area is None:
+        pagination = _pagination_args()
+        revision = get_subtree_revision_use_case.for_area(area_id)
+        if revision is None:
             raise NotFound("Área no encontrada")
 
-        equipment = list_area_equipment_use_case.execute(area_id)
-        scoped = scope_authorizer.filter_equipment(claims, area_id, equipment)
-        return jsonify(present_equipment_list(scoped))
+        etag = _entity_tag(claims, revision)
+        cached = _not_modified(etag)
+        if cached is not None:
+            return cached
+
+        if pagination is None:
+            equipment = list_area_equipment_use_case.execute(area_id)
+            scoped = scope_authorizer.filter_equipment(claims, area_id, equipment)
+            return _with_etag(jsonify(present_equipment_list(scoped)), etag)
+
+        limit, after = pagination
+        page = list_area_equipment_use_case.execute_page(
+            area_id,
+            limit=limit,
+            after=after,
+            ids=scope_authorizer.equipment_ids_in_scope(claims, area_id),
+        )
+        body = _paginated_body(present_equipment_list(page.items), page.next_after)
+        return _with_etag(jsonify(body), etag)
 
     @areas_bp.post("/<int:area_id>/equipos")
     def create_equipment(area_id: int):
@@ -85,4 +126,33 @@ def build_areas_blueprint(
 
         return jsonify(present_equipment(created)), 201
 
+    @areas_bp.post("/<int:area_id>/equipos:lote")
+    def create_equipment_batch(area_id: int):
+        claims = auth_service.require_claims(request)
+        scope_authorizer.ensure_can_create_equipment(claims, area_id)
+
+        items = _validate_batch(_require_json(), EquipmentCreate)
+        created = create_equipment_use_case.execute_many(area_id, items)
+        if created is None:
+            raise NotFound("Área no encontrada")
+
+        return jsonify(present_equipment_list(created)), 201
+
+    @areas_bp.put("/<int:area_id>/estado")
+    def change_status(area_id: int):
+        claims = auth_service.require_claims(request)
+        scope_authorizer.ensure_can_manage_area(claims, area_id)
+
+        data = _validate_payload(_require_json(), StatusChange)
+        try:
+            result = change_status_use_case.for_area(
+                area_id, data["status"], cascade=_flag_arg("cascada")
+            )
+        except ValueError as exc:
+            raise BadRequest(str(exc)) from exc
+        if result is None:
+            raise NotFound("Área no encontrada")
+
+        return jsonify(present_status(result))
+
     return areas_bp
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, request
 
-from src.infrastructure.flask.auth import AuthService
-from src.infrastructure.flask.helpers import _require_json, _validate_payload
-from src.interface_adapters.schemas import LoginRequest
+from src.infrastructure.flask.helpers import _require_json
+from src.infrastructure.http.auth import AuthService
+from src.infrastructure.http.helpers import _session_payload, _validate_payload
+from src.interface_adapters.schemas import LoginRequest, RefreshRequest
 
 
 def build_auth_blueprint(auth_service: AuthService) -> Blueprint:
@@ -17,19 +18,28 @@ def build_auth_blueprint(auth_service: AuthService) -> Blueprint:
         payload = _require_json()
         data = _validate_payload(payload, LoginRequest)
 
-        token = auth_service.issue_token(data["username"], data["password"])
+        session = auth_service.login(
+            data["username"], data["password"], client_ip=request.remote_addr
+        )
 
-        claims = auth_service.decode_token(token)
+        claims = session.claims
         return jsonify(
             {
-                "token": token,
+                **_session_payload(session),
                 "user": {
                     "username": claims.username,
                     "role": claims.role,
-                    "areas": claims.areas,
-                    "equipos": claims.equipos,
+                    "areas": sorted(claims.areas),
+                    "equipos": sorted(claims.equipos),
                 },
             }
         )
 
+    @auth_bp.post("/refresh")
+    def refresh():
+        payload = _require_json()
+        data = _validate_payload(payload, RefreshRequest)
+
+        return jsonify(_session_payload(auth_service.refresh(data["refresh_token"])))
+
     return auth_bp
@@ -0,0 +1,50 @@
+"""Blueprint con el feed incremental de cambios de la jerarquía."""
+
+from __future__ import annotations
+
+from flask import Blueprint, jsonify, request
+from werkzeug.exceptions import Gone
+
+from src.infrastructure.flask.helpers import _limit_arg
+from src.infrastructure.http.auth import AuthService, ScopeAuthorizer
+from src.infrastructure.http.helpers import _decode_cursor, _encode_cursor
+from src.interface_adapters.presenters.change_presenter import (
+    present_many as present_changes,
+)
+from src.use_cases.list_changes import ListChangesUseCase
+
+
+def build_changes_blueprint(
+    list_changes_use_case: ListChangesUseCase,
+    auth_service: AuthService,
+    scope_authorizer: ScopeAuthorizer,
+) -> Blueprint:
+    """Crea un blueprint específico para el feed de cambios."""
+
+    changes_bp = Blueprint("changes", __name__, url_prefix="/cambios")
+
+    @changes_bp.get("")
+    def list_changes():
+        claims = auth_service.require_claims(request)
+        limit = _limit_arg()
+        cursor = request.args.get("desde")
+        if not cursor:
+            current = list_changes_use_case.current_cursor()
+            return jsonify(
+                {"items": [], "siguiente": _encode_cursor(current or 0), "hayMas": False}
+            )
+
+        feed = list_changes_use_case.execute(after=_decode_cursor(cursor), limit=limit)
+        if feed is None:
+            raise Gone("El cursor ya fue compactado; recarga la jerarquía completa")
+
+        scoped = scope_authorizer.filter_changes(claims, feed.items)
+        return jsonify(
+            {
+                "items": present_changes(scoped),
+                "siguiente": _encode_cursor(feed.cursor),
+                "hayMas": feed.has_more,
+            }
+        )
+
+    return changes_bp
@@ -0,0 +1,50 @@
+"""Sesión SQLAlchemy compartida durante una petición HTTP de Flask."""
+
+from __future__ import annotations
+
+from flask import Flask, g, has_app_context
+from sqlalchemy.orm import Session
+
+from src.infrastructure.sqlalchemy.session import SessionFactory
+
+_G_KEY = "_db_session"
+
+
+class RequestSessionScope:
+    """Entrega una única sesión (y mapa de identidad) por contexto de Flask.
+
+    Los repositorios y unidades de trabajo la reciben como `current_session`,
+    de modo que el autorizador, las lecturas y la escritura de una misma
+    petición reutilizan una sola conexión del pool. Fuera de un contexto de
+    aplicación devuelve `None` y cada operación abre su propia sesión.
+    """
+
+    def __init__(self, session_factory: SessionFactory) -> None:
+        self._session_factory = session_factory
+
+    def init_app(self, app: Flask) -> None:
+        app.teardown_appcontext(self._teardown)
+
+    def current(self) -> Session | None:
+        if not has_app_context():
+            return None
+
+        session = g.get(_G_KEY)
+        if session is None:
+            session = self._session_factory()
+            setattr(g, _G_KEY, session)
+        return session
+
+    @staticmethod
+    def _teardown(exc: BaseException | None) -> None:
+        session: Session | None = g.pop(_G_KEY, None)
+        if session is None:
+            return
+        try:
+            if exc is not None:
+                session.rollback()
+        finally:
+            session.close()
+
+
+__all__ = ["RequestSessionScope"]
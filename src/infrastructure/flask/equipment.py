@@ -5,8 +5,20 @@ from __future__ import annotations
 from flask import Blueprint, jsonify, request
 from werkzeug.exceptions import BadRequest, NotFound
 
-from src.infrastructure.flask.auth import AuthService, ScopeAuthorizer
-from src.infrastructure.flask.helpers import _require_json, _validate_payload
+from src.infrastructure.flask.helpers import (
+    _entity_tag,
+    _flag_arg,
+    _not_modified,
+    _pagination_args,
+    _require_json,
+    _with_etag,
+)
+from src.infrastructure.http.auth import AuthService, ScopeAuthorizer
+from src.infrastructure.http.helpers import (
+    _paginated_body,
+    _validate_batch,
+    _validate_payload,
+)
 from src.interface_adapters.presenters.equipment_presenter import (
     present as present_equipment,
 )
@@ -14,10 +26,19 @@ from src.interface_adapters.presenters.system_presenter import (
     present as present_system,
     present_many as present_systems,
 )
-from src.interface_adapters.schemas import EquipmentUpdate, SystemCreate
+from src.interface_adapters.presenters.status_presenter import (
+    present as present_status,
+)
+from src.interface_adapters.schemas import (
+    EquipmentUpdate,
+    SystemCreate,
+    StatusChange,
+)
 from src.use_cases.create_system import CreateSystemUseCase
+from src.use_cases.change_status import ChangeStatusUseCase
 from src.use_cases.delete_equipment import DeleteEquipmentUseCase
 from src.use_cases.get_equipment import GetEquipmentUseCase
+from src.use_cases.get_subtree_revision import GetSubtreeRevisionUseCase
 from src.use_cases.list_equipment_systems import ListEquipmentSystemsUseCase
 from src.use_cases.update_equipment import UpdateEquipmentUseCase
 
@@ -28,6 +49,8 @@ def build_equipment_blueprint(
     delete_equipment_use_case: DeleteEquipmentUseCase,
     list_equipment_systems_use_case: ListEquipmentSystemsUseCase,
     create_system_use_case: CreateSystemUseCase,
+    change_status_use_case: ChangeStatusUseCase,
+    get_subtree_revision_use_case: GetSubtreeRevisionUseCase,
     auth_service: AuthService,
     scope_authorizer: ScopeAuthorizer,
 ) -> Blueprint:
@@ -35,7 +58,7 @@ def build_equipment_blueprint(
 
     equipment_bp = Blueprint("equipment", __name__, url_prefix="/equipos")
 
-    @equipment_bp.put("/<int:equipment_id>")
+    @equipment_bp.route("/<int:equipment_id>", methods=["PUT", "PATCH"])
     def update_equipment(equipment_id: int):
         claims = auth_service.require_claims(request)
         equipment = scope_authorizer.ensure_can_manage_equipment(claims, equipment_id)
@@ -62,13 +85,30 @@ def build_equipment_blueprint(
     @equipment_bp.get("/<int:equipment_id>/sistemas")
     def list_equipment_systems(equipment_id: int):
         claims = auth_service.require_claims(request)
-        equipment = get_equipment_use_case.execute(equipment_id)
-        if equipment is None:
+        pagination = _pagination_args()
+        revision = get_subtree_revision_use_case.for_equipment(equipment_id)
+        if revision is None:
             raise NotFound("Equipo no encontrado")
 
-        systems = list_equipment_systems_use_case.execute(equipment_id)
-        scoped = scope_authorizer.filter_systems(claims, equipment_id, systems)
-        return jsonify(present_systems(scoped))
+        etag = _entity_tag(claims, revision)
+        cached = _not_modified(etag)
+        if cached is not None:
+            return cached
+
+        if pagination is None:
+            systems = list_equipment_systems_use_case.execute(equipment_id)
+            scoped = scope_authorizer.filter_systems(claims, equipment_id, systems)
+            return _with_etag(jsonify(present_systems(scoped)), etag)
+
+        if not scope_authorizer.can_list_systems(claims, equipment_id):
+            return _with_etag(jsonify(_paginated_body([], None)), etag)
+
+        limit, after = pagination
+        page = list_equipment_systems_use_case.execute_page(
+            equipment_id, limit=limit, after=after
+        )
+        body = _paginated_body(present_systems(page.items), page.next_after)
+        return _with_etag(jsonify(body), etag)
 
     @equipment_bp.post("/<int:equipment_id>/sistemas")
     def create_system(equipment_id: int):
@@ -88,4 +128,33 @@ def build_equipment_blueprint(
 
         return jsonify(present_system(created)), 201
 
+    @equipment_bp.post("/<int:equipment_id>/sistemas:lote")
+    def create_system_batch(equipment_id: int):
+        claims = auth_service.require_claims(request)
+        scope_authorizer.ensure_can_create_system(claims, equipment_id)
+
+        items = _validate_batch(_require_json(), SystemCreate)
+        created = create_system_use_case.execute_many(equipment_id, items)
+        if created is None:
+            raise NotFound("Equipo no encontrado")
+
+        return jsonify(present_systems(created)), 201
+
+    @equipment_bp.put("/<int:equipment_id>/estado")
+    def change_status(equipment_id: int):
+        claims = auth_service.require_claims(request)
+        scope_authorizer.ensure_can_manage_equipment(claims, equipment_id)
+
+        data = _validate_payload(_require_json(), StatusChange)
+        try:
+            result = change_status_use_case.for_equipment(
+                equipment_id, data["status"], cascade=_flag_arg("cascada")
+            )
+        except ValueError as exc:
+            raise BadRequest(str(exc)) from exc
+        if result is None:
+            raise NotFound("Equipo no encontrado")
+
+        return jsonify(present_status(result))
+
     return equipment_bp
@@ -5,24 +5,20 @@ from __future__ import annotations
 from flask import current_app, jsonify
 from werkzeug.exceptions import HTTPException
 
+from src.infrastructure.http.errors import (
+    FALLBACK_MESSAGES,
+    error_message,
+    response_headers,
+)
+
 
 def handle_http_exception(error: HTTPException):
-    fallback_messages = {
-        400: "Solicitud inválida",
-        401: "No autorizado",
-        403: "Prohibido",
-        404: "Recurso no encontrado",
-        405: "Método no permitido",
-    }
-
-    description = (
-        error.description
-        or fallback_messages.get(error.code or 0)
-        or getattr(error, "name", None)
-        or "Error HTTP"
-    )
     status_code = error.code or 500
-    return jsonify({"message": description}), status_code
+    return (
+        jsonify({"message": error_message(error)}),
+        status_code,
+        response_headers(error),
+    )
 
 
 def handle_unexpected_exception(error: Exception):
@@ -30,4 +26,9 @@ def handle_unexpected_exception(error: Exception):
     return jsonify({"message": "Error interno del servidor"}), 500
 
 
-__all__ = ["handle_http_exception", "handle_unexpected_exception"]
+__all__ = [
+    "FALLBACK_MESSAGES",
+    "handle_http_exception",
+    "response_headers",
+    "handle_unexpected_exception",
+]
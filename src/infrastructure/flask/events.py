@@ -0,0 +1,94 @@
+"""Blueprint con el stream de eventos (Server-Sent Events) de la jerarquía."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+from flask import Blueprint, Response, request
+from werkzeug.exceptions import ServiceUnavailable
+
+from src.infrastructure.flask.server import DETACH_ENVIRON_KEY
+from src.infrastructure.http.auth import AuthService, ScopeAuthorizer
+from src.infrastructure.http.events import RETRY_MILLISECONDS, _format_events, _replay
+from src.infrastructure.http.helpers import _decode_cursor
+from src.interface_adapters.gateways.change_broadcaster import ChangeBroadcaster
+from src.use_cases.list_changes import ListChangesUseCase
+
+
+def build_events_blueprint(
+    broadcaster: ChangeBroadcaster,
+    list_changes_use_case: ListChangesUseCase,
+    auth_service: AuthService,
+    scope_authorizer: ScopeAuthorizer,
+    *,
+    heartbeat_seconds: float = 15.0,
+) -> Blueprint:
+    """Crea un blueprint específico para el stream de eventos.
+
+    Un único hilo por proceso lee `change_log`, pero cada conexión espera
+    bloqueada en `Subscription.receive`: bajo WSGI cada stream abierto ocupa
+    un hilo del sistema aunque esté inactivo. Con `ThreadPoolWSGIServer` ese
+    hilo sale del pool de peticiones (las REST siguen atendiéndose) y se
+    cierra al apagar el servidor, pero sigue existiendo; el total lo acota
+    `max_subscribers` del broadcaster (`SSE_MAX_CLIENTS`). Para muchos
+    clientes inactivos, `/eventos` debe servirse desde el front end FastAPI,
+    que espera en el event loop sin un hilo por conexión. Los ids de evento
+    son cursores del feed `/cambios`, por lo que `Last-Event-ID` permite
+    reanudar sin pérdidas.
+    """
+
+    events_bp = Blueprint("events", __name__, url_prefix="/eventos")
+
+    @events_bp.get("")
+    def stream_events():
+        claims = auth_service.require_claims(request)
+        raw_cursor = (
+            request.headers.get("Last-Event-ID") or request.args.get("desde")
+        )
+        after = _decode_cursor(raw_cursor) if raw_cursor else None
+
+        subscription = broadcaster.subscribe(after)
+        if subscription is None:
+            raise ServiceUnavailable(
+                "Demasiadas conexiones de eventos abiertas; reintentar más tarde"
+            )
+        detach = request.environ.get(DETACH_ENVIRON_KEY)
+        if detach is not None:
+            detach(subscription.close)
+
+        def generate() -> Iterator[str]:
+            yield f"retry: {RETRY_MILLISECONDS}\n\n"
+            needs_replay = after is not None
+            while True:
+                if needs_replay:
+                    needs_replay = False
+                    for chunk in _replay(
+                        list_changes_use_case, scope_authorizer, claims, subscription
+                    ):
+                        if chunk is None:
+                            yield "event: reinicio\ndata: {}\n\n"
+                            return
+                        yield chunk
+
+                changes = subscription.receive(heartbeat_seconds)
+                if subscription.closed:
+                    return
+                if changes:
+                    scoped = scope_authorizer.filter_changes(claims, changes)
+                    if scoped:
+                        yield _format_events(scoped)
+                else:
+                    yield ": ping\n\n"
+
+                if subscription.overflowed:
+                    # Cliente lento: se descartó su cola y se relee el log.
+                    subscription.resume()
+                    needs_replay = True
+
+        response = Response(generate(), mimetype="text/event-stream")
+        response.call_on_close(lambda: broadcaster.unsubscribe(subscription))
+        response.headers["Cache-Control"] = "no-cache"
+        response.headers["X-Accel-Buffering"] = "no"
+        return response
+
+    return events_bp
@@ -0,0 +1,45 @@
+"""Blueprint con la exportación completa del inventario."""
+
+from __future__ import annotations
+
+from flask import Blueprint, Response, request
+from werkzeug.exceptions import BadRequest
+
+from src.infrastructure.http.auth import AuthService, ScopeAuthorizer
+from src.infrastructure.http.inventory import _MIMETYPES, _csv_chunks, _ndjson_chunks
+from src.interface_adapters.presenters.inventory_presenter import present as present_row
+from src.use_cases.export_inventory import ExportInventoryUseCase
+
+
+def build_export_blueprint(
+    export_inventory_use_case: ExportInventoryUseCase,
+    auth_service: AuthService,
+    scope_authorizer: ScopeAuthorizer,
+) -> Blueprint:
+    """Crea un blueprint específico para la exportación del inventario.
+
+    La respuesta es un generador: cada fila se serializa y se envía apenas la
+    entrega el cursor de la base, sin armar listas intermedias. El generador
+    corre fuera del contexto de la petición y abre su propia sesión.
+    """
+
+    export_bp = Blueprint("export", __name__, url_prefix="/export")
+
+    @export_bp.get("")
+    def export_inventory():
+        claims = auth_service.require_claims(request)
+        fmt = request.args.get("formato", "ndjson")
+        if fmt not in _MIMETYPES:
+            raise BadRequest("El parámetro formato debe ser ndjson o csv")
+
+        scope = scope_authorizer.inventory_scope(claims)
+        rows = (present_row(row) for row in export_inventory_use_case.execute(scope))
+
+        body = _ndjson_chunks(rows) if fmt == "ndjson" else _csv_chunks(rows)
+        response = Response(body, mimetype=_MIMETYPES[fmt])
+        response.headers["Content-Disposition"] = (
+            f'attachment; filename="inventario.{fmt}"'
+        )
+        return response
+
+    return export_bp
@@ -1,13 +1,23 @@
-"""Funciones auxiliares compartidas para rutas de Flask."""
+"""Funciones auxiliares compartidas para rutas de Flask.
+
+Aplican las de `src.infrastructure.http.helpers` sobre la petición en curso.
+"""
 
 from __future__ import annotations
 
-from typing import Any, Type
+from typing import Any
 
-from flask import request
-from pydantic import BaseModel, ValidationError
+from flask import Response, request
 from werkzeug.exceptions import BadRequest
 
+from src.infrastructure.http.helpers import (
+    _CACHE_CONTROL,
+    _parse_flag,
+    _parse_limit,
+    _parse_pagination,
+    _tag_for,
+)
+
 
 def _require_json() -> dict[str, Any]:
     data = request.get_json(silent=True)
@@ -16,18 +26,39 @@ def _require_json() -> dict[str, Any]:
     return data
 
 
-def _format_validation_errors(exc: ValidationError) -> str:
-    errors = []
-    for error in exc.errors():
-        loc = ".".join(str(item) for item in error.get("loc", []))
-        errors.append(f"{loc or 'body'}: {error.get('msg')}")
-    return "; ".join(errors) if errors else "Payload inválido"
+def _pagination_args() -> tuple[int, int | None] | None:
+    """Lee `limite` y `despues` de la query string.
+
+    Devuelve `None` cuando no se pidió paginación para mantener la respuesta
+    en forma de lista que ya consume el frontend.
+    """
+    return _parse_pagination(request.args)
+
+
+def _flag_arg(name: str) -> bool:
+    """Lee un parámetro booleano (`true`/`false`, `1`/`0`); ausente es falso."""
+    return _parse_flag(request.args, name)
+
+
+def _limit_arg() -> int:
+    """Lee `limite` de la query string; por defecto `MAX_PAGE_SIZE`."""
+    return _parse_limit(request.args)
+
+
+def _entity_tag(claims: Any, revision: object) -> str:
+    """ETag (`_tag_for`) de la petición en curso, con su query string."""
+    return _tag_for(request.full_path, claims, revision)
+
+
+def _not_modified(etag: str) -> Response | None:
+    """Devuelve un 304 si el cliente ya tiene la versión `etag`."""
+    if not request.if_none_match.contains(etag):
+        return None
+    response = Response(status=304)
+    return _with_etag(response, etag)
 
 
-def _validate_payload(payload: dict[str, Any], schema: Type[BaseModel]) -> dict[str, Any]:
-    """Valida un payload contra un schema Pydantic y retorna datos filtrados."""
-    try:
-        validated = schema.model_validate(payload)
-    except ValidationError as exc:
-        raise BadRequest(f"Payload inválido: {_format_validation_errors(exc)}") from exc
-    return validated.model_dump(exclude_none=True)
+def _with_etag(response: Response, etag: str) -> Response:
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = _CACHE_CONTROL
+    return response
@@ -0,0 +1,52 @@
+"""Blueprint con la importación masiva del inventario."""
+
+from __future__ import annotations
+
+import io
+
+from flask import Blueprint, jsonify, request
+from werkzeug.exceptions import BadRequest
+
+from src.infrastructure.http.auth import AuthService, ScopeAuthorizer
+from src.infrastructure.http.inventory import (
+    _FORMATS,
+    _csv_rows,
+    _decoded,
+    _ndjson_rows,
+)
+from src.interface_adapters.presenters.inventory_presenter import present_report
+from src.use_cases.import_inventory import ImportInventoryUseCase
+
+
+def build_import_blueprint(
+    import_inventory_use_case: ImportInventoryUseCase,
+    auth_service: AuthService,
+    scope_authorizer: ScopeAuthorizer,
+) -> Blueprint:
+    """Crea un blueprint específico para la importación del inventario.
+
+    El cuerpo se lee como stream, fila por fila, y se guarda en bloques de una
+    transacción cada uno; el tamaño del archivo no condiciona la memoria. Un
+    error en una fila no detiene la importación: se informa con su número de
+    línea.
+    """
+
+    import_bp = Blueprint("inventory_import", __name__, url_prefix="/import")
+
+    @import_bp.post("")
+    def import_inventory():
+        claims = auth_service.require_claims(request)
+        scope_authorizer.ensure_superadmin(claims)
+
+        fmt = request.args.get("formato")
+        if fmt is None:
+            fmt = "csv" if request.mimetype == "text/csv" else "ndjson"
+        if fmt not in _FORMATS:
+            raise BadRequest("El parámetro formato debe ser ndjson o csv")
+
+        text = io.TextIOWrapper(request.stream, encoding="utf-8-sig", newline="")
+        rows = _ndjson_rows(text) if fmt == "ndjson" else _csv_rows(text)
+        report = import_inventory_use_case.execute(_decoded(rows))
+        return jsonify(present_report(report))
+
+    return import_bp
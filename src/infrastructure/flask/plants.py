@@ -2,11 +2,23 @@
 
 from __future__ import annotations
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, jsonify, request, url_for
 from werkzeug.exceptions import BadRequest, NotFound
 
-from src.infrastructure.flask.auth import AuthService, ScopeAuthorizer
-from src.infrastructure.flask.helpers import _require_json, _validate_payload
+from src.infrastructure.flask.helpers import (
+    _entity_tag,
+    _flag_arg,
+    _not_modified,
+    _pagination_args,
+    _require_json,
+    _with_etag,
+)
+from src.infrastructure.http.auth import AuthService, ScopeAuthorizer
+from src.infrastructure.http.helpers import (
+    _paginated_body,
+    _validate_batch,
+    _validate_payload,
+)
 from src.interface_adapters.presenters.area_presenter import (
     present as present_area,
     present_many as present_areas,
@@ -15,10 +27,28 @@ from src.interface_adapters.presenters.plant_presenter import (
     present as present_plant,
     present_many as present_plants,
 )
-from src.interface_adapters.schemas import PlantCreate, PlantUpdate, AreaCreate
+from src.interface_adapters.gateways.purge_runner import PurgeRunner
+from src.interface_adapters.presenters.plant_tree_presenter import (
+    present as present_plant_tree,
+)
+from src.interface_adapters.presenters.purge_job_presenter import (
+    present as present_purge_job,
+)
+from src.interface_adapters.presenters.status_presenter import (
+    present as present_status,
+)
+from src.interface_adapters.schemas import (
+    PlantCreate,
+    PlantUpdate,
+    AreaCreate,
+    StatusChange,
+)
+from src.use_cases.change_status import ChangeStatusUseCase
 from src.use_cases.create_area import CreateAreaUseCase
 from src.use_cases.create_plant import CreatePlantUseCase
 from src.use_cases.get_plant import GetPlantUseCase
+from src.use_cases.get_plant_tree import GetPlantTreeUseCase
+from src.use_cases.get_subtree_revision import GetSubtreeRevisionUseCase
 from src.use_cases.list_plant_areas import ListPlantAreasUseCase
 from src.use_cases.list_plants import ListPlantsUseCase
 from src.use_cases.update_plant import UpdatePlantUseCase
@@ -31,8 +61,12 @@ def build_plants_blueprint(
     create_plant_use_case: CreatePlantUseCase,
     update_plant_use_case: UpdatePlantUseCase,
     delete_plant_use_case: DeletePlantUseCase,
+    purge_runner: PurgeRunner,
     list_plant_areas_use_case: ListPlantAreasUseCase,
     create_area_use_case: CreateAreaUseCase,
+    change_status_use_case: ChangeStatusUseCase,
+    get_plant_tree_use_case: GetPlantTreeUseCase,
+    get_subtree_revision_use_case: GetSubtreeRevisionUseCase,
     auth_service: AuthService,
     scope_authorizer: ScopeAuthorizer,
 ) -> Blueprint:
@@ -42,9 +76,22 @@ def build_plants_blueprint(
 
     @plants_bp.get("")
     def list_plants():
-        auth_service.require_claims(request)
-        plants = list_plants_use_case.execute()
-        return jsonify(present_plants(plants))
+        claims = auth_service.require_claims(request)
+        pagination = _pagination_args()
+        versions = get_subtree_revision_use_case.for_all_plants()
+        etag = _entity_tag(claims, sorted(versions.items()))
+        cached = _not_modified(etag)
+        if cached is not None:
+            return cached
+
+        if pagination is None:
+            plants = list_plants_use_case.execute()
+            return _with_etag(jsonify(present_plants(plants)), etag)
+
+        limit, after = pagination
+        page = list_plants_use_case.execute_page(limit=limit, after=after)
+        body = _paginated_body(present_plants(page.items), page.next_after)
+        return _with_etag(jsonify(body), etag)
 
     @plants_bp.post("")
     def create_plant():
@@ -58,13 +105,18 @@ def build_plants_blueprint(
 
     @plants_bp.get("/<int:plant_id>")
     def get_plant(plant_id: int):
-        auth_service.require_claims(request)
+        claims = auth_service.require_claims(request)
+        etag = _entity_tag(claims, get_subtree_revision_use_case.for_plant(plant_id))
+        cached = _not_modified(etag)
+        if cached is not None:
+            return cached
+
         plant = get_plant_use_case.execute(plant_id)
         if plant is None:
             raise NotFound("Planta no encontrada")
-        return jsonify(present_plant(plant))
+        return _with_etag(jsonify(present_plant(plant)), etag)
 
-    @plants_bp.put("/<int:plant_id>")
+    @plants_bp.route("/<int:plant_id>", methods=["PUT", "PATCH"])
     def update_plant(plant_id: int):
         claims = auth_service.require_claims(request)
         scope_authorizer.ensure_superadmin(claims)
@@ -83,21 +135,65 @@ def build_plants_blueprint(
         claims = auth_service.require_claims(request)
         scope_authorizer.ensure_superadmin(claims)
 
+        if _flag_arg("async"):
+            # Subárboles grandes: se ocultan ya y se purgan por lotes.
+            job = purge_runner.start(plant_id)
+            if job is None:
+                raise NotFound("Planta no encontrada")
+            response = jsonify(present_purge_job(job))
+            response.status_code = 202
+            response.headers["Location"] = url_for(
+                "api.purge_jobs.get_purge_job", job_id=job.id
+            )
+            return response
+
         deleted = delete_plant_use_case.execute(plant_id)
         if not deleted:
             raise NotFound("Planta no encontrada")
         return ("", 204)
 
+    @plants_bp.get("/<int:plant_id>/arbol")
+    def get_plant_tree(plant_id: int):
+        claims = auth_service.require_claims(request)
+        etag = _entity_tag(claims, get_subtree_revision_use_case.for_plant(plant_id))
+        cached = _not_modified(etag)
+        if cached is not None:
+            return cached
+
+        tree = get_plant_tree_use_case.execute(plant_id)
+        if tree is None:
+            raise NotFound("Planta no encontrada")
+
+        scoped = scope_authorizer.filter_tree(claims, tree)
+        return _with_etag(jsonify(present_plant_tree(scoped)), etag)
+
     @plants_bp.get("/<int:plant_id>/areas")
     def list_plant_areas(plant_id: int):
         claims = auth_service.require_claims(request)
+        pagination = _pagination_args()
+        etag = _entity_tag(claims, get_subtree_revision_use_case.for_plant(plant_id))
+        cached = _not_modified(etag)
+        if cached is not None:
+            return cached
+
         plant = get_plant_use_case.execute(plant_id)
         if plant is None:
             raise NotFound("Planta no encontrada")
 
-        areas = list_plant_areas_use_case.execute(plant_id)
-        scoped = scope_authorizer.filter_areas(claims, plant_id, areas)
-        return jsonify(present_areas(scoped))
+        if pagination is None:
+            areas = list_plant_areas_use_case.execute(plant_id)
+            scoped = scope_authorizer.filter_areas(claims, plant_id, areas)
+            return _with_etag(jsonify(present_areas(scoped)), etag)
+
+        limit, after = pagination
+        page = list_plant_areas_use_case.execute_page(
+            plant_id,
+            limit=limit,
+            after=after,
+            ids=scope_authorizer.area_ids_in_scope(claims),
+        )
+        body = _paginated_body(present_areas(page.items), page.next_after)
+        return _with_etag(jsonify(body), etag)
 
     @plants_bp.post("/<int:plant_id>/areas")
     def create_area(plant_id: int):
@@ -117,4 +213,33 @@ def build_plants_blueprint(
 
         return jsonify(present_area(created)), 201
 
+    @plants_bp.post("/<int:plant_id>/areas:lote")
+    def create_area_batch(plant_id: int):
+        claims = auth_service.require_claims(request)
+        scope_authorizer.ensure_can_create_area(claims, plant_id)
+
+        items = _validate_batch(_require_json(), AreaCreate)
+        created = create_area_use_case.execute_many(plant_id, items)
+        if created is None:
+            raise NotFound("Planta no encontrada")
+
+        return jsonify(present_areas(created)), 201
+
+    @plants_bp.put("/<int:plant_id>/estado")
+    def change_status(plant_id: int):
+        claims = auth_service.require_claims(request)
+        scope_authorizer.ensure_superadmin(claims)
+
+        data = _validate_payload(_require_json(), StatusChange)
+        try:
+            result = change_status_use_case.for_plant(
+                plant_id, data["status"], cascade=_flag_arg("cascada")
+            )
+        except ValueError as exc:
+            raise BadRequest(str(exc)) from exc
+        if result is None:
+            raise NotFound("Planta no encontrada")
+
+        return jsonify(present_status(result))
+
     return plants_bp
@@ -0,0 +1,38 @@
+"""Blueprint con el estado de los borrados diferidos de plantas."""
+
+from __future__ import annotations
+
+from flask import Blueprint, jsonify, request
+from werkzeug.exceptions import NotFound
+
+from src.infrastructure.http.auth import AuthService, ScopeAuthorizer
+from src.interface_adapters.presenters.purge_job_presenter import (
+    present as present_purge_job,
+)
+from src.use_cases.purge_plant import PurgePlantUseCase
+
+
+def build_purge_jobs_blueprint(
+    purge_plant_use_case: PurgePlantUseCase,
+    auth_service: AuthService,
+    scope_authorizer: ScopeAuthorizer,
+) -> Blueprint:
+    """Crea un blueprint específico para consultar borrados en curso.
+
+    El progreso se guarda en la base, así que cualquier worker responde por un
+    trabajo aunque lo esté ejecutando otro proceso.
+    """
+
+    purge_jobs_bp = Blueprint("purge_jobs", __name__, url_prefix="/borrados")
+
+    @purge_jobs_bp.get("/<int:job_id>")
+    def get_purge_job(job_id: int):
+        claims = auth_service.require_claims(request)
+        scope_authorizer.ensure_superadmin(claims)
+
+        job = purge_plant_use_case.get(job_id)
+        if job is None:
+            raise NotFound("Borrado no encontrado")
+        return jsonify(present_purge_job(job))
+
+    return purge_jobs_bp
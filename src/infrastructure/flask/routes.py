@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Callable
 
-from flask import Blueprint, jsonify
+from flask import Blueprint, jsonify, request
 from werkzeug.exceptions import BadRequest, HTTPException, NotFound
 
 from src.infrastructure.flask.error_handlers import (
@@ -13,11 +13,19 @@ from src.infrastructure.flask.error_handlers import (
 )
 
 from src.infrastructure.flask.areas import build_areas_blueprint
-from src.infrastructure.flask.auth import AuthService, ScopeAuthorizer
+from src.infrastructure.flask.changes import build_changes_blueprint
 from src.infrastructure.flask.equipment import build_equipment_blueprint
+from src.infrastructure.flask.events import build_events_blueprint
+from src.infrastructure.flask.export import build_export_blueprint
+from src.infrastructure.flask.inventory_import import build_import_blueprint
 from src.infrastructure.flask.plants import build_plants_blueprint
+from src.infrastructure.flask.purge_jobs import build_purge_jobs_blueprint
 from src.infrastructure.flask.systems import build_systems_blueprint
 from src.infrastructure.flask.auth_routes import build_auth_blueprint
+from src.infrastructure.http.auth import AuthService, ScopeAuthorizer
+from src.interface_adapters.gateways.change_broadcaster import ChangeBroadcaster
+from src.interface_adapters.gateways.purge_runner import PurgeRunner
+from src.use_cases.change_status import ChangeStatusUseCase
 from src.use_cases.create_area import CreateAreaUseCase
 from src.use_cases.create_equipment import CreateEquipmentUseCase
 from src.use_cases.create_plant import CreatePlantUseCase
@@ -26,14 +34,25 @@ from src.use_cases.delete_area import DeleteAreaUseCase
 from src.use_cases.delete_equipment import DeleteEquipmentUseCase
 from src.use_cases.delete_plant import DeletePlantUseCase
 from src.use_cases.delete_system import DeleteSystemUseCase
+from src.use_cases.export_inventory import ExportInventoryUseCase
 from src.use_cases.get_area import GetAreaUseCase
 from src.use_cases.get_equipment import GetEquipmentUseCase
 from src.use_cases.get_plant import GetPlantUseCase
+from src.use_cases.get_plant_tree import GetPlantTreeUseCase
+from src.use_cases.get_subtree_revision import GetSubtreeRevisionUseCase
 from src.use_cases.list_area_equipment import ListAreaEquipmentUseCase
+from src.use_cases.list_changes import ListChangesUseCase
 from src.use_cases.list_equipment_systems import ListEquipmentSystemsUseCase
 from src.use_cases.list_plant_areas import ListPlantAreasUseCase
 from src.use_cases.list_plants import ListPlantsUseCase
 from src.use_cases.get_system import GetSystemUseCase
+from src.use_cases.import_inventory import ImportInventoryUseCase
+from src.use_cases.purge_plant import PurgePlantUseCase
+from src.use_cases.ports.change_log import ChangeLogRepository
+from src.use_cases.ports.inventory import (
+    InventoryImportRepository,
+    InventoryRepository,
+)
 from src.use_cases.ports.plant_repository import PlantDataRepository
 from src.use_cases.ports.unit_of_work import UnitOfWork
 from src.use_cases.update_area import UpdateAreaUseCase
@@ -48,8 +67,21 @@ def build_blueprint(
     *,
     auth_service: AuthService | None = None,
     scope_authorizer: ScopeAuthorizer | None = None,
+    change_log: ChangeLogRepository | None = None,
+    change_broadcaster: ChangeBroadcaster | None = None,
+    event_heartbeat_seconds: float = 15.0,
+    inventory: InventoryRepository | None = None,
+    inventory_import: InventoryImportRepository | None = None,
+    purge_runner: PurgeRunner | None = None,
 ) -> Blueprint:
-    "Construye el Blueprint de Flask con las rutas de la API."
+    """Construye el Blueprint de Flask con las rutas de la API.
+
+    `change_log` habilita `/cambios` y `/eventos`, `inventory` habilita
+    `/export` e `inventory_import` habilita `/import`. Si se omiten se usa `repository` cuando éste también implementa
+    esos puertos (los decoradores de caché no lo hacen). `purge_runner`
+    ejecuta los borrados diferidos (`DELETE /plantas/<id>?async=true`); por
+    defecto se crea uno con lotes de 1000 filas.
+    """
     api_bp = Blueprint("api", __name__, url_prefix="/api")
 
     api_bp.register_error_handler(BadRequest, handle_http_exception)
@@ -62,8 +94,13 @@ def build_blueprint(
     create_plant_use_case = CreatePlantUseCase(repository, uow_factory)
     update_plant_use_case = UpdatePlantUseCase(repository, uow_factory)
     delete_plant_use_case = DeletePlantUseCase(repository, uow_factory)
+    purge_plant_use_case = PurgePlantUseCase(repository, uow_factory)
+    purge_runner = purge_runner or PurgeRunner(purge_plant_use_case)
     list_plant_areas_use_case = ListPlantAreasUseCase(repository)
     create_area_use_case = CreateAreaUseCase(repository, uow_factory)
+    get_plant_tree_use_case = GetPlantTreeUseCase(repository)
+    get_subtree_revision_use_case = GetSubtreeRevisionUseCase(repository)
+    change_status_use_case = ChangeStatusUseCase(repository, uow_factory)
 
     get_area_use_case = GetAreaUseCase(repository)
     update_area_use_case = UpdateAreaUseCase(repository, uow_factory)
@@ -86,6 +123,8 @@ def build_blueprint(
         get_area=get_area_use_case.execute,
         get_equipment=get_equipment_use_case.execute,
         get_system=get_system_use_case.execute,
+        get_areas=get_area_use_case.execute_many,
+        get_equipment_many=get_equipment_use_case.execute_many,
     )
 
     plants_bp = build_plants_blueprint(
@@ -94,8 +133,12 @@ def build_blueprint(
         create_plant_use_case,
         update_plant_use_case,
         delete_plant_use_case,
+        purge_runner,
         list_plant_areas_use_case,
         create_area_use_case,
+        change_status_use_case,
+        get_plant_tree_use_case,
+        get_subtree_revision_use_case,
         auth_service,
         scope,
     )
@@ -106,6 +149,8 @@ def build_blueprint(
         delete_area_use_case,
         list_area_equipment_use_case,
         create_equipment_use_case,
+        change_status_use_case,
+        get_subtree_revision_use_case,
         auth_service,
         scope,
     )
@@ -116,6 +161,8 @@ def build_blueprint(
         delete_equipment_use_case,
         list_equipment_systems_use_case,
         create_system_use_case,
+        change_status_use_case,
+        get_subtree_revision_use_case,
         auth_service,
         scope,
     )
@@ -128,12 +175,60 @@ def build_blueprint(
         scope,
     )
 
+    purge_jobs_bp = build_purge_jobs_blueprint(
+        purge_plant_use_case, auth_service, scope
+    )
     auth_bp = build_auth_blueprint(auth_service)
 
+    if inventory is None and isinstance(repository, InventoryRepository):
+        inventory = repository
+    if inventory is not None:
+        export_bp = build_export_blueprint(
+            ExportInventoryUseCase(inventory), auth_service, scope
+        )
+        api_bp.register_blueprint(export_bp)
+
+    if inventory_import is None and isinstance(repository, InventoryImportRepository):
+        inventory_import = repository
+    if inventory_import is not None:
+        import_bp = build_import_blueprint(
+            ImportInventoryUseCase(inventory_import, uow_factory),
+            auth_service,
+            scope,
+        )
+        api_bp.register_blueprint(import_bp)
+
+    if change_log is None and isinstance(repository, ChangeLogRepository):
+        change_log = repository
+    if change_log is not None:
+        list_changes_use_case = ListChangesUseCase(change_log)
+        broadcaster = change_broadcaster or ChangeBroadcaster(change_log)
+        changes_bp = build_changes_blueprint(
+            list_changes_use_case, auth_service, scope
+        )
+        events_bp = build_events_blueprint(
+            broadcaster,
+            list_changes_use_case,
+            auth_service,
+            scope,
+            heartbeat_seconds=event_heartbeat_seconds,
+        )
+        api_bp.register_blueprint(changes_bp)
+        api_bp.register_blueprint(events_bp)
+
+        @api_bp.after_request
+        def wake_event_stream(response):
+            # Las escrituras ya quedaron en change_log; se adelanta la lectura.
+            writes = request.method not in {"GET", "HEAD", "OPTIONS"}
+            if writes and response.status_code < 400:
+                broadcaster.wake()
+            return response
+
     api_bp.register_blueprint(plants_bp)
     api_bp.register_blueprint(areas_bp)
     api_bp.register_blueprint(equipment_bp)
     api_bp.register_blueprint(systems_bp)
+    api_bp.register_blueprint(purge_jobs_bp)
     api_bp.register_blueprint(auth_bp)
 
     return api_bp
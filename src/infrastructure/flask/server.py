@@ -0,0 +1,390 @@
+"""
+Path: src/infrastructure/flask/server.py
+"""
+
+from __future__ import annotations
+
+import os
+import signal
+import socket
+import threading
+import time
+from typing import Callable
+
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+
+from src.shared.logger import get_logger
+
+logger = get_logger("flask-server")
+
+AppFactory = Callable[[], object]
+WorkerExit = Callable[[object], None]
+
+# Cada cuánto revisa el proceso maestro si algún worker terminó.
+_REAP_INTERVAL_SECONDS = 0.2
+# Un worker que muere antes de este plazo probablemente no puede arrancar
+# (configuración, base caída): se espera lo mismo antes de reemplazarlo.
+_RESPAWN_BACKOFF_SECONDS = 1.0
+# Clave del environ WSGI con `ThreadPoolWSGIServer.detach` para las respuestas
+# de larga duración (el stream de eventos).
+DETACH_ENVIRON_KEY = "planta.server.detach"
+
+
+class _RequestHandler(WSGIRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Una conexión keep-alive inactiva libera su hilo tras estos segundos.
+    timeout = 5
+
+    def log_error(self, format: str, *args) -> None:
+        if format.startswith("Request timed out"):
+            return
+        super().log_error(format, *args)
+
+    def make_environ(self):
+        environ = super().make_environ()
+        environ[DETACH_ENVIRON_KEY] = self.server.detach
+        return environ
+
+
+class ThreadPoolWSGIServer(BaseWSGIServer):
+    """Servidor WSGI de Werkzeug con un máximo de `threads` peticiones a la vez.
+
+    A diferencia del servidor de desarrollo (un hilo nuevo por conexión), deja
+    de aceptar conexiones cuando todos los hilos están ocupados: las demás
+    esperan en el backlog del socket, o las toma otro worker si se usa
+    `SO_REUSEPORT`. Una respuesta que queda abierta indefinidamente (SSE)
+    llama a `detach` y devuelve su lugar, así no deja al resto sin hilos; esas
+    conexiones las acota quien las acepta. `server_close` avisa a las
+    conexiones desacopladas que deben cerrar y `wait_for_requests` espera a que
+    terminen las peticiones en curso.
+    """
+
+    multithread = True
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        app,
+        *,
+        threads: int = 8,
+        reuse_port: bool = False,
+        fd: int | None = None,
+    ) -> None:
+        self._reuse_port = reuse_port
+        self._slots = threading.BoundedSemaphore(max(threads, 1))
+        self._active: set[threading.Thread] = set()
+        self._detached: dict[threading.Thread, Callable[[], None] | None] = {}
+        self._active_lock = threading.Lock()
+        super().__init__(host, port, app, handler=_RequestHandler, fd=fd)
+
+    def server_bind(self) -> None:
+        if self._reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+    def process_request(self, request, client_address) -> None:
+        self._slots.acquire()
+        thread = threading.Thread(
+            target=self._process_request_thread,
+            args=(request, client_address),
+            daemon=True,
+        )
+        with self._active_lock:
+            self._active.add(thread)
+        thread.start()
+
+    def _process_request_thread(self, request, client_address) -> None:
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            current = threading.current_thread()
+            with self._active_lock:
+                self._active.discard(current)
+                detached = current in self._detached
+                self._detached.pop(current, None)
+            if not detached:
+                self._slots.release()
+
+    def detach(self, on_shutdown: Callable[[], None] | None = None) -> None:
+        """Libera el lugar de la petición actual, que seguirá abierta.
+
+        La llama la aplicación desde el hilo de la petición (vía
+        `environ[DETACH_ENVIRON_KEY]`). `on_shutdown` se invoca en
+        `server_close` para que la respuesta termine y el hilo salga.
+        """
+        current = threading.current_thread()
+        with self._active_lock:
+            if current not in self._active or current in self._detached:
+                return
+            self._detached[current] = on_shutdown
+        self._slots.release()
+
+    def server_close(self) -> None:
+        super().server_close()
+        with self._active_lock:
+            callbacks = [
+                callback
+                for callback in self._detached.values()
+                if callback is not None
+            ]
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                logger.exception("No se pudo cerrar una conexión desacoplada")
+
+    def wait_for_requests(self, timeout: float | None = None) -> bool:
+        """Espera las peticiones en curso; `False` si venció `timeout` antes."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._active_lock:
+                pending = list(self._active)
+            if not pending:
+                return True
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            pending[0].join(remaining)
+
+
+def reuse_port_supported() -> bool:
+    return hasattr(socket, "SO_REUSEPORT")
+
+
+def serve(
+    app_factory: AppFactory,
+    *,
+    host: str = "0.0.0.0",
+    port: int = 8000,
+    workers: int = 1,
+    threads: int = 8,
+    reuse_port: bool = True,
+    graceful_timeout: float = 30.0,
+    worker_exit: WorkerExit | None = None,
+) -> None:
+    """Sirve la aplicación con `workers` procesos pre-forkeados.
+
+    `app_factory` se llama dentro de cada worker, después del fork, para que
+    ningún proceso herede conexiones abiertas del padre. Con `reuse_port` (y
+    soporte del sistema) cada worker abre su propio socket con `SO_REUSEPORT`
+    y el kernel reparte las conexiones; si no, el maestro abre uno y los
+    workers lo heredan. El maestro reemplaza a los workers que mueren y, ante
+    `SIGTERM` o `SIGINT`, les pide terminar y espera `graceful_timeout`
+    segundos antes de forzarlos. `worker_exit` recibe la aplicación al cerrar
+    cada worker (por ejemplo, para liberar el pool de la base).
+
+    Sin `os.fork` (Windows) se sirve en un único proceso.
+    """
+
+    if not hasattr(os, "fork"):
+        if workers > 1:
+            logger.warning("Sin os.fork: se sirve en un único proceso.")
+        _serve_single(
+            app_factory, host, port, threads, graceful_timeout, worker_exit
+        )
+        return
+
+    _Arbiter(
+        app_factory,
+        host=host,
+        port=port,
+        workers=max(workers, 1),
+        threads=threads,
+        reuse_port=reuse_port and reuse_port_supported(),
+        graceful_timeout=graceful_timeout,
+        worker_exit=worker_exit,
+    ).run()
+
+
+def _serve_single(
+    app_factory: AppFactory,
+    host: str,
+    port: int,
+    threads: int,
+    graceful_timeout: float,
+    worker_exit: WorkerExit | None,
+) -> None:
+    app = app_factory()
+    server = ThreadPoolWSGIServer(host, port, app, threads=threads)
+    logger.info("Sirviendo en http://%s:%s con %s hilos", host, server.port, threads)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.wait_for_requests(graceful_timeout)
+        if worker_exit is not None:
+            worker_exit(app)
+
+
+class _Arbiter:
+    """Proceso maestro: crea, vigila y apaga a los workers."""
+
+    def __init__(
+        self,
+        app_factory: AppFactory,
+        *,
+        host: str,
+        port: int,
+        workers: int,
+        threads: int,
+        reuse_port: bool,
+        graceful_timeout: float,
+        worker_exit: WorkerExit | None,
+    ) -> None:
+        self._app_factory = app_factory
+        self._host = host
+        self._port = port
+        self._workers = workers
+        self._threads = threads
+        self._reuse_port = reuse_port
+        self._graceful_timeout = graceful_timeout
+        self._worker_exit = worker_exit
+        self._listener: socket.socket | None = None
+        self._children: dict[int, float] = {}
+        self._stopping = False
+
+    def run(self) -> None:
+        if not self._reuse_port:
+            self._listener = _listen(self._host, self._port)
+        previous = {
+            signum: signal.signal(signum, self._request_stop)
+            for signum in (signal.SIGTERM, signal.SIGINT)
+        }
+        logger.info(
+            "Sirviendo en http://%s:%s con %s workers x %s hilos (SO_REUSEPORT: %s)",
+            self._host,
+            self._port,
+            self._workers,
+            self._threads,
+            "sí" if self._reuse_port else "no",
+        )
+        try:
+            for _ in range(self._workers):
+                self._spawn()
+            self._supervise()
+        finally:
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+            if self._listener is not None:
+                self._listener.close()
+
+    def _request_stop(self, _signum, _frame) -> None:
+        if self._stopping:
+            return
+        self._stopping = True
+        for pid in list(self._children):
+            _kill(pid, signal.SIGTERM)
+
+    def _supervise(self) -> None:
+        deadline: float | None = None
+        while self._children:
+            self._reap()
+            if self._stopping:
+                if deadline is None:
+                    deadline = time.monotonic() + self._graceful_timeout
+                elif time.monotonic() >= deadline:
+                    logger.warning(
+                        "Workers sin terminar tras %ss; se fuerzan: %s",
+                        self._graceful_timeout,
+                        sorted(self._children),
+                    )
+                    for pid in list(self._children):
+                        _kill(pid, signal.SIGKILL)
+                    deadline = float("inf")
+            time.sleep(_REAP_INTERVAL_SECONDS)
+
+    def _reap(self) -> None:
+        while self._children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self._children.clear()
+                return
+            if pid == 0:
+                return
+            started = self._children.pop(pid, 0.0)
+            if not self._stopping:
+                logger.warning(
+                    "Worker %s terminó (código %s); se reemplaza.",
+                    pid,
+                    os.waitstatus_to_exitcode(status),
+                )
+                if time.monotonic() - started < _RESPAWN_BACKOFF_SECONDS:
+                    time.sleep(_RESPAWN_BACKOFF_SECONDS)
+                self._spawn()
+
+    def _spawn(self) -> None:
+        pid = os.fork()
+        if pid:
+            self._children[pid] = time.monotonic()
+            return
+
+        status = 1
+        try:
+            self._run_worker()
+            status = 0
+        except BaseException:
+            logger.exception("El worker %s falló", os.getpid())
+        finally:
+            os._exit(status)
+
+    def _run_worker(self) -> None:
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, signal.SIG_DFL)
+
+        app = self._app_factory()
+        server = ThreadPoolWSGIServer(
+            self._host,
+            self._port,
+            app,
+            threads=self._threads,
+            reuse_port=self._reuse_port,
+            fd=None if self._listener is None else self._listener.fileno(),
+        )
+
+        def stop(_signum, _frame) -> None:
+            # `shutdown` bloquea hasta que termina `serve_forever`: otro hilo.
+            threading.Thread(target=server.shutdown, daemon=True).start()
+
+        signal.signal(signal.SIGTERM, stop)
+        # Ctrl+C llega a todo el grupo; el maestro coordina el apagado.
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+            if not server.wait_for_requests(self._graceful_timeout):
+                logger.warning("Worker %s cerró con peticiones en curso", os.getpid())
+            if self._worker_exit is not None:
+                self._worker_exit(app)
+
+
+def _listen(host: str, port: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    listener = socket.socket(family, socket.SOCK_STREAM)
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    listener.bind((host, port))
+    listener.listen(ThreadPoolWSGIServer.request_queue_size)
+    listener.set_inheritable(True)
+    return listener
+
+
+def _kill(pid: int, signum: int) -> None:
+    try:
+        os.kill(pid, signum)
+    except ProcessLookupError:
+        pass
+
+
+__all__ = [
+    "DETACH_ENVIRON_KEY",
+    "ThreadPoolWSGIServer",
+    "reuse_port_supported",
+    "serve",
+]
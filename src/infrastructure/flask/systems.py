@@ -5,8 +5,9 @@ from __future__ import annotations
 from flask import Blueprint, jsonify, request
 from werkzeug.exceptions import BadRequest, NotFound
 
-from src.infrastructure.flask.auth import AuthService, ScopeAuthorizer
-from src.infrastructure.flask.helpers import _require_json, _validate_payload
+from src.infrastructure.flask.helpers import _require_json
+from src.infrastructure.http.auth import AuthService, ScopeAuthorizer
+from src.infrastructure.http.helpers import _validate_payload
 from src.interface_adapters.presenters.system_presenter import present as present_system
 from src.interface_adapters.schemas import SystemUpdate
 from src.use_cases.get_system import GetSystemUseCase
@@ -25,7 +26,7 @@ def build_systems_blueprint(
 
     systems_bp = Blueprint("systems", __name__, url_prefix="/sistemas")
 
-    @systems_bp.put("/<int:system_id>")
+    @systems_bp.route("/<int:system_id>", methods=["PUT", "PATCH"])
     def update_system(system_id: int):
         claims = auth_service.require_claims(request)
         system = scope_authorizer.ensure_can_manage_system(claims, system_id)
@@ -0,0 +1 @@
+"""Piezas HTTP comunes a los front ends Flask y FastAPI, sin depender de ninguno."""
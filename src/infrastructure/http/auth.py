@@ -0,0 +1,756 @@
+"""
+Path: src/infrastructure/http/auth.py
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import logging
+import secrets
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Callable, Iterable, Sequence
+
+import jwt
+from jwt.exceptions import ExpiredSignatureError, InvalidTokenError
+from werkzeug.exceptions import Forbidden, Unauthorized
+
+from src.entities.area import Area
+from src.entities.change import ChangeEntry, utc_now
+from src.entities.equipment import Equipment
+from src.entities.inventory import InventoryScope
+from src.entities.plant_tree import AreaNode, EquipmentNode, PlantTree
+from src.entities.system import System
+from src.shared.cache import MISSING, CacheStats, LruTtlCache
+from src.shared.config import get_env, get_superadmin_credentials
+from src.shared.logger import get_logger
+from src.infrastructure.login_throttle import LoginThrottle
+from src.infrastructure.password_hashing import PasswordHashPool
+from src.infrastructure.refresh_tokens import (
+    InMemoryRefreshTokenStore,
+    RefreshTokenStore,
+)
+from src.infrastructure.user_repository import (
+    InMemoryUserRepository,
+    UserRepository,
+    User,
+)
+
+if TYPE_CHECKING:
+    from flask import Request
+
+
+logger = get_logger(__name__)
+
+
+JWT_ALGORITHM = "HS256"
+
+ALLOWED_ROLES = {
+    "superadministrador",
+    "administrador",
+    "maquinista",
+    "invitado",
+}
+
+
+def mask_authorization_header(auth_header: str) -> str:
+    """Devuelve una versión segura del header Authorization para logging."""
+
+    scheme, _, token = auth_header.partition(" ")
+    token = token.strip()
+
+    if not token:
+        return scheme or "<sin esquema>"
+
+    if len(token) <= 8:
+        masked = f"{token[:2]}...{token[-2:]}"
+    else:
+        masked = f"{token[:4]}...{token[-4:]}"
+
+    return f"{scheme} {masked}".strip()
+
+
+@dataclass(frozen=True, slots=True)
+class AuthClaims:
+    """Claims de autorización extraídos de un token.
+
+    Inmutables: `areas` y `equipos` se guardan como `frozenset` al construir,
+    así las mismas instancias se comparten entre peticiones (caché de
+    `AuthService`) y `ScopeAuthorizer` consulta pertenencia sin copiarlas.
+    """
+
+    username: str
+    role: str
+    areas: frozenset[int]
+    equipos: frozenset[int]
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "areas", frozenset(self.areas))
+        object.__setattr__(self, "equipos", frozenset(self.equipos))
+
+
+@dataclass(frozen=True, slots=True)
+class AuthSession:
+    "Tokens emitidos por un login o un refresh."
+
+    token: str
+    refresh_token: str
+    expires_in: int
+    claims: AuthClaims
+
+
+@dataclass(frozen=True, slots=True)
+class AuthUser(AuthClaims):
+    "Usuario autenticable con credenciales."
+
+    password: str
+
+
+def _default_users() -> dict[str, AuthUser]:
+    "Usuarios de demostración acordes a los roles del frontend."
+
+    superadmin_username, superadmin_password = get_superadmin_credentials()
+
+    return {
+        superadmin_username: AuthUser(
+            username=superadmin_username,
+            password=superadmin_password,
+            role="superadministrador",
+            areas=[],
+            equipos=[],
+        ),
+        "admin": AuthUser(
+            username="admin",
+            password="admin",
+            role="administrador",
+            areas=[101, 201],
+            equipos=[],
+        ),
+        "maquinista": AuthUser(
+            username="maquinista",
+            password="maquinista",
+            role="maquinista",
+            areas=[],
+            equipos=[1001],
+        ),
+        "invitado": AuthUser(
+            username="invitado",
+            password="invitado",
+            role="invitado",
+            areas=[],
+            equipos=[],
+        ),
+    }
+
+
+class AuthService:
+    """Emite y valida tokens firmados con claims de autorización estándar.
+
+    Firma con PyJWT y el mismo formato que `flask_jwt_extended` (`sub`, `jti`,
+    `type`, `fresh`...), sin depender del contexto de una app Flask, para que
+    otros front ends (FastAPI) compartan los tokens.
+
+    `login` entrega además un refresh token rotativo
+    (`<familia>.<generación>.<HMAC>`): renovar la sesión cuesta un HMAC y una
+    escritura en `refresh_store`, no un hash de contraseña. Cada refresh
+    invalida el anterior; presentar uno ya usado revoca la sesión completa.
+
+    Las contraseñas se verifican en `hash_pool`, fuera del hilo de la
+    petición, y `login_throttle` frena con 429 a quien acumula fallos antes
+    de gastar otro hash.
+    """
+
+    def __init__(
+        self,
+        *,
+        secret_key: str | None = None,
+        token_ttl_seconds: int | None = None,
+        user_repository: UserRepository | None = None,
+        claims_cache_size: int | None = None,
+        refresh_store: RefreshTokenStore | None = None,
+        refresh_ttl_seconds: int | None = None,
+        hash_pool: PasswordHashPool | None = None,
+        login_throttle: LoginThrottle | None = None,
+    ) -> None:
+        self._secret_key = secret_key or get_env("AUTH_SECRET_KEY", "dev-secret-key")
+        self._token_ttl = int(
+            token_ttl_seconds or get_env("AUTH_TOKEN_TTL_SECONDS", "3600")
+        )
+        cache_size = int(
+            claims_cache_size
+            if claims_cache_size is not None
+            else get_env("AUTH_CLAIMS_CACHE_SIZE", "4096")
+        )
+        # Token ya verificado -> claims, hasta su `exp`; 0 desactiva la caché.
+        self._claims_cache = (
+            LruTtlCache(max_entries=cache_size) if cache_size > 0 else None
+        )
+        self._refresh_store = refresh_store or InMemoryRefreshTokenStore()
+        self._refresh_ttl = int(
+            refresh_ttl_seconds or get_env("AUTH_REFRESH_TTL_SECONDS", "1209600")
+        )
+        # Clave derivada: una firma de refresh nunca coincide con una de JWT.
+        self._refresh_key = hashlib.sha256(
+            f"refresh:{self._secret_key}".encode()
+        ).digest()
+        self._hash_pool = hash_pool or PasswordHashPool(
+            workers=int(get_env("AUTH_HASH_WORKERS", "2")),
+            max_pending=int(get_env("AUTH_HASH_MAX_PENDING", "16")),
+            wait_seconds=float(get_env("AUTH_HASH_WAIT_SECONDS", "1")),
+        )
+        # Los hashes demo diferidos también se calculan en el pool.
+        self._user_repository = user_repository or (
+            InMemoryUserRepository.with_defaults(
+                hash_password=self._hash_pool.hash_password
+            )
+        )
+        self._login_throttle = login_throttle or LoginThrottle(
+            max_failures_per_user=int(get_env("AUTH_LOGIN_MAX_FAILURES", "5")),
+            max_failures_per_ip=int(get_env("AUTH_LOGIN_MAX_FAILURES_PER_IP", "50")),
+            window_seconds=float(get_env("AUTH_LOGIN_WINDOW_SECONDS", "300")),
+        )
+
+    @property
+    def secret_key(self) -> str:
+        return self._secret_key
+
+    @property
+    def token_ttl_seconds(self) -> int:
+        return self._token_ttl
+
+    def claims_cache_stats(self) -> CacheStats | None:
+        "Aciertos, fallos y tamaño de la caché de claims (`None` si está apagada)."
+        if self._claims_cache is None:
+            return None
+        return self._claims_cache.stats()
+
+    def issue_token(
+        self, username: str, password: str, *, client_ip: str | None = None
+    ) -> str:
+        """Emite un token JWT si las credenciales son válidas."""
+        user = self._authenticate(username, password, client_ip)
+        return self._access_token(user)[0]
+
+    def login(
+        self, username: str, password: str, *, client_ip: str | None = None
+    ) -> AuthSession:
+        """Valida credenciales y abre una sesión con refresh token."""
+        user = self._authenticate(username, password, client_ip)
+        family = secrets.token_urlsafe(16)
+        self._refresh_store.start(
+            family, user.username, utc_now() + timedelta(seconds=self._refresh_ttl)
+        )
+        return self._session_for(user, family, 0)
+
+    def refresh(self, refresh_token: str) -> AuthSession:
+        """Canjea un refresh token vigente por un access token y otro refresh."""
+        family, generation = self._parse_refresh_token(refresh_token)
+        username = self._refresh_store.rotate(family, generation, now=utc_now())
+        if username is None:
+            logger.warning(
+                "Refresh token reutilizado o vencido; sesión revocada",
+                extra={"family": family},
+            )
+            raise Unauthorized("Refresh token inválido o vencido")
+
+        user = self._user_repository.get_by_username(username)
+        if user is None:
+            self._refresh_store.revoke(family)
+            raise Unauthorized("Refresh token inválido o vencido")
+        return self._session_for(user, family, generation + 1)
+
+    def _authenticate(
+        self, username: str, password: str, client_ip: str | None
+    ) -> User:
+        self._login_throttle.check(username, client_ip)
+        user = self._user_repository.get_by_username(username)
+        if user is None or not self._hash_pool.verify(user.password_hash, password):
+            self._login_throttle.record_failure(username, client_ip)
+            logger.warning(
+                "Intento de login con credenciales inválidas",
+                extra={"username": username},
+            )
+            raise Unauthorized("Credenciales inválidas")
+
+        self._login_throttle.record_success(username)
+        logger.info("Login exitoso", extra={"username": username})
+        return user
+
+    def _access_token(self, user: User) -> tuple[str, AuthClaims]:
+        claims = AuthClaims(
+            username=user.username,
+            role=user.role,
+            areas=user.areas,
+            equipos=user.equipos,
+        )
+        now = datetime.now(timezone.utc)
+        token = jwt.encode(
+            {
+                "fresh": False,
+                "iat": now,
+                "jti": str(uuid.uuid4()),
+                "type": "access",
+                "sub": user.username,
+                "nbf": now,
+                "exp": now + timedelta(seconds=self._token_ttl),
+                "role": user.role,
+                "areas": list(user.areas),
+                "equipos": list(user.equipos),
+            },
+            self._secret_key,
+            algorithm=JWT_ALGORITHM,
+        )
+        return token, claims
+
+    def _session_for(self, user: User, family: str, generation: int) -> AuthSession:
+        if user.role not in ALLOWED_ROLES:
+            logger.error("Usuario con rol no permitido", extra={"role": user.role})
+            raise Unauthorized("Rol inválido en el token")
+
+        token, claims = self._access_token(user)
+        if self._claims_cache is not None:
+            # El token recién firmado no necesita verificarse en su primer uso.
+            self._claims_cache.set(
+                self._cache_key(token), claims, ttl_seconds=self._token_ttl
+            )
+        return AuthSession(
+            token=token,
+            refresh_token=self._sign_refresh(family, generation),
+            expires_in=self._token_ttl,
+            claims=claims,
+        )
+
+    def _sign_refresh(self, family: str, generation: int) -> str:
+        body = f"{family}.{generation}"
+        digest = hmac.new(self._refresh_key, body.encode(), hashlib.sha256).digest()
+        signature = base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+        return f"{body}.{signature}"
+
+    def _parse_refresh_token(self, refresh_token: str) -> tuple[str, int]:
+        family, _, rest = refresh_token.strip().partition(".")
+        raw_generation, _, _ = rest.partition(".")
+        if family and raw_generation.isdigit():
+            generation = int(raw_generation)
+            expected = self._sign_refresh(family, generation)
+            if hmac.compare_digest(expected, refresh_token.strip()):
+                return family, generation
+
+        logger.warning("Refresh token con firma inválida")
+        raise Unauthorized("Refresh token inválido o vencido")
+
+    @staticmethod
+    def _cache_key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def decode_token(self, token: str) -> AuthClaims:
+        """Decodifica y valida un token, devolviendo sus claims.
+
+        Un token ya verificado se resuelve desde la caché (por digest SHA-256)
+        sin volver a comprobar la firma, hasta que vence su `exp`. Los tokens
+        inválidos no se cachean.
+        """
+        cache_key = None
+        if self._claims_cache is not None:
+            cache_key = self._cache_key(token)
+            cached = self._claims_cache.get(cache_key)
+            if cached is not MISSING:
+                return cached
+
+        try:
+            data = jwt.decode(
+                token,
+                self._secret_key,
+                algorithms=[JWT_ALGORITHM],
+                options={"require": ["exp", "sub"]},
+            )
+        except ExpiredSignatureError as exc:
+            logger.warning("Token expirado: %s", exc)
+            raise Unauthorized("Token expirado") from exc
+        except InvalidTokenError as exc:
+            logger.warning("Token inválido: %s", exc)
+            raise Unauthorized("Token inválido") from exc
+
+        role = data.get("role")
+        if role not in ALLOWED_ROLES:
+            logger.error("Token con rol no permitido", extra={"role": role})
+            raise Unauthorized("Rol inválido en el token")
+
+        logger.debug(
+            "Token decodificado correctamente",
+            extra={"username": data.get("sub", ""), "role": role},
+        )
+        claims = AuthClaims(
+            username=data.get("sub", ""),
+            role=role,
+            areas=data.get("areas", []) or [],
+            equipos=data.get("equipos", []) or [],
+        )
+        if cache_key is not None:
+            remaining = data["exp"] - time.time()
+            if remaining > 0:
+                self._claims_cache.set(cache_key, claims, ttl_seconds=remaining)
+        return claims
+
+    def require_claims(self, request: Request) -> AuthClaims:
+        """Extrae y valida los claims del header Authorization de una petición Flask."""
+        return self.claims_from_header(
+            request.headers.get("Authorization", ""),
+            method=request.method,
+            path=request.path,
+            header_names=request.headers.keys(),
+        )
+
+    def claims_from_header(
+        self,
+        auth_header: str,
+        *,
+        method: str = "",
+        path: str = "",
+        header_names: Iterable[str] = (),
+    ) -> AuthClaims:
+        """Valida un header `Authorization: Bearer ...` de cualquier framework.
+
+        `method`, `path` y `header_names` sólo se usan para el log.
+        """
+        auth_header = auth_header.strip()
+        if not auth_header:
+            logger.warning(
+                "Solicitud sin header Authorization",
+                extra={
+                    "method": method,
+                    "path": path,
+                    "headers_presentes": sorted(header_names),
+                },
+            )
+            raise Unauthorized("Falta token de autenticación")
+
+        scheme, _, token = auth_header.partition(" ")
+        if scheme.lower() != "bearer":
+            logger.warning(
+                "Esquema de autorización inválido",
+                extra={
+                    "scheme": scheme,
+                    "auth_header": mask_authorization_header(auth_header),
+                },
+            )
+            raise Unauthorized("Falta token de autenticación")
+
+        token = token.strip()
+        if not token:
+            logger.warning(
+                "Token vacío en header Authorization",
+                extra={"auth_header": mask_authorization_header(auth_header)},
+            )
+            raise Unauthorized("Token incompleto")
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Token recibido, procediendo a validación",
+                extra={"auth_header": mask_authorization_header(auth_header)},
+            )
+        return self.decode_token(token)
+
+
+class ScopeAuthorizer:
+    "Valida permisos por rol y alcance sobre entidades jerárquicas."
+
+    def __init__(
+        self,
+        *,
+        get_area: Callable[[int], Area | None],
+        get_equipment: Callable[[int], Equipment | None],
+        get_system: Callable[[int], System | None],
+        get_areas: Callable[[Iterable[int]], Sequence[Area]] | None = None,
+        get_equipment_many: (
+            Callable[[Iterable[int]], Sequence[Equipment]] | None
+        ) = None,
+    ) -> None:
+        self._get_area = get_area
+        self._get_equipment = get_equipment
+        self._get_system = get_system
+        self._get_areas = get_areas
+        self._get_equipment_many = get_equipment_many
+
+    def ensure_superadmin(self, claims: AuthClaims) -> None:
+        "Verifica que el usuario tenga rol de superadministrador."
+        if claims.role != "superadministrador":
+            raise Forbidden("Se requiere rol superadministrador")
+
+    def ensure_can_manage_area(self, claims: AuthClaims, area_id: int) -> Area:
+        "Verifica si el usuario puede administrar el área dada."
+        area = self._get_area(area_id)
+        if area is None:
+            raise Forbidden("Área fuera de alcance")
+
+        if claims.role == "superadministrador":
+            return area
+        if claims.role == "administrador" and area.id in claims.areas:
+            return area
+
+        raise Forbidden("El usuario no puede administrar esta área")
+
+    def ensure_can_create_area(self, claims: AuthClaims, plant_id: int) -> None:
+        "Verifica si el usuario puede crear un área en la planta dada."
+        if claims.role == "superadministrador":
+            return
+
+        if claims.role != "administrador":
+            raise Forbidden("Solo administradores pueden crear áreas")
+
+        scoped_plants = {area.plant_id for area in self._areas_from_ids(claims.areas)}
+        if plant_id not in scoped_plants:
+            raise Forbidden("El área a crear no está en el alcance del administrador")
+
+    def ensure_can_manage_equipment(
+        self, claims: AuthClaims, equipment_id: int
+    ) -> Equipment:
+        "Verifica si el usuario puede administrar el equipo dado."
+        equipment = self._get_equipment(equipment_id)
+        if equipment is None:
+            raise Forbidden("Equipo fuera de alcance")
+
+        if self._can_manage_equipment(claims, equipment):
+            return equipment
+
+        raise Forbidden("El usuario no puede administrar este equipo")
+
+    def ensure_can_create_equipment(self, claims: AuthClaims, area_id: int) -> None:
+        "Verifica si el usuario puede crear un equipo en el área dada."
+        if claims.role == "superadministrador":
+            return
+
+        if claims.role != "administrador":
+            raise Forbidden("Solo administradores pueden crear equipos")
+
+        if area_id not in claims.areas:
+            raise Forbidden(
+                "El área del equipo no está en el alcance del administrador"
+            )
+
+    def ensure_can_manage_system(self, claims: AuthClaims, system_id: int) -> System:
+        "Verifica si el usuario puede administrar el sistema dado."
+        system = self._get_system(system_id)
+        if system is None:
+            raise Forbidden("Sistema fuera de alcance")
+
+        equipment = self.ensure_can_manage_equipment(claims, system.equipment_id)
+        if equipment is None:  # pragma: no cover - defensive
+            raise Forbidden("Equipo no asociado al sistema")
+
+        return system
+
+    def ensure_can_create_system(self, claims: AuthClaims, equipment_id: int) -> None:
+        "Verifica si el usuario puede crear un sistema en el equipo dado."
+        self.ensure_can_manage_equipment(claims, equipment_id)
+
+    def filter_areas(
+        self, claims: AuthClaims, plant_id: int, areas: Sequence[Area]
+    ) -> list[Area]:
+        "Filtra áreas según los claims del usuario y el plant_id solicitado."
+        allowed = self.area_ids_in_scope(claims)
+        if allowed is None:
+            return list(areas)
+        return [area for area in areas if area.id in allowed]
+
+    def filter_equipment(
+        self, claims: AuthClaims, area_id: int, equipment: Sequence[Equipment]
+    ) -> list[Equipment]:
+        "Filtra equipos según los claims del usuario."
+        allowed = self.equipment_ids_in_scope(claims, area_id)
+        if allowed is None:
+            return list(equipment)
+        return [eq for eq in equipment if eq.id in allowed]
+
+    def filter_systems(
+        self, claims: AuthClaims, equipment_id: int, systems: Sequence[System]
+    ) -> list[System]:
+        "Filtra sistemas según los claims del usuario."
+        if not self.can_list_systems(claims, equipment_id):
+            return []
+
+        return list(systems)
+
+    def area_ids_in_scope(self, claims: AuthClaims) -> frozenset[int] | None:
+        """Ids de las áreas visibles para el usuario; `None` si ve todas.
+
+        Son las reglas de `filter_areas` expresadas como ids, para filtrar en
+        la consulta paginada antes del LIMIT y no después.
+        """
+        if claims.role in {"superadministrador", "invitado"}:
+            return None
+
+        if claims.role == "administrador":
+            return claims.areas
+
+        if claims.role == "maquinista":
+            return frozenset(
+                eq.area_id for eq in self._equipment_from_ids(claims.equipos)
+            )
+
+        return frozenset()
+
+    def equipment_ids_in_scope(
+        self, claims: AuthClaims, area_id: int
+    ) -> frozenset[int] | None:
+        "Ids de los equipos visibles del área, como `area_ids_in_scope`."
+        if claims.role in {"superadministrador", "invitado"}:
+            return None
+
+        if claims.role == "administrador":
+            return None if area_id in claims.areas else frozenset()
+
+        if claims.role == "maquinista":
+            return claims.equipos
+
+        return frozenset()
+
+    def can_list_systems(self, claims: AuthClaims, equipment_id: int) -> bool:
+        "Indica si el usuario ve los sistemas del equipo (todos o ninguno)."
+        try:
+            self.ensure_can_manage_equipment(claims, equipment_id)
+        except Forbidden:
+            return False
+
+        return True
+
+    def inventory_scope(self, claims: AuthClaims) -> InventoryScope:
+        """Parte del inventario visible para el usuario.
+
+        Son las reglas de `hierarchy_predicate` expresadas como ids, para que
+        la exportación las aplique en cada consulta en lugar de leer todo.
+        """
+        if claims.role not in ALLOWED_ROLES:
+            return InventoryScope(entity_types=frozenset())
+
+        if claims.role == "invitado":
+            return InventoryScope(entity_types=frozenset({"planta", "area", "equipo"}))
+
+        if claims.role == "administrador":
+            return InventoryScope(area_ids=claims.areas)
+
+        if claims.role == "maquinista":
+            return InventoryScope(
+                area_ids=self.area_ids_in_scope(claims), equipment_ids=claims.equipos
+            )
+
+        return InventoryScope()
+
+    def filter_tree(self, claims: AuthClaims, tree: PlantTree) -> PlantTree:
+        """Filtra un árbol ya cargado sin consultas adicionales.
+
+        Aplica las mismas reglas que `filter_areas`, `filter_equipment` y
+        `filter_systems`, pero usando las relaciones presentes en el árbol.
+        """
+        if claims.role not in ALLOWED_ROLES:
+            return PlantTree(plant=tree.plant, areas=[])
+
+        allowed_areas = claims.areas
+        allowed_equipment = claims.equipos
+        scoped_areas: list[AreaNode] = []
+        for area_node in tree.areas:
+            area = area_node.area
+            if claims.role == "administrador" and area.id not in allowed_areas:
+                continue
+
+            scoped_equipment = [
+                EquipmentNode(
+                    equipment=node.equipment,
+                    systems=(
+                        list(node.systems)
+                        if self._can_manage_equipment(claims, node.equipment)
+                        else []
+                    ),
+                )
+                for node in area_node.equipment
+                if claims.role != "maquinista" or node.equipment.id in allowed_equipment
+            ]
+            if claims.role == "maquinista" and not scoped_equipment:
+                continue
+
+            scoped_areas.append(AreaNode(area=area, equipment=scoped_equipment))
+
+        return PlantTree(plant=tree.plant, areas=scoped_areas)
+
+    def filter_changes(
+        self, claims: AuthClaims, changes: Sequence[ChangeEntry]
+    ) -> list[ChangeEntry]:
+        """Filtra entradas del feed de cambios con las reglas de `filter_tree`.
+
+        Usa los ids de ancestros guardados en cada entrada, por lo que también
+        funciona para entidades ya eliminadas.
+        """
+        visible = self.hierarchy_predicate(claims)
+        return [
+            change
+            for change in changes
+            if visible(change.entity_type, change.area_id, change.equipment_id)
+        ]
+
+    def hierarchy_predicate(
+        self, claims: AuthClaims
+    ) -> Callable[[str, int | None, int | None], bool]:
+        """Devuelve un filtro por `(tipo, area_id, equipo_id)` para filas planas.
+
+        Aplica las reglas de `filter_tree` sin cargar entidades. La única
+        consulta (áreas de los equipos de un maquinista) se hace al crear el
+        filtro, de modo que aplicarlo nunca toca la base.
+        """
+        role = claims.role
+        allowed_areas = claims.areas
+        allowed_equipment = claims.equipos
+        equipment_areas: set[int] = set()
+        if role == "maquinista":
+            equipment_areas = {
+                eq.area_id for eq in self._equipment_from_ids(allowed_equipment)
+            }
+
+        def visible(
+            entity_type: str, area_id: int | None, equipment_id: int | None
+        ) -> bool:
+            if role not in ALLOWED_ROLES:
+                return False
+            if role == "superadministrador" or entity_type == "planta":
+                return True
+            if role == "invitado":
+                return entity_type != "sistema"
+            if role == "administrador":
+                return area_id in allowed_areas
+            if entity_type == "area":
+                return area_id in equipment_areas
+            return equipment_id in allowed_equipment
+
+        return visible
+
+    @staticmethod
+    def _can_manage_equipment(claims: AuthClaims, equipment: Equipment) -> bool:
+        if claims.role == "superadministrador":
+            return True
+        if claims.role == "administrador":
+            return equipment.area_id in claims.areas
+        if claims.role == "maquinista":
+            return equipment.id in claims.equipos
+        return False
+
+    def _areas_from_ids(self, area_ids: Iterable[int]) -> list[Area]:
+        ids = {area_id for area_id in area_ids if area_id is not None}
+        if not ids:
+            return []
+        if self._get_areas is not None:
+            return list(self._get_areas(ids))
+
+        areas = (self._get_area(area_id) for area_id in ids)
+        return [area for area in areas if area is not None]
+
+    def _equipment_from_ids(self, equipment_ids: Iterable[int]) -> list[Equipment]:
+        ids = {eq_id for eq_id in equipment_ids if eq_id is not None}
+        if not ids:
+            return []
+        if self._get_equipment_many is not None:
+            return list(self._get_equipment_many(ids))
+
+        equipment = (self._get_equipment(eq_id) for eq_id in ids)
+        return [eq for eq in equipment if eq is not None]
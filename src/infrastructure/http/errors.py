@@ -0,0 +1,36 @@
+"""Formato común de las respuestas de error JSON (`{"message": ...}`)."""
+
+from __future__ import annotations
+
+from werkzeug.exceptions import HTTPException
+
+
+FALLBACK_MESSAGES = {
+    400: "Solicitud inválida",
+    401: "No autorizado",
+    403: "Prohibido",
+    404: "Recurso no encontrado",
+    405: "Método no permitido",
+}
+
+
+def error_message(error: HTTPException) -> str:
+    "Mensaje para el cliente: la descripción de la excepción o uno genérico."
+    return (
+        error.description
+        or FALLBACK_MESSAGES.get(error.code or 0)
+        or getattr(error, "name", None)
+        or "Error HTTP"
+    )
+
+
+def response_headers(error: HTTPException) -> dict[str, str]:
+    "Cabeceras propias de la excepción (p. ej. `Retry-After`), sin su Content-Type."
+    return {
+        name: value
+        for name, value in error.get_headers()
+        if name.lower() != "content-type"
+    }
+
+
+__all__ = ["FALLBACK_MESSAGES", "error_message", "response_headers"]
@@ -0,0 +1,47 @@
+"""Formato Server-Sent Events del stream de cambios, común a Flask y FastAPI."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator, Sequence
+
+from src.entities.change import ChangeEntry
+from src.infrastructure.http.auth import AuthClaims, ScopeAuthorizer
+from src.infrastructure.http.helpers import MAX_PAGE_SIZE, _encode_cursor
+from src.interface_adapters.gateways.change_broadcaster import Subscription
+from src.interface_adapters.presenters.change_presenter import present as present_change
+from src.use_cases.list_changes import ListChangesUseCase
+
+RETRY_MILLISECONDS = 3000
+
+
+def _format_events(changes: Sequence[ChangeEntry]) -> str:
+    return "".join(
+        f"id: {_encode_cursor(change.id)}\n"
+        "event: cambio\n"
+        f"data: {json.dumps(present_change(change), ensure_ascii=False)}\n\n"
+        for change in changes
+    )
+
+
+def _replay(
+    list_changes_use_case: ListChangesUseCase,
+    scope_authorizer: ScopeAuthorizer,
+    claims: AuthClaims,
+    subscription: Subscription,
+) -> Iterator[str | None]:
+    """Lee el log desde `last_id`; emite `None` si el cursor fue compactado."""
+    while True:
+        feed = list_changes_use_case.execute(
+            after=subscription.last_id or 0, limit=MAX_PAGE_SIZE
+        )
+        if feed is None:
+            yield None
+            return
+        fresh = subscription.accept(feed.items)
+        if fresh:
+            scoped = scope_authorizer.filter_changes(claims, fresh)
+            if scoped:
+                yield _format_events(scoped)
+        if not feed.has_more:
+            return
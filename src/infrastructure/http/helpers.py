@@ -0,0 +1,149 @@
+"""Funciones auxiliares de las rutas HTTP que no dependen del framework.
+
+Validación de payloads, cursores de paginación y ETags: Flask y FastAPI las
+aplican sobre su propia petición, de modo que ambos front ends responden igual.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, Type
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from werkzeug.exceptions import BadRequest
+
+from src.infrastructure.http.auth import AuthSession
+
+
+MAX_PAGE_SIZE = 500
+MAX_BATCH_SIZE = 500
+_CURSOR_PREFIX = "id:"
+_CACHE_CONTROL = "private, no-cache"
+
+
+def _format_validation_errors(exc: ValidationError) -> str:
+    errors = []
+    for error in exc.errors():
+        loc = ".".join(str(item) for item in error.get("loc", []))
+        errors.append(f"{loc or 'body'}: {error.get('msg')}")
+    return "; ".join(errors) if errors else "Payload inválido"
+
+
+def _validate_payload(payload: dict[str, Any], schema: Type[BaseModel]) -> dict[str, Any]:
+    """Valida un payload contra un schema Pydantic y retorna datos filtrados."""
+    try:
+        validated = schema.model_validate(payload)
+    except ValidationError as exc:
+        raise BadRequest(f"Payload inválido: {_format_validation_errors(exc)}") from exc
+    return validated.model_dump(exclude_none=True)
+
+
+@lru_cache(maxsize=None)
+def _batch_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[schema])
+
+
+def _validate_batch(payload: Any, schema: Type[BaseModel]) -> list[dict[str, Any]]:
+    """Valida un arreglo de payloads de alta en una sola pasada.
+
+    Los errores indican la posición del elemento (`0.nombre`). También se
+    rechazan nombres repetidos dentro del lote.
+    """
+    if not isinstance(payload, list) or not 1 <= len(payload) <= MAX_BATCH_SIZE:
+        raise BadRequest(f"Se esperaba un arreglo de 1 a {MAX_BATCH_SIZE} elementos")
+    try:
+        validated = _batch_adapter(schema).validate_python(payload)
+    except ValidationError as exc:
+        raise BadRequest(f"Payload inválido: {_format_validation_errors(exc)}") from exc
+
+    items = [item.model_dump(exclude_none=True) for item in validated]
+    names = [item["name"] for item in items]
+    if len(set(names)) != len(names):
+        raise BadRequest("El lote contiene nombres repetidos")
+    return items
+
+
+def _encode_cursor(after: int | None) -> str | None:
+    """Convierte el último id de una página en un cursor opaco."""
+    if after is None:
+        return None
+    raw = f"{_CURSOR_PREFIX}{after}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> int:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise BadRequest("Cursor de paginación inválido") from exc
+
+    prefix, _, value = raw.partition(_CURSOR_PREFIX)
+    if prefix or not value.isdigit():
+        raise BadRequest("Cursor de paginación inválido")
+    return int(value)
+
+
+def _parse_pagination(args: Mapping[str, str]) -> tuple[int, int | None] | None:
+    raw_limit = args.get("limite")
+    cursor = args.get("despues")
+    if raw_limit is None and cursor is None:
+        return None
+
+    return _parse_limit(args), _decode_cursor(cursor) if cursor else None
+
+
+def _parse_flag(args: Mapping[str, str], name: str) -> bool:
+    raw = args.get(name, "false").lower()
+    if raw not in {"true", "false", "1", "0"}:
+        raise BadRequest(f"El parámetro {name} debe ser true o false")
+    return raw in {"true", "1"}
+
+
+def _parse_limit(args: Mapping[str, str]) -> int:
+    raw_limit = args.get("limite")
+    if raw_limit is None:
+        return MAX_PAGE_SIZE
+
+    try:
+        limit = int(raw_limit)
+    except ValueError as exc:
+        raise BadRequest("El parámetro limite debe ser un entero") from exc
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise BadRequest(f"El parámetro limite debe estar entre 1 y {MAX_PAGE_SIZE}")
+    return limit
+
+
+def _paginated_body(items: list[Any], next_after: int | None) -> dict[str, Any]:
+    return {"items": items, "siguiente": _encode_cursor(next_after)}
+
+
+def _tag_for(full_path: str, claims: Any, revision: object) -> str:
+    """Calcula un ETag fuerte para la respuesta de un GET de jerarquía.
+
+    Combina `full_path` (`ruta?query`, paginación incluida), el alcance del
+    usuario que usa `ScopeAuthorizer` y la revisión del subárbol consultado:
+    dos roles con la misma URL obtienen etiquetas distintas.
+    """
+    material = "|".join(
+        (
+            full_path,
+            claims.role,
+            ",".join(str(area_id) for area_id in sorted(claims.areas)),
+            ",".join(str(equipment_id) for equipment_id in sorted(claims.equipos)),
+            repr(revision),
+        )
+    )
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+def _session_payload(session: AuthSession) -> dict[str, object]:
+    return {
+        "token": session.token,
+        "refresh_token": session.refresh_token,
+        "expires_in": session.expires_in,
+    }
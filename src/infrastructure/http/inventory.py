@@ -0,0 +1,95 @@
+"""Formatos de exportación e importación del inventario (NDJSON y CSV).
+
+Comunes a Flask y FastAPI: cada front end sólo adapta la lectura del cuerpo y
+el envío de la respuesta.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from pydantic import ValidationError
+from werkzeug.exceptions import BadRequest
+
+from src.entities.inventory import ImportRow, ImportRowError
+from src.infrastructure.http.helpers import _format_validation_errors
+from src.interface_adapters.presenters.inventory_presenter import COLUMNS
+from src.interface_adapters.schemas import InventoryImportRow
+
+_ROWS_PER_CHUNK = 500
+_MIMETYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _ndjson_chunks(records: Iterable[dict[str, Any]]) -> Iterator[str]:
+    lines: list[str] = []
+    for record in records:
+        lines.append(json.dumps(record, ensure_ascii=False))
+        if len(lines) == _ROWS_PER_CHUNK:
+            yield "\n".join(lines) + "\n"
+            lines.clear()
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def _csv_chunks(records: Iterable[dict[str, Any]]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=COLUMNS)
+    writer.writeheader()
+    for count, record in enumerate(records, start=1):
+        writer.writerow(record)
+        if count % _ROWS_PER_CHUNK == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+_FORMATS = ("ndjson", "csv")
+
+
+def _to_row(line: int, record: Any) -> ImportRow | ImportRowError:
+    if not isinstance(record, dict):
+        return ImportRowError(line, "Se esperaba un objeto por fila")
+    # Las celdas vacías de un CSV equivalen a campos omitidos.
+    record = {key: value for key, value in record.items() if value not in ("", None)}
+    try:
+        validated = InventoryImportRow.model_validate(record)
+    except ValidationError as exc:
+        return ImportRowError(line, _format_validation_errors(exc))
+    return ImportRow(line=line, **validated.model_dump())
+
+
+def _ndjson_rows(text: Iterable[str]) -> Iterator[ImportRow | ImportRowError]:
+    for line, raw in enumerate(text, start=1):
+        if not raw.strip():
+            continue
+        try:
+            record = json.loads(raw)
+        except json.JSONDecodeError:
+            yield ImportRowError(line, "JSON inválido")
+            continue
+        yield _to_row(line, record)
+
+
+def _csv_rows(text: Iterable[str]) -> Iterator[ImportRow | ImportRowError]:
+    reader = csv.DictReader(text)
+    # La línea 1 es el encabezado.
+    for line, record in enumerate(reader, start=2):
+        yield _to_row(line, record)
+
+
+def _decoded(
+    rows: Iterator[ImportRow | ImportRowError],
+) -> Iterator[ImportRow | ImportRowError]:
+    try:
+        yield from rows
+    except UnicodeDecodeError as exc:
+        raise BadRequest("El archivo debe estar codificado en UTF-8") from exc
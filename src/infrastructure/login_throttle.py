@@ -0,0 +1,86 @@
+"""
+Path: src/infrastructure/login_throttle.py
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections.abc import Callable
+
+from werkzeug.exceptions import TooManyRequests
+
+from src.shared.cache import MISSING, LruTtlCache
+from src.shared.logger import get_logger
+
+logger = get_logger("login-throttle")
+
+
+class LoginThrottle:
+    """Corta los intentos de login fallidos por usuario y por IP.
+
+    Cuenta fallos en una ventana fija de `window_seconds` que empieza con el
+    primero; al llegar al máximo, `check` responde 429 sin calcular ningún
+    hash hasta que la ventana termine. Un login correcto limpia el contador
+    del usuario, no el de la IP. Los contadores viven en una LRU acotada a
+    `max_tracked` claves, de modo que rotar usuarios o IPs no agota memoria.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_failures_per_user: int = 5,
+        max_failures_per_ip: int = 50,
+        window_seconds: float = 300.0,
+        max_tracked: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._limits = {"usuario": max_failures_per_user, "ip": max_failures_per_ip}
+        self._window = window_seconds
+        self._clock = clock
+        self._failures = LruTtlCache(
+            max_entries=max_tracked, ttl_seconds=window_seconds, clock=clock
+        )
+        self._lock = threading.Lock()
+
+    def check(self, username: str, client_ip: str | None = None) -> None:
+        "Lanza 429 si el usuario o la IP agotaron sus intentos."
+        now = self._clock()
+        for key in self._keys(username, client_ip):
+            entry = self._failures.peek(key)
+            if entry is MISSING:
+                continue
+            count, started = entry
+            if count >= self._limits[key[0]]:
+                logger.warning(
+                    "Login bloqueado por intentos fallidos",
+                    extra={"scope": key[0], "username": username},
+                )
+                raise TooManyRequests(
+                    "Demasiados intentos de inicio de sesión; reintentar más tarde",
+                    retry_after=max(math.ceil(started + self._window - now), 1),
+                )
+
+    def record_failure(self, username: str, client_ip: str | None = None) -> None:
+        now = self._clock()
+        with self._lock:
+            for key in self._keys(username, client_ip):
+                entry = self._failures.peek(key)
+                count, started = (0, now) if entry is MISSING else entry
+                self._failures.set(
+                    key, (count + 1, started), ttl_seconds=started + self._window - now
+                )
+
+    def record_success(self, username: str) -> None:
+        self._failures.delete(("usuario", username))
+
+    @staticmethod
+    def _keys(username: str, client_ip: str | None) -> list[tuple[str, str]]:
+        keys = [("usuario", username)]
+        if client_ip:
+            keys.append(("ip", client_ip))
+        return keys
+
+
+__all__ = ["LoginThrottle"]
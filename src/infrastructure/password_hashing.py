@@ -0,0 +1,83 @@
+"""
+Path: src/infrastructure/password_hashing.py
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import TypeVar
+
+from werkzeug.exceptions import ServiceUnavailable
+from werkzeug.security import check_password_hash, generate_password_hash
+
+from src.shared.logger import get_logger
+
+logger = get_logger("password-hashing")
+
+T = TypeVar("T")
+
+
+class PasswordHashPool:
+    """Verifica y genera hashes de contraseñas en un pool de hilos acotado.
+
+    El hash (scrypt/pbkdf2 de `hashlib`) libera el GIL, así que `workers` hilos
+    calculan en paralelo sin frenar al resto del proceso; lo que no entra en
+    `workers` + `max_pending` se rechaza con 503 en vez de encolarse sin
+    límite. Como el servidor tiene menos hilos que ese cupo, además ningún
+    login espera su turno más de `wait_seconds`: pasado ese plazo se cancela
+    si aún no empezó y responde 503, y el hilo de la petición queda libre.
+    Los hilos se crean con el primer login, después del fork de los workers
+    del servidor.
+    """
+
+    def __init__(
+        self, *, workers: int = 2, max_pending: int = 16, wait_seconds: float = 1.0
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers debe ser mayor que cero")
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="password-hash"
+        )
+        self._slots = threading.BoundedSemaphore(workers + max(max_pending, 0))
+        self._wait_seconds = wait_seconds
+
+    def verify(self, password_hash: str, password: str) -> bool:
+        "Compara `password` con `password_hash`; 503 si el pool está saturado."
+        return self._run(check_password_hash, password_hash, password)
+
+    def hash_password(self, password: str) -> str:
+        "Genera el hash de `password`; 503 si el pool está saturado."
+        return self._run(generate_password_hash, password)
+
+    def _run(self, function: Callable[..., T], *args: str) -> T:
+        if not self._slots.acquire(blocking=False):
+            logger.warning("Pool de hash de contraseñas saturado")
+            raise _saturated()
+        try:
+            future = self._executor.submit(function, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _future: self._slots.release())
+        try:
+            return future.result(timeout=self._wait_seconds)
+        except FutureTimeoutError:
+            future.cancel()
+            logger.warning("Hash de contraseña sin turno tras %ss", self._wait_seconds)
+            raise _saturated() from None
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _saturated() -> ServiceUnavailable:
+    return ServiceUnavailable(
+        "Demasiados inicios de sesión en curso; reintentar más tarde",
+        retry_after=1,
+    )
+
+
+__all__ = ["PasswordHashPool"]
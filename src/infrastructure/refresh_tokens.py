@@ -0,0 +1,65 @@
+"""
+Path: src/infrastructure/refresh_tokens.py
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime
+from typing import Protocol
+
+
+class RefreshTokenStore(Protocol):
+    """Estado de servidor de los refresh tokens rotativos.
+
+    Se guarda una sola entrada por sesión ("familia"): el usuario, la
+    generación vigente y el vencimiento. Cada refresh avanza la generación;
+    presentar una generación anterior delata un token reutilizado.
+    """
+
+    def start(self, family: str, username: str, expires_at: datetime) -> None:
+        "Registra una sesión nueva en la generación 0."
+        pass  # pylint: disable=unnecessary-pass
+
+    def rotate(self, family: str, generation: int, *, now: datetime) -> str | None:
+        """Avanza la familia si `generation` es la vigente y no venció.
+
+        Devuelve el usuario de la sesión o `None`. Una generación distinta de
+        la vigente (reuso) o una sesión vencida elimina la familia entera.
+        """
+        pass  # pylint: disable=unnecessary-pass
+
+    def revoke(self, family: str) -> None:
+        "Elimina la sesión; sus refresh tokens dejan de servir."
+        pass  # pylint: disable=unnecessary-pass
+
+
+class InMemoryRefreshTokenStore(RefreshTokenStore):
+    """Almacén por proceso para pruebas y fallback local."""
+
+    def __init__(self) -> None:
+        self._families: dict[str, tuple[str, int, datetime]] = {}
+        self._lock = threading.Lock()
+
+    def start(self, family: str, username: str, expires_at: datetime) -> None:
+        with self._lock:
+            self._families[family] = (username, 0, expires_at)
+
+    def rotate(self, family: str, generation: int, *, now: datetime) -> str | None:
+        with self._lock:
+            entry = self._families.get(family)
+            if entry is None:
+                return None
+            username, current, expires_at = entry
+            if current != generation or expires_at <= now:
+                del self._families[family]
+                return None
+            self._families[family] = (username, current + 1, expires_at)
+            return username
+
+    def revoke(self, family: str) -> None:
+        with self._lock:
+            self._families.pop(family, None)
+
+
+__all__ = ["InMemoryRefreshTokenStore", "RefreshTokenStore"]
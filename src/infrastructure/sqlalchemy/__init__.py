@@ -1,21 +1,35 @@
 """Integraciones de base de datos con SQLAlchemy ubicadas en infraestructura."""
 
+from src.infrastructure.sqlalchemy.async_plant_repository import (
+    AsyncSqlAlchemyPlantRepository,
+)
+from src.infrastructure.sqlalchemy.async_unit_of_work import AsyncSqlAlchemyUnitOfWork
 from src.infrastructure.sqlalchemy.mappers import (
     area_to_entity,
+    change_to_entity,
     equipment_to_entity,
     plant_to_entity,
+    plant_tree_to_entity,
+    purge_job_to_entity,
     system_to_entity,
     user_to_entity,
 )
 from src.infrastructure.sqlalchemy.models import (
     AreaModel,
     Base,
+    ChangeLogModel,
+    EntityVersionModel,
     EquipmentModel,
     PlantModel,
+    PurgeJobModel,
+    RefreshTokenModel,
     SystemModel,
     UserModel,
 )
 from src.infrastructure.sqlalchemy.plant_repository import SqlAlchemyPlantRepository
+from src.infrastructure.sqlalchemy.refresh_token_store import (
+    SqlAlchemyRefreshTokenStore,
+)
 from src.infrastructure.sqlalchemy.user_repository import SqlAlchemyUserRepository
 from src.infrastructure.sqlalchemy.unit_of_work import SqlAlchemyUnitOfWork
 
@@ -25,12 +39,22 @@ __all__ = [
     "AreaModel",
     "EquipmentModel",
     "SystemModel",
+    "EntityVersionModel",
+    "ChangeLogModel",
+    "PurgeJobModel",
     "UserModel",
+    "RefreshTokenModel",
     "SqlAlchemyPlantRepository",
     "SqlAlchemyUserRepository",
+    "SqlAlchemyRefreshTokenStore",
     "SqlAlchemyUnitOfWork",
+    "AsyncSqlAlchemyPlantRepository",
+    "AsyncSqlAlchemyUnitOfWork",
     "plant_to_entity",
+    "plant_tree_to_entity",
+    "purge_job_to_entity",
     "area_to_entity",
+    "change_to_entity",
     "equipment_to_entity",
     "system_to_entity",
     "user_to_entity",
@@ -0,0 +1,437 @@
+"""Implementación async de PlantDataRepository basada en SQLAlchemy."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Collection, Iterable, Mapping, Sequence
+from datetime import datetime
+from typing import Any, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.entities.area import Area
+from src.entities.change import utc_now
+from src.entities.equipment import Equipment
+from src.entities.plant import Plant
+from src.entities.plant_tree import PlantTree
+from src.entities.purge_job import PurgeJob
+from src.entities.status_cascade import StatusCascade
+from src.entities.system import System
+from src.infrastructure.sqlalchemy.plant_repository import SqlAlchemyPlantRepository
+from src.infrastructure.sqlalchemy.session import AsyncSessionFactory
+from src.use_cases.ports.pagination import Page
+from src.use_cases.ports.plant_repository import AsyncPlantDataRepository
+
+T = TypeVar("T")
+
+
+def _session_required() -> Session:
+    raise RuntimeError("El repositorio síncrono interno siempre recibe una sesión")
+
+
+class AsyncSqlAlchemyPlantRepository(AsyncPlantDataRepository):
+    """Repositorio async sobre `AsyncSession` con las consultas del síncrono.
+
+    Cada operación ejecuta el método equivalente de `SqlAlchemyPlantRepository`
+    con `AsyncSession.run_sync`: las sentencias, el change log y los ETag son
+    los mismos, pero la E/S pasa por el driver async y no bloquea el event
+    loop. Sin `session` cada llamada abre la suya (y su transacción si
+    escribe); con la de un `AsyncSqlAlchemyUnitOfWork` el commit queda a cargo
+    de éste.
+    """
+
+    def __init__(
+        self,
+        session_factory: AsyncSessionFactory,
+        *,
+        clock: Callable[[], datetime] = utc_now,
+    ) -> None:
+        self._session_factory = session_factory
+        self._sync = SqlAlchemyPlantRepository(_session_required, clock=clock)
+
+    async def _read(
+        self,
+        session: AsyncSession | None,
+        method: Callable[..., T],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        def call(db: Session) -> T:
+            return method(*args, session=db, **kwargs)
+
+        if session is not None:
+            return await session.run_sync(call)
+        async with self._session_factory() as db:
+            return await db.run_sync(call)
+
+    async def _write(
+        self,
+        session: AsyncSession | None,
+        method: Callable[..., T],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        if session is not None:
+            return await self._read(session, method, *args, **kwargs)
+        async with self._session_factory() as db, db.begin():
+            return await self._read(db, method, *args, **kwargs)
+
+    # Plant operations
+    async def list_plants(
+        self, *, session: AsyncSession | None = None
+    ) -> Sequence[Plant]:
+        return await self._read(session, self._sync.list_plants)
+
+    async def list_plants_page(
+        self,
+        *,
+        limit: int,
+        after: int | None = None,
+        session: AsyncSession | None = None,
+    ) -> Page[Plant]:
+        return await self._read(
+            session, self._sync.list_plants_page, limit=limit, after=after
+        )
+
+    async def get_plant(
+        self, plant_id: int, *, session: AsyncSession | None = None
+    ) -> Plant | None:
+        return await self._read(session, self._sync.get_plant, plant_id)
+
+    async def create_plant(
+        self,
+        *,
+        name: str,
+        location: str | None = None,
+        status: str | None = None,
+        session: AsyncSession | None = None,
+    ) -> Plant:
+        return await self._write(
+            session,
+            self._sync.create_plant,
+            name=name,
+            location=location,
+            status=status,
+        )
+
+    async def update_plant(
+        self,
+        plant_id: int,
+        *,
+        name: str | None = None,
+        location: str | None = None,
+        status: str | None = None,
+        session: AsyncSession | None = None,
+    ) -> Plant | None:
+        return await self._write(
+            session,
+            self._sync.update_plant,
+            plant_id,
+            name=name,
+            location=location,
+            status=status,
+        )
+
+    async def set_plant_status(
+        self,
+        plant_id: int,
+        statuses: Mapping[str, str],
+        *,
+        session: AsyncSession | None = None,
+    ) -> StatusCascade | None:
+        return await self._write(
+            session, self._sync.set_plant_status, plant_id, statuses
+        )
+
+    async def delete_plant(
+        self, plant_id: int, *, session: AsyncSession | None = None
+    ) -> bool:
+        return await self._write(session, self._sync.delete_plant, plant_id)
+
+    async def hide_plant(
+        self, plant_id: int, *, session: AsyncSession | None = None
+    ) -> PurgeJob | None:
+        return await self._write(session, self._sync.hide_plant, plant_id)
+
+    async def purge_plant_batch(
+        self, job_id: int, *, batch_size: int, session: AsyncSession | None = None
+    ) -> PurgeJob | None:
+        return await self._write(
+            session, self._sync.purge_plant_batch, job_id, batch_size=batch_size
+        )
+
+    async def get_purge_job(
+        self, job_id: int, *, session: AsyncSession | None = None
+    ) -> PurgeJob | None:
+        return await self._read(session, self._sync.get_purge_job, job_id)
+
+    async def fail_purge_job(
+        self, job_id: int, error: str, *, session: AsyncSession | None = None
+    ) -> PurgeJob | None:
+        return await self._write(session, self._sync.fail_purge_job, job_id, error)
+
+    async def list_unfinished_purge_jobs(
+        self, *, session: AsyncSession | None = None
+    ) -> Sequence[PurgeJob]:
+        return await self._read(session, self._sync.list_unfinished_purge_jobs)
+
+    async def get_plant_tree(
+        self, plant_id: int, *, session: AsyncSession | None = None
+    ) -> PlantTree | None:
+        return await self._read(session, self._sync.get_plant_tree, plant_id)
+
+    async def get_plant_versions(
+        self,
+        plant_ids: Iterable[int] | None = None,
+        *,
+        session: AsyncSession | None = None,
+    ) -> dict[int, int]:
+        return await self._read(session, self._sync.get_plant_versions, plant_ids)
+
+    # Area operations
+    async def list_areas(
+        self, plant_id: int, *, session: AsyncSession | None = None
+    ) -> Sequence[Area]:
+        return await self._read(session, self._sync.list_areas, plant_id)
+
+    async def list_areas_page(
+        self,
+        plant_id: int,
+        *,
+        limit: int,
+        after: int | None = None,
+        ids: Collection[int] | None = None,
+        session: AsyncSession | None = None,
+    ) -> Page[Area]:
+        return await self._read(
+            session,
+            self._sync.list_areas_page,
+            plant_id,
+            limit=limit,
+            after=after,
+            ids=ids,
+        )
+
+    async def get_area(
+        self, area_id: int, *, session: AsyncSession | None = None
+    ) -> Area | None:
+        return await self._read(session, self._sync.get_area, area_id)
+
+    async def get_areas_by_ids(
+        self, area_ids: Iterable[int], *, session: AsyncSession | None = None
+    ) -> Sequence[Area]:
+        return await self._read(session, self._sync.get_areas_by_ids, area_ids)
+
+    async def create_area(
+        self,
+        plant_id: int,
+        *,
+        name: str,
+        status: str | None = None,
+        session: AsyncSession | None = None,
+    ) -> Area | None:
+        return await self._write(
+            session, self._sync.create_area, plant_id, name=name, status=status
+        )
+
+    async def create_area_batch(
+        self,
+        plant_id: int,
+        items: Sequence[Mapping[str, Any]],
+        *,
+        session: AsyncSession | None = None,
+    ) -> Sequence[Area] | None:
+        return await self._write(
+            session, self._sync.create_area_batch, plant_id, items
+        )
+
+    async def update_area(
+        self,
+        area_id: int,
+        *,
+        name: str | None = None,
+        status: str | None = None,
+        session: AsyncSession | None = None,
+    ) -> Area | None:
+        return await self._write(
+            session, self._sync.update_area, area_id, name=name, status=status
+        )
+
+    async def set_area_status(
+        self,
+        area_id: int,
+        statuses: Mapping[str, str],
+        *,
+        session: AsyncSession | None = None,
+    ) -> StatusCascade | None:
+        return await self._write(
+            session, self._sync.set_area_status, area_id, statuses
+        )
+
+    async def delete_area(
+        self, area_id: int, *, session: AsyncSession | None = None
+    ) -> bool:
+        return await self._write(session, self._sync.delete_area, area_id)
+
+    # Equipment operations
+    async def list_equipment(
+        self, area_id: int, *, session: AsyncSession | None = None
+    ) -> Sequence[Equipment]:
+        return await self._read(session, self._sync.list_equipment, area_id)
+
+    async def list_equipment_page(
+        self,
+        area_id: int,
+        *,
+        limit: int,
+        after: int | None = None,
+        ids: Collection[int] | None = None,
+        session: AsyncSession | None = None,
+    ) -> Page[Equipment]:
+        return await self._read(
+            session,
+            self._sync.list_equipment_page,
+            area_id,
+            limit=limit,
+            after=after,
+            ids=ids,
+        )
+
+    async def get_equipment(
+        self, equipment_id: int, *, session: AsyncSession | None = None
+    ) -> Equipment | None:
+        return await self._read(session, self._sync.get_equipment, equipment_id)
+
+    async def get_equipment_by_ids(
+        self, equipment_ids: Iterable[int], *, session: AsyncSession | None = None
+    ) -> Sequence[Equipment]:
+        return await self._read(
+            session, self._sync.get_equipment_by_ids, equipment_ids
+        )
+
+    async def create_equipment(
+        self,
+        area_id: int,
+        *,
+        name: str,
+        status: str | None = None,
+        session: AsyncSession | None = None,
+    ) -> Equipment | None:
+        return await self._write(
+            session, self._sync.create_equipment, area_id, name=name, status=status
+        )
+
+    async def create_equipment_batch(
+        self,
+        area_id: int,
+        items: Sequence[Mapping[str, Any]],
+        *,
+        session: AsyncSession | None = None,
+    ) -> Sequence[Equipment] | None:
+        return await self._write(
+            session, self._sync.create_equipment_batch, area_id, items
+        )
+
+    async def update_equipment(
+        self,
+        equipment_id: int,
+        *,
+        name: str | None = None,
+        status: str | None = None,
+        session: AsyncSession | None = None,
+    ) -> Equipment | None:
+        return await self._write(
+            session,
+            self._sync.update_equipment,
+            equipment_id,
+            name=name,
+            status=status,
+        )
+
+    async def set_equipment_status(
+        self,
+        equipment_id: int,
+        statuses: Mapping[str, str],
+        *,
+        session: AsyncSession | None = None,
+    ) -> StatusCascade | None:
+        return await self._write(
+            session, self._sync.set_equipment_status, equipment_id, statuses
+        )
+
+    async def delete_equipment(
+        self, equipment_id: int, *, session: AsyncSession | None = None
+    ) -> bool:
+        return await self._write(session, self._sync.delete_equipment, equipment_id)
+
+    # System operations
+    async def list_systems(
+        self, equipment_id: int, *, session: AsyncSession | None = None
+    ) -> Sequence[System]:
+        return await self._read(session, self._sync.list_systems, equipment_id)
+
+    async def list_systems_page(
+        self,
+        equipment_id: int,
+        *,
+        limit: int,
+        after: int | None = None,
+        session: AsyncSession | None = None,
+    ) -> Page[System]:
+        return await self._read(
+            session,
+            self._sync.list_systems_page,
+            equipment_id,
+            limit=limit,
+            after=after,
+        )
+
+    async def get_system(
+        self, system_id: int, *, session: AsyncSession | None = None
+    ) -> System | None:
+        return await self._read(session, self._sync.get_system, system_id)
+
+    async def get_systems_by_ids(
+        self, system_ids: Iterable[int], *, session: AsyncSession | None = None
+    ) -> Sequence[System]:
+        return await self._read(session, self._sync.get_systems_by_ids, system_ids)
+
+    async def create_system(
+        self,
+        equipment_id: int,
+        *,
+        name: str,
+        status: str | None = None,
+        session: AsyncSession | None = None,
+    ) -> System | None:
+        return await self._write(
+            session, self._sync.create_system, equipment_id, name=name, status=status
+        )
+
+    async def create_system_batch(
+        self,
+        equipment_id: int,
+        items: Sequence[Mapping[str, Any]],
+        *,
+        session: AsyncSession | None = None,
+    ) -> Sequence[System] | None:
+        return await self._write(
+            session, self._sync.create_system_batch, equipment_id, items
+        )
+
+    async def update_system(
+        self,
+        system_id: int,
+        *,
+        name: str | None = None,
+        status: str | None = None,
+        session: AsyncSession | None = None,
+    ) -> System | None:
+        return await self._write(
+            session, self._sync.update_system, system_id, name=name, status=status
+        )
+
+    async def delete_system(
+        self, system_id: int, *, session: AsyncSession | None = None
+    ) -> bool:
+        return await self._write(session, self._sync.delete_system, system_id)
@@ -0,0 +1,63 @@
+"""SQLAlchemy-backed async Unit of Work en infraestructura."""
+
+from __future__ import annotations
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.infrastructure.sqlalchemy.session import AsyncSessionFactory, stick_to_primary
+from src.use_cases.ports.unit_of_work import AsyncUnitOfWork
+
+
+class AsyncSqlAlchemyUnitOfWork(AsyncUnitOfWork):
+    """Manage an `AsyncSession` lifecycle for a use case.
+
+    Mirrors `SqlAlchemyUnitOfWork`: commit on a clean exit, rollback on an
+    exception, unless `commit()`/`rollback()` already ran. The session is
+    always its own; there is no ambient request session on the async side.
+    """
+
+    def __init__(self, session_factory: AsyncSessionFactory):
+        self._session_factory = session_factory
+        self._session: AsyncSession | None = None
+        self._completed = False
+
+    async def __aenter__(self) -> "AsyncSqlAlchemyUnitOfWork":
+        self._session = self._session_factory()
+        stick_to_primary(self._session.sync_session)
+        self._completed = False
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+        try:
+            if self._session is None:
+                return False
+
+            if exc_type and not self._completed:
+                await self._session.rollback()
+                self._completed = True
+            elif not exc_type and not self._completed:
+                await self._session.commit()
+                self._completed = True
+        finally:
+            if self._session is not None:
+                await self._session.close()
+            self._session = None
+        return False
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            raise RuntimeError("UnitOfWork session requested outside context")
+        return self._session
+
+    async def commit(self) -> None:
+        if self._session is None:
+            raise RuntimeError("commit() called without an active session")
+        await self._session.commit()
+        self._completed = True
+
+    async def rollback(self) -> None:
+        if self._session is None:
+            raise RuntimeError("rollback() called without an active session")
+        await self._session.rollback()
+        self._completed = True
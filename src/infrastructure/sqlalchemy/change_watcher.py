@@ -0,0 +1,69 @@
+"""Detección de cambios hechos por otros procesos vía `entity_versions`."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+
+from sqlalchemy import select
+
+from src.infrastructure.sqlalchemy.models import EntityVersionModel
+from src.infrastructure.sqlalchemy.session import SessionFactory
+
+
+class PlantVersionWatcher:
+    """Informa qué subárboles de planta cambiaron desde la última consulta.
+
+    Cada worker mantiene su propia instancia. `poll` lee la tabla
+    `entity_versions` (una fila por planta) como mucho una vez cada
+    `min_interval_seconds`; las llamadas intermedias, o concurrentes con una
+    consulta en curso, devuelven un conjunto vacío sin tocar la base. La
+    primera consulta sólo fija la línea base.
+    """
+
+    def __init__(
+        self,
+        session_factory: SessionFactory,
+        *,
+        min_interval_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._session_factory = session_factory
+        self._min_interval = min_interval_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._last_poll: float | None = None
+        self._versions: dict[int, int] | None = None
+
+    def poll(self) -> set[int]:
+        if not self._lock.acquire(blocking=False):
+            return set()
+        try:
+            now = self._clock()
+            if self._last_poll is not None and now - self._last_poll < self._min_interval:
+                return set()
+            self._last_poll = now
+
+            with self._session_factory() as db:
+                rows = db.execute(
+                    select(EntityVersionModel.plant_id, EntityVersionModel.version)
+                ).all()
+            current = {plant_id: version for plant_id, version in rows}
+
+            previous = self._versions
+            self._versions = current
+            if previous is None:
+                return set()
+
+            changed = {
+                plant_id
+                for plant_id, version in current.items()
+                if previous.get(plant_id) != version
+            }
+            return changed | (previous.keys() - current.keys())
+        finally:
+            self._lock.release()
+
+
+__all__ = ["PlantVersionWatcher"]
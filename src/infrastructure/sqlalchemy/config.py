@@ -2,12 +2,16 @@
 Path: src/infrastructure/sqlalchemy/config.py
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from urllib.parse import quote_plus
 
 from src.shared.config import get_mysql_config, load_env
 
 
+# Conexiones que pueden tomar a la vez los hilos de fondo de un proceso.
+BACKGROUND_CONNECTIONS = 2
+
+
 @dataclass(frozen=True, slots=True)
 class DBConfig:
     """Valores necesarios para crear el engine de SQLAlchemy."""
@@ -22,6 +26,9 @@ class DBConfig:
     pool_timeout: int = 30
     pool_recycle: int = 1800
     echo: bool = False
+    # URLs completas de réplicas de sólo lectura; vacío desactiva el ruteo.
+    replica_urls: tuple[str, ...] = ()
+    replica_check_seconds: float = 5.0
 
     @property
     def url(self) -> str:
@@ -32,6 +39,28 @@ class DBConfig:
             f"{self.database}"
         )
 
+    @property
+    def async_url(self) -> str:
+        "URL de conexión para el engine async (driver aiomysql)."
+        return self.url.replace("mysql+pymysql://", "mysql+aiomysql://", 1)
+
+    def for_worker(self, threads: int) -> "DBConfig":
+        """Pool recortado a lo que puede usar un worker con `threads` hilos.
+
+        Cada petición retiene como mucho una conexión, y los hilos de fondo
+        (stream de eventos, borrados diferidos, chequeo de réplicas) suman
+        hasta `BACKGROUND_CONNECTIONS` más. `pool_size` y `max_overflow` nunca
+        superan lo configurado: son el techo por proceso.
+        """
+
+        limit = max(threads, 1) + BACKGROUND_CONNECTIONS
+        pool_size = min(self.pool_size, limit)
+        return replace(
+            self,
+            pool_size=pool_size,
+            max_overflow=min(self.max_overflow, limit - pool_size),
+        )
+
 
 def load_db_config() -> DBConfig:
     """Lee variables de entorno (o `.env`) y devuelve una configuración inmutable.
@@ -61,9 +90,11 @@ def load_db_config() -> DBConfig:
             pool_timeout=int(values["pool_timeout"]),
             pool_recycle=int(values["pool_recycle"]),
             echo=bool(values["echo"]),
+            replica_urls=tuple(values["replica_urls"]),
+            replica_check_seconds=float(values["replica_check_seconds"]),
         )
     except (TypeError, ValueError, RuntimeError) as exc:
         raise RuntimeError(
             "Variables de entorno DB_* inválidas. Asegúrate de que los valores numéricos sean enteros"
-            " (por ejemplo DB_PORT, DB_POOL_SIZE)."
+            " (por ejemplo DB_PORT, DB_POOL_SIZE) y DB_REPLICA_CHECK_SECONDS un número."
         ) from exc
@@ -1,14 +1,19 @@
 """Funciones de mapeo entre modelos ORM y entidades de dominio."""
 
 from src.entities.area import Area
+from src.entities.change import ChangeEntry
 from src.entities.equipment import Equipment
 from src.entities.plant import Plant
+from src.entities.plant_tree import AreaNode, EquipmentNode, PlantTree
+from src.entities.purge_job import PurgeJob
 from src.entities.system import System
 from src.entities.user import User
 from src.infrastructure.sqlalchemy.models import (
     AreaModel,
+    ChangeLogModel,
     EquipmentModel,
     PlantModel,
+    PurgeJobModel,
     SystemModel,
     UserModel,
 )
@@ -50,6 +55,89 @@ def system_to_entity(model: SystemModel) -> System:
     )
 
 
+def plant_tree_to_entity(model: PlantModel) -> PlantTree:
+    "Mapea una planta con sus relaciones ya cargadas a un árbol de dominio."
+    return PlantTree(
+        plant=plant_to_entity(model),
+        areas=[
+            AreaNode(
+                area=area_to_entity(area),
+                equipment=[
+                    EquipmentNode(
+                        equipment=equipment_to_entity(equipment),
+                        systems=[system_to_entity(system) for system in equipment.systems],
+                    )
+                    for equipment in area.equipment
+                ],
+            )
+            for area in model.areas
+        ],
+    )
+
+
+def _change_snapshot(model: ChangeLogModel) -> Plant | Area | Equipment | System | None:
+    if model.action == "eliminado" or model.name is None:
+        return None
+    if model.entity_type == "planta":
+        return Plant(
+            id=model.entity_id,
+            name=model.name,
+            location=model.location or "",
+            status=model.status,
+        )
+    if model.entity_type == "area":
+        return Area(
+            id=model.entity_id,
+            plant_id=model.plant_id,
+            name=model.name,
+            status=model.status,
+        )
+    if model.entity_type == "equipo":
+        return Equipment(
+            id=model.entity_id,
+            area_id=model.area_id,
+            name=model.name,
+            status=model.status,
+        )
+    return System(
+        id=model.entity_id,
+        equipment_id=model.equipment_id,
+        name=model.name,
+        status=model.status,
+    )
+
+
+def change_to_entity(model: ChangeLogModel) -> ChangeEntry:
+    return ChangeEntry(
+        id=model.id,
+        entity_type=model.entity_type,
+        entity_id=model.entity_id,
+        action=model.action,
+        plant_id=model.plant_id,
+        area_id=model.area_id,
+        equipment_id=model.equipment_id,
+        recorded_at=model.recorded_at,
+        snapshot=_change_snapshot(model),
+    )
+
+
+def purge_job_to_entity(model: PurgeJobModel) -> PurgeJob:
+    return PurgeJob(
+        id=model.id,
+        plant_id=model.plant_id,
+        status=model.status,
+        created_at=model.created_at,
+        deleted={
+            "sistema": model.systems_deleted,
+            "equipo": model.equipment_deleted,
+            "area": model.areas_deleted,
+            "planta": 1 if model.status == "completado" else 0,
+        },
+        finished_at=model.finished_at,
+        error=model.error,
+    )
+
+
 def user_to_entity(model: UserModel) -> User:
     return User(
         username=model.username,
@@ -2,7 +2,15 @@
 Path: src/infrastructure/sqlalchemy/models.py
 """
 
-from sqlalchemy import ForeignKey, Integer, String, Text, UniqueConstraint
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import DeclarativeBase, mapped_column, relationship
 
 
@@ -22,6 +30,16 @@ class UserModel(Base):
     equipos = mapped_column(Text, nullable=True)
 
 
+class RefreshTokenModel(Base):
+    """Sesión de refresh tokens rotativos: una fila por login, no por token."""
+    __tablename__ = "refresh_tokens"
+
+    family = mapped_column(String(32), primary_key=True)
+    username = mapped_column(String(100), nullable=False)
+    generation = mapped_column(Integer, nullable=False, default=0)
+    expires_at = mapped_column(DateTime, nullable=False, index=True)
+
+
 class PlantModel(Base):
     "Modelo ORM para plantas."
     __tablename__ = "plants"
@@ -30,10 +48,13 @@ class PlantModel(Base):
     name = mapped_column(String(150), nullable=False, unique=True)
     location = mapped_column(String(255), nullable=True)
     status = mapped_column(String(50), nullable=False, default="operativa")
+    # Marca de borrado diferido: la planta y su subárbol dejan de leerse.
+    deleted_at = mapped_column(DateTime, nullable=True)
 
     areas = relationship(
         "AreaModel",
         back_populates="plant",
+        order_by="AreaModel.id",
         cascade="all, delete-orphan",
         passive_deletes=True,
     )
@@ -57,6 +78,7 @@ class AreaModel(Base):
     equipment = relationship(
         "EquipmentModel",
         back_populates="area",
+        order_by="EquipmentModel.id",
         cascade="all, delete-orphan",
         passive_deletes=True,
     )
@@ -80,6 +102,7 @@ class EquipmentModel(Base):
     systems = relationship(
         "SystemModel",
         back_populates="equipment",
+        order_by="SystemModel.id",
         cascade="all, delete-orphan",
         passive_deletes=True,
     )
@@ -103,11 +126,71 @@ class SystemModel(Base):
     )
 
 
+class EntityVersionModel(Base):
+    """Revisión por subárbol de planta, incrementada en cada escritura.
+
+    No tiene FK hacia `plants` para que el incremento de un borrado siga
+    visible para los demás procesos.
+    """
+    __tablename__ = "entity_versions"
+
+    plant_id = mapped_column(Integer, primary_key=True, autoincrement=False)
+    version = mapped_column(BigInteger, nullable=False, default=1)
+
+
+class ChangeLogModel(Base):
+    """Registro append-only de altas, modificaciones y bajas de la jerarquía.
+
+    Se escribe en la misma transacción que el cambio. Igual que
+    `entity_versions`, no tiene FKs para sobrevivir al borrado de la entidad.
+    """
+    __tablename__ = "change_log"
+
+    id = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    )
+    entity_type = mapped_column(String(16), nullable=False)
+    entity_id = mapped_column(Integer, nullable=False)
+    action = mapped_column(String(16), nullable=False)
+    plant_id = mapped_column(Integer, nullable=False)
+    area_id = mapped_column(Integer, nullable=True)
+    equipment_id = mapped_column(Integer, nullable=True)
+    name = mapped_column(String(150), nullable=True)
+    location = mapped_column(String(255), nullable=True)
+    status = mapped_column(String(50), nullable=True)
+    recorded_at = mapped_column(DateTime, nullable=False, index=True)
+
+
+class PurgeJobModel(Base):
+    """Borrado por lotes de una planta oculta.
+
+    Sin FK hacia `plants`: el trabajo conserva su progreso cuando la planta ya
+    no existe.
+    """
+    __tablename__ = "purge_jobs"
+
+    id = mapped_column(Integer, primary_key=True, autoincrement=True)
+    plant_id = mapped_column(Integer, nullable=False, index=True)
+    status = mapped_column(String(16), nullable=False, default="pendiente")
+    systems_deleted = mapped_column(Integer, nullable=False, default=0)
+    equipment_deleted = mapped_column(Integer, nullable=False, default=0)
+    areas_deleted = mapped_column(Integer, nullable=False, default=0)
+    created_at = mapped_column(DateTime, nullable=False)
+    finished_at = mapped_column(DateTime, nullable=True)
+    error = mapped_column(String(255), nullable=True)
+
+
 __all__ = [
     "Base",
     "UserModel",
+    "RefreshTokenModel",
     "PlantModel",
     "AreaModel",
     "EquipmentModel",
     "SystemModel",
+    "EntityVersionModel",
+    "ChangeLogModel",
+    "PurgeJobModel",
 ]
@@ -2,37 +2,201 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import (
+    Callable,
+    Collection,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
 from contextlib import contextmanager
+from importlib import import_module
+from datetime import datetime, timedelta
+from typing import Any, TypeVar
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    DateTime,
+    and_,
+    Select,
+    delete,
+    func,
+    insert,
+    literal,
+    null,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.orm import Session, selectinload
 
 from src.entities.area import Area
+from src.entities.change import ChangeEntry, utc_now
 from src.entities.equipment import Equipment
+from src.entities.inventory import (
+    ImportRow,
+    ImportRowError,
+    InventoryRow,
+    InventoryScope,
+)
 from src.entities.plant import Plant
+from src.entities.plant_tree import PlantTree
+from src.entities.purge_job import PurgeJob
+from src.entities.status_cascade import StatusCascade
 from src.entities.system import System
 from src.infrastructure.sqlalchemy import mappers
-from src.infrastructure.sqlalchemy.session import SessionFactory
+from src.infrastructure.sqlalchemy.session import (
+    CurrentSessionProvider,
+    SessionFactory,
+    stick_to_primary,
+)
 from src.infrastructure.sqlalchemy.models import (
     AreaModel,
+    ChangeLogModel,
+    EntityVersionModel,
     EquipmentModel,
     PlantModel,
+    PurgeJobModel,
     SystemModel,
 )
+from src.use_cases.ports.change_log import ChangeLogRepository
+from src.use_cases.ports.inventory import (
+    InventoryImportRepository,
+    InventoryRepository,
+)
+from src.use_cases.ports.pagination import Page
 from src.use_cases.ports.plant_repository import PlantDataRepository
 
+T = TypeVar("T")
+
+_CHANGE_ENTITY_TYPES: dict[type, str] = {
+    PlantModel: "planta",
+    AreaModel: "area",
+    EquipmentModel: "equipo",
+    SystemModel: "sistema",
+}
+
+# Niveles de la importación: tipo, modelo y columna del padre en la clave natural.
+_IMPORT_LEVELS: tuple[tuple[str, Any, Any], ...] = (
+    ("planta", PlantModel, None),
+    ("area", AreaModel, AreaModel.plant_id),
+    ("equipo", EquipmentModel, EquipmentModel.area_id),
+    ("sistema", SystemModel, SystemModel.equipment_id),
+)
+_IMPORT_DEPTH = {
+    entity_type: depth for depth, (entity_type, _, _) in enumerate(_IMPORT_LEVELS)
+}
+_MISSING_PARENT_MESSAGES = (
+    "Planta no encontrada: {}",
+    "Área no encontrada: {}",
+    "Equipo no encontrado: {}",
+)
+_PURGING_PLANT_MESSAGE = "Planta en eliminación: {}"
+# Joins desde cada modelo hasta `plants`, para excluir subárboles ocultos.
+_JOINS_TO_PLANT: dict[Any, tuple[tuple[Any, Any], ...]] = {
+    PlantModel: (),
+    AreaModel: ((PlantModel, AreaModel.plant_id == PlantModel.id),),
+    EquipmentModel: (
+        (AreaModel, EquipmentModel.area_id == AreaModel.id),
+        (PlantModel, AreaModel.plant_id == PlantModel.id),
+    ),
+    SystemModel: (
+        (EquipmentModel, SystemModel.equipment_id == EquipmentModel.id),
+        (AreaModel, EquipmentModel.area_id == AreaModel.id),
+        (PlantModel, AreaModel.plant_id == PlantModel.id),
+    ),
+}
+# Niveles del purgado diferido (hojas primero) y su contador en `purge_jobs`.
+_PURGE_LEVELS: tuple[tuple[Any, str], ...] = (
+    (SystemModel, "systems_deleted"),
+    (EquipmentModel, "equipment_deleted"),
+    (AreaModel, "areas_deleted"),
+)
+# Los ids de `change_log` se asignan al insertar, no al confirmar: un hueco más
+# reciente que esto puede ser una transacción abierta que todavía lo llenará.
+CHANGE_LOG_SETTLE_SECONDS = 5.0
+# Módulo de `sqlalchemy.dialects` con el INSERT ... ON CONFLICT de cada motor.
+# Se importa al primer upsert: sólo el del motor en uso, no los tres al arrancar.
+_DIALECT_INSERTS = {
+    "mysql": "mysql",
+    "mariadb": "mysql",
+    "postgresql": "postgresql",
+    "sqlite": "sqlite",
+}
+
+
+def _visible(stmt: Select, model: Any) -> Select:
+    """Restringe `stmt` a filas cuya planta no está oculta por un borrado."""
+    for target, onclause in _JOINS_TO_PLANT[model]:
+        stmt = stmt.join(target, onclause)
+    return stmt.where(PlantModel.deleted_at.is_(None))
+
+
+def _visible_row(model: Any) -> Any:
+    """Condición de `_visible` para UPDATE/DELETE, que no admiten JOIN.
+
+    Es un `EXISTS` correlacionado por la clave del padre: no vuelve a leer la
+    tabla que se modifica, así que MySQL lo acepta (error 1093 si no).
+    """
+    joins = _JOINS_TO_PLANT[model]
+    if not joins:
+        return PlantModel.deleted_at.is_(None)
+    (parent, to_parent), *rest = joins
+    stmt = select(literal(1)).select_from(parent)
+    for target, onclause in rest:
+        stmt = stmt.join(target, onclause)
+    return stmt.where(to_parent, PlantModel.deleted_at.is_(None)).exists()
+
+
+def _import_path(row: ImportRow) -> tuple[str, ...]:
+    """Nombres desde la planta hasta la propia entidad de la fila."""
+    parents = (row.plant_name, row.area_name, row.equipment_name)
+    return (*parents[: _IMPORT_DEPTH[row.entity_type]], row.name)
 
-class SqlAlchemyPlantRepository(PlantDataRepository):
+
+def _changed_values(**fields: Any) -> dict[str, Any]:
+    """Columnas a escribir en un UPDATE: sólo las que se enviaron."""
+    return {column: value for column, value in fields.items() if value is not None}
+
+
+def _natural_key(values: dict[str, Any], parent_column: Any) -> tuple[Any, str]:
+    parent_id = values[parent_column.key] if parent_column is not None else None
+    return parent_id, values["name"]
+
+
+class SqlAlchemyPlantRepository(
+    PlantDataRepository,
+    ChangeLogRepository,
+    InventoryRepository,
+    InventoryImportRepository,
+):
     """Repositorio concreto respaldado por SQLAlchemy y MySQL."""
 
-    def __init__(self, session_factory: SessionFactory) -> None:
+    def __init__(
+        self,
+        session_factory: SessionFactory,
+        *,
+        current_session: CurrentSessionProvider | None = None,
+        clock: Callable[[], datetime] = utc_now,
+        change_settle_seconds: float = CHANGE_LOG_SETTLE_SECONDS,
+    ) -> None:
         self._session_factory = session_factory
+        self._current_session = current_session
+        self._clock = clock
+        self._change_settle = timedelta(seconds=change_settle_seconds)
+
+    def _ambient_session(self) -> Session | None:
+        if self._current_session is None:
+            return None
+        return self._current_session()
 
     @contextmanager
     def _session_scope(self, session: Session | None):
         if session is not None:
             yield session
+        elif (ambient := self._ambient_session()) is not None:
+            yield ambient
         else:
             with self._session_factory() as new_session:
                 yield new_session
@@ -40,23 +204,356 @@ class SqlAlchemyPlantRepository(PlantDataRepository):
     @contextmanager
     def _transactional_scope(self, session: Session | None):
         if session is not None:
+            stick_to_primary(session)
             yield session
+        elif (ambient := self._ambient_session()) is not None:
+            stick_to_primary(ambient)
+            try:
+                yield ambient
+            except Exception:
+                ambient.rollback()
+                raise
+            ambient.commit()
         else:
             with self._session_factory() as new_session, new_session.begin():
+                stick_to_primary(new_session)
                 yield new_session
 
+    @staticmethod
+    def _keyset_page(
+        db: Session,
+        stmt: Select,
+        id_column: Any,
+        mapper: Callable[[Any], T],
+        *,
+        limit: int,
+        after: int | None,
+        ids: Collection[int] | None = None,
+    ) -> Page[T]:
+        """Página por `id_column > after`, con `ids` filtrado antes del LIMIT."""
+        if ids is not None:
+            if not ids:
+                return Page(items=[], next_after=None)
+            stmt = stmt.where(id_column.in_(ids))
+        if after is not None:
+            stmt = stmt.where(id_column > after)
+        rows = db.execute(stmt.order_by(id_column).limit(limit + 1)).scalars().all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        return Page(
+            items=[mapper(row) for row in rows],
+            next_after=rows[-1].id if has_more and rows else None,
+        )
+
+    @staticmethod
+    def _bump_plant_version(db: Session, plant_id: int | None) -> None:
+        """Incrementa la revisión del subárbol dentro de la transacción en curso."""
+        if plant_id is None:
+            return
+        result = db.execute(
+            update(EntityVersionModel)
+            .where(EntityVersionModel.plant_id == plant_id)
+            .values(version=EntityVersionModel.version + 1)
+        )
+        if result.rowcount == 0:
+            db.add(EntityVersionModel(plant_id=plant_id, version=1))
+            db.flush()
+
+    def _record_change(
+        self,
+        db: Session,
+        action: str,
+        model: Any,
+        *,
+        plant_id: int | None,
+        area_id: int | None = None,
+        equipment_id: int | None = None,
+    ) -> None:
+        """Versiona el subárbol y agrega la entrada al change log.
+
+        Ambas escrituras ocurren en la transacción del cambio, por lo que un
+        rollback tampoco deja rastro en el log.
+        """
+        self._bump_plant_version(db, plant_id)
+        if plant_id is None:
+            return
+
+        deleted = action == "eliminado"
+        db.add(
+            ChangeLogModel(
+                entity_type=_CHANGE_ENTITY_TYPES[type(model)],
+                entity_id=model.id,
+                action=action,
+                plant_id=plant_id,
+                area_id=area_id,
+                equipment_id=equipment_id,
+                name=None if deleted else model.name,
+                location=None if deleted else getattr(model, "location", None),
+                status=None if deleted else model.status,
+                recorded_at=self._clock(),
+            )
+        )
+
+    def _append_changes(self, db: Session, entries: list[dict[str, Any]]) -> None:
+        """Inserta varias entradas del change log con un único executemany.
+
+        Cada planta afectada se versiona una sola vez, sin importar cuántas
+        entradas le correspondan.
+        """
+        if not entries:
+            return
+        db.execute(insert(ChangeLogModel), entries)
+        for plant_id in sorted({entry["plant_id"] for entry in entries}):
+            self._bump_plant_version(db, plant_id)
+
+    def _insert_children(
+        self,
+        db: Session,
+        model: Any,
+        parent_column: Any,
+        parent_id: int,
+        items: Sequence[Mapping[str, Any]],
+        *,
+        default_status: str,
+        ancestors: dict[str, int | None],
+    ) -> list[Any]:
+        """Crea hijos de un mismo padre con un único INSERT multi-fila.
+
+        Los ids se recuperan con una consulta por clave natural (padre, nombre),
+        que funciona también en dialectos sin `RETURNING`. Devuelve los modelos
+        en el orden de `items`.
+        """
+        if not items:
+            return []
+
+        names = [item["name"] for item in items]
+        db.execute(
+            insert(model).values(
+                [
+                    {
+                        parent_column.key: parent_id,
+                        "name": item["name"],
+                        "status": item.get("status") or default_status,
+                    }
+                    for item in items
+                ]
+            )
+        )
+        stored = db.execute(
+            select(model).where(parent_column == parent_id, model.name.in_(names))
+        ).scalars()
+        by_name = {row.name: row for row in stored}
+        created = [by_name[name] for name in names]
+
+        entity_type = _CHANGE_ENTITY_TYPES[model]
+        own_column = {"area": "area_id", "equipo": "equipment_id"}.get(entity_type)
+        recorded_at = self._clock()
+        self._append_changes(
+            db,
+            [
+                {
+                    "entity_type": entity_type,
+                    "entity_id": row.id,
+                    "action": "creado",
+                    "plant_id": None,
+                    "area_id": None,
+                    "equipment_id": None,
+                    **ancestors,
+                    **({own_column: row.id} if own_column else {}),
+                    "name": row.name,
+                    "location": None,
+                    "status": row.status,
+                    "recorded_at": recorded_at,
+                }
+                for row in created
+            ],
+        )
+        return created
+
+    def _apply_statuses(
+        self,
+        db: Session,
+        plant_id: int,
+        statuses: Mapping[str, str],
+        levels: Sequence[tuple[str, Any, Sequence[Any], Sequence[Any]]],
+    ) -> StatusCascade:
+        """Cambia el estado de cada nivel con sentencias sobre conjuntos.
+
+        Cada nivel es `(tipo, modelo, condiciones, (plant_id, area_id,
+        equipment_id))`; las condiciones pueden referir a tablas ancestro, lo
+        que produce un `UPDATE ... JOIN` (o `UPDATE ... FROM`). Antes de cada
+        UPDATE, un `INSERT ... SELECT` registra en el change log las filas que
+        realmente cambian, con las mismas condiciones.
+        """
+        recorded_at = literal(self._clock(), DateTime)
+        updated: dict[str, int] = {}
+        for entity_type, model, conditions, ancestors in levels:
+            status = statuses.get(entity_type)
+            if status is None:
+                continue
+
+            changed = [*conditions, model.status != status]
+            location = model.location if model is PlantModel else null()
+            db.execute(
+                insert(ChangeLogModel).from_select(
+                    [
+                        "entity_type",
+                        "entity_id",
+                        "action",
+                        "plant_id",
+                        "area_id",
+                        "equipment_id",
+                        "name",
+                        "location",
+                        "status",
+                        "recorded_at",
+                    ],
+                    select(
+                        literal(entity_type),
+                        model.id,
+                        literal("actualizado"),
+                        *ancestors,
+                        model.name,
+                        location,
+                        literal(status),
+                        recorded_at,
+                    ).where(*changed),
+                )
+            )
+            result = db.execute(
+                update(model)
+                .where(*changed)
+                .values(status=status)
+                .execution_options(synchronize_session=False)
+            )
+            updated[entity_type] = result.rowcount
+
+        if any(updated.values()):
+            self._bump_plant_version(db, plant_id)
+        return StatusCascade(plant_id=plant_id, updated=updated)
+
+    @staticmethod
+    def _update_row(
+        db: Session, model: Any, entity_id: int, values: dict[str, Any]
+    ) -> tuple[Any | None, bool]:
+        """Actualiza una fila por id con una sola sentencia y la devuelve.
+
+        Devuelve `(fila, cambió)`. El UPDATE sólo alcanza la fila si alguna
+        columna enviada difiere de la guardada, así un PATCH vacío o que repite
+        los valores actuales no escribe nada. Donde el dialecto admite
+        `UPDATE ... RETURNING` (SQLite, PostgreSQL) un cambio cuesta un viaje a
+        la base; sin cambios, o en MySQL, la fila se lee por clave primaria. El
+        resultado es un modelo transitorio, fuera de la sesión. Las filas de
+        una planta oculta cuentan como inexistentes.
+        """
+        columns = list(model.__table__.columns)
+        by_id = and_(model.id == entity_id, _visible_row(model))
+        if values:
+            differs = or_(
+                *(
+                    getattr(model, column).is_distinct_from(value)
+                    for column, value in values.items()
+                )
+            )
+            stmt = update(model).where(by_id, differs).values(values)
+            if db.get_bind().dialect.update_returning:
+                row = db.execute(stmt.returning(*columns)).first()
+                if row is not None:
+                    return model(**row._mapping), True
+            elif db.execute(stmt).rowcount:
+                row = db.execute(select(*columns).where(by_id)).first()
+                if row is not None:
+                    return model(**row._mapping), True
+        row = db.execute(select(*columns).where(by_id)).first()
+        return (model(**row._mapping) if row is not None else None), False
+
+    @staticmethod
+    def _delete_row(
+        db: Session, model: Any, entity_id: int, *columns: Any
+    ) -> Any | None:
+        """Borra una fila por id con un único DELETE, sin cargar modelos.
+
+        Los descendientes los elimina la base con sus `ON DELETE CASCADE`, de
+        modo que ningún hijo pasa por Python. Devuelve `(id, *columns)` de la
+        fila borrada o `None` si no existía; las columnas se obtienen con
+        `RETURNING` donde el dialecto lo admite y, si no, con una lectura previa
+        por clave primaria. Las filas de una planta oculta no se tocan: las
+        borra su trabajo de purga.
+        """
+        by_id = and_(model.id == entity_id, _visible_row(model))
+        stmt = delete(model).where(by_id)
+        if db.get_bind().dialect.delete_returning:
+            return db.execute(stmt.returning(model.id, *columns)).first()
+
+        row = None
+        if columns:
+            row = db.execute(select(model.id, *columns).where(by_id)).first()
+            if row is None:
+                return None
+        if db.execute(stmt).rowcount == 0:
+            return None
+        return row if row is not None else (entity_id,)
+
+    @staticmethod
+    def _plant_id_of_area(db: Session, area_id: int) -> int | None:
+        area = db.get(AreaModel, area_id)
+        return area.plant_id if area is not None else None
+
+    @staticmethod
+    def _ancestors_of_equipment(
+        db: Session, equipment_id: int, *, visible: bool = False
+    ) -> tuple[int | None, int | None]:
+        """Devuelve `(area_id, plant_id)` del equipo con una sola consulta.
+
+        Con `visible` se ignoran los equipos de plantas ocultas.
+        """
+        stmt = (
+            select(AreaModel.id, AreaModel.plant_id)
+            .join(EquipmentModel, EquipmentModel.area_id == AreaModel.id)
+            .where(EquipmentModel.id == equipment_id)
+        )
+        if visible:
+            stmt = stmt.join(PlantModel, AreaModel.plant_id == PlantModel.id).where(
+                PlantModel.deleted_at.is_(None)
+            )
+        row = db.execute(stmt).first()
+        return (row[0], row[1]) if row is not None else (None, None)
+
+    @staticmethod
+    def _get_visible(db: Session, model: Any, entity_id: int) -> Any | None:
+        """Carga una fila por id salvo que pertenezca a una planta oculta."""
+        if model is PlantModel:
+            plant = db.get(PlantModel, entity_id)
+            return plant if plant is not None and plant.deleted_at is None else None
+        return db.execute(
+            _visible(select(model), model).where(model.id == entity_id)
+        ).scalar_one_or_none()
+
     # Plant operations
     def list_plants(self, *, session: Session | None = None) -> Sequence[Plant]:
         with self._session_scope(session) as db:
-            rows = db.execute(select(PlantModel)).scalars().all()
+            rows = db.execute(_visible(select(PlantModel), PlantModel)).scalars().all()
             return [mappers.plant_to_entity(row) for row in rows]
 
+    def list_plants_page(
+        self, *, limit: int, after: int | None = None, session: Session | None = None
+    ) -> Page[Plant]:
+        with self._session_scope(session) as db:
+            return self._keyset_page(
+                db,
+                _visible(select(PlantModel), PlantModel),
+                PlantModel.id,
+                mappers.plant_to_entity,
+                limit=limit,
+                after=after,
+            )
+
     def get_plant(
         self, plant_id: int, *, session: Session | None = None
     ) -> Plant | None:
         with self._session_scope(session) as db:
             plant = db.get(PlantModel, plant_id)
-            if plant is None:
+            if plant is None or plant.deleted_at is not None:
                 return None
             return mappers.plant_to_entity(plant)
 
@@ -74,6 +571,7 @@ class SqlAlchemyPlantRepository(PlantDataRepository):
             )
             db.add(plant)
             db.flush()
+            self._record_change(db, "creado", plant, plant_id=plant.id)
             return mappers.plant_to_entity(plant)
 
     def update_plant(
@@ -85,47 +583,274 @@ class SqlAlchemyPlantRepository(PlantDataRepository):
         status: str | None = None,
         session: Session | None = None,
     ) -> Plant | None:
+        values = _changed_values(name=name, location=location, status=status)
         with self._transactional_scope(session) as db:
-            plant = db.get(PlantModel, plant_id)
+            plant, changed = self._update_row(db, PlantModel, plant_id, values)
             if plant is None:
                 return None
 
-            if name is not None:
-                plant.name = name
-            if location is not None:
-                plant.location = location
-            if status is not None:
-                plant.status = status
-
-            db.flush()
+            if changed:
+                self._record_change(db, "actualizado", plant, plant_id=plant.id)
             return mappers.plant_to_entity(plant)
 
+    def set_plant_status(
+        self,
+        plant_id: int,
+        statuses: Mapping[str, str],
+        *,
+        session: Session | None = None,
+    ) -> StatusCascade | None:
+        with self._transactional_scope(session) as db:
+            if self._get_visible(db, PlantModel, plant_id) is None:
+                return None
+
+            in_plant = AreaModel.plant_id == plant_id
+            return self._apply_statuses(
+                db,
+                plant_id,
+                statuses,
+                (
+                    (
+                        "planta",
+                        PlantModel,
+                        [PlantModel.id == plant_id],
+                        [PlantModel.id, null(), null()],
+                    ),
+                    (
+                        "area",
+                        AreaModel,
+                        [in_plant],
+                        [literal(plant_id), AreaModel.id, null()],
+                    ),
+                    (
+                        "equipo",
+                        EquipmentModel,
+                        [EquipmentModel.area_id == AreaModel.id, in_plant],
+                        [literal(plant_id), AreaModel.id, EquipmentModel.id],
+                    ),
+                    (
+                        "sistema",
+                        SystemModel,
+                        [
+                            SystemModel.equipment_id == EquipmentModel.id,
+                            EquipmentModel.area_id == AreaModel.id,
+                            in_plant,
+                        ],
+                        [literal(plant_id), AreaModel.id, EquipmentModel.id],
+                    ),
+                ),
+            )
+
     def delete_plant(self, plant_id: int, *, session: Session | None = None) -> bool:
         with self._transactional_scope(session) as db:
-            plant = db.get(PlantModel, plant_id)
-            if plant is None:
+            if self._delete_row(db, PlantModel, plant_id) is None:
                 return False
 
-            db.delete(plant)
+            self._record_change(
+                db, "eliminado", PlantModel(id=plant_id), plant_id=plant_id
+            )
             return True
 
+    def hide_plant(
+        self, plant_id: int, *, session: Session | None = None
+    ) -> PurgeJob | None:
+        """Oculta la planta con un UPDATE de una fila y abre su trabajo de purga.
+
+        Las lecturas filtran por `plants.deleted_at`, de modo que el subárbol
+        desaparece sin tocar sus filas; la baja queda en el change log desde
+        este momento.
+        """
+        now = self._clock()
+        with self._transactional_scope(session) as db:
+            hidden = db.execute(
+                update(PlantModel)
+                .where(PlantModel.id == plant_id, PlantModel.deleted_at.is_(None))
+                .values(deleted_at=now)
+                .execution_options(synchronize_session=False)
+            )
+            if hidden.rowcount == 0:
+                return None
+
+            job = PurgeJobModel(
+                plant_id=plant_id,
+                status="pendiente",
+                systems_deleted=0,
+                equipment_deleted=0,
+                areas_deleted=0,
+                created_at=now,
+            )
+            db.add(job)
+            db.flush()
+            self._record_change(
+                db, "eliminado", PlantModel(id=plant_id), plant_id=plant_id
+            )
+            return mappers.purge_job_to_entity(job)
+
+    def purge_plant_batch(
+        self, job_id: int, *, batch_size: int, session: Session | None = None
+    ) -> PurgeJob | None:
+        """Borra hasta `batch_size` filas del nivel más bajo que aún tenga datos.
+
+        Los ids se leen primero y se borran por clave primaria, así cada lote
+        bloquea sólo las filas que elimina (MySQL no admite `LIMIT` en una
+        subconsulta del mismo `DELETE`). Cuando no quedan hijos se borra la
+        planta y el trabajo termina.
+        """
+        with self._transactional_scope(session) as db:
+            # El bloqueo de la fila del trabajo serializa a dos procesos que
+            # retomen el mismo trabajo: cada lote ve lo que borró el anterior.
+            job = db.get(PurgeJobModel, job_id, with_for_update=True)
+            if job is None:
+                return None
+            if job.status == "completado":
+                return mappers.purge_job_to_entity(job)
+
+            job.status = "en_curso"
+            job.error = None
+            job.finished_at = None
+            for model, counter in _PURGE_LEVELS:
+                stmt = select(model.id)
+                for target, onclause in _JOINS_TO_PLANT[model][:-1]:
+                    stmt = stmt.join(target, onclause)
+                ids = db.execute(
+                    stmt.where(AreaModel.plant_id == job.plant_id)
+                    .order_by(model.id)
+                    .limit(batch_size)
+                ).scalars().all()
+                if ids:
+                    db.execute(
+                        delete(model)
+                        .where(model.id.in_(ids))
+                        .execution_options(synchronize_session=False)
+                    )
+                    setattr(job, counter, getattr(job, counter) + len(ids))
+                    return mappers.purge_job_to_entity(job)
+
+            db.execute(
+                delete(PlantModel)
+                .where(PlantModel.id == job.plant_id, PlantModel.deleted_at.is_not(None))
+                .execution_options(synchronize_session=False)
+            )
+            job.status = "completado"
+            job.finished_at = self._clock()
+            self._bump_plant_version(db, job.plant_id)
+            return mappers.purge_job_to_entity(job)
+
+    def get_purge_job(
+        self, job_id: int, *, session: Session | None = None
+    ) -> PurgeJob | None:
+        with self._session_scope(session) as db:
+            job = db.get(PurgeJobModel, job_id)
+            if job is None:
+                return None
+            return mappers.purge_job_to_entity(job)
+
+    def fail_purge_job(
+        self, job_id: int, error: str, *, session: Session | None = None
+    ) -> PurgeJob | None:
+        with self._transactional_scope(session) as db:
+            job = db.get(PurgeJobModel, job_id)
+            if job is None:
+                return None
+
+            job.status = "fallido"
+            job.error = error[:255]
+            job.finished_at = self._clock()
+            return mappers.purge_job_to_entity(job)
+
+    def list_unfinished_purge_jobs(
+        self, *, session: Session | None = None
+    ) -> Sequence[PurgeJob]:
+        with self._session_scope(session) as db:
+            jobs = db.execute(
+                select(PurgeJobModel)
+                .where(PurgeJobModel.status != "completado")
+                .order_by(PurgeJobModel.id)
+            ).scalars()
+            return [mappers.purge_job_to_entity(job) for job in jobs]
+
+    def get_plant_tree(
+        self, plant_id: int, *, session: Session | None = None
+    ) -> PlantTree | None:
+        with self._session_scope(session) as db:
+            plant = db.execute(
+                select(PlantModel)
+                .where(PlantModel.id == plant_id, PlantModel.deleted_at.is_(None))
+                .options(
+                    selectinload(PlantModel.areas)
+                    .selectinload(AreaModel.equipment)
+                    .selectinload(EquipmentModel.systems)
+                )
+            ).scalar_one_or_none()
+            if plant is None:
+                return None
+            return mappers.plant_tree_to_entity(plant)
+
+    def get_plant_versions(
+        self, plant_ids: Iterable[int] | None = None, *, session: Session | None = None
+    ) -> dict[int, int]:
+        stmt = select(EntityVersionModel.plant_id, EntityVersionModel.version)
+        if plant_ids is not None:
+            ids = set(plant_ids)
+            if not ids:
+                return {}
+            stmt = stmt.where(EntityVersionModel.plant_id.in_(ids))
+        with self._session_scope(session) as db:
+            return {plant_id: version for plant_id, version in db.execute(stmt)}
+
     # Area operations
     def list_areas(
         self, plant_id: int, *, session: Session | None = None
     ) -> Sequence[Area]:
         with self._session_scope(session) as db:
             rows = db.execute(
-                select(AreaModel).where(AreaModel.plant_id == plant_id)
+                _visible(select(AreaModel), AreaModel).where(
+                    AreaModel.plant_id == plant_id
+                )
             ).scalars()
             return [mappers.area_to_entity(row) for row in rows]
 
+    def list_areas_page(
+        self,
+        plant_id: int,
+        *,
+        limit: int,
+        after: int | None = None,
+        ids: Collection[int] | None = None,
+        session: Session | None = None,
+    ) -> Page[Area]:
+        with self._session_scope(session) as db:
+            return self._keyset_page(
+                db,
+                _visible(select(AreaModel), AreaModel).where(
+                    AreaModel.plant_id == plant_id
+                ),
+                AreaModel.id,
+                mappers.area_to_entity,
+                limit=limit,
+                after=after,
+                ids=ids,
+            )
+
     def get_area(self, area_id: int, *, session: Session | None = None) -> Area | None:
         with self._session_scope(session) as db:
-            area = db.get(AreaModel, area_id)
+            area = self._get_visible(db, AreaModel, area_id)
             if area is None:
                 return None
             return mappers.area_to_entity(area)
 
+    def get_areas_by_ids(
+        self, area_ids: Iterable[int], *, session: Session | None = None
+    ) -> Sequence[Area]:
+        ids = set(area_ids)
+        if not ids:
+            return []
+        with self._session_scope(session) as db:
+            rows = db.execute(
+                _visible(select(AreaModel), AreaModel).where(AreaModel.id.in_(ids))
+            ).scalars()
+            return [mappers.area_to_entity(row) for row in rows]
+
     def create_area(
         self,
         plant_id: int,
@@ -135,15 +860,40 @@ class SqlAlchemyPlantRepository(PlantDataRepository):
         session: Session | None = None,
     ) -> Area | None:
         with self._transactional_scope(session) as db:
-            plant = db.get(PlantModel, plant_id)
+            plant = self._get_visible(db, PlantModel, plant_id)
             if plant is None:
                 return None
 
             area = AreaModel(plant_id=plant.id, name=name, status=status or "operativa")
             db.add(area)
             db.flush()
+            self._record_change(
+                db, "creado", area, plant_id=area.plant_id, area_id=area.id
+            )
             return mappers.area_to_entity(area)
 
+    def create_area_batch(
+        self,
+        plant_id: int,
+        items: Sequence[Mapping[str, Any]],
+        *,
+        session: Session | None = None,
+    ) -> Sequence[Area] | None:
+        with self._transactional_scope(session) as db:
+            if self._get_visible(db, PlantModel, plant_id) is None:
+                return None
+
+            created = self._insert_children(
+                db,
+                AreaModel,
+                AreaModel.plant_id,
+                plant_id,
+                items,
+                default_status="operativa",
+                ancestors={"plant_id": plant_id},
+            )
+            return [mappers.area_to_entity(area) for area in created]
+
     def update_area(
         self,
         area_id: int,
@@ -152,26 +902,74 @@ class SqlAlchemyPlantRepository(PlantDataRepository):
         status: str | None = None,
         session: Session | None = None,
     ) -> Area | None:
+        values = _changed_values(name=name, status=status)
         with self._transactional_scope(session) as db:
-            area = db.get(AreaModel, area_id)
+            area, changed = self._update_row(db, AreaModel, area_id, values)
             if area is None:
                 return None
 
-            if name is not None:
-                area.name = name
-            if status is not None:
-                area.status = status
-
-            db.flush()
+            if changed:
+                self._record_change(
+                    db, "actualizado", area, plant_id=area.plant_id, area_id=area.id
+                )
             return mappers.area_to_entity(area)
 
-    def delete_area(self, area_id: int, *, session: Session | None = None) -> bool:
+    def set_area_status(
+        self,
+        area_id: int,
+        statuses: Mapping[str, str],
+        *,
+        session: Session | None = None,
+    ) -> StatusCascade | None:
         with self._transactional_scope(session) as db:
-            area = db.get(AreaModel, area_id)
+            area = self._get_visible(db, AreaModel, area_id)
             if area is None:
+                return None
+
+            plant_id = area.plant_id
+            ancestors = [literal(plant_id), literal(area_id)]
+            return self._apply_statuses(
+                db,
+                plant_id,
+                statuses,
+                (
+                    (
+                        "area",
+                        AreaModel,
+                        [AreaModel.id == area_id],
+                        [*ancestors, null()],
+                    ),
+                    (
+                        "equipo",
+                        EquipmentModel,
+                        [EquipmentModel.area_id == area_id],
+                        [*ancestors, EquipmentModel.id],
+                    ),
+                    (
+                        "sistema",
+                        SystemModel,
+                        [
+                            SystemModel.equipment_id == EquipmentModel.id,
+                            EquipmentModel.area_id == area_id,
+                        ],
+                        [*ancestors, EquipmentModel.id],
+                    ),
+                ),
+            )
+
+    def delete_area(self, area_id: int, *, session: Session | None = None) -> bool:
+        with self._transactional_scope(session) as db:
+            row = self._delete_row(db, AreaModel, area_id, AreaModel.plant_id)
+            if row is None:
                 return False
 
-            db.delete(area)
+            self._record_change(
+                db,
+                "eliminado",
+                AreaModel(id=area_id),
+                plant_id=row.plant_id,
+                area_id=area_id,
+            )
             return True
 
     # Equipment operations
@@ -180,19 +978,57 @@ class SqlAlchemyPlantRepository(PlantDataRepository):
     ) -> Sequence[Equipment]:
         with self._session_scope(session) as db:
             rows = db.execute(
-                select(EquipmentModel).where(EquipmentModel.area_id == area_id)
+                _visible(select(EquipmentModel), EquipmentModel).where(
+                    EquipmentModel.area_id == area_id
+                )
             ).scalars()
             return [mappers.equipment_to_entity(row) for row in rows]
 
+    def list_equipment_page(
+        self,
+        area_id: int,
+        *,
+        limit: int,
+        after: int | None = None,
+        ids: Collection[int] | None = None,
+        session: Session | None = None,
+    ) -> Page[Equipment]:
+        with self._session_scope(session) as db:
+            return self._keyset_page(
+                db,
+                _visible(select(EquipmentModel), EquipmentModel).where(
+                    EquipmentModel.area_id == area_id
+                ),
+                EquipmentModel.id,
+                mappers.equipment_to_entity,
+                limit=limit,
+                after=after,
+                ids=ids,
+            )
+
     def get_equipment(
         self, equipment_id: int, *, session: Session | None = None
     ) -> Equipment | None:
         with self._session_scope(session) as db:
-            equipment = db.get(EquipmentModel, equipment_id)
+            equipment = self._get_visible(db, EquipmentModel, equipment_id)
             if equipment is None:
                 return None
             return mappers.equipment_to_entity(equipment)
 
+    def get_equipment_by_ids(
+        self, equipment_ids: Iterable[int], *, session: Session | None = None
+    ) -> Sequence[Equipment]:
+        ids = set(equipment_ids)
+        if not ids:
+            return []
+        with self._session_scope(session) as db:
+            rows = db.execute(
+                _visible(select(EquipmentModel), EquipmentModel).where(
+                    EquipmentModel.id.in_(ids)
+                )
+            ).scalars()
+            return [mappers.equipment_to_entity(row) for row in rows]
+
     def create_equipment(
         self,
         area_id: int,
@@ -202,7 +1038,7 @@ class SqlAlchemyPlantRepository(PlantDataRepository):
         session: Session | None = None,
     ) -> Equipment | None:
         with self._transactional_scope(session) as db:
-            area = db.get(AreaModel, area_id)
+            area = self._get_visible(db, AreaModel, area_id)
             if area is None:
                 return None
 
@@ -211,8 +1047,39 @@ class SqlAlchemyPlantRepository(PlantDataRepository):
             )
             db.add(equipment)
             db.flush()
+            self._record_change(
+                db,
+                "creado",
+                equipment,
+                plant_id=area.plant_id,
+                area_id=area.id,
+                equipment_id=equipment.id,
+            )
             return mappers.equipment_to_entity(equipment)
 
+    def create_equipment_batch(
+        self,
+        area_id: int,
+        items: Sequence[Mapping[str, Any]],
+        *,
+        session: Session | None = None,
+    ) -> Sequence[Equipment] | None:
+        with self._transactional_scope(session) as db:
+            area = self._get_visible(db, AreaModel, area_id)
+            if area is None:
+                return None
+
+            created = self._insert_children(
+                db,
+                EquipmentModel,
+                EquipmentModel.area_id,
+                area_id,
+                items,
+                default_status="operativo",
+                ancestors={"plant_id": area.plant_id, "area_id": area.id},
+            )
+            return [mappers.equipment_to_entity(equipment) for equipment in created]
+
     def update_equipment(
         self,
         equipment_id: int,
@@ -221,28 +1088,78 @@ class SqlAlchemyPlantRepository(PlantDataRepository):
         status: str | None = None,
         session: Session | None = None,
     ) -> Equipment | None:
+        values = _changed_values(name=name, status=status)
         with self._transactional_scope(session) as db:
-            equipment = db.get(EquipmentModel, equipment_id)
+            equipment, changed = self._update_row(
+                db, EquipmentModel, equipment_id, values
+            )
             if equipment is None:
                 return None
 
-            if name is not None:
-                equipment.name = name
-            if status is not None:
-                equipment.status = status
-
-            db.flush()
+            if changed:
+                self._record_change(
+                    db,
+                    "actualizado",
+                    equipment,
+                    plant_id=self._plant_id_of_area(db, equipment.area_id),
+                    area_id=equipment.area_id,
+                    equipment_id=equipment.id,
+                )
             return mappers.equipment_to_entity(equipment)
 
+    def set_equipment_status(
+        self,
+        equipment_id: int,
+        statuses: Mapping[str, str],
+        *,
+        session: Session | None = None,
+    ) -> StatusCascade | None:
+        with self._transactional_scope(session) as db:
+            area_id, plant_id = self._ancestors_of_equipment(
+                db, equipment_id, visible=True
+            )
+            if plant_id is None:
+                return None
+
+            ancestors = [literal(plant_id), literal(area_id), literal(equipment_id)]
+            return self._apply_statuses(
+                db,
+                plant_id,
+                statuses,
+                (
+                    (
+                        "equipo",
+                        EquipmentModel,
+                        [EquipmentModel.id == equipment_id],
+                        ancestors,
+                    ),
+                    (
+                        "sistema",
+                        SystemModel,
+                        [SystemModel.equipment_id == equipment_id],
+                        ancestors,
+                    ),
+                ),
+            )
+
     def delete_equipment(
         self, equipment_id: int, *, session: Session | None = None
     ) -> bool:
         with self._transactional_scope(session) as db:
-            equipment = db.get(EquipmentModel, equipment_id)
-            if equipment is None:
+            row = self._delete_row(
+                db, EquipmentModel, equipment_id, EquipmentModel.area_id
+            )
+            if row is None:
                 return False
 
-            db.delete(equipment)
+            self._record_change(
+                db,
+                "eliminado",
+                EquipmentModel(id=equipment_id),
+                plant_id=self._plant_id_of_area(db, row.area_id),
+                area_id=row.area_id,
+                equipment_id=equipment_id,
+            )
             return True
 
     # System operations
@@ -251,19 +1168,55 @@ class SqlAlchemyPlantRepository(PlantDataRepository):
     ) -> Sequence[System]:
         with self._session_scope(session) as db:
             rows = db.execute(
-                select(SystemModel).where(SystemModel.equipment_id == equipment_id)
+                _visible(select(SystemModel), SystemModel).where(
+                    SystemModel.equipment_id == equipment_id
+                )
             ).scalars()
             return [mappers.system_to_entity(row) for row in rows]
 
+    def list_systems_page(
+        self,
+        equipment_id: int,
+        *,
+        limit: int,
+        after: int | None = None,
+        session: Session | None = None,
+    ) -> Page[System]:
+        with self._session_scope(session) as db:
+            return self._keyset_page(
+                db,
+                _visible(select(SystemModel), SystemModel).where(
+                    SystemModel.equipment_id == equipment_id
+                ),
+                SystemModel.id,
+                mappers.system_to_entity,
+                limit=limit,
+                after=after,
+            )
+
     def get_system(
         self, system_id: int, *, session: Session | None = None
     ) -> System | None:
         with self._session_scope(session) as db:
-            system = db.get(SystemModel, system_id)
+            system = self._get_visible(db, SystemModel, system_id)
             if system is None:
                 return None
             return mappers.system_to_entity(system)
 
+    def get_systems_by_ids(
+        self, system_ids: Iterable[int], *, session: Session | None = None
+    ) -> Sequence[System]:
+        ids = set(system_ids)
+        if not ids:
+            return []
+        with self._session_scope(session) as db:
+            rows = db.execute(
+                _visible(select(SystemModel), SystemModel).where(
+                    SystemModel.id.in_(ids)
+                )
+            ).scalars()
+            return [mappers.system_to_entity(row) for row in rows]
+
     def create_system(
         self,
         equipment_id: int,
@@ -273,7 +1226,7 @@ class SqlAlchemyPlantRepository(PlantDataRepository):
         session: Session | None = None,
     ) -> System | None:
         with self._transactional_scope(session) as db:
-            equipment = db.get(EquipmentModel, equipment_id)
+            equipment = self._get_visible(db, EquipmentModel, equipment_id)
             if equipment is None:
                 return None
 
@@ -282,8 +1235,45 @@ class SqlAlchemyPlantRepository(PlantDataRepository):
             )
             db.add(system)
             db.flush()
+            self._record_change(
+                db,
+                "creado",
+                system,
+                plant_id=self._plant_id_of_area(db, equipment.area_id),
+                area_id=equipment.area_id,
+                equipment_id=equipment.id,
+            )
             return mappers.system_to_entity(system)
 
+    def create_system_batch(
+        self,
+        equipment_id: int,
+        items: Sequence[Mapping[str, Any]],
+        *,
+        session: Session | None = None,
+    ) -> Sequence[System] | None:
+        with self._transactional_scope(session) as db:
+            area_id, plant_id = self._ancestors_of_equipment(
+                db, equipment_id, visible=True
+            )
+            if area_id is None:
+                return None
+
+            created = self._insert_children(
+                db,
+                SystemModel,
+                SystemModel.equipment_id,
+                equipment_id,
+                items,
+                default_status="operativo",
+                ancestors={
+                    "plant_id": plant_id,
+                    "area_id": area_id,
+                    "equipment_id": equipment_id,
+                },
+            )
+            return [mappers.system_to_entity(system) for system in created]
+
     def update_system(
         self,
         system_id: int,
@@ -292,24 +1282,419 @@ class SqlAlchemyPlantRepository(PlantDataRepository):
         status: str | None = None,
         session: Session | None = None,
     ) -> System | None:
+        values = _changed_values(name=name, status=status)
         with self._transactional_scope(session) as db:
-            system = db.get(SystemModel, system_id)
+            system, changed = self._update_row(db, SystemModel, system_id, values)
             if system is None:
                 return None
 
-            if name is not None:
-                system.name = name
-            if status is not None:
-                system.status = status
-
-            db.flush()
+            if changed:
+                area_id, plant_id = self._ancestors_of_equipment(
+                    db, system.equipment_id
+                )
+                self._record_change(
+                    db,
+                    "actualizado",
+                    system,
+                    plant_id=plant_id,
+                    area_id=area_id,
+                    equipment_id=system.equipment_id,
+                )
             return mappers.system_to_entity(system)
 
     def delete_system(self, system_id: int, *, session: Session | None = None) -> bool:
         with self._transactional_scope(session) as db:
-            system = db.get(SystemModel, system_id)
-            if system is None:
+            row = self._delete_row(db, SystemModel, system_id, SystemModel.equipment_id)
+            if row is None:
                 return False
 
-            db.delete(system)
+            area_id, plant_id = self._ancestors_of_equipment(db, row.equipment_id)
+            self._record_change(
+                db,
+                "eliminado",
+                SystemModel(id=system_id),
+                plant_id=plant_id,
+                area_id=area_id,
+                equipment_id=row.equipment_id,
+            )
             return True
+
+    # Change log
+    def list_changes(
+        self, *, limit: int, after: int | None = None, session: Session | None = None
+    ) -> Page[ChangeEntry]:
+        """Entradas posteriores a `after`, cortadas antes de un hueco reciente.
+
+        Un id faltante registrado hace menos de `change_settle_seconds` puede
+        ser una transacción que confirmará después; entregar lo que sigue
+        movería el cursor por encima de ella y se perdería para siempre. La
+        página termina antes del hueco (sin `next_after`) y el lector vuelve a
+        pedirla: la entrada aparece al confirmarse o el hueco se da por
+        definitivo (rollback, compactación) al vencer la ventana.
+        """
+        with self._session_scope(session) as db:
+            page = self._keyset_page(
+                db,
+                select(ChangeLogModel),
+                ChangeLogModel.id,
+                mappers.change_to_entity,
+                limit=limit,
+                after=after,
+            )
+            unsettled_since = self._clock() - self._change_settle
+            previous = after
+            for index, change in enumerate(page.items):
+                if (
+                    previous is not None
+                    and change.id != previous + 1
+                    and change.recorded_at > unsettled_since
+                ):
+                    return Page(items=page.items[:index], next_after=None)
+                previous = change.id
+            return page
+
+    def get_change_bounds(
+        self, *, session: Session | None = None
+    ) -> tuple[int | None, int | None]:
+        """`newest` es el último id sin huecos recientes antes que él.
+
+        Es el cursor que `list_changes` alcanzaría, de modo que quien recarga la
+        jerarquía y sigue desde ahí no saltea transacciones aún abiertas.
+        """
+        with self._session_scope(session) as db:
+            oldest = db.execute(select(func.min(ChangeLogModel.id))).scalar()
+            if oldest is None:
+                return None, None
+
+            settled = db.execute(
+                select(func.max(ChangeLogModel.id)).where(
+                    ChangeLogModel.recorded_at <= self._clock() - self._change_settle
+                )
+            ).scalar()
+            recent = select(ChangeLogModel.id).order_by(ChangeLogModel.id)
+            if settled is not None:
+                recent = recent.where(ChangeLogModel.id > settled)
+            newest = settled
+            for change_id in db.execute(recent).scalars():
+                if newest is not None and change_id != newest + 1:
+                    break
+                newest = change_id
+            return oldest, newest
+
+    def compact_changes(
+        self, *, before: datetime, session: Session | None = None
+    ) -> int:
+        with self._transactional_scope(session) as db:
+            newest = db.execute(select(func.max(ChangeLogModel.id))).scalar()
+            if newest is None:
+                return 0
+            result = db.execute(
+                delete(ChangeLogModel).where(
+                    ChangeLogModel.recorded_at < before,
+                    ChangeLogModel.id < newest,
+                )
+            )
+            return result.rowcount
+
+    # Inventory export
+    def iter_inventory(
+        self,
+        *,
+        batch_size: int = 1000,
+        scope: InventoryScope | None = None,
+        session: Session | None = None,
+    ) -> Iterator[InventoryRow]:
+        """Recorre la jerarquía con cursores del lado del servidor.
+
+        `yield_per` activa `stream_results`, de modo que cada consulta trae
+        filas de a `batch_size` y la memoria no crece con el inventario. Se
+        seleccionan columnas sueltas para no poblar el mapa de identidad. El
+        alcance (`scope`) se filtra en cada consulta: un usuario acotado a
+        pocas áreas o equipos no recorre el inventario completo.
+        """
+        queries: tuple[tuple[str, Select], ...] = (
+            (
+                "planta",
+                select(
+                    PlantModel.id,
+                    PlantModel.name,
+                    PlantModel.status,
+                    PlantModel.id,
+                    null(),
+                    null(),
+                    PlantModel.location,
+                )
+                .where(PlantModel.deleted_at.is_(None))
+                .order_by(PlantModel.id),
+            ),
+            (
+                "area",
+                select(
+                    AreaModel.id,
+                    AreaModel.name,
+                    AreaModel.status,
+                    AreaModel.plant_id,
+                    AreaModel.id,
+                    null(),
+                    null(),
+                )
+                .join(PlantModel, AreaModel.plant_id == PlantModel.id)
+                .where(PlantModel.deleted_at.is_(None))
+                .order_by(AreaModel.id),
+            ),
+            (
+                "equipo",
+                select(
+                    EquipmentModel.id,
+                    EquipmentModel.name,
+                    EquipmentModel.status,
+                    AreaModel.plant_id,
+                    EquipmentModel.area_id,
+                    EquipmentModel.id,
+                    null(),
+                )
+                .join(AreaModel, EquipmentModel.area_id == AreaModel.id)
+                .join(PlantModel, AreaModel.plant_id == PlantModel.id)
+                .where(PlantModel.deleted_at.is_(None))
+                .order_by(EquipmentModel.id),
+            ),
+            (
+                "sistema",
+                select(
+                    SystemModel.id,
+                    SystemModel.name,
+                    SystemModel.status,
+                    AreaModel.plant_id,
+                    EquipmentModel.area_id,
+                    SystemModel.equipment_id,
+                    null(),
+                )
+                .join(EquipmentModel, SystemModel.equipment_id == EquipmentModel.id)
+                .join(AreaModel, EquipmentModel.area_id == AreaModel.id)
+                .join(PlantModel, AreaModel.plant_id == PlantModel.id)
+                .where(PlantModel.deleted_at.is_(None))
+                .order_by(SystemModel.id),
+            ),
+        )
+        with self._session_scope(session) as db:
+            for entity_type, stmt in queries:
+                stmt = self._scope_inventory_query(entity_type, stmt, scope)
+                if stmt is None:
+                    continue
+                result = db.execute(stmt.execution_options(yield_per=batch_size))
+                for row in result:
+                    yield InventoryRow(
+                        entity_type=entity_type,
+                        id=row[0],
+                        name=row[1],
+                        status=row[2],
+                        plant_id=row[3],
+                        area_id=row[4],
+                        equipment_id=row[5],
+                        location=row[6],
+                    )
+
+    @staticmethod
+    def _scope_inventory_query(
+        entity_type: str, stmt: Select, scope: InventoryScope | None
+    ) -> Select | None:
+        """Agrega los filtros de `scope`; `None` si el nivel queda vacío.
+
+        Usa las columnas de ancestros de la consulta (posiciones 4 y 5:
+        `area_id` y `equipment_id` de `InventoryRow`).
+        """
+        if scope is None:
+            return stmt
+        if scope.entity_types is not None and entity_type not in scope.entity_types:
+            return None
+        if entity_type == "planta":
+            return stmt
+
+        restrictions = [(scope.area_ids, 4)]
+        if entity_type != "area":
+            restrictions.append((scope.equipment_ids, 5))
+        for ids, position in restrictions:
+            if ids is None:
+                continue
+            if not ids:
+                return None
+            stmt = stmt.where(stmt.selected_columns[position].in_(sorted(ids)))
+        return stmt
+
+    # Inventory import
+    def upsert_rows(
+        self, rows: Sequence[ImportRow], *, session: Session | None = None
+    ) -> list[ImportRowError]:
+        """Inserta o actualiza un bloque de filas con un upsert por nivel.
+
+        Cada nivel de la jerarquía cuesta una lectura de las claves naturales
+        involucradas, un único `INSERT ... ON DUPLICATE KEY UPDATE` (u `ON
+        CONFLICT` según el dialecto) con las filas nuevas o modificadas y una
+        lectura de los ids recién creados. Las filas idénticas a lo guardado no
+        se escriben ni generan entradas en el change log.
+        """
+        errors: list[ImportRowError] = []
+        # Ids de los ancestros ya resueltos de cada fila, indexados por línea.
+        chains: dict[int, list[int]] = {row.line: [] for row in rows}
+        with self._transactional_scope(session) as db:
+            log_entries: list[dict[str, Any]] = []
+            for depth, (entity_type, model, parent_column) in enumerate(
+                _IMPORT_LEVELS
+            ):
+                pending = [
+                    row
+                    for row in rows
+                    if row.line in chains and _IMPORT_DEPTH[row.entity_type] >= depth
+                ]
+                if not pending:
+                    break
+
+                keys = {
+                    row.line: (
+                        chains[row.line][-1] if depth else None,
+                        _import_path(row)[depth],
+                    )
+                    for row in pending
+                }
+                existing = self._find_by_natural_key(
+                    db, model, parent_column, set(keys.values())
+                )
+                if model is PlantModel:
+                    # Una planta oculta la está borrando su purga: no se
+                    # escribe en ella ni en su subárbol.
+                    for row in pending:
+                        current = existing.get(keys[row.line])
+                        if current is not None and current.deleted_at is not None:
+                            errors.append(
+                                ImportRowError(
+                                    row.line,
+                                    _PURGING_PLANT_MESSAGE.format(keys[row.line][1]),
+                                )
+                            )
+                            del chains[row.line]
+                    pending = [row for row in pending if row.line in chains]
+
+                own = {
+                    keys[row.line]: row
+                    for row in pending
+                    if row.entity_type == entity_type
+                }
+
+                writes: list[dict[str, Any]] = []
+                for (parent_id, name), row in own.items():
+                    current = existing.get((parent_id, name))
+                    values: dict[str, Any] = {"name": name, "status": row.status}
+                    if parent_column is not None:
+                        values[parent_column.key] = parent_id
+                    if model is PlantModel:
+                        values["location"] = (
+                            row.location
+                            if row.location is not None or current is None
+                            else current.location
+                        )
+                    if current is not None and all(
+                        getattr(current, column) == value
+                        for column, value in values.items()
+                    ):
+                        continue
+                    writes.append(values)
+
+                stored = set(existing)
+                if writes:
+                    self._upsert(db, model, parent_column, writes)
+                    created = {
+                        _natural_key(values, parent_column) for values in writes
+                    } - stored
+                    existing.update(
+                        self._find_by_natural_key(db, model, parent_column, created)
+                    )
+
+                for row in pending:
+                    current = existing.get(keys[row.line])
+                    if current is None:
+                        errors.append(
+                            ImportRowError(
+                                row.line,
+                                _MISSING_PARENT_MESSAGES[depth].format(
+                                    _import_path(row)[depth]
+                                ),
+                            )
+                        )
+                        del chains[row.line]
+                        continue
+                    chains[row.line].append(current.id)
+
+                for values in writes:
+                    key = _natural_key(values, parent_column)
+                    chain = chains[own[key].line]
+                    log_entries.append(
+                        {
+                            "entity_type": entity_type,
+                            "entity_id": existing[key].id,
+                            "action": "actualizado" if key in stored else "creado",
+                            "plant_id": chain[0],
+                            "area_id": chain[1] if len(chain) > 1 else None,
+                            "equipment_id": chain[2] if len(chain) > 2 else None,
+                            "name": values["name"],
+                            "location": values.get("location"),
+                            "status": values["status"],
+                            "recorded_at": self._clock(),
+                        }
+                    )
+
+            self._append_changes(db, log_entries)
+        return errors
+
+    @staticmethod
+    def _find_by_natural_key(
+        db: Session, model: Any, parent_column: Any, keys: set[tuple[Any, str]]
+    ) -> dict[tuple[Any, str], Any]:
+        """Lee las filas guardadas de `keys` (`(id_padre, nombre)`) en una consulta."""
+        if not keys:
+            return {}
+
+        columns = [model.id, model.name, model.status]
+        if model is PlantModel:
+            columns.extend((model.location, model.deleted_at))
+        if parent_column is None:
+            names = sorted(name for _, name in keys)
+            stmt = select(*columns).where(model.name.in_(names))
+            return {(None, row.name): row for row in db.execute(stmt)}
+
+        stmt = select(*columns, parent_column).where(
+            tuple_(parent_column, model.name).in_(sorted(keys))
+        )
+        return {
+            (getattr(row, parent_column.key), row.name): row
+            for row in db.execute(stmt)
+        }
+
+    @staticmethod
+    def _upsert(
+        db: Session, model: Any, parent_column: Any, values: list[dict[str, Any]]
+    ) -> None:
+        """Ejecuta un upsert multi-fila sobre la clave natural del modelo."""
+        dialect = db.get_bind().dialect.name
+        try:
+            dialect_module = _DIALECT_INSERTS[dialect]
+        except KeyError:
+            raise NotImplementedError(
+                f"Importación no soportada para el dialecto {dialect}"
+            ) from None
+
+        key_columns = ["name"]
+        if parent_column is not None:
+            key_columns.insert(0, parent_column.key)
+        updated = [column for column in values[0] if column not in key_columns]
+        dialect_insert = import_module(f"sqlalchemy.dialects.{dialect_module}").insert
+        stmt = dialect_insert(model).values(values)
+        if dialect_module == "mysql":
+            stmt = stmt.on_duplicate_key_update(
+                {column: stmt.inserted[column] for column in updated}
+            )
+        else:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=key_columns,
+                set_={column: stmt.excluded[column] for column in updated},
+            )
+        db.execute(stmt)
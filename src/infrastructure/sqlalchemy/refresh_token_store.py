@@ -0,0 +1,102 @@
+"""
+Path: src/infrastructure/sqlalchemy/refresh_token_store.py
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from datetime import datetime
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session
+
+from src.entities.change import utc_now
+from src.infrastructure.refresh_tokens import RefreshTokenStore
+from src.infrastructure.sqlalchemy.models import RefreshTokenModel
+from src.infrastructure.sqlalchemy.session import (
+    CurrentSessionProvider,
+    SessionFactory,
+    stick_to_primary,
+)
+
+
+class SqlAlchemyRefreshTokenStore(RefreshTokenStore):
+    """Familias de refresh tokens en la tabla `refresh_tokens`.
+
+    Compartida entre workers: la rotación es un `UPDATE` condicionado a la
+    generación vigente, de modo que dos refresh simultáneos con el mismo token
+    no pueden avanzar ambos. Cada login borra de paso las sesiones vencidas.
+    """
+
+    def __init__(
+        self,
+        session_factory: SessionFactory,
+        *,
+        current_session: CurrentSessionProvider | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._current_session = current_session
+
+    @contextmanager
+    def _transactional_scope(self):
+        ambient = self._current_session() if self._current_session else None
+        if ambient is not None:
+            stick_to_primary(ambient)
+            try:
+                yield ambient
+            except Exception:
+                ambient.rollback()
+                raise
+            ambient.commit()
+        else:
+            with self._session_factory() as new_session, new_session.begin():
+                stick_to_primary(new_session)
+                yield new_session
+
+    def start(self, family: str, username: str, expires_at: datetime) -> None:
+        now = utc_now()
+        with self._transactional_scope() as db:
+            db.execute(
+                delete(RefreshTokenModel).where(RefreshTokenModel.expires_at <= now)
+            )
+            db.execute(
+                insert(RefreshTokenModel).values(
+                    family=family,
+                    username=username,
+                    generation=0,
+                    expires_at=expires_at,
+                )
+            )
+
+    def rotate(self, family: str, generation: int, *, now: datetime) -> str | None:
+        by_family = RefreshTokenModel.family == family
+        with self._transactional_scope() as db:
+            advanced = db.execute(
+                update(RefreshTokenModel)
+                .where(
+                    by_family,
+                    RefreshTokenModel.generation == generation,
+                    RefreshTokenModel.expires_at > now,
+                )
+                .values(generation=RefreshTokenModel.generation + 1)
+                .execution_options(synchronize_session=False)
+            )
+            if advanced.rowcount == 1:
+                return db.execute(
+                    select(RefreshTokenModel.username).where(by_family)
+                ).scalar_one()
+
+            self._delete(db, family)
+            return None
+
+    def revoke(self, family: str) -> None:
+        with self._transactional_scope() as db:
+            self._delete(db, family)
+
+    @staticmethod
+    def _delete(db: Session, family: str) -> None:
+        db.execute(
+            delete(RefreshTokenModel)
+            .where(RefreshTokenModel.family == family)
+            .execution_options(synchronize_session=False)
+        )
@@ -1,34 +1,243 @@
 """Helpers to build SQLAlchemy engines and sessions."""
 
-from collections.abc import Callable
+from __future__ import annotations
 
-from sqlalchemy import create_engine
+import itertools
+import threading
+import time
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from sqlalchemy import Select, create_engine, event, text
 from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
 
 from src.infrastructure.sqlalchemy.config import DBConfig
+from src.shared.logger import get_logger
 
+logger = get_logger(__name__)
 
 SessionFactory = Callable[[], Session]
+AsyncSessionFactory = Callable[[], AsyncSession]
+# Devuelve la sesión ambiental (por ejemplo, la de la petición HTTP en curso) o
+# `None` cuando no hay ninguna y cada operación debe abrir la suya.
+CurrentSessionProvider = Callable[[], Session | None]
+
+_PRIMARY_KEY = "use_primary"
+_AFTER_COMMIT_KEY = "after_commit"
 
 
 def create_engine_from_config(config: DBConfig) -> Engine:
     """Construct an Engine with sensible pooling defaults."""
 
+    return _create_engine(config.url, config)
+
+
+def create_async_engine_from_config(config: DBConfig) -> AsyncEngine:
+    """Async counterpart of `create_engine_from_config` (same pooling)."""
+
+    return create_async_engine(
+        config.async_url,
+        pool_size=config.pool_size,
+        max_overflow=config.max_overflow,
+        pool_timeout=config.pool_timeout,
+        pool_recycle=config.pool_recycle,
+        echo=config.echo,
+    )
+
+
+def create_replica_engines(config: DBConfig) -> list[Engine]:
+    """One Engine per `config.replica_urls`, with the primary pooling settings."""
+
+    return [
+        _create_engine(url, config, pool_pre_ping=True) for url in config.replica_urls
+    ]
+
+
+def _create_engine(url: str, config: DBConfig, **options: Any) -> Engine:
     return create_engine(
-        config.url,
+        url,
         pool_size=config.pool_size,
         max_overflow=config.max_overflow,
         pool_timeout=config.pool_timeout,
         pool_recycle=config.pool_recycle,
         echo=config.echo,
         future=True,
+        **options,
     )
 
 
-def build_session_factory(engine: Engine) -> SessionFactory:
-    """Return a session factory to produce short-lived sessions per request."""
+class ReplicaSet:
+    """Réplicas de lectura en rotación, con chequeo de salud periódico.
+
+    `choose` reparte las sesiones entre las réplicas sanas. Como mucho una vez
+    cada `check_interval_seconds` se ejecuta `SELECT 1` contra todas (también
+    contra las caídas, que vuelven a la rotación al responder). Sin réplicas
+    sanas se devuelve `None` y las lecturas van al primario.
+    """
+
+    def __init__(
+        self,
+        engines: Sequence[Engine],
+        *,
+        check_interval_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._engines = list(engines)
+        self._check_interval = check_interval_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._check_lock = threading.Lock()
+        self._healthy = list(self._engines)
+        self._rotation = itertools.cycle(self._healthy)
+        self._last_check: float | None = None
+
+    @property
+    def healthy(self) -> list[Engine]:
+        return list(self._healthy)
+
+    def choose(self) -> Engine | None:
+        self._check_if_due()
+        with self._lock:
+            if not self._healthy:
+                return None
+            return next(self._rotation)
+
+    def check(self) -> list[Engine]:
+        """Prueba todas las réplicas y deja en rotación sólo las que responden."""
+        healthy = [engine for engine in self._engines if self._responds(engine)]
+        with self._lock:
+            self._last_check = self._clock()
+            for engine in set(self._healthy) - set(healthy):
+                logger.warning("Réplica fuera de rotación: %r", engine.url)
+            self._set_healthy(healthy)
+        return list(healthy)
+
+    def _check_if_due(self) -> None:
+        last = self._last_check
+        if last is not None and self._clock() - last < self._check_interval:
+            return
+        # Sólo un llamador sale a chequear; el resto usa el estado previo.
+        if not self._check_lock.acquire(blocking=False):
+            return
+        try:
+            self.check()
+        finally:
+            self._check_lock.release()
+
+    def _set_healthy(self, healthy: list[Engine]) -> None:
+        if healthy != self._healthy:
+            self._healthy = healthy
+            self._rotation = itertools.cycle(healthy)
+
+    @staticmethod
+    def _responds(engine: Engine) -> bool:
+        try:
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+            return True
+        except Exception:  # noqa: BLE001 - cualquier fallo deja la réplica fuera
+            return False
 
+
+class RoutingSession(Session):
+    """Sesión que envía los SELECT a una réplica y todo lo demás al primario.
+
+    La réplica se elige una vez por sesión. Tras la primera escritura (o si se
+    llamó a `stick_to_primary`) la sesión queda fijada al primario, de modo que
+    las lecturas posteriores de la misma petición ven lo que acaba de escribir.
+    """
+
+    def __init__(self, *args: Any, replicas: ReplicaSet, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._replicas = replicas
+        self._replica: Engine | None = None
+
+    def get_bind(self, mapper=None, *, clause=None, **kwargs):
+        primary = super().get_bind(mapper, clause=clause, **kwargs)
+        if self.info.get(_PRIMARY_KEY):
+            return primary
+        if self._flushing or (clause is not None and not isinstance(clause, Select)):
+            # Una escritura fija el resto de la sesión al primario.
+            self.info[_PRIMARY_KEY] = True
+            return primary
+        if clause is None:
+            return primary
+
+        if self._replica is None:
+            self._replica = self._replicas.choose()
+        return self._replica or primary
+
+
+def stick_to_primary(session: Session) -> None:
+    """Fija la sesión al primario para el resto de su vida (no-op sin réplicas)."""
+    session.info[_PRIMARY_KEY] = True
+
+
+def run_after_commit(session: Session, callback: Callable[[], None]) -> None:
+    """Ejecuta `callback` cuando `session` confirme su transacción en curso.
+
+    Si la transacción termina en rollback el callback se descarta. Los
+    callbacks de una misma transacción corren en el orden en que se
+    registraron; un fallo se registra en el log sin afectar al commit.
+    """
+
+    pending = session.info.get(_AFTER_COMMIT_KEY)
+    if pending is None:
+        pending = session.info[_AFTER_COMMIT_KEY] = []
+        event.listen(session, "after_commit", _run_pending_callbacks)
+        event.listen(session, "after_rollback", _drop_pending_callbacks)
+    pending.append(callback)
+
+
+def _run_pending_callbacks(session: Session) -> None:
+    pending = session.info.get(_AFTER_COMMIT_KEY) or []
+    session.info[_AFTER_COMMIT_KEY] = []
+    for callback in pending:
+        try:
+            callback()
+        except Exception:
+            logger.exception("Falló un callback posterior al commit")
+
+
+def _drop_pending_callbacks(session: Session) -> None:
+    session.info[_AFTER_COMMIT_KEY] = []
+
+
+def build_session_factory(
+    engine: Engine, *, replicas: ReplicaSet | None = None
+) -> SessionFactory:
+    """Return a session factory to produce short-lived sessions per request.
+
+    With `replicas`, sessions route plain reads to a replica (see
+    `RoutingSession`); units of work and repository writes pin theirs to the
+    primary through `stick_to_primary`.
+    """
+
+    if replicas is None:
+        return sessionmaker(
+            bind=engine, autoflush=False, expire_on_commit=False, future=True
+        )
     return sessionmaker(
-        bind=engine, autoflush=False, expire_on_commit=False, future=True
+        bind=engine,
+        class_=RoutingSession,
+        replicas=replicas,
+        autoflush=False,
+        expire_on_commit=False,
+        future=True,
     )
+
+
+def build_async_session_factory(engine: AsyncEngine) -> AsyncSessionFactory:
+    """Return a factory of `AsyncSession`s with the sync factory's settings.
+
+    Replica routing is not applied: async sessions always use `engine`.
+    """
+
+    return async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
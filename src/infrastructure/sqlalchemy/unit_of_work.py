@@ -5,19 +5,41 @@ from __future__ import annotations
 from sqlalchemy.orm import Session
 
 from src.use_cases.ports.unit_of_work import UnitOfWork
-from src.infrastructure.sqlalchemy.session import SessionFactory
+from src.infrastructure.sqlalchemy.session import (
+    CurrentSessionProvider,
+    SessionFactory,
+    stick_to_primary,
+)
 
 
 class SqlAlchemyUnitOfWork(UnitOfWork):
-    """Manage a SQLAlchemy session lifecycle for a use case."""
+    """Manage a SQLAlchemy session lifecycle for a use case.
 
-    def __init__(self, session_factory: SessionFactory):
+    When `current_session` yields an ambient session (for example the one bound
+    to the HTTP request) the unit of work commits or rolls back on it but leaves
+    closing it to its owner. The session is pinned to the primary database, so
+    read replicas never serve reads that belong to a write.
+    """
+
+    def __init__(
+        self,
+        session_factory: SessionFactory,
+        *,
+        current_session: CurrentSessionProvider | None = None,
+    ):
         self._session_factory = session_factory
+        self._current_session = current_session
         self._session: Session | None = None
+        self._owns_session = True
         self._completed = False
 
     def __enter__(self) -> "SqlAlchemyUnitOfWork":
-        self._session = self._session_factory()
+        ambient = self._current_session() if self._current_session else None
+        self._owns_session = ambient is None
+        self._session = ambient if ambient is not None else self._session_factory()
+        # Lo que se lea dentro de la unidad de trabajo (y, con la sesión de la
+        # petición, lo que venga después) debe salir del primario.
+        stick_to_primary(self._session)
         self._completed = False
         return self
 
@@ -33,9 +55,9 @@ class SqlAlchemyUnitOfWork(UnitOfWork):
                 self._session.commit()
                 self._completed = True
         finally:
-            if self._session is not None:
+            if self._session is not None and self._owns_session:
                 self._session.close()
-                self._session = None
+            self._session = None
         return False
 
     @property
@@ -15,20 +15,37 @@ from werkzeug.security import generate_password_hash
 from src.entities.user import User
 from src.infrastructure.sqlalchemy import mappers
 from src.infrastructure.sqlalchemy.models import UserModel
-from src.infrastructure.sqlalchemy.session import SessionFactory
+from src.infrastructure.sqlalchemy.session import (
+    CurrentSessionProvider,
+    SessionFactory,
+    stick_to_primary,
+)
 from src.infrastructure.user_repository import UserRepository
 
 
 class SqlAlchemyUserRepository(UserRepository):
     """Persiste usuarios y claims usando SQLAlchemy."""
 
-    def __init__(self, session_factory: SessionFactory) -> None:
+    def __init__(
+        self,
+        session_factory: SessionFactory,
+        *,
+        current_session: CurrentSessionProvider | None = None,
+    ) -> None:
         self._session_factory = session_factory
+        self._current_session = current_session
+
+    def _ambient_session(self) -> Session | None:
+        if self._current_session is None:
+            return None
+        return self._current_session()
 
     @contextmanager
     def _session_scope(self, session: Session | None):
         if session is not None:
             yield session
+        elif (ambient := self._ambient_session()) is not None:
+            yield ambient
         else:
             with self._session_factory() as new_session:
                 yield new_session
@@ -36,9 +53,19 @@ class SqlAlchemyUserRepository(UserRepository):
     @contextmanager
     def _transactional_scope(self, session: Session | None):
         if session is not None:
+            stick_to_primary(session)
             yield session
+        elif (ambient := self._ambient_session()) is not None:
+            stick_to_primary(ambient)
+            try:
+                yield ambient
+            except Exception:
+                ambient.rollback()
+                raise
+            ambient.commit()
         else:
             with self._session_factory() as new_session, new_session.begin():
+                stick_to_primary(new_session)
                 yield new_session
 
     def get_by_username(
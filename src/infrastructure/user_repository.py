@@ -4,7 +4,7 @@ Path: src/infrastructure/user_repository.py
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from typing import Protocol
 
 from werkzeug.security import check_password_hash, generate_password_hash
@@ -43,6 +43,44 @@ DEFAULT_DEMO_USERS = (
 )
 
 
+# Hash de cada contraseña demo, compartido por todos los repositorios.
+_DEMO_PASSWORD_HASHES: dict[str, str] = {}
+
+
+def _demo_password_hash(
+    username: str, hash_password: Callable[[str], str] = generate_password_hash
+) -> str:
+    """Hash de la contraseña de un usuario demo, calculado una vez por proceso.
+
+    Cada `generate_password_hash` cuesta decenas de milisegundos; se calcula
+    recién cuando alguien busca ese usuario, con `hash_password` (p. ej.
+    `PasswordHashPool.hash_password`, para no ocupar el hilo de la petición),
+    y lo reutilizan todos los repositorios creados con `with_defaults`.
+    """
+    password_hash = _DEMO_PASSWORD_HASHES.get(username)
+    if password_hash is None:
+        spec = next(
+            user for user in DEFAULT_DEMO_USERS if user["username"] == username
+        )
+        password_hash = _DEMO_PASSWORD_HASHES.setdefault(
+            username, hash_password(spec["password"])
+        )
+    return password_hash
+
+
+def _demo_user(
+    username: str, hash_password: Callable[[str], str] = generate_password_hash
+) -> User:
+    spec = next(user for user in DEFAULT_DEMO_USERS if user["username"] == username)
+    return User(
+        username=spec["username"],
+        password_hash=_demo_password_hash(username, hash_password),
+        role=spec["role"],
+        areas=list(spec["areas"]),
+        equipos=list(spec["equipos"]),
+    )
+
+
 class UserRepository(Protocol):
     """Contrato mínimo para almacenar y recuperar usuarios."""
 
@@ -75,25 +113,35 @@ class InMemoryUserRepository(UserRepository):
 
     def __init__(self, initial: Sequence[User] | None = None) -> None:
         self._users: dict[str, User] = {user.username: user for user in initial or ()}
+        # Usuarios demo aún sin hashear; se materializan al primer acceso.
+        self._pending_demo: set[str] = set()
+        self._hash_password: Callable[[str], str] = generate_password_hash
 
     @classmethod
-    def with_defaults(cls) -> "InMemoryUserRepository":
-        "Crea un repositorio con usuarios de demostración."
+    def with_defaults(
+        cls, *, hash_password: Callable[[str], str] | None = None
+    ) -> "InMemoryUserRepository":
+        """Crea un repositorio con usuarios de demostración (hash diferido).
+
+        `hash_password` calcula esos hashes al primer acceso; por defecto
+        `generate_password_hash` en el hilo que busca al usuario.
+        """
         repo = cls()
-        for user in DEFAULT_DEMO_USERS:
-            repo.create_user(
-                username=user["username"],
-                password=user["password"],
-                role=user["role"],
-                areas=user["areas"],
-                equipos=user["equipos"],
-            )
+        if hash_password is not None:
+            repo._hash_password = hash_password
+        repo._pending_demo.update(user["username"] for user in DEFAULT_DEMO_USERS)
         return repo
 
     def get_by_username(
         self, username: str, *, session: object | None = None
     ) -> User | None:
-        return self._users.get(username)
+        user = self._users.get(username)
+        if user is None and username in self._pending_demo:
+            user = self._users.setdefault(
+                username, _demo_user(username, self._hash_password)
+            )
+            self._pending_demo.discard(username)
+        return user
 
     def create_user(
         self,
@@ -113,14 +161,26 @@ class InMemoryUserRepository(UserRepository):
             equipos=list(equipos),
         )
         self._users[username] = user
+        self._pending_demo.discard(username)
         return user
 
     def list_users(self, *, session: object | None = None) -> Sequence[User]:
+        for user in DEFAULT_DEMO_USERS:
+            self.get_by_username(user["username"])
         return list(self._users.values())
 
-    def verify_credentials(self, username: str, password: str) -> User | None:
-        "Verifica las credenciales y devuelve el usuario si son correctas."
+    def verify_credentials(
+        self,
+        username: str,
+        password: str,
+        *,
+        verify: Callable[[str, str], bool] = check_password_hash,
+    ) -> User | None:
+        """Verifica las credenciales y devuelve el usuario si son correctas.
+
+        `verify` permite delegar el hash, p. ej. en `PasswordHashPool.verify`.
+        """
         user = self.get_by_username(username)
-        if user and check_password_hash(user.password_hash, password):
+        if user and verify(user.password_hash, password):
             return user
         return None
@@ -0,0 +1,742 @@
+"""Read-through cache decorator for any PlantDataRepository."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Collection, Hashable, Iterable
+from typing import Any, Mapping, Sequence, TypeVar
+
+from src.entities.area import Area
+from src.entities.equipment import Equipment
+from src.entities.inventory import ImportRow, ImportRowError
+from src.entities.plant import Plant
+from src.entities.plant_tree import PlantTree
+from src.entities.purge_job import PurgeJob
+from src.entities.status_cascade import StatusCascade
+from src.entities.system import System
+from src.shared.cache import MISSING, CacheStats, LruTtlCache
+from src.use_cases.ports.pagination import Page
+from src.use_cases.ports.plant_repository import PlantDataRepository
+
+T = TypeVar("T")
+AfterCommit = Callable[[object, Callable[[], None]], None]
+E = TypeVar("E", Area, Equipment, System)
+
+_PARENT_ATTRIBUTE = {
+    "area": "plant_id",
+    "equipment": "area_id",
+    "system": "equipment_id",
+}
+
+
+def _ids_key(ids: Collection[int] | None) -> frozenset[int] | None:
+    """Part of a page key for the `ids` restriction; order does not matter."""
+    return None if ids is None else frozenset(ids)
+
+
+class CachingPlantRepository(PlantDataRepository):
+    """Serve reads from a bounded LRU+TTL cache and invalidate on writes.
+
+    Calls that carry an explicit `session` belong to a unit of work and bypass
+    the cache, so uncommitted data is never stored. Writes drop exactly the
+    entries they affect, including every descendant removed by a cascading
+    delete. A write made with an explicit `session` is only invalidated once
+    `after_commit(session, callback)` reports that its transaction committed;
+    dropping entries earlier would let a concurrent reader cache the rows the
+    transaction is about to replace. Without `after_commit` they are dropped
+    right away. The TTL bounds staleness for writes made by other processes.
+    """
+
+    def __init__(
+        self,
+        inner: PlantDataRepository,
+        *,
+        max_entries: int = 2048,
+        ttl_seconds: float = 30.0,
+        clock: Callable[[], float] | None = None,
+        after_commit: AfterCommit | None = None,
+    ) -> None:
+        self._inner = inner
+        self._after_commit = after_commit
+        cache_options: dict[str, Any] = {
+            "max_entries": max_entries,
+            "ttl_seconds": ttl_seconds,
+        }
+        if clock is not None:
+            cache_options["clock"] = clock
+        self._cache = LruTtlCache(**cache_options)
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats()
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def invalidate_plants(self, plant_ids: Iterable[int]) -> None:
+        """Drop everything cached under the given plants.
+
+        Meant for changes made by other processes (see `PlantVersionWatcher`).
+        Entries whose plant cannot be resolved from the cache itself, such as
+        negative lookups, are dropped as well.
+        """
+        targets = set(plant_ids)
+        if not targets:
+            return
+
+        self._cache.delete_prefix(("plants",))
+        stale = [
+            key
+            for key, value in self._cache.items()
+            if self._owning_plant(key, value) in targets | {None}
+        ]
+        for key in stale:
+            self._cache.delete(key)
+
+    # Plant operations
+    def list_plants(self, *, session: object | None = None) -> Sequence[Plant]:
+        return list(
+            self._read(
+                ("plants",),
+                session,
+                lambda: tuple(self._inner.list_plants(session=session)),
+            )
+        )
+
+    def list_plants_page(
+        self, *, limit: int, after: int | None = None, session: object | None = None
+    ) -> Page[Plant]:
+        return self._read_page(
+            ("plants", "page", limit, after),
+            session,
+            lambda: self._inner.list_plants_page(
+                limit=limit, after=after, session=session
+            ),
+        )
+
+    def get_plant(
+        self, plant_id: int, *, session: object | None = None
+    ) -> Plant | None:
+        return self._read(
+            ("plant", plant_id),
+            session,
+            lambda: self._inner.get_plant(plant_id, session=session),
+        )
+
+    def get_plant_tree(
+        self, plant_id: int, *, session: object | None = None
+    ) -> PlantTree | None:
+        return self._read(
+            ("tree", plant_id),
+            session,
+            lambda: self._inner.get_plant_tree(plant_id, session=session),
+        )
+
+    def create_plant(
+        self,
+        *,
+        name: str,
+        location: str | None = None,
+        status: str | None = None,
+        session: object | None = None,
+    ) -> Plant:
+        created = self._inner.create_plant(
+            name=name, location=location, status=status, session=session
+        )
+        self._on_commit(session, lambda: self._forget_plant(created.id))
+        return created
+
+    def update_plant(
+        self,
+        plant_id: int,
+        *,
+        name: str | None = None,
+        location: str | None = None,
+        status: str | None = None,
+        session: object | None = None,
+    ) -> Plant | None:
+        updated = self._inner.update_plant(
+            plant_id, name=name, location=location, status=status, session=session
+        )
+        self._on_commit(session, lambda: self._forget_plant(plant_id))
+        return updated
+
+    def set_plant_status(
+        self,
+        plant_id: int,
+        statuses: Mapping[str, str],
+        *,
+        session: object | None = None,
+    ) -> StatusCascade | None:
+        result = self._inner.set_plant_status(plant_id, statuses, session=session)
+        if result is not None:
+            self._forget_plants_on_commit(session, result.plant_id)
+        return result
+
+    def delete_plant(self, plant_id: int, *, session: object | None = None) -> bool:
+        deleted = self._inner.delete_plant(plant_id, session=session)
+        self._forget_plants_on_commit(session, plant_id)
+        return deleted
+
+    def hide_plant(
+        self, plant_id: int, *, session: object | None = None
+    ) -> PurgeJob | None:
+        job = self._inner.hide_plant(plant_id, session=session)
+        if job is not None:
+            self._forget_plants_on_commit(session, plant_id)
+        return job
+
+    def purge_plant_batch(
+        self, job_id: int, *, batch_size: int, session: object | None = None
+    ) -> PurgeJob | None:
+        # Purged rows were already hidden, and dropped from the cache, by
+        # `hide_plant`.
+        return self._inner.purge_plant_batch(
+            job_id, batch_size=batch_size, session=session
+        )
+
+    def get_purge_job(
+        self, job_id: int, *, session: object | None = None
+    ) -> PurgeJob | None:
+        return self._inner.get_purge_job(job_id, session=session)
+
+    def fail_purge_job(
+        self, job_id: int, error: str, *, session: object | None = None
+    ) -> PurgeJob | None:
+        return self._inner.fail_purge_job(job_id, error, session=session)
+
+    def list_unfinished_purge_jobs(
+        self, *, session: object | None = None
+    ) -> Sequence[PurgeJob]:
+        return self._inner.list_unfinished_purge_jobs(session=session)
+
+    def get_plant_versions(
+        self, plant_ids: Iterable[int] | None = None, *, session: object | None = None
+    ) -> Mapping[int, int]:
+        # Revisions are the freshness signal itself, so they are never cached.
+        return self._inner.get_plant_versions(plant_ids, session=session)
+
+    # Area operations
+    def list_areas(
+        self, plant_id: int, *, session: object | None = None
+    ) -> Sequence[Area]:
+        return list(
+            self._read(
+                ("areas", plant_id),
+                session,
+                lambda: tuple(self._inner.list_areas(plant_id, session=session)),
+            )
+        )
+
+    def list_areas_page(
+        self,
+        plant_id: int,
+        *,
+        limit: int,
+        after: int | None = None,
+        ids: Collection[int] | None = None,
+        session: object | None = None,
+    ) -> Page[Area]:
+        return self._read_page(
+            ("areas", plant_id, "page", limit, after, _ids_key(ids)),
+            session,
+            lambda: self._inner.list_areas_page(
+                plant_id, limit=limit, after=after, ids=ids, session=session
+            ),
+        )
+
+    def get_area(self, area_id: int, *, session: object | None = None) -> Area | None:
+        return self._read(
+            ("area", area_id),
+            session,
+            lambda: self._inner.get_area(area_id, session=session),
+        )
+
+    def get_areas_by_ids(
+        self, area_ids: Iterable[int], *, session: object | None = None
+    ) -> Sequence[Area]:
+        return self._read_many(
+            "area", area_ids, session, self._inner.get_areas_by_ids
+        )
+
+    def create_area(
+        self,
+        plant_id: int,
+        *,
+        name: str,
+        status: str | None = None,
+        session: object | None = None,
+    ) -> Area | None:
+        created = self._inner.create_area(
+            plant_id, name=name, status=status, session=session
+        )
+
+        def forget() -> None:
+            if created is not None:
+                self._cache.delete(("area", created.id))
+            self._forget_area_listing(plant_id)
+
+        self._on_commit(session, forget)
+        return created
+
+    def create_area_batch(
+        self,
+        plant_id: int,
+        items: Sequence[Mapping[str, Any]],
+        *,
+        session: object | None = None,
+    ) -> Sequence[Area] | None:
+        created = self._inner.create_area_batch(plant_id, items, session=session)
+
+        def forget() -> None:
+            for item in created or ():
+                self._cache.delete(("area", item.id))
+            self._forget_area_listing(plant_id)
+
+        self._on_commit(session, forget)
+        return created
+
+    def update_area(
+        self,
+        area_id: int,
+        *,
+        name: str | None = None,
+        status: str | None = None,
+        session: object | None = None,
+    ) -> Area | None:
+        updated = self._inner.update_area(
+            area_id, name=name, status=status, session=session
+        )
+
+        def forget() -> None:
+            self._cache.delete(("area", area_id))
+            if updated is not None:
+                self._forget_area_listing(updated.plant_id)
+
+        self._on_commit(session, forget)
+        return updated
+
+    def set_area_status(
+        self,
+        area_id: int,
+        statuses: Mapping[str, str],
+        *,
+        session: object | None = None,
+    ) -> StatusCascade | None:
+        result = self._inner.set_area_status(area_id, statuses, session=session)
+        if result is not None:
+            self._forget_plants_on_commit(session, result.plant_id)
+        return result
+
+    def delete_area(self, area_id: int, *, session: object | None = None) -> bool:
+        area = self._inner.get_area(area_id, session=session)
+        deleted = self._inner.delete_area(area_id, session=session)
+        if area is not None:
+            # The cascade reaches every equipment and system of the area; the
+            # plant's entries are dropped without loading the subtree.
+            self._forget_plants_on_commit(session, area.plant_id)
+        return deleted
+
+    # Equipment operations
+    def list_equipment(
+        self, area_id: int, *, session: object | None = None
+    ) -> Sequence[Equipment]:
+        return list(
+            self._read(
+                ("equipment_of", area_id),
+                session,
+                lambda: tuple(self._inner.list_equipment(area_id, session=session)),
+            )
+        )
+
+    def list_equipment_page(
+        self,
+        area_id: int,
+        *,
+        limit: int,
+        after: int | None = None,
+        ids: Collection[int] | None = None,
+        session: object | None = None,
+    ) -> Page[Equipment]:
+        return self._read_page(
+            ("equipment_of", area_id, "page", limit, after, _ids_key(ids)),
+            session,
+            lambda: self._inner.list_equipment_page(
+                area_id, limit=limit, after=after, ids=ids, session=session
+            ),
+        )
+
+    def get_equipment(
+        self, equipment_id: int, *, session: object | None = None
+    ) -> Equipment | None:
+        return self._read(
+            ("equipment", equipment_id),
+            session,
+            lambda: self._inner.get_equipment(equipment_id, session=session),
+        )
+
+    def get_equipment_by_ids(
+        self, equipment_ids: Iterable[int], *, session: object | None = None
+    ) -> Sequence[Equipment]:
+        return self._read_many(
+            "equipment", equipment_ids, session, self._inner.get_equipment_by_ids
+        )
+
+    def create_equipment(
+        self,
+        area_id: int,
+        *,
+        name: str,
+        status: str | None = None,
+        session: object | None = None,
+    ) -> Equipment | None:
+        created = self._inner.create_equipment(
+            area_id, name=name, status=status, session=session
+        )
+
+        def forget() -> None:
+            if created is not None:
+                self._cache.delete(("equipment", created.id))
+            self._forget_equipment_listing(area_id)
+
+        self._on_commit(session, forget)
+        return created
+
+    def create_equipment_batch(
+        self,
+        area_id: int,
+        items: Sequence[Mapping[str, Any]],
+        *,
+        session: object | None = None,
+    ) -> Sequence[Equipment] | None:
+        created = self._inner.create_equipment_batch(area_id, items, session=session)
+
+        def forget() -> None:
+            for item in created or ():
+                self._cache.delete(("equipment", item.id))
+            self._forget_equipment_listing(area_id)
+
+        self._on_commit(session, forget)
+        return created
+
+    def update_equipment(
+        self,
+        equipment_id: int,
+        *,
+        name: str | None = None,
+        status: str | None = None,
+        session: object | None = None,
+    ) -> Equipment | None:
+        updated = self._inner.update_equipment(
+            equipment_id, name=name, status=status, session=session
+        )
+
+        def forget() -> None:
+            self._cache.delete(("equipment", equipment_id))
+            if updated is not None:
+                self._forget_equipment_listing(updated.area_id)
+
+        self._on_commit(session, forget)
+        return updated
+
+    def set_equipment_status(
+        self,
+        equipment_id: int,
+        statuses: Mapping[str, str],
+        *,
+        session: object | None = None,
+    ) -> StatusCascade | None:
+        result = self._inner.set_equipment_status(equipment_id, statuses, session=session)
+        if result is not None:
+            self._forget_plants_on_commit(session, result.plant_id)
+        return result
+
+    def delete_equipment(
+        self, equipment_id: int, *, session: object | None = None
+    ) -> bool:
+        equipment = self._inner.get_equipment(equipment_id, session=session)
+        if equipment is None:
+            return self._inner.delete_equipment(equipment_id, session=session)
+
+        deleted = self._inner.delete_equipment(equipment_id, session=session)
+
+        def forget() -> None:
+            # The cascade removes the equipment's systems; their entries are
+            # dropped by prefix instead of listing them before the delete.
+            self._forget_equipment_subtree(equipment_id)
+            self._forget_equipment_listing(equipment.area_id)
+
+        self._on_commit(session, forget)
+        return deleted
+
+    # System operations
+    def list_systems(
+        self, equipment_id: int, *, session: object | None = None
+    ) -> Sequence[System]:
+        return list(
+            self._read(
+                ("systems_of", equipment_id),
+                session,
+                lambda: tuple(self._inner.list_systems(equipment_id, session=session)),
+            )
+        )
+
+    def list_systems_page(
+        self,
+        equipment_id: int,
+        *,
+        limit: int,
+        after: int | None = None,
+        session: object | None = None,
+    ) -> Page[System]:
+        return self._read_page(
+            ("systems_of", equipment_id, "page", limit, after),
+            session,
+            lambda: self._inner.list_systems_page(
+                equipment_id, limit=limit, after=after, session=session
+            ),
+        )
+
+    def get_system(
+        self, system_id: int, *, session: object | None = None
+    ) -> System | None:
+        return self._read(
+            ("system", system_id),
+            session,
+            lambda: self._inner.get_system(system_id, session=session),
+        )
+
+    def get_systems_by_ids(
+        self, system_ids: Iterable[int], *, session: object | None = None
+    ) -> Sequence[System]:
+        return self._read_many(
+            "system", system_ids, session, self._inner.get_systems_by_ids
+        )
+
+    def create_system(
+        self,
+        equipment_id: int,
+        *,
+        name: str,
+        status: str | None = None,
+        session: object | None = None,
+    ) -> System | None:
+        created = self._inner.create_system(
+            equipment_id, name=name, status=status, session=session
+        )
+
+        def forget() -> None:
+            if created is not None:
+                self._cache.delete(("system", created.id))
+            self._forget_system_listing(equipment_id)
+
+        self._on_commit(session, forget)
+        return created
+
+    def create_system_batch(
+        self,
+        equipment_id: int,
+        items: Sequence[Mapping[str, Any]],
+        *,
+        session: object | None = None,
+    ) -> Sequence[System] | None:
+        created = self._inner.create_system_batch(equipment_id, items, session=session)
+
+        def forget() -> None:
+            for item in created or ():
+                self._cache.delete(("system", item.id))
+            self._forget_system_listing(equipment_id)
+
+        self._on_commit(session, forget)
+        return created
+
+    def update_system(
+        self,
+        system_id: int,
+        *,
+        name: str | None = None,
+        status: str | None = None,
+        session: object | None = None,
+    ) -> System | None:
+        updated = self._inner.update_system(
+            system_id, name=name, status=status, session=session
+        )
+
+        def forget() -> None:
+            self._cache.delete(("system", system_id))
+            if updated is not None:
+                self._forget_system_listing(updated.equipment_id)
+
+        self._on_commit(session, forget)
+        return updated
+
+    def delete_system(self, system_id: int, *, session: object | None = None) -> bool:
+        system = self._inner.get_system(system_id, session=session)
+        deleted = self._inner.delete_system(system_id, session=session)
+        if system is not None:
+
+            def forget() -> None:
+                self._cache.delete(("system", system_id))
+                self._forget_system_listing(system.equipment_id)
+
+            self._on_commit(session, forget)
+        return deleted
+
+    # Inventory import
+    def upsert_rows(
+        self, rows: Sequence[ImportRow], *, session: object | None = None
+    ) -> list[ImportRowError]:
+        """Import through the wrapped repository, which must support it.
+
+        The plants named by the chunk are resolved to ids in the same
+        transaction, so plants it creates are covered too, and their cached
+        entries are dropped once it commits.
+        """
+        errors = self._inner.upsert_rows(rows, session=session)
+        names = {row.plant_name or row.name for row in rows}
+        plant_ids = [
+            plant.id
+            for plant in self._inner.list_plants(session=session)
+            if plant.name in names
+        ]
+        self._on_commit(session, lambda: self.invalidate_plants(plant_ids))
+        return errors
+
+    # Cache helpers
+    def _on_commit(
+        self, session: object | None, forget: Callable[[], None]
+    ) -> None:
+        if session is None or self._after_commit is None:
+            forget()
+        else:
+            self._after_commit(session, forget)
+
+    def _forget_plants_on_commit(self, session: object | None, plant_id: int) -> None:
+        self._on_commit(session, lambda: self.invalidate_plants([plant_id]))
+
+    def _read(
+        self, key: Hashable, session: object | None, loader: Callable[[], T]
+    ) -> T:
+        if session is not None:
+            return loader()
+
+        cached = self._cache.get(key)
+        if cached is not MISSING:
+            return cached
+
+        value = loader()
+        self._cache.set(key, value)
+        return value
+
+    def _read_page(
+        self, key: Hashable, session: object | None, loader: Callable[[], Page[T]]
+    ) -> Page[T]:
+        if session is not None:
+            return loader()
+
+        cached = self._cache.get(key)
+        if cached is MISSING:
+            page = loader()
+            cached = (tuple(page.items), page.next_after)
+            self._cache.set(key, cached)
+
+        items, next_after = cached
+        return Page(items=list(items), next_after=next_after)
+
+    def _read_many(
+        self,
+        kind: str,
+        ids: Iterable[int],
+        session: object | None,
+        loader: Callable[..., Sequence[E]],
+    ) -> Sequence[E]:
+        wanted = set(ids)
+        if session is not None:
+            return loader(wanted, session=session)
+
+        found: list[E] = []
+        missing: set[int] = set()
+        for item_id in wanted:
+            cached = self._cache.get((kind, item_id))
+            if cached is MISSING:
+                missing.add(item_id)
+            elif cached is not None:
+                found.append(cached)
+
+        if missing:
+            loaded = {item.id: item for item in loader(missing)}
+            for item_id in missing:
+                item = loaded.get(item_id)
+                self._cache.set((kind, item_id), item)
+                if item is not None:
+                    found.append(item)
+        return found
+
+    def _cached_parent(self, kind: str, item_id: int) -> int | None:
+        cached = self._cache.peek((kind, item_id))
+        if cached is MISSING or cached is None:
+            return None
+        return getattr(cached, _PARENT_ATTRIBUTE[kind])
+
+    def _owning_plant(self, key: Hashable, value: Any) -> int | None:
+        kind, item_id = key[0], key[1]
+        if kind in {"plant", "tree", "areas"}:
+            return item_id
+        if kind == "equipment_of":
+            return self._cached_parent("area", item_id)
+        if kind == "systems_of":
+            area_id = self._cached_parent("equipment", item_id)
+            return self._cached_parent("area", area_id) if area_id else None
+        if value is None:
+            return None
+
+        parent_id = getattr(value, _PARENT_ATTRIBUTE[kind])
+        if kind == "area":
+            return parent_id
+        if kind == "equipment":
+            return self._cached_parent("area", parent_id)
+        area_id = self._cached_parent("equipment", parent_id)
+        return self._cached_parent("area", area_id) if area_id else None
+
+    def _forget_tree(self, plant_id: int | None) -> None:
+        if plant_id is None:
+            self._cache.delete_prefix(("tree",))
+        else:
+            self._cache.delete(("tree", plant_id))
+
+    def _forget_plant(self, plant_id: int) -> None:
+        self._cache.delete(("plant", plant_id))
+        self._cache.delete_prefix(("plants",))
+        self._forget_tree(plant_id)
+
+    def _forget_area_listing(self, plant_id: int | None) -> None:
+        if plant_id is None:
+            self._cache.delete_prefix(("areas",))
+        else:
+            self._cache.delete_prefix(("areas", plant_id))
+        self._forget_tree(plant_id)
+
+    def _forget_equipment_listing(self, area_id: int | None) -> None:
+        if area_id is None:
+            self._cache.delete_prefix(("equipment_of",))
+            self._forget_tree(None)
+            return
+        self._cache.delete_prefix(("equipment_of", area_id))
+        self._forget_tree(self._cached_parent("area", area_id))
+
+    def _forget_system_listing(self, equipment_id: int | None) -> None:
+        if equipment_id is None:
+            self._cache.delete_prefix(("systems_of",))
+            self._forget_tree(None)
+            return
+        self._cache.delete_prefix(("systems_of", equipment_id))
+        area_id = self._cached_parent("equipment", equipment_id)
+        plant_id = self._cached_parent("area", area_id) if area_id else None
+        self._forget_tree(plant_id)
+
+    def _forget_equipment_subtree(self, equipment_id: int) -> None:
+        self._cache.delete(("equipment", equipment_id))
+        self._cache.delete_prefix(("systems_of", equipment_id))
+        self._cache.delete_prefix(("system",))
+
+
+__all__ = ["CachingPlantRepository"]
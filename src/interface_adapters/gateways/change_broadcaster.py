@@ -0,0 +1,222 @@
+"""Fan-out of change log entries to live subscribers (Server-Sent Events)."""
+
+from __future__ import annotations
+
+import queue
+import threading
+from collections.abc import Callable
+
+from src.entities.change import ChangeEntry
+from src.shared.logger import get_logger
+from src.use_cases.ports.change_log import ChangeLogRepository
+
+logger = get_logger(__name__)
+
+
+class Subscription:
+    """Bounded inbox of one live client.
+
+    `offer` never blocks the broadcaster: when the inbox is full the
+    subscription is marked as overflowed and stops receiving entries, so a
+    slow client costs at most `queue_size` entries of memory. Every entry is
+    also in the change log, so the consumer recovers by reading it from
+    `last_id` and calling `resume`.
+
+    Consumers that must not block a thread while they wait (an event loop)
+    register a listener with `set_listener` and drain with `receive(0)`.
+    """
+
+    def __init__(self, *, after: int | None, queue_size: int) -> None:
+        self.last_id = after
+        self._inbox: queue.Queue[ChangeEntry | None] = queue.Queue(maxsize=queue_size)
+        self._overflowed = False
+        self._closed = threading.Event()
+        self._listener: Callable[[], None] | None = None
+
+    @property
+    def overflowed(self) -> bool:
+        return self._overflowed
+
+    @property
+    def closed(self) -> bool:
+        return self._closed.is_set()
+
+    def set_listener(self, listener: Callable[[], None] | None) -> None:
+        """Call `listener` whenever new entries arrive, or on overflow or close.
+
+        It runs on the broadcaster thread, so it must be cheap and thread
+        safe (e.g. `loop.call_soon_threadsafe(event.set)`).
+        """
+        self._listener = listener
+
+    def close(self) -> None:
+        """Ask the consumer to stop, e.g. because the server is shutting down.
+
+        A pending `receive` returns right away with an empty list.
+        """
+        self._closed.set()
+        try:
+            self._inbox.put_nowait(None)
+        except queue.Full:
+            pass
+        self._notify()
+
+    def offer(self, change: ChangeEntry) -> None:
+        if self._overflowed or self.closed:
+            return
+        try:
+            self._inbox.put_nowait(change)
+        except queue.Full:
+            self._overflowed = True
+        self._notify()
+
+    def _notify(self) -> None:
+        listener = self._listener
+        if listener is not None:
+            listener()
+
+    def resume(self) -> None:
+        """Accept entries again after the consumer caught up from the log."""
+        self._overflowed = False
+
+    def receive(self, timeout: float) -> list[ChangeEntry]:
+        """Wait up to `timeout` seconds and drain every pending entry.
+
+        Entries at or below `last_id` (already delivered by the catch-up read)
+        are skipped; an empty list means the wait timed out or the
+        subscription was closed.
+        """
+        if self.closed:
+            return []
+        try:
+            first = self._inbox.get(timeout=timeout)
+        except queue.Empty:
+            return []
+
+        pending = [first]
+        while True:
+            try:
+                pending.append(self._inbox.get_nowait())
+            except queue.Empty:
+                break
+        if self.closed:
+            return []
+        return self.accept([change for change in pending if change is not None])
+
+    def accept(self, changes: list[ChangeEntry]) -> list[ChangeEntry]:
+        """Drop entries already delivered and advance `last_id`."""
+        fresh = [
+            change
+            for change in changes
+            if self.last_id is None or change.id > self.last_id
+        ]
+        if fresh:
+            self.last_id = fresh[-1].id
+        return fresh
+
+
+class ChangeBroadcaster:
+    """Tail the change log once per process and fan entries out.
+
+    A single background thread reads entries newer than its cursor, waking
+    every `poll_seconds` or as soon as `wake` is called after a local write.
+    Entries written by other workers reach the log in the same transaction
+    as the change, so every process sees every write; `list_changes` stops
+    before ids whose transaction may still commit, so an entry committed late
+    is delivered late rather than skipped. The thread only runs
+    while there are subscribers.
+
+    The broadcaster adds no thread per client, but a consumer blocked in
+    `Subscription.receive` (the Flask stream) holds its own thread while it
+    waits; only a consumer driven by `set_listener` (the FastAPI stream)
+    waits without one. `max_subscribers` bounds both.
+    """
+
+    def __init__(
+        self,
+        change_log: ChangeLogRepository,
+        *,
+        poll_seconds: float = 1.0,
+        queue_size: int = 256,
+        max_subscribers: int = 200,
+        batch_size: int = 500,
+    ) -> None:
+        self._change_log = change_log
+        self._poll_seconds = poll_seconds
+        self._queue_size = queue_size
+        self._max_subscribers = max_subscribers
+        self._batch_size = batch_size
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._subscribers: set[Subscription] = set()
+        self._cursor: int | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def subscribe(self, after: int | None) -> Subscription | None:
+        """Register a client; `None` when the process is at capacity."""
+        with self._lock:
+            if len(self._subscribers) >= self._max_subscribers:
+                return None
+            if not self._subscribers:
+                self._cursor = self._change_log.get_change_bounds()[1]
+            subscription = Subscription(
+                after=self._cursor if after is None else after,
+                queue_size=self._queue_size,
+            )
+            self._subscribers.add(subscription)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="change-broadcaster", daemon=True
+                )
+                self._thread.start()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+        self._wakeup.set()
+
+    def wake(self) -> None:
+        """Ask for an immediate read, typically right after a local write."""
+        self._wakeup.set()
+
+    def poll_once(self) -> int:
+        """Read pending entries and offer them to every subscriber."""
+        dispatched = 0
+        while True:
+            page = self._change_log.list_changes(
+                limit=self._batch_size, after=self._cursor
+            )
+            if not page.items:
+                return dispatched
+
+            with self._lock:
+                subscribers = list(self._subscribers)
+                self._cursor = page.items[-1].id
+            for change in page.items:
+                for subscription in subscribers:
+                    subscription.offer(change)
+            dispatched += len(page.items)
+            if page.next_after is None:
+                return dispatched
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.wait(self._poll_seconds)
+            self._wakeup.clear()
+            with self._lock:
+                if not self._subscribers:
+                    self._thread = None
+                    return
+            try:
+                self.poll_once()
+            except Exception:  # pragma: no cover - retried on the next cycle
+                logger.exception("No se pudo leer change_log para los eventos")
+
+
+__all__ = ["ChangeBroadcaster", "Subscription"]
@@ -2,19 +2,47 @@
 
 from __future__ import annotations
 
-from typing import Sequence
+from collections.abc import Callable, Iterator
+from dataclasses import replace
+from datetime import datetime
+from typing import Any, Collection, Iterable, Mapping, Sequence, TypeVar
 
 from src.entities.area import Area
+from src.entities.change import ChangeEntry, utc_now
 from src.entities.equipment import Equipment
+from src.entities.inventory import (
+    ImportRow,
+    ImportRowError,
+    InventoryRow,
+    InventoryScope,
+)
 from src.entities.plant import Plant
+from src.entities.plant_tree import AreaNode, EquipmentNode, PlantTree
+from src.entities.purge_job import PurgeJob
+from src.entities.status_cascade import StatusCascade
 from src.entities.system import System
+from src.use_cases.ports.change_log import ChangeLogRepository
+from src.use_cases.ports.inventory import (
+    InventoryImportRepository,
+    InventoryRepository,
+)
+from src.use_cases.ports.pagination import Page
 from src.use_cases.ports.plant_repository import PlantDataRepository
 
+T = TypeVar("T", Plant, Area, Equipment, System, ChangeEntry)
 
-class InMemoryPlantRepository(PlantDataRepository):
+_IMPORT_ORDER = {"planta": 0, "area": 1, "equipo": 2, "sistema": 3}
+
+
+class InMemoryPlantRepository(
+    PlantDataRepository,
+    ChangeLogRepository,
+    InventoryRepository,
+    InventoryImportRepository,
+):
     """Provide a predictable data set without hitting a real database."""
 
-    def __init__(self) -> None:
+    def __init__(self, *, clock: Callable[[], datetime] = utc_now) -> None:
         self._plants: dict[int, Plant] = {
             1: Plant(
                 id=1,
@@ -81,11 +109,22 @@ class InMemoryPlantRepository(PlantDataRepository):
                 ),
             ),
         }
+        self._versions: dict[int, int] = {}
+        self._changes: list[ChangeEntry] = []
+        self._last_change_id = 0
+        self._purge_jobs: dict[int, PurgeJob] = {}
+        self._purge_counts: dict[int, dict[str, int]] = {}
+        self._clock = clock
 
     # Plant operations
     def list_plants(self, *, session: object | None = None) -> Sequence[Plant]:
         return list(self._plants.values())
 
+    def list_plants_page(
+        self, *, limit: int, after: int | None = None, session: object | None = None
+    ) -> Page[Plant]:
+        return self._slice_page(self._plants.values(), limit=limit, after=after)
+
     def get_plant(
         self, plant_id: int, *, session: object | None = None
     ) -> Plant | None:
@@ -107,6 +146,7 @@ class InMemoryPlantRepository(PlantDataRepository):
             status=status or "operativa",
         )
         self._plants[new_id] = plant
+        self._record_change("creado", "planta", plant, plant_id=new_id)
         return plant
 
     def update_plant(
@@ -128,10 +168,27 @@ class InMemoryPlantRepository(PlantDataRepository):
             location=location if location is not None else current.location,
             status=status if status is not None else current.status,
         )
+        if updated == current:
+            return current
 
         self._plants[plant_id] = updated
+        self._record_change("actualizado", "planta", updated, plant_id=plant_id)
         return updated
 
+    def set_plant_status(
+        self,
+        plant_id: int,
+        statuses: Mapping[str, str],
+        *,
+        session: object | None = None,
+    ) -> StatusCascade | None:
+        plant = self._plants.get(plant_id)
+        if plant is None:
+            return None
+
+        updated = self._apply_statuses(statuses, plants=[plant])
+        return StatusCascade(plant_id=plant_id, updated=updated)
+
     def delete_plant(self, plant_id: int, *, session: object | None = None) -> bool:
         if plant_id not in self._plants:
             return False
@@ -140,15 +197,132 @@ class InMemoryPlantRepository(PlantDataRepository):
         for area in self._areas.pop(plant_id, ()):  # remove areas for plant
             self._cascade_delete_area(area.id)
 
-        del self._plants[plant_id]
+        deleted = self._plants.pop(plant_id)
+        self._record_change("eliminado", "planta", deleted, plant_id=plant_id)
         return True
 
+    def hide_plant(
+        self, plant_id: int, *, session: object | None = None
+    ) -> PurgeJob | None:
+        # Without locks to hold, the subtree is dropped right away and the job
+        # only reports it once a batch runs.
+        tree = self.get_plant_tree(plant_id)
+        if tree is None:
+            return None
+
+        equipment = [node for area in tree.areas for node in area.equipment]
+        counts = {
+            "sistema": sum(len(node.systems) for node in equipment),
+            "equipo": len(equipment),
+            "area": len(tree.areas),
+            "planta": 1,
+        }
+        self.delete_plant(plant_id)
+        job = PurgeJob(
+            id=len(self._purge_jobs) + 1,
+            plant_id=plant_id,
+            status="pendiente",
+            created_at=self._clock(),
+            deleted={level: 0 for level in counts},
+        )
+        self._purge_jobs[job.id] = job
+        self._purge_counts[job.id] = counts
+        return job
+
+    def purge_plant_batch(
+        self, job_id: int, *, batch_size: int, session: object | None = None
+    ) -> PurgeJob | None:
+        job = self._purge_jobs.get(job_id)
+        if job is None or job.status == "completado":
+            return job
+
+        job = replace(
+            job,
+            status="completado",
+            deleted=self._purge_counts.pop(job_id, job.deleted),
+            finished_at=self._clock(),
+            error=None,
+        )
+        self._purge_jobs[job_id] = job
+        return job
+
+    def get_purge_job(
+        self, job_id: int, *, session: object | None = None
+    ) -> PurgeJob | None:
+        return self._purge_jobs.get(job_id)
+
+    def fail_purge_job(
+        self, job_id: int, error: str, *, session: object | None = None
+    ) -> PurgeJob | None:
+        job = self._purge_jobs.get(job_id)
+        if job is None:
+            return None
+
+        job = replace(job, status="fallido", error=error, finished_at=self._clock())
+        self._purge_jobs[job_id] = job
+        return job
+
+    def list_unfinished_purge_jobs(
+        self, *, session: object | None = None
+    ) -> Sequence[PurgeJob]:
+        return [
+            job for job in self._purge_jobs.values() if job.status != "completado"
+        ]
+
+    def get_plant_tree(
+        self, plant_id: int, *, session: object | None = None
+    ) -> PlantTree | None:
+        plant = self._plants.get(plant_id)
+        if plant is None:
+            return None
+
+        return PlantTree(
+            plant=plant,
+            areas=[
+                AreaNode(
+                    area=area,
+                    equipment=[
+                        EquipmentNode(
+                            equipment=equipment,
+                            systems=list(self._systems.get(equipment.id, ())),
+                        )
+                        for equipment in self._equipment.get(area.id, ())
+                    ],
+                )
+                for area in self._areas.get(plant_id, ())
+            ],
+        )
+
+    def get_plant_versions(
+        self, plant_ids: Iterable[int] | None = None, *, session: object | None = None
+    ) -> dict[int, int]:
+        if plant_ids is None:
+            return dict(self._versions)
+        return {
+            plant_id: self._versions[plant_id]
+            for plant_id in set(plant_ids)
+            if plant_id in self._versions
+        }
+
     # Area operations
     def list_areas(
         self, plant_id: int, *, session: object | None = None
     ) -> Sequence[Area]:
         return list(self._areas.get(plant_id, ()))
 
+    def list_areas_page(
+        self,
+        plant_id: int,
+        *,
+        limit: int,
+        after: int | None = None,
+        ids: Collection[int] | None = None,
+        session: object | None = None,
+    ) -> Page[Area]:
+        return self._slice_page(
+            self._areas.get(plant_id, ()), limit=limit, after=after, ids=ids
+        )
+
     def get_area(self, area_id: int, *, session: object | None = None) -> Area | None:
         for areas in self._areas.values():
             for area in areas:
@@ -156,6 +330,12 @@ class InMemoryPlantRepository(PlantDataRepository):
                     return area
         return None
 
+    def get_areas_by_ids(
+        self, area_ids: Iterable[int], *, session: object | None = None
+    ) -> Sequence[Area]:
+        index = {area.id: area for areas in self._areas.values() for area in areas}
+        return [index[area_id] for area_id in set(area_ids) if area_id in index]
+
     def create_area(
         self,
         plant_id: int,
@@ -183,8 +363,25 @@ class InMemoryPlantRepository(PlantDataRepository):
         current = list(self._areas.get(plant_id, ()))
         current.append(area)
         self._areas[plant_id] = tuple(current)
+        self._record_change(
+            "creado", "area", area, plant_id=plant_id, area_id=area.id
+        )
         return area
 
+    def create_area_batch(
+        self,
+        plant_id: int,
+        items: Sequence[Mapping[str, Any]],
+        *,
+        session: object | None = None,
+    ) -> Sequence[Area] | None:
+        if plant_id not in self._plants:
+            return None
+        return [
+            self.create_area(plant_id, name=item["name"], status=item.get("status"))
+            for item in items
+        ]
+
     def update_area(
         self,
         area_id: int,
@@ -204,20 +401,43 @@ class InMemoryPlantRepository(PlantDataRepository):
                         name=name if name is not None else area.name,
                         status=status if status is not None else area.status,
                     )
+                    if found == area:
+                        return area
                     updated.append(found)
                 else:
                     updated.append(area)
             if found:
                 self._areas[plant_id] = tuple(updated)
+                self._record_change(
+                    "actualizado", "area", found, plant_id=plant_id, area_id=area_id
+                )
                 return found
         return None
 
+    def set_area_status(
+        self,
+        area_id: int,
+        statuses: Mapping[str, str],
+        *,
+        session: object | None = None,
+    ) -> StatusCascade | None:
+        area = self.get_area(area_id)
+        if area is None:
+            return None
+
+        updated = self._apply_statuses(statuses, areas=[area])
+        return StatusCascade(plant_id=area.plant_id, updated=updated)
+
     def delete_area(self, area_id: int, *, session: object | None = None) -> bool:
         for plant_id, areas in list(self._areas.items()):
             filtered = [area for area in areas if area.id != area_id]
             if len(filtered) != len(areas):
+                deleted = next(area for area in areas if area.id == area_id)
                 self._areas[plant_id] = tuple(filtered)
                 self._cascade_delete_area(area_id)
+                self._record_change(
+                    "eliminado", "area", deleted, plant_id=plant_id, area_id=area_id
+                )
                 return True
         return False
 
@@ -227,6 +447,19 @@ class InMemoryPlantRepository(PlantDataRepository):
     ) -> Sequence[Equipment]:
         return list(self._equipment.get(area_id, ()))
 
+    def list_equipment_page(
+        self,
+        area_id: int,
+        *,
+        limit: int,
+        after: int | None = None,
+        ids: Collection[int] | None = None,
+        session: object | None = None,
+    ) -> Page[Equipment]:
+        return self._slice_page(
+            self._equipment.get(area_id, ()), limit=limit, after=after, ids=ids
+        )
+
     def get_equipment(
         self, equipment_id: int, *, session: object | None = None
     ) -> Equipment | None:
@@ -236,6 +469,12 @@ class InMemoryPlantRepository(PlantDataRepository):
                     return equipment
         return None
 
+    def get_equipment_by_ids(
+        self, equipment_ids: Iterable[int], *, session: object | None = None
+    ) -> Sequence[Equipment]:
+        index = {eq.id: eq for items in self._equipment.values() for eq in items}
+        return [index[eq_id] for eq_id in set(equipment_ids) if eq_id in index]
+
     def create_equipment(
         self,
         area_id: int,
@@ -263,8 +502,30 @@ class InMemoryPlantRepository(PlantDataRepository):
         current = list(self._equipment.get(area_id, ()))
         current.append(equipment)
         self._equipment[area_id] = tuple(current)
+        self._record_change(
+            "creado",
+            "equipo",
+            equipment,
+            plant_id=area.plant_id,
+            area_id=area_id,
+            equipment_id=equipment.id,
+        )
         return equipment
 
+    def create_equipment_batch(
+        self,
+        area_id: int,
+        items: Sequence[Mapping[str, Any]],
+        *,
+        session: object | None = None,
+    ) -> Sequence[Equipment] | None:
+        if self.get_area(area_id) is None:
+            return None
+        return [
+            self.create_equipment(area_id, name=item["name"], status=item.get("status"))
+            for item in items
+        ]
+
     def update_equipment(
         self,
         equipment_id: int,
@@ -284,22 +545,57 @@ class InMemoryPlantRepository(PlantDataRepository):
                         name=name if name is not None else equipment.name,
                         status=status if status is not None else equipment.status,
                     )
+                    if found == equipment:
+                        return equipment
                     updated.append(found)
                 else:
                     updated.append(equipment)
             if found:
                 self._equipment[area_id] = tuple(updated)
+                self._record_change(
+                    "actualizado",
+                    "equipo",
+                    found,
+                    plant_id=self._plant_id_of_area(area_id),
+                    area_id=area_id,
+                    equipment_id=equipment_id,
+                )
                 return found
         return None
 
+    def set_equipment_status(
+        self,
+        equipment_id: int,
+        statuses: Mapping[str, str],
+        *,
+        session: object | None = None,
+    ) -> StatusCascade | None:
+        equipment = self.get_equipment(equipment_id)
+        if equipment is None:
+            return None
+
+        updated = self._apply_statuses(statuses, equipment=[equipment])
+        return StatusCascade(
+            plant_id=self._plant_id_of_area(equipment.area_id), updated=updated
+        )
+
     def delete_equipment(
         self, equipment_id: int, *, session: object | None = None
     ) -> bool:
         for area_id, equipments in list(self._equipment.items()):
             filtered = [eq for eq in equipments if eq.id != equipment_id]
             if len(filtered) != len(equipments):
+                deleted = next(eq for eq in equipments if eq.id == equipment_id)
                 self._equipment[area_id] = tuple(filtered)
                 self._systems.pop(equipment_id, None)
+                self._record_change(
+                    "eliminado",
+                    "equipo",
+                    deleted,
+                    plant_id=self._plant_id_of_area(area_id),
+                    area_id=area_id,
+                    equipment_id=equipment_id,
+                )
                 return True
         return False
 
@@ -309,6 +605,18 @@ class InMemoryPlantRepository(PlantDataRepository):
     ) -> Sequence[System]:
         return list(self._systems.get(equipment_id, ()))
 
+    def list_systems_page(
+        self,
+        equipment_id: int,
+        *,
+        limit: int,
+        after: int | None = None,
+        session: object | None = None,
+    ) -> Page[System]:
+        return self._slice_page(
+            self._systems.get(equipment_id, ()), limit=limit, after=after
+        )
+
     def get_system(
         self, system_id: int, *, session: object | None = None
     ) -> System | None:
@@ -318,6 +626,12 @@ class InMemoryPlantRepository(PlantDataRepository):
                     return system
         return None
 
+    def get_systems_by_ids(
+        self, system_ids: Iterable[int], *, session: object | None = None
+    ) -> Sequence[System]:
+        index = {sys.id: sys for systems in self._systems.values() for sys in systems}
+        return [index[sys_id] for sys_id in set(system_ids) if sys_id in index]
+
     def create_system(
         self,
         equipment_id: int,
@@ -346,8 +660,30 @@ class InMemoryPlantRepository(PlantDataRepository):
         current = list(self._systems.get(equipment_id, ()))
         current.append(system)
         self._systems[equipment_id] = tuple(current)
+        self._record_change(
+            "creado",
+            "sistema",
+            system,
+            plant_id=self._plant_id_of_area(equipment.area_id),
+            area_id=equipment.area_id,
+            equipment_id=equipment_id,
+        )
         return system
 
+    def create_system_batch(
+        self,
+        equipment_id: int,
+        items: Sequence[Mapping[str, Any]],
+        *,
+        session: object | None = None,
+    ) -> Sequence[System] | None:
+        if self.get_equipment(equipment_id) is None:
+            return None
+        return [
+            self.create_system(equipment_id, name=item["name"], status=item.get("status"))
+            for item in items
+        ]
+
     def update_system(
         self,
         system_id: int,
@@ -367,11 +703,14 @@ class InMemoryPlantRepository(PlantDataRepository):
                         name=name if name is not None else system.name,
                         status=status if status is not None else system.status,
                     )
+                    if found == system:
+                        return system
                     updated.append(found)
                 else:
                     updated.append(system)
             if found:
                 self._systems[equipment_id] = tuple(updated)
+                self._record_system_change("actualizado", found)
                 return found
         return None
 
@@ -379,11 +718,300 @@ class InMemoryPlantRepository(PlantDataRepository):
         for equipment_id, systems in list(self._systems.items()):
             filtered = [sys for sys in systems if sys.id != system_id]
             if len(filtered) != len(systems):
+                deleted = next(sys for sys in systems if sys.id == system_id)
                 self._systems[equipment_id] = tuple(filtered)
+                self._record_system_change("eliminado", deleted)
                 return True
         return False
 
+    # Change log
+    def list_changes(
+        self, *, limit: int, after: int | None = None, session: object | None = None
+    ) -> Page[ChangeEntry]:
+        return self._slice_page(self._changes, limit=limit, after=after)
+
+    def get_change_bounds(
+        self, *, session: object | None = None
+    ) -> tuple[int | None, int | None]:
+        if not self._changes:
+            return None, None
+        return self._changes[0].id, self._changes[-1].id
+
+    def compact_changes(
+        self, *, before: datetime, session: object | None = None
+    ) -> int:
+        if not self._changes:
+            return 0
+        newest = self._changes[-1]
+        kept = [
+            change
+            for change in self._changes
+            if change.recorded_at >= before or change is newest
+        ]
+        removed = len(self._changes) - len(kept)
+        self._changes = kept
+        return removed
+
+    # Inventory export
+    def iter_inventory(
+        self,
+        *,
+        batch_size: int = 1000,
+        scope: InventoryScope | None = None,
+        session: object | None = None,
+    ) -> Iterator[InventoryRow]:
+        rows = self._inventory_rows()
+        if scope is None:
+            return rows
+        return (row for row in rows if scope.includes(row))
+
+    def _inventory_rows(self) -> Iterator[InventoryRow]:
+        for plant in sorted(self._plants.values(), key=lambda item: item.id):
+            yield InventoryRow(
+                entity_type="planta",
+                id=plant.id,
+                name=plant.name,
+                status=plant.status,
+                plant_id=plant.id,
+                location=plant.location,
+            )
+        areas = sorted(
+            (area for items in self._areas.values() for area in items),
+            key=lambda item: item.id,
+        )
+        area_plants = {area.id: area.plant_id for area in areas}
+        for area in areas:
+            yield InventoryRow(
+                entity_type="area",
+                id=area.id,
+                name=area.name,
+                status=area.status,
+                plant_id=area.plant_id,
+                area_id=area.id,
+            )
+        equipment_list = sorted(
+            (eq for items in self._equipment.values() for eq in items),
+            key=lambda item: item.id,
+        )
+        equipment_areas = {eq.id: eq.area_id for eq in equipment_list}
+        for equipment in equipment_list:
+            yield InventoryRow(
+                entity_type="equipo",
+                id=equipment.id,
+                name=equipment.name,
+                status=equipment.status,
+                plant_id=area_plants[equipment.area_id],
+                area_id=equipment.area_id,
+                equipment_id=equipment.id,
+            )
+        systems = sorted(
+            (sys for items in self._systems.values() for sys in items),
+            key=lambda item: item.id,
+        )
+        for system in systems:
+            area_id = equipment_areas[system.equipment_id]
+            yield InventoryRow(
+                entity_type="sistema",
+                id=system.id,
+                name=system.name,
+                status=system.status,
+                plant_id=area_plants[area_id],
+                area_id=area_id,
+                equipment_id=system.equipment_id,
+            )
+
+    def upsert_rows(
+        self, rows: Sequence[ImportRow], *, session: object | None = None
+    ) -> list[ImportRowError]:
+        errors: list[ImportRowError] = []
+        for row in sorted(rows, key=lambda item: _IMPORT_ORDER[item.entity_type]):
+            plant = next(
+                (
+                    item
+                    for item in self._plants.values()
+                    if item.name == (row.plant_name or row.name)
+                ),
+                None,
+            )
+            if row.entity_type == "planta":
+                if plant is None:
+                    self.create_plant(
+                        name=row.name, location=row.location, status=row.status
+                    )
+                elif (plant.status, plant.location) != (
+                    row.status,
+                    row.location or plant.location,
+                ):
+                    self.update_plant(
+                        plant.id, location=row.location, status=row.status
+                    )
+                continue
+            if plant is None:
+                errors.append(
+                    ImportRowError(row.line, f"Planta no encontrada: {row.plant_name}")
+                )
+                continue
+
+            area = self._find_named(
+                self._areas.get(plant.id, ()), row.area_name or row.name
+            )
+            if row.entity_type == "area":
+                if area is None:
+                    self.create_area(plant.id, name=row.name, status=row.status)
+                elif area.status != row.status:
+                    self.update_area(area.id, status=row.status)
+                continue
+            if area is None:
+                errors.append(
+                    ImportRowError(row.line, f"Área no encontrada: {row.area_name}")
+                )
+                continue
+
+            equipment = self._find_named(
+                self._equipment.get(area.id, ()), row.equipment_name or row.name
+            )
+            if row.entity_type == "equipo":
+                if equipment is None:
+                    self.create_equipment(area.id, name=row.name, status=row.status)
+                elif equipment.status != row.status:
+                    self.update_equipment(equipment.id, status=row.status)
+                continue
+            if equipment is None:
+                errors.append(
+                    ImportRowError(
+                        row.line, f"Equipo no encontrado: {row.equipment_name}"
+                    )
+                )
+                continue
+
+            system = self._find_named(self._systems.get(equipment.id, ()), row.name)
+            if system is None:
+                self.create_system(equipment.id, name=row.name, status=row.status)
+            elif system.status != row.status:
+                self.update_system(system.id, status=row.status)
+        return sorted(errors, key=lambda error: error.line)
+
     # Helpers
+    def _apply_statuses(
+        self,
+        statuses: Mapping[str, str],
+        *,
+        plants: Iterable[Plant] = (),
+        areas: Iterable[Area] = (),
+        equipment: Iterable[Equipment] = (),
+    ) -> dict[str, int]:
+        """Walk the subtree below the given roots, one level at a time."""
+        updated: dict[str, int] = {}
+        levels = (
+            ("planta", list(plants), self.update_plant),
+            ("area", list(areas), self.update_area),
+            ("equipo", list(equipment), self.update_equipment),
+            ("sistema", [], self.update_system),
+        )
+        children: list[Area | Equipment | System] = []
+        for entity_type, roots, update in levels:
+            items = roots + children
+            status = statuses.get(entity_type)
+            if status is not None:
+                changed = [item for item in items if item.status != status]
+                for item in changed:
+                    update(item.id, status=status)
+                updated[entity_type] = len(changed)
+            children = [
+                child
+                for item in items
+                for child in self._children_of(entity_type, item.id)
+            ]
+        return updated
+
+    def _children_of(
+        self, entity_type: str, item_id: int
+    ) -> Sequence[Area | Equipment | System]:
+        if entity_type == "planta":
+            return self._areas.get(item_id, [])
+        if entity_type == "area":
+            return self._equipment.get(item_id, [])
+        if entity_type == "equipo":
+            return self._systems.get(item_id, [])
+        return []
+
+    @staticmethod
+    def _find_named(items: Iterable[T], name: str) -> T | None:
+        return next((item for item in items if item.name == name), None)
+
+    @staticmethod
+    def _slice_page(
+        items: Iterable[T],
+        *,
+        limit: int,
+        after: int | None,
+        ids: Collection[int] | None = None,
+    ) -> Page[T]:
+        ordered = sorted(
+            (
+                item
+                for item in items
+                if (after is None or item.id > after)
+                and (ids is None or item.id in ids)
+            ),
+            key=lambda item: item.id,
+        )
+        selected = ordered[:limit]
+        has_more = len(ordered) > limit
+        return Page(
+            items=selected,
+            next_after=selected[-1].id if has_more and selected else None,
+        )
+
+    def _bump_version(self, plant_id: int | None) -> None:
+        if plant_id is None:
+            return
+        self._versions[plant_id] = self._versions.get(plant_id, 0) + 1
+
+    def _plant_id_of_area(self, area_id: int) -> int | None:
+        area = self.get_area(area_id)
+        return area.plant_id if area is not None else None
+
+    def _record_change(
+        self,
+        action: str,
+        entity_type: str,
+        entity: Plant | Area | Equipment | System,
+        *,
+        plant_id: int | None,
+        area_id: int | None = None,
+        equipment_id: int | None = None,
+    ) -> None:
+        self._bump_version(plant_id)
+        if plant_id is None:
+            return
+        self._last_change_id += 1
+        self._changes.append(
+            ChangeEntry(
+                id=self._last_change_id,
+                entity_type=entity_type,
+                entity_id=entity.id,
+                action=action,
+                plant_id=plant_id,
+                area_id=area_id,
+                equipment_id=equipment_id,
+                recorded_at=self._clock(),
+                snapshot=None if action == "eliminado" else entity,
+            )
+        )
+
+    def _record_system_change(self, action: str, system: System) -> None:
+        equipment = self.get_equipment(system.equipment_id)
+        area_id = equipment.area_id if equipment is not None else None
+        self._record_change(
+            action,
+            "sistema",
+            system,
+            plant_id=self._plant_id_of_area(area_id) if area_id is not None else None,
+            area_id=area_id,
+            equipment_id=system.equipment_id,
+        )
+
     def _cascade_delete_area(self, area_id: int) -> None:
         equipment_in_area = self._equipment.pop(area_id, ())
         for equipment in equipment_in_area:
@@ -0,0 +1,105 @@
+"""Background execution of plant purge jobs."""
+
+from __future__ import annotations
+
+import queue
+import threading
+
+from src.entities.purge_job import PurgeJob
+from src.shared.logger import get_logger
+from src.use_cases.purge_plant import PurgePlantUseCase
+
+logger = get_logger(__name__)
+
+
+class PurgeRunner:
+    """Run purge jobs one after another on a single daemon thread.
+
+    Jobs are processed sequentially so concurrent deletions never compete
+    for the same locks. The thread starts with the first submitted job and
+    exits once the queue stays empty for `idle_seconds`. Progress lives in
+    the repository, so any process can report on a job that another one runs.
+
+    `resume` re-queues the jobs left `pendiente`, `en_curso` or `fallido` by a
+    restart or a failed batch; the lookup itself runs on the worker thread,
+    so calling it at startup never blocks on the database.
+    """
+
+    def __init__(
+        self, use_case: PurgePlantUseCase, *, idle_seconds: float = 5.0
+    ) -> None:
+        self._use_case = use_case
+        self._idle_seconds = idle_seconds
+        # `None` asks the worker thread to look up unfinished jobs.
+        self._jobs: queue.Queue[int | None] = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def start(self, plant_id: int) -> PurgeJob | None:
+        """Hide the plant and queue its purge; `None` when it does not exist."""
+        job = self._use_case.start(plant_id)
+        if job is not None:
+            self.submit(job.id)
+        return job
+
+    def submit(self, job_id: int) -> None:
+        self._enqueue(job_id)
+
+    def resume(self) -> None:
+        """Queue every unfinished job found in the repository."""
+        self._enqueue(None)
+
+    def _enqueue(self, job_id: int | None) -> None:
+        self._jobs.put(job_id)
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="plant-purge", daemon=True
+                )
+                self._thread.start()
+
+    def join(self, timeout: float | None = None) -> bool:
+        """Wait until every queued job ran; `False` if `timeout` expired first."""
+        done = threading.Event()
+
+        def wait() -> None:
+            self._jobs.join()
+            done.set()
+
+        threading.Thread(target=wait, daemon=True).start()
+        return done.wait(timeout)
+
+    def _run(self) -> None:
+        while True:
+            try:
+                job_id = self._jobs.get(timeout=self._idle_seconds)
+            except queue.Empty:
+                with self._lock:
+                    if self._jobs.empty():
+                        self._thread = None
+                        return
+                continue
+
+            try:
+                if job_id is None:
+                    self._queue_unfinished()
+                else:
+                    self._use_case.run(job_id)
+            except Exception:
+                logger.exception("Falló el borrado diferido del trabajo %s", job_id)
+            finally:
+                self._jobs.task_done()
+
+    def _queue_unfinished(self) -> None:
+        jobs = self._use_case.unfinished()
+        if jobs:
+            logger.info(
+                "Se retoman %s borrados diferidos pendientes: %s",
+                len(jobs),
+                [job.id for job in jobs],
+            )
+        for job in jobs:
+            self._jobs.put(job.id)
+
+
+__all__ = ["PurgeRunner"]
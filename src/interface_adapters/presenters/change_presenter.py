@@ -0,0 +1,41 @@
+"""Transform change log entries into API responses."""
+
+from typing import Any, Sequence
+
+from src.entities.change import ChangeEntry
+from src.interface_adapters.presenters import (
+    area_presenter,
+    equipment_presenter,
+    plant_presenter,
+    system_presenter,
+)
+
+_SNAPSHOT_PRESENTERS = {
+    "planta": plant_presenter.present,
+    "area": area_presenter.present,
+    "equipo": equipment_presenter.present,
+    "sistema": system_presenter.present,
+}
+
+
+def present(change: ChangeEntry) -> dict[str, Any]:
+    snapshot = change.snapshot
+    return {
+        "id": change.id,
+        "entidad": change.entity_type,
+        "entidadId": change.entity_id,
+        "accion": change.action,
+        "plantaId": change.plant_id,
+        "areaId": change.area_id,
+        "equipoId": change.equipment_id,
+        "fecha": change.recorded_at.isoformat(),
+        "datos": (
+            _SNAPSHOT_PRESENTERS[change.entity_type](snapshot)
+            if snapshot is not None
+            else None
+        ),
+    }
+
+
+def present_many(changes: Sequence[ChangeEntry]) -> list[dict[str, Any]]:
+    return [present(change) for change in changes]
@@ -0,0 +1,40 @@
+"""Transform inventory rows into flat export records."""
+
+from typing import Any
+
+from src.entities.inventory import ImportReport, InventoryRow
+
+COLUMNS = (
+    "tipo",
+    "id",
+    "nombre",
+    "estado",
+    "ubicacion",
+    "plantaId",
+    "areaId",
+    "equipoId",
+)
+
+
+def present(row: InventoryRow) -> dict[str, Any]:
+    return {
+        "tipo": row.entity_type,
+        "id": row.id,
+        "nombre": row.name,
+        "estado": row.status,
+        "ubicacion": row.location,
+        "plantaId": row.plant_id,
+        "areaId": row.area_id,
+        "equipoId": row.equipment_id,
+    }
+
+
+def present_report(report: ImportReport) -> dict[str, Any]:
+    return {
+        "procesadas": report.processed,
+        "guardadas": dict(report.saved),
+        "errores": [
+            {"linea": error.line, "mensaje": error.message} for error in report.errors
+        ],
+        "totalErrores": report.error_count,
+    }
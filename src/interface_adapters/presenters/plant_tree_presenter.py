@@ -0,0 +1,32 @@
+"""Transform plant trees into nested API responses."""
+
+from typing import Any
+
+from src.entities.plant_tree import AreaNode, EquipmentNode, PlantTree
+from src.interface_adapters.presenters import (
+    area_presenter,
+    equipment_presenter,
+    plant_presenter,
+    system_presenter,
+)
+
+
+def _present_equipment(node: EquipmentNode) -> dict[str, Any]:
+    return {
+        **equipment_presenter.present(node.equipment),
+        "sistemas": system_presenter.present_many(node.systems),
+    }
+
+
+def _present_area(node: AreaNode) -> dict[str, Any]:
+    return {
+        **area_presenter.present(node.area),
+        "equipos": [_present_equipment(item) for item in node.equipment],
+    }
+
+
+def present(tree: PlantTree) -> dict[str, Any]:
+    return {
+        **plant_presenter.present(tree.plant),
+        "areas": [_present_area(node) for node in tree.areas],
+    }
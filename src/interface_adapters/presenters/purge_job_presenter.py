@@ -0,0 +1,17 @@
+"""Transform plant purge jobs into API responses."""
+
+from typing import Any
+
+from src.entities.purge_job import PurgeJob
+
+
+def present(job: PurgeJob) -> dict[str, Any]:
+    return {
+        "id": job.id,
+        "plantaId": job.plant_id,
+        "estado": job.status,
+        "eliminados": dict(job.deleted),
+        "creado": job.created_at.isoformat(),
+        "finalizado": job.finished_at.isoformat() if job.finished_at else None,
+        "error": job.error,
+    }
@@ -0,0 +1,10 @@
+"""Transform status transitions into API responses."""
+
+from src.entities.status_cascade import StatusCascade
+
+
+def present(result: StatusCascade) -> dict[str, int | dict[str, int]]:
+    return {
+        "plantaId": result.plant_id,
+        "actualizados": dict(result.updated),
+    }
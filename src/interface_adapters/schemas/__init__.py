@@ -1,9 +1,11 @@
 """Pydantic schemas para entradas y salidas de los adaptadores HTTP."""
 
 from .area import AreaCreate, AreaUpdate
-from .auth import LoginRequest
+from .auth import LoginRequest, RefreshRequest
 from .equipment import EquipmentCreate, EquipmentUpdate
+from .inventory import InventoryImportRow
 from .plant import PlantCreate, PlantUpdate
+from .status import StatusChange
 from .system import SystemCreate, SystemUpdate
 
 __all__ = [
@@ -15,5 +17,8 @@ __all__ = [
     "EquipmentUpdate",
     "SystemCreate",
     "SystemUpdate",
+    "InventoryImportRow",
+    "StatusChange",
     "LoginRequest",
+    "RefreshRequest",
 ]
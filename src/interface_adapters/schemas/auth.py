@@ -1,4 +1,4 @@
-"""Schema Pydantic para login."""
+"""Schemas Pydantic para login y refresh."""
 
 from __future__ import annotations
 
@@ -7,6 +7,7 @@ from pydantic import BaseModel, Field, ConfigDict, constr
 
 _USERNAME = constr(strip_whitespace=True, min_length=1, max_length=150)
 _PASSWORD = constr(min_length=1, max_length=128)
+_REFRESH_TOKEN = constr(strip_whitespace=True, min_length=1, max_length=256)
 
 
 class LoginRequest(BaseModel):
@@ -14,3 +15,9 @@ class LoginRequest(BaseModel):
 
     username: _USERNAME = Field(..., alias="username")
     password: _PASSWORD = Field(..., alias="password")
+
+
+class RefreshRequest(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    refresh_token: _REFRESH_TOKEN = Field(..., alias="refresh_token")
@@ -0,0 +1,26 @@
+"""Schemas Pydantic para la importación masiva del inventario."""
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from .plant import (
+    LocalizedModel,
+    _LOCATION_CONSTRAINT,
+    _NAME_CONSTRAINT,
+    _STATUS_CONSTRAINT,
+)
+
+
+class InventoryImportRow(LocalizedModel):
+    entity_type: Literal["planta", "area", "equipo", "sistema"] = Field(
+        ..., alias="tipo"
+    )
+    name: _NAME_CONSTRAINT = Field(..., alias="nombre")
+    status: _STATUS_CONSTRAINT | None = Field(None, alias="estado")
+    location: _LOCATION_CONSTRAINT | None = Field(None, alias="ubicacion")
+    plant_name: _NAME_CONSTRAINT | None = Field(None, alias="planta")
+    area_name: _NAME_CONSTRAINT | None = Field(None, alias="area")
+    equipment_name: _NAME_CONSTRAINT | None = Field(None, alias="equipo")
@@ -0,0 +1,11 @@
+"""Schemas Pydantic para cambios de estado."""
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from .plant import LocalizedModel, _STATUS_CONSTRAINT
+
+
+class StatusChange(LocalizedModel):
+    status: _STATUS_CONSTRAINT = Field(..., alias="estado")
@@ -0,0 +1,128 @@
+"""Caché en memoria acotada por tamaño (LRU) y por antigüedad (TTL)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+MISSING = object()
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """Contadores acumulados de una caché."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class LruTtlCache:
+    """Diccionario thread-safe con expulsión LRU y expiración por TTL.
+
+    Las claves son tuplas para poder invalidar familias completas con
+    `delete_prefix`. `None` es un valor válido, lo que permite cachear
+    búsquedas negativas; `get` devuelve `MISSING` cuando no hay entrada.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 2048,
+        ttl_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries debe ser mayor que cero")
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return MISSING
+
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self._misses += 1
+                return MISSING
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def peek(self, key: Hashable) -> Any:
+        """Lee una entrada vigente sin alterar orden LRU ni contadores."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                return MISSING
+            return entry[1]
+
+    def set(
+        self, key: Hashable, value: Any, *, ttl_seconds: float | None = None
+    ) -> None:
+        """`ttl_seconds` reemplaza el TTL de la caché sólo para esta entrada."""
+        ttl = self._ttl if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_prefix(self, prefix: tuple[Any, ...]) -> None:
+        """Elimina todas las claves tupla que comienzan con `prefix`."""
+        size = len(prefix)
+        with self._lock:
+            stale = [
+                key
+                for key in self._entries
+                if isinstance(key, tuple) and key[:size] == prefix
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def items(self) -> list[tuple[Hashable, Any]]:
+        """Copia de las entradas vigentes, sin alterar orden ni contadores."""
+        with self._lock:
+            now = self._clock()
+            return [
+                (key, value)
+                for key, (expires_at, value) in self._entries.items()
+                if expires_at > now
+            ]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
+
+
+__all__ = ["CacheStats", "LruTtlCache", "MISSING"]
@@ -83,7 +83,8 @@ def get_mysql_config() -> Dict[str, Any]:
     """Devuelve un diccionario con la configuración de MySQL.
 
     Acepta variables prefijadas como `DB_*` o `MYSQL_*` y aplica valores
-    por defecto cuando están ausentes.
+    por defecto cuando están ausentes. `DB_REPLICA_URLS` lista, separadas por
+    comas, las URLs de réplicas de lectura.
     """
 
     return {
@@ -99,9 +100,143 @@ def get_mysql_config() -> Dict[str, Any]:
         "pool_timeout": _int_or_default(get_env("DB_POOL_TIMEOUT"), 30),
         "pool_recycle": _int_or_default(get_env("DB_POOL_RECYCLE"), 1800),
         "echo": str(get_env("DB_ECHO", "false")).lower() in {"1", "true", "yes"},
+        "replica_urls": [
+            url.strip()
+            for url in (get_env("DB_REPLICA_URLS") or "").split(",")
+            if url.strip()
+        ],
+        "replica_check_seconds": get_env("DB_REPLICA_CHECK_SECONDS", "5"),
     }
 
 
+def get_plant_cache_config() -> Dict[str, Any]:
+    """Configuración de la caché de lectura de la jerarquía de plantas.
+
+    Se habilita con `PLANT_CACHE_ENABLED`; `PLANT_CACHE_MAX_ENTRIES` acota el
+    número de entradas y `PLANT_CACHE_TTL_SECONDS` su antigüedad máxima.
+    `PLANT_CACHE_POLL_SECONDS` define cada cuánto se consulta `entity_versions`
+    para descartar cambios hechos por otros workers.
+    """
+
+    try:
+        ttl_seconds = float(get_env("PLANT_CACHE_TTL_SECONDS", "30"))
+        poll_seconds = float(get_env("PLANT_CACHE_POLL_SECONDS", "1"))
+    except ValueError as exc:
+        raise RuntimeError(
+            "Valor numérico inválido en configuración (.env o variables del sistema)."
+        ) from exc
+
+    return {
+        "enabled": str(get_env("PLANT_CACHE_ENABLED", "false")).lower()
+        in {"1", "true", "yes"},
+        "max_entries": _int_or_default(get_env("PLANT_CACHE_MAX_ENTRIES"), 2048),
+        "ttl_seconds": ttl_seconds,
+        "poll_seconds": poll_seconds,
+    }
+
+
+def get_change_log_retention_days() -> float:
+    """Días que se conservan las entradas de `change_log`.
+
+    Se configura con `CHANGE_LOG_RETENTION_DAYS`; por defecto una semana.
+    """
+
+    try:
+        return float(get_env("CHANGE_LOG_RETENTION_DAYS", "7"))
+    except ValueError as exc:
+        raise RuntimeError(
+            "Valor numérico inválido en configuración (.env o variables del sistema)."
+        ) from exc
+
+
+def get_event_stream_config() -> Dict[str, Any]:
+    """Configuración del stream de eventos (`/api/eventos`).
+
+    `SSE_HEARTBEAT_SECONDS` fija cada cuánto se envía un comentario de
+    keep-alive, `SSE_POLL_SECONDS` cada cuánto se lee `change_log`,
+    `SSE_QUEUE_SIZE` cuántos eventos se retienen por cliente lento y
+    `SSE_MAX_CLIENTS` cuántas conexiones acepta cada proceso.
+    """
+
+    try:
+        heartbeat_seconds = float(get_env("SSE_HEARTBEAT_SECONDS", "15"))
+        poll_seconds = float(get_env("SSE_POLL_SECONDS", "1"))
+    except ValueError as exc:
+        raise RuntimeError(
+            "Valor numérico inválido en configuración (.env o variables del sistema)."
+        ) from exc
+
+    return {
+        "heartbeat_seconds": heartbeat_seconds,
+        "poll_seconds": poll_seconds,
+        "queue_size": _int_or_default(get_env("SSE_QUEUE_SIZE"), 256),
+        "max_clients": _int_or_default(get_env("SSE_MAX_CLIENTS"), 200),
+    }
+
+
+def get_purge_config() -> Dict[str, Any]:
+    """Configuración de los borrados diferidos (`DELETE /api/plantas/<id>?async=true`).
+
+    `PURGE_BATCH_SIZE` limita las filas que borra cada transacción y
+    `PURGE_PAUSE_SECONDS` la espera entre lotes, para ceder los bloqueos a
+    las demás escrituras.
+    """
+
+    try:
+        pause_seconds = float(get_env("PURGE_PAUSE_SECONDS", "0.05"))
+    except ValueError as exc:
+        raise RuntimeError(
+            "Valor numérico inválido en configuración (.env o variables del sistema)."
+        ) from exc
+
+    return {
+        "batch_size": _int_or_default(get_env("PURGE_BATCH_SIZE"), 1000),
+        "pause_seconds": pause_seconds,
+    }
+
+
+def get_server_config() -> Dict[str, Any]:
+    """Configuración del servidor de producción (`serve.py`).
+
+    `SERVER_HOST` y `SERVER_PORT` (o `FLASK_PORT`) fijan dónde escuchar,
+    `SERVER_WORKERS` cuántos procesos se pre-forkean (por defecto uno por CPU)
+    y `SERVER_THREADS` cuántas peticiones atiende cada uno a la vez.
+    `SERVER_REUSE_PORT` deja que cada worker abra su propio socket con
+    `SO_REUSEPORT` y `SERVER_GRACEFUL_TIMEOUT` cuántos segundos se esperan las
+    peticiones en curso al apagar.
+    """
+
+    try:
+        graceful_timeout = float(get_env("SERVER_GRACEFUL_TIMEOUT", "30"))
+    except ValueError as exc:
+        raise RuntimeError(
+            "Valor numérico inválido en configuración (.env o variables del sistema)."
+        ) from exc
+
+    return {
+        "host": get_env("SERVER_HOST", "0.0.0.0"),
+        "port": _int_or_default(
+            get_env("SERVER_PORT") or get_env("FLASK_PORT"), 8000
+        ),
+        "workers": _int_or_default(get_env("SERVER_WORKERS"), os.cpu_count() or 1),
+        "threads": _int_or_default(get_env("SERVER_THREADS"), 8),
+        "reuse_port": str(get_env("SERVER_REUSE_PORT", "true")).lower()
+        in {"1", "true", "yes"},
+        "graceful_timeout": graceful_timeout,
+    }
+
+
+def get_trusted_proxy_hops() -> int:
+    """Proxies de confianza delante de la API (`TRUSTED_PROXY_HOPS`).
+
+    Con `N > 0` la IP del cliente y el esquema salen del `N`-ésimo valor desde
+    la derecha de `X-Forwarded-For`/`X-Forwarded-Proto`; con 0 (por defecto) se
+    ignoran esos headers, que el cliente podría falsificar.
+    """
+
+    return max(_int_or_default(get_env("TRUSTED_PROXY_HOPS"), 0), 0)
+
+
 def get_use_db() -> Optional[str]:
     "Indica si se debe usar la base de datos según configuración."
     return get_env("USE_DB")
@@ -0,0 +1,58 @@
+"""Use case for changing the status of an entity and, optionally, its subtree."""
+
+from typing import Callable, Mapping
+
+from src.entities.status_cascade import StatusCascade, cascade_statuses
+from src.use_cases.ports.plant_repository import PlantDataRepository
+from src.use_cases.ports.unit_of_work import UnitOfWork
+
+
+class ChangeStatusUseCase:
+    """Set a status on a plant, area or equipment in a single unit of work.
+
+    With `cascade` every descendant receives the equivalent status for its
+    level. Invalid statuses raise ValueError before touching the repository.
+    """
+
+    def __init__(
+        self,
+        repository: PlantDataRepository,
+        uow_factory: Callable[[], UnitOfWork],
+    ) -> None:
+        self._repository = repository
+        self._uow_factory = uow_factory
+
+    def for_plant(
+        self, plant_id: int, status: str, *, cascade: bool = False
+    ) -> StatusCascade | None:
+        statuses = cascade_statuses("planta", status, cascade=cascade)
+        return self._run(self._repository.set_plant_status, plant_id, statuses)
+
+    def for_area(
+        self, area_id: int, status: str, *, cascade: bool = False
+    ) -> StatusCascade | None:
+        statuses = cascade_statuses("area", status, cascade=cascade)
+        return self._run(self._repository.set_area_status, area_id, statuses)
+
+    def for_equipment(
+        self, equipment_id: int, status: str, *, cascade: bool = False
+    ) -> StatusCascade | None:
+        statuses = cascade_statuses("equipo", status, cascade=cascade)
+        return self._run(
+            self._repository.set_equipment_status, equipment_id, statuses
+        )
+
+    def _run(
+        self,
+        apply: Callable[..., StatusCascade | None],
+        entity_id: int,
+        statuses: Mapping[str, str],
+    ) -> StatusCascade | None:
+        with self._uow_factory() as uow:
+            result = apply(entity_id, statuses, session=uow.session)
+            if result is None:
+                uow.rollback()
+                return None
+
+            uow.commit()
+            return result
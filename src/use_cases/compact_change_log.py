@@ -0,0 +1,22 @@
+"""Use case for trimming old entries from the change log."""
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from src.entities.change import utc_now
+from src.use_cases.ports.change_log import ChangeLogRepository
+
+
+class CompactChangeLogUseCase:
+    """Delete entries older than the retention window."""
+
+    def __init__(
+        self,
+        repository: ChangeLogRepository,
+        clock: Callable[[], datetime] = utc_now,
+    ) -> None:
+        self._repository = repository
+        self._clock = clock
+
+    def execute(self, retention: timedelta) -> int:
+        return self._repository.compact_changes(before=self._clock() - retention)
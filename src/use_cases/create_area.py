@@ -1,6 +1,6 @@
 """Use case for creating a new area within a plant."""
 
-from typing import Callable
+from typing import Any, Callable, Mapping, Sequence
 
 from src.entities.area import Area
 from src.use_cases.ports.plant_repository import AreaRepository
@@ -29,3 +29,18 @@ class CreateAreaUseCase:
 
             uow.commit()
             return created
+
+    def execute_many(
+        self, plant_id: int, items: Sequence[Mapping[str, Any]]
+    ) -> Sequence[Area] | None:
+        """Create every item in one unit of work; all or nothing."""
+        with self._uow_factory() as uow:
+            created = self._repository.create_area_batch(
+                plant_id, items, session=uow.session
+            )
+            if created is None:
+                uow.rollback()
+                return None
+
+            uow.commit()
+            return created
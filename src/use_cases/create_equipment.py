@@ -1,6 +1,6 @@
 """Use case for creating new equipment inside an area."""
 
-from typing import Callable
+from typing import Any, Callable, Mapping, Sequence
 
 from src.entities.equipment import Equipment
 from src.use_cases.ports.plant_repository import EquipmentRepository
@@ -29,3 +29,18 @@ class CreateEquipmentUseCase:
 
             uow.commit()
             return created
+
+    def execute_many(
+        self, area_id: int, items: Sequence[Mapping[str, Any]]
+    ) -> Sequence[Equipment] | None:
+        """Create every item in one unit of work; all or nothing."""
+        with self._uow_factory() as uow:
+            created = self._repository.create_equipment_batch(
+                area_id, items, session=uow.session
+            )
+            if created is None:
+                uow.rollback()
+                return None
+
+            uow.commit()
+            return created
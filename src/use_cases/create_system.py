@@ -1,6 +1,6 @@
 """Use case for creating new systems."""
 
-from typing import Callable
+from typing import Any, Callable, Mapping, Sequence
 
 from src.entities.system import System
 from src.use_cases.ports.plant_repository import SystemRepository
@@ -29,3 +29,18 @@ class CreateSystemUseCase:
 
             uow.commit()
             return created
+
+    def execute_many(
+        self, equipment_id: int, items: Sequence[Mapping[str, Any]]
+    ) -> Sequence[System] | None:
+        """Create every item in one unit of work; all or nothing."""
+        with self._uow_factory() as uow:
+            created = self._repository.create_system_batch(
+                equipment_id, items, session=uow.session
+            )
+            if created is None:
+                uow.rollback()
+                return None
+
+            uow.commit()
+            return created
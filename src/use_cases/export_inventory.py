@@ -0,0 +1,19 @@
+"""Use case for exporting the whole asset inventory."""
+
+from typing import Iterator
+
+from src.entities.inventory import InventoryRow, InventoryScope
+from src.use_cases.ports.inventory import InventoryRepository
+
+
+class ExportInventoryUseCase:
+    """Stream every plant, area, equipment and system as flat rows."""
+
+    def __init__(self, repository: InventoryRepository, batch_size: int = 1000) -> None:
+        self._repository = repository
+        self._batch_size = batch_size
+
+    def execute(self, scope: InventoryScope | None = None) -> Iterator[InventoryRow]:
+        return self._repository.iter_inventory(
+            batch_size=self._batch_size, scope=scope
+        )
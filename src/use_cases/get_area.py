@@ -1,5 +1,7 @@
 """Use case for retrieving a single area."""
 
+from typing import Iterable, Sequence
+
 from src.entities.area import Area
 from src.use_cases.ports.plant_repository import AreaRepository
 
@@ -12,3 +14,6 @@ class GetAreaUseCase:
 
     def execute(self, area_id: int) -> Area | None:
         return self._repository.get_area(area_id)
+
+    def execute_many(self, area_ids: Iterable[int]) -> Sequence[Area]:
+        return self._repository.get_areas_by_ids(area_ids)
@@ -1,5 +1,7 @@
 """Use case for retrieving a single equipment."""
 
+from typing import Iterable, Sequence
+
 from src.entities.equipment import Equipment
 from src.use_cases.ports.plant_repository import EquipmentRepository
 
@@ -12,3 +14,6 @@ class GetEquipmentUseCase:
 
     def execute(self, equipment_id: int) -> Equipment | None:
         return self._repository.get_equipment(equipment_id)
+
+    def execute_many(self, equipment_ids: Iterable[int]) -> Sequence[Equipment]:
+        return self._repository.get_equipment_by_ids(equipment_ids)
@@ -0,0 +1,14 @@
+"""Use case for retrieving a plant with its whole hierarchy."""
+
+from src.entities.plant_tree import PlantTree
+from src.use_cases.ports.plant_repository import PlantDataRepository
+
+
+class GetPlantTreeUseCase:
+    """Fetch a plant together with its areas, equipment and systems."""
+
+    def __init__(self, repository: PlantDataRepository) -> None:
+        self._repository = repository
+
+    def execute(self, plant_id: int) -> PlantTree | None:
+        return self._repository.get_plant_tree(plant_id)
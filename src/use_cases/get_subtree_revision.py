@@ -0,0 +1,35 @@
+"""Use case for reading the revision counters behind conditional GETs."""
+
+from typing import Mapping
+
+from src.use_cases.ports.plant_repository import PlantDataRepository
+
+
+class GetSubtreeRevisionUseCase:
+    """Resolve the revision of the plant subtree that contains an entity.
+
+    Every write bumps the counter of the affected plant, so a resource is
+    unchanged as long as the revision returned here stays the same. Methods
+    return `None` when the entity itself does not exist.
+    """
+
+    def __init__(self, repository: PlantDataRepository) -> None:
+        self._repository = repository
+
+    def for_all_plants(self) -> Mapping[int, int]:
+        return self._repository.get_plant_versions()
+
+    def for_plant(self, plant_id: int) -> int:
+        return self._repository.get_plant_versions([plant_id]).get(plant_id, 0)
+
+    def for_area(self, area_id: int) -> int | None:
+        area = self._repository.get_area(area_id)
+        if area is None:
+            return None
+        return self.for_plant(area.plant_id)
+
+    def for_equipment(self, equipment_id: int) -> int | None:
+        equipment = self._repository.get_equipment(equipment_id)
+        if equipment is None:
+            return None
+        return self.for_area(equipment.area_id)
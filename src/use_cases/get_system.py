@@ -1,5 +1,7 @@
 """Use case for retrieving a single system."""
 
+from typing import Iterable, Sequence
+
 from src.entities.system import System
 from src.use_cases.ports.plant_repository import SystemRepository
 
@@ -12,3 +14,6 @@ class GetSystemUseCase:
 
     def execute(self, system_id: int) -> System | None:
         return self._repository.get_system(system_id)
+
+    def execute_many(self, system_ids: Iterable[int]) -> Sequence[System]:
+        return self._repository.get_systems_by_ids(system_ids)
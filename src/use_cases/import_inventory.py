@@ -0,0 +1,125 @@
+"""Use case for bulk importing the hierarchy from flat rows."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Callable, Iterable
+
+from src.entities.area import Area
+from src.entities.equipment import Equipment
+from src.entities.inventory import ImportReport, ImportRow, ImportRowError
+from src.entities.plant import Plant
+from src.entities.system import System
+from src.use_cases.ports.inventory import InventoryImportRepository
+from src.use_cases.ports.unit_of_work import UnitOfWork
+
+_DEFAULT_STATUSES = {
+    "planta": "operativa",
+    "area": "operativa",
+    "equipo": "operativo",
+    "sistema": "operativo",
+}
+
+_REQUIRED_PARENTS = {
+    "planta": (),
+    "area": ("plant_name",),
+    "equipo": ("plant_name", "area_name"),
+    "sistema": ("plant_name", "area_name", "equipment_name"),
+}
+
+
+def _check_entity(row: ImportRow) -> None:
+    """Apply the same validation as the domain entities (raises ValueError)."""
+    if row.entity_type == "planta":
+        Plant(id=None, name=row.name, location=row.location, status=row.status)
+    elif row.entity_type == "area":
+        Area(id=None, plant_id=0, name=row.name, status=row.status)
+    elif row.entity_type == "equipo":
+        Equipment(id=None, area_id=0, name=row.name, status=row.status)
+    else:
+        System(id=None, equipment_id=0, name=row.name, status=row.status)
+
+
+class ImportInventoryUseCase:
+    """Validate rows and upsert them in chunks, one transaction per chunk.
+
+    Rows are consumed lazily, so memory depends on `chunk_size` and not on the
+    size of the source. Parents must appear in an earlier chunk or in the same
+    one. Only the first `max_reported_errors` errors are kept in the report;
+    `error_count` always has the total.
+    """
+
+    def __init__(
+        self,
+        repository: InventoryImportRepository,
+        uow_factory: Callable[[], UnitOfWork],
+        *,
+        chunk_size: int = 1000,
+        max_reported_errors: int = 1000,
+    ) -> None:
+        self._repository = repository
+        self._uow_factory = uow_factory
+        self._chunk_size = chunk_size
+        self._max_reported_errors = max_reported_errors
+
+    def execute(self, rows: Iterable[ImportRow | ImportRowError]) -> ImportReport:
+        report = ImportReport(saved={entity: 0 for entity in _DEFAULT_STATUSES})
+        chunk: list[ImportRow] = []
+        for item in rows:
+            report.processed += 1
+            if isinstance(item, ImportRowError):
+                self._add_error(report, item)
+                continue
+
+            try:
+                chunk.append(self._validate(item))
+            except ValueError as exc:
+                self._add_error(report, ImportRowError(item.line, str(exc)))
+                continue
+
+            if len(chunk) >= self._chunk_size:
+                self._flush(chunk, report)
+                chunk = []
+
+        if chunk:
+            self._flush(chunk, report)
+        report.errors.sort(key=lambda error: error.line)
+        return report
+
+    @staticmethod
+    def _validate(row: ImportRow) -> ImportRow:
+        if row.entity_type not in _DEFAULT_STATUSES:
+            raise ValueError(f"Tipo de entidad inválido: {row.entity_type}")
+        for parent in _REQUIRED_PARENTS[row.entity_type]:
+            if not getattr(row, parent):
+                raise ValueError(f"Falta el padre requerido para {row.entity_type}")
+
+        if row.status is None:
+            row = replace(row, status=_DEFAULT_STATUSES[row.entity_type])
+        _check_entity(row)
+        return row
+
+    def _flush(self, chunk: list[ImportRow], report: ImportReport) -> None:
+        try:
+            with self._uow_factory() as uow:
+                errors = self._repository.upsert_rows(chunk, session=uow.session)
+                uow.commit()
+        except Exception as exc:  # noqa: BLE001 - se informa en cada fila del bloque
+            errors = [
+                ImportRowError(
+                    row.line, f"No se pudo guardar el bloque ({type(exc).__name__})"
+                )
+                for row in chunk
+            ]
+
+        failed = {error.line for error in errors}
+        for error in errors:
+            self._add_error(report, error)
+        for row in chunk:
+            if row.line not in failed:
+                report.saved[row.entity_type] += 1
+
+    def _add_error(self, report: ImportReport, error: ImportRowError) -> None:
+        report.error_count += 1
+        if len(report.errors) < self._max_reported_errors:
+            report.errors.append(error)
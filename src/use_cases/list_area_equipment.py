@@ -1,8 +1,9 @@
 """Use case for listing equipment belonging to an area."""
 
-from typing import Sequence
+from typing import Collection, Sequence
 
 from src.entities.equipment import Equipment
+from src.use_cases.ports.pagination import Page
 from src.use_cases.ports.plant_repository import EquipmentRepository
 
 
@@ -14,3 +15,15 @@ class ListAreaEquipmentUseCase:
 
     def execute(self, area_id: int) -> Sequence[Equipment]:
         return self._repository.list_equipment(area_id)
+
+    def execute_page(
+        self,
+        area_id: int,
+        *,
+        limit: int,
+        after: int | None = None,
+        ids: Collection[int] | None = None,
+    ) -> Page[Equipment]:
+        return self._repository.list_equipment_page(
+            area_id, limit=limit, after=after, ids=ids
+        )
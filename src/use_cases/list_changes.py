@@ -0,0 +1,51 @@
+"""Use case for reading the incremental change feed."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from src.entities.change import ChangeEntry
+from src.use_cases.ports.change_log import ChangeLogRepository
+
+
+@dataclass(slots=True)
+class ChangeFeed:
+    """Changes recorded after a cursor plus the cursor to resume from."""
+
+    items: list[ChangeEntry] = field(default_factory=list)
+    cursor: int | None = None
+    has_more: bool = False
+
+
+class ListChangesUseCase:
+    """Serve the change log in id order, coalescing repeated entities."""
+
+    def __init__(self, repository: ChangeLogRepository) -> None:
+        self._repository = repository
+
+    def current_cursor(self) -> int | None:
+        """Cursor of the newest entry, to be taken before a full reload."""
+        return self._repository.get_change_bounds()[1]
+
+    def execute(self, *, after: int, limit: int) -> ChangeFeed | None:
+        """Return changes after `after`, or `None` if they were compacted."""
+        oldest, _ = self._repository.get_change_bounds()
+        if oldest is not None and after < oldest - 1:
+            return None
+
+        page = self._repository.list_changes(limit=limit, after=after)
+        return ChangeFeed(
+            items=self._coalesce(page.items),
+            cursor=page.items[-1].id if page.items else after,
+            has_more=page.next_after is not None,
+        )
+
+    @staticmethod
+    def _coalesce(changes: list[ChangeEntry]) -> list[ChangeEntry]:
+        """Keep only the latest entry per entity within the page."""
+        latest: dict[tuple[str, int], ChangeEntry] = {}
+        for change in changes:
+            key = (change.entity_type, change.entity_id)
+            latest.pop(key, None)
+            latest[key] = change
+        return list(latest.values())
@@ -3,6 +3,7 @@
 from typing import Sequence
 
 from src.entities.system import System
+from src.use_cases.ports.pagination import Page
 from src.use_cases.ports.plant_repository import SystemRepository
 
 
@@ -14,3 +15,10 @@ class ListEquipmentSystemsUseCase:
 
     def execute(self, equipment_id: int) -> Sequence[System]:
         return self._repository.list_systems(equipment_id)
+
+    def execute_page(
+        self, equipment_id: int, *, limit: int, after: int | None = None
+    ) -> Page[System]:
+        return self._repository.list_systems_page(
+            equipment_id, limit=limit, after=after
+        )
@@ -1,8 +1,9 @@
 """Use case for listing the areas of a plant."""
 
-from typing import Sequence
+from typing import Collection, Sequence
 
 from src.entities.area import Area
+from src.use_cases.ports.pagination import Page
 from src.use_cases.ports.plant_repository import AreaRepository
 
 
@@ -14,3 +15,15 @@ class ListPlantAreasUseCase:
 
     def execute(self, plant_id: int) -> Sequence[Area]:
         return self._repository.list_areas(plant_id)
+
+    def execute_page(
+        self,
+        plant_id: int,
+        *,
+        limit: int,
+        after: int | None = None,
+        ids: Collection[int] | None = None,
+    ) -> Page[Area]:
+        return self._repository.list_areas_page(
+            plant_id, limit=limit, after=after, ids=ids
+        )
@@ -3,6 +3,7 @@
 from typing import Sequence
 
 from src.entities.plant import Plant
+from src.use_cases.ports.pagination import Page
 from src.use_cases.ports.plant_repository import PlantRepository
 
 
@@ -14,3 +15,6 @@ class ListPlantsUseCase:
 
     def execute(self) -> Sequence[Plant]:
         return self._repository.list_plants()
+
+    def execute_page(self, *, limit: int, after: int | None = None) -> Page[Plant]:
+        return self._repository.list_plants_page(limit=limit, after=after)
@@ -0,0 +1,46 @@
+"""Contract for reading and trimming the hierarchy change log.
+
+Las entradas se escriben desde los repositorios de la jerarquía en la misma
+transacción que cada alta, modificación o baja; este puerto sólo expone la
+lectura incremental y la compactación.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Protocol, runtime_checkable
+
+from src.entities.change import ChangeEntry
+from src.use_cases.ports.pagination import Page
+
+
+@runtime_checkable
+class ChangeLogRepository(Protocol):
+    """Expose the append-only change log ordered by id.
+
+    Ids are assigned when an entry is inserted, not when its transaction
+    commits, so a lower id can become visible after a higher one.
+    Implementations must never hand out an entry, or a newest id, above such
+    a pending gap. Reading from a cursor then yields every committed entry
+    exactly once, in id order, as long as no write transaction stays open
+    longer than the implementation's settle window.
+    """
+
+    def list_changes(
+        self, *, limit: int, after: int | None = None, session: Any | None = None
+    ) -> Page[ChangeEntry]: ...
+
+    def get_change_bounds(
+        self, *, session: Any | None = None
+    ) -> tuple[int | None, int | None]:
+        """Oldest and newest retained ids, `(None, None)` when empty."""
+        ...
+
+    def compact_changes(
+        self, *, before: datetime, session: Any | None = None
+    ) -> int:
+        """Delete entries recorded before `before`, always keeping the newest."""
+        ...
+
+
+__all__ = ["ChangeLogRepository"]
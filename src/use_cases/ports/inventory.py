@@ -0,0 +1,49 @@
+"""Contract for streaming the whole hierarchy as flat rows."""
+
+from __future__ import annotations
+
+from typing import Any, Iterator, Protocol, Sequence, runtime_checkable
+
+from src.entities.inventory import (
+    ImportRow,
+    ImportRowError,
+    InventoryRow,
+    InventoryScope,
+)
+
+
+@runtime_checkable
+class InventoryRepository(Protocol):
+    """Yield every entity without materializing the full result set."""
+
+    def iter_inventory(
+        self,
+        *,
+        batch_size: int = 1000,
+        scope: InventoryScope | None = None,
+        session: Any | None = None,
+    ) -> Iterator[InventoryRow]:
+        """Plants, then areas, equipment and systems, each ordered by id.
+
+        Rows outside `scope` are filtered by the query itself, not skipped
+        after being read.
+        """
+        ...
+
+
+@runtime_checkable
+class InventoryImportRepository(Protocol):
+    """Create or update entities addressed by natural key."""
+
+    def upsert_rows(
+        self, rows: Sequence[ImportRow], *, session: Any | None = None
+    ) -> list[ImportRowError]:
+        """Upsert a chunk of rows, returning those that could not be saved.
+
+        Parents are resolved by name among existing rows and rows of the same
+        chunk; a missing parent is reported as an error for that row only.
+        """
+        ...
+
+
+__all__ = ["InventoryImportRepository", "InventoryRepository"]
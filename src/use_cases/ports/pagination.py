@@ -0,0 +1,24 @@
+"""Keyset pagination primitives shared by repositories and use cases."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class Page(Generic[T]):
+    """Slice of an id-ordered listing.
+
+    `next_after` holds the last id of the slice when more rows exist, so the
+    caller can request the following page with `after=next_after` instead of
+    an OFFSET scan.
+    """
+
+    items: list[T] = field(default_factory=list)
+    next_after: int | None = None
+
+
+__all__ = ["Page"]
@@ -5,12 +5,24 @@ y la infraestructura de persistencia, permitiendo que cada caso de uso dependa
 solo de los métodos que necesita.
 """
 
-from typing import Any, Protocol, Sequence, runtime_checkable
+from typing import (
+    Any,
+    Collection,
+    Iterable,
+    Mapping,
+    Protocol,
+    Sequence,
+    runtime_checkable,
+)
 
 from src.entities.area import Area
 from src.entities.equipment import Equipment
 from src.entities.plant import Plant
+from src.entities.plant_tree import PlantTree
+from src.entities.purge_job import PurgeJob
+from src.entities.status_cascade import StatusCascade
 from src.entities.system import System
+from src.use_cases.ports.pagination import Page
 
 
 @runtime_checkable
@@ -19,6 +31,10 @@ class PlantRepository(Protocol):
 
     def list_plants(self, *, session: Any | None = None) -> Sequence[Plant]: ...
 
+    def list_plants_page(
+        self, *, limit: int, after: int | None = None, session: Any | None = None
+    ) -> Page[Plant]: ...
+
     def get_plant(
         self, plant_id: int, *, session: Any | None = None
     ) -> Plant | None: ...
@@ -42,8 +58,59 @@ class PlantRepository(Protocol):
         session: Any | None = None,
     ) -> Plant | None: ...
 
+    def set_plant_status(
+        self,
+        plant_id: int,
+        statuses: Mapping[str, str],
+        *,
+        session: Any | None = None,
+    ) -> StatusCascade | None:
+        """Apply `statuses` (level -> status) to the plant and its subtree.
+
+        Levels missing from `statuses` are left untouched.
+        """
+        ...
+
     def delete_plant(self, plant_id: int, *, session: Any | None = None) -> bool: ...
 
+    def hide_plant(
+        self, plant_id: int, *, session: Any | None = None
+    ) -> PurgeJob | None:
+        """Hide the plant subtree from every read and open a purge job.
+
+        Returns `None` when the plant does not exist or is already hidden.
+        """
+        ...
+
+    def purge_plant_batch(
+        self, job_id: int, *, batch_size: int, session: Any | None = None
+    ) -> PurgeJob | None:
+        """Delete up to `batch_size` rows of the lowest non-empty level.
+
+        Once only the plant is left it is deleted and the job completes.
+        """
+        ...
+
+    def get_purge_job(
+        self, job_id: int, *, session: Any | None = None
+    ) -> PurgeJob | None: ...
+
+    def fail_purge_job(
+        self, job_id: int, error: str, *, session: Any | None = None
+    ) -> PurgeJob | None: ...
+
+    def list_unfinished_purge_jobs(
+        self, *, session: Any | None = None
+    ) -> Sequence[PurgeJob]:
+        """Jobs not yet `completado` (pending, interrupted or failed), oldest first."""
+        ...
+
+    def get_plant_versions(
+        self, plant_ids: Iterable[int] | None = None, *, session: Any | None = None
+    ) -> Mapping[int, int]:
+        """Revision of each plant subtree; `None` requests every plant."""
+        ...
+
 
 @runtime_checkable
 class AreaRepository(Protocol):
@@ -53,8 +120,24 @@ class AreaRepository(Protocol):
         self, plant_id: int, *, session: Any | None = None
     ) -> Sequence[Area]: ...
 
+    def list_areas_page(
+        self,
+        plant_id: int,
+        *,
+        limit: int,
+        after: int | None = None,
+        ids: Collection[int] | None = None,
+        session: Any | None = None,
+    ) -> Page[Area]:
+        """Areas by id; `ids` restricts them before `limit` applies."""
+        ...
+
     def get_area(self, area_id: int, *, session: Any | None = None) -> Area | None: ...
 
+    def get_areas_by_ids(
+        self, area_ids: Iterable[int], *, session: Any | None = None
+    ) -> Sequence[Area]: ...
+
     def create_area(
         self,
         plant_id: int,
@@ -64,6 +147,14 @@ class AreaRepository(Protocol):
         session: Any | None = None,
     ) -> Area | None: ...
 
+    def create_area_batch(
+        self,
+        plant_id: int,
+        items: Sequence[Mapping[str, Any]],
+        *,
+        session: Any | None = None,
+    ) -> Sequence[Area] | None: ...
+
     def update_area(
         self,
         area_id: int,
@@ -73,6 +164,14 @@ class AreaRepository(Protocol):
         session: Any | None = None,
     ) -> Area | None: ...
 
+    def set_area_status(
+        self,
+        area_id: int,
+        statuses: Mapping[str, str],
+        *,
+        session: Any | None = None,
+    ) -> StatusCascade | None: ...
+
     def delete_area(self, area_id: int, *, session: Any | None = None) -> bool: ...
 
 
@@ -84,10 +183,26 @@ class EquipmentRepository(Protocol):
         self, area_id: int, *, session: Any | None = None
     ) -> Sequence[Equipment]: ...
 
+    def list_equipment_page(
+        self,
+        area_id: int,
+        *,
+        limit: int,
+        after: int | None = None,
+        ids: Collection[int] | None = None,
+        session: Any | None = None,
+    ) -> Page[Equipment]:
+        """Equipment by id; `ids` restricts them before `limit` applies."""
+        ...
+
     def get_equipment(
         self, equipment_id: int, *, session: Any | None = None
     ) -> Equipment | None: ...
 
+    def get_equipment_by_ids(
+        self, equipment_ids: Iterable[int], *, session: Any | None = None
+    ) -> Sequence[Equipment]: ...
+
     def create_equipment(
         self,
         area_id: int,
@@ -97,6 +212,14 @@ class EquipmentRepository(Protocol):
         session: Any | None = None,
     ) -> Equipment | None: ...
 
+    def create_equipment_batch(
+        self,
+        area_id: int,
+        items: Sequence[Mapping[str, Any]],
+        *,
+        session: Any | None = None,
+    ) -> Sequence[Equipment] | None: ...
+
     def update_equipment(
         self,
         equipment_id: int,
@@ -106,6 +229,14 @@ class EquipmentRepository(Protocol):
         session: Any | None = None,
     ) -> Equipment | None: ...
 
+    def set_equipment_status(
+        self,
+        equipment_id: int,
+        statuses: Mapping[str, str],
+        *,
+        session: Any | None = None,
+    ) -> StatusCascade | None: ...
+
     def delete_equipment(
         self, equipment_id: int, *, session: Any | None = None
     ) -> bool: ...
@@ -119,10 +250,23 @@ class SystemRepository(Protocol):
         self, equipment_id: int, *, session: Any | None = None
     ) -> Sequence[System]: ...
 
+    def list_systems_page(
+        self,
+        equipment_id: int,
+        *,
+        limit: int,
+        after: int | None = None,
+        session: Any | None = None,
+    ) -> Page[System]: ...
+
     def get_system(
         self, system_id: int, *, session: Any | None = None
     ) -> System | None: ...
 
+    def get_systems_by_ids(
+        self, system_ids: Iterable[int], *, session: Any | None = None
+    ) -> Sequence[System]: ...
+
     def create_system(
         self,
         equipment_id: int,
@@ -132,6 +276,14 @@ class SystemRepository(Protocol):
         session: Any | None = None,
     ) -> System | None: ...
 
+    def create_system_batch(
+        self,
+        equipment_id: int,
+        items: Sequence[Mapping[str, Any]],
+        *,
+        session: Any | None = None,
+    ) -> Sequence[System] | None: ...
+
     def update_system(
         self,
         system_id: int,
@@ -150,7 +302,289 @@ class PlantDataRepository(
 ):
     """Composite protocol used by controllers that need all aggregates."""
 
-    pass
+    def get_plant_tree(
+        self, plant_id: int, *, session: Any | None = None
+    ) -> PlantTree | None: ...
+
+
+
+@runtime_checkable
+class AsyncPlantRepository(Protocol):
+    """Awaitable counterpart of `PlantRepository`."""
+
+    async def list_plants(self, *, session: Any | None = None) -> Sequence[Plant]: ...
+
+    async def list_plants_page(
+        self, *, limit: int, after: int | None = None, session: Any | None = None
+    ) -> Page[Plant]: ...
+
+    async def get_plant(
+        self, plant_id: int, *, session: Any | None = None
+    ) -> Plant | None: ...
+
+    async def create_plant(
+        self,
+        *,
+        name: str,
+        location: str | None = None,
+        status: str | None = None,
+        session: Any | None = None,
+    ) -> Plant: ...
+
+    async def update_plant(
+        self,
+        plant_id: int,
+        *,
+        name: str | None = None,
+        location: str | None = None,
+        status: str | None = None,
+        session: Any | None = None,
+    ) -> Plant | None: ...
+
+    async def set_plant_status(
+        self,
+        plant_id: int,
+        statuses: Mapping[str, str],
+        *,
+        session: Any | None = None,
+    ) -> StatusCascade | None: ...
+
+    async def delete_plant(
+        self, plant_id: int, *, session: Any | None = None
+    ) -> bool: ...
+
+    async def hide_plant(
+        self, plant_id: int, *, session: Any | None = None
+    ) -> PurgeJob | None: ...
+
+    async def purge_plant_batch(
+        self, job_id: int, *, batch_size: int, session: Any | None = None
+    ) -> PurgeJob | None: ...
+
+    async def get_purge_job(
+        self, job_id: int, *, session: Any | None = None
+    ) -> PurgeJob | None: ...
+
+    async def fail_purge_job(
+        self, job_id: int, error: str, *, session: Any | None = None
+    ) -> PurgeJob | None: ...
+
+    async def list_unfinished_purge_jobs(
+        self, *, session: Any | None = None
+    ) -> Sequence[PurgeJob]: ...
+
+    async def get_plant_versions(
+        self, plant_ids: Iterable[int] | None = None, *, session: Any | None = None
+    ) -> Mapping[int, int]: ...
+
+
+@runtime_checkable
+class AsyncAreaRepository(Protocol):
+    """Awaitable counterpart of `AreaRepository`."""
+
+    async def list_areas(
+        self, plant_id: int, *, session: Any | None = None
+    ) -> Sequence[Area]: ...
+
+    async def list_areas_page(
+        self,
+        plant_id: int,
+        *,
+        limit: int,
+        after: int | None = None,
+        ids: Collection[int] | None = None,
+        session: Any | None = None,
+    ) -> Page[Area]:
+        """Areas by id; `ids` restricts them before `limit` applies."""
+        ...
+
+    async def get_area(
+        self, area_id: int, *, session: Any | None = None
+    ) -> Area | None: ...
+
+    async def get_areas_by_ids(
+        self, area_ids: Iterable[int], *, session: Any | None = None
+    ) -> Sequence[Area]: ...
+
+    async def create_area(
+        self,
+        plant_id: int,
+        *,
+        name: str,
+        status: str | None = None,
+        session: Any | None = None,
+    ) -> Area | None: ...
+
+    async def create_area_batch(
+        self,
+        plant_id: int,
+        items: Sequence[Mapping[str, Any]],
+        *,
+        session: Any | None = None,
+    ) -> Sequence[Area] | None: ...
+
+    async def update_area(
+        self,
+        area_id: int,
+        *,
+        name: str | None = None,
+        status: str | None = None,
+        session: Any | None = None,
+    ) -> Area | None: ...
+
+    async def set_area_status(
+        self,
+        area_id: int,
+        statuses: Mapping[str, str],
+        *,
+        session: Any | None = None,
+    ) -> StatusCascade | None: ...
+
+    async def delete_area(
+        self, area_id: int, *, session: Any | None = None
+    ) -> bool: ...
+
+
+@runtime_checkable
+class AsyncEquipmentRepository(Protocol):
+    """Awaitable counterpart of `EquipmentRepository`."""
+
+    async def list_equipment(
+        self, area_id: int, *, session: Any | None = None
+    ) -> Sequence[Equipment]: ...
+
+    async def list_equipment_page(
+        self,
+        area_id: int,
+        *,
+        limit: int,
+        after: int | None = None,
+        ids: Collection[int] | None = None,
+        session: Any | None = None,
+    ) -> Page[Equipment]:
+        """Equipment by id; `ids` restricts them before `limit` applies."""
+        ...
+
+    async def get_equipment(
+        self, equipment_id: int, *, session: Any | None = None
+    ) -> Equipment | None: ...
+
+    async def get_equipment_by_ids(
+        self, equipment_ids: Iterable[int], *, session: Any | None = None
+    ) -> Sequence[Equipment]: ...
+
+    async def create_equipment(
+        self,
+        area_id: int,
+        *,
+        name: str,
+        status: str | None = None,
+        session: Any | None = None,
+    ) -> Equipment | None: ...
+
+    async def create_equipment_batch(
+        self,
+        area_id: int,
+        items: Sequence[Mapping[str, Any]],
+        *,
+        session: Any | None = None,
+    ) -> Sequence[Equipment] | None: ...
+
+    async def update_equipment(
+        self,
+        equipment_id: int,
+        *,
+        name: str | None = None,
+        status: str | None = None,
+        session: Any | None = None,
+    ) -> Equipment | None: ...
+
+    async def set_equipment_status(
+        self,
+        equipment_id: int,
+        statuses: Mapping[str, str],
+        *,
+        session: Any | None = None,
+    ) -> StatusCascade | None: ...
+
+    async def delete_equipment(
+        self, equipment_id: int, *, session: Any | None = None
+    ) -> bool: ...
+
+
+@runtime_checkable
+class AsyncSystemRepository(Protocol):
+    """Awaitable counterpart of `SystemRepository`."""
+
+    async def list_systems(
+        self, equipment_id: int, *, session: Any | None = None
+    ) -> Sequence[System]: ...
+
+    async def list_systems_page(
+        self,
+        equipment_id: int,
+        *,
+        limit: int,
+        after: int | None = None,
+        session: Any | None = None,
+    ) -> Page[System]: ...
+
+    async def get_system(
+        self, system_id: int, *, session: Any | None = None
+    ) -> System | None: ...
+
+    async def get_systems_by_ids(
+        self, system_ids: Iterable[int], *, session: Any | None = None
+    ) -> Sequence[System]: ...
+
+    async def create_system(
+        self,
+        equipment_id: int,
+        *,
+        name: str,
+        status: str | None = None,
+        session: Any | None = None,
+    ) -> System | None: ...
+
+    async def create_system_batch(
+        self,
+        equipment_id: int,
+        items: Sequence[Mapping[str, Any]],
+        *,
+        session: Any | None = None,
+    ) -> Sequence[System] | None: ...
+
+    async def update_system(
+        self,
+        system_id: int,
+        *,
+        name: str | None = None,
+        status: str | None = None,
+        session: Any | None = None,
+    ) -> System | None: ...
+
+    async def delete_system(
+        self, system_id: int, *, session: Any | None = None
+    ) -> bool: ...
+
+
+@runtime_checkable
+class AsyncPlantDataRepository(
+    AsyncPlantRepository,
+    AsyncAreaRepository,
+    AsyncEquipmentRepository,
+    AsyncSystemRepository,
+    Protocol,
+):
+    """Composite protocol for async front ends.
+
+    Same operations and semantics as `PlantDataRepository`; `session` is the
+    handle of an `AsyncUnitOfWork`.
+    """
+
+    async def get_plant_tree(
+        self, plant_id: int, *, session: Any | None = None
+    ) -> PlantTree | None: ...
 
 
 __all__ = [
@@ -159,4 +593,9 @@ __all__ = [
     "EquipmentRepository",
     "SystemRepository",
     "PlantDataRepository",
+    "AsyncPlantRepository",
+    "AsyncAreaRepository",
+    "AsyncEquipmentRepository",
+    "AsyncSystemRepository",
+    "AsyncPlantDataRepository",
 ]
@@ -27,4 +27,22 @@ class UnitOfWork(Protocol):
     def rollback(self) -> None: ...
 
 
-__all__ = ["UnitOfWork"]
+@runtime_checkable
+class AsyncUnitOfWork(Protocol):
+    """Awaitable counterpart of `UnitOfWork` (`async with uow: ...`)."""
+
+    async def __aenter__(self) -> "AsyncUnitOfWork": ...
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool: ...
+
+    @property
+    def session(self) -> object:
+        """Opaque session/transaction handle usable by async repositories."""
+        ...
+
+    async def commit(self) -> None: ...
+
+    async def rollback(self) -> None: ...
+
+
+__all__ = ["AsyncUnitOfWork", "UnitOfWork"]
@@ -0,0 +1,76 @@
+"""Use case for deleting a large plant subtree in the background."""
+
+from __future__ import annotations
+
+import time
+from typing import Callable, Sequence
+
+from src.entities.purge_job import PurgeJob
+from src.use_cases.ports.plant_repository import PlantRepository
+from src.use_cases.ports.unit_of_work import UnitOfWork
+
+
+class PurgePlantUseCase:
+    """Hide a plant at once, then delete its rows in bounded batches.
+
+    `start` is a single short transaction that makes the subtree invisible
+    and returns the job. `run` deletes at most `batch_size` rows per unit of
+    work, leaves first, so no transaction holds many locks and other writers
+    interleave between batches; `pause_seconds` adds breathing room between
+    them. A failure marks the job as `fallido`; running it again resumes
+    where it stopped.
+    """
+
+    def __init__(
+        self,
+        repository: PlantRepository,
+        uow_factory: Callable[[], UnitOfWork],
+        *,
+        batch_size: int = 1000,
+        pause_seconds: float = 0.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size debe ser mayor que cero")
+        self._repository = repository
+        self._uow_factory = uow_factory
+        self._batch_size = batch_size
+        self._pause_seconds = pause_seconds
+        self._sleep = sleep
+
+    def start(self, plant_id: int) -> PurgeJob | None:
+        with self._uow_factory() as uow:
+            job = self._repository.hide_plant(plant_id, session=uow.session)
+            if job is None:
+                uow.rollback()
+                return None
+
+            uow.commit()
+            return job
+
+    def run(self, job_id: int) -> PurgeJob | None:
+        try:
+            while True:
+                with self._uow_factory() as uow:
+                    job = self._repository.purge_plant_batch(
+                        job_id, batch_size=self._batch_size, session=uow.session
+                    )
+                    uow.commit()
+                if job is None or job.finished:
+                    return job
+                if self._pause_seconds > 0:
+                    self._sleep(self._pause_seconds)
+        except Exception as exc:
+            with self._uow_factory() as uow:
+                self._repository.fail_purge_job(
+                    job_id, type(exc).__name__, session=uow.session
+                )
+                uow.commit()
+            raise
+
+    def get(self, job_id: int) -> PurgeJob | None:
+        return self._repository.get_purge_job(job_id)
+
+    def unfinished(self) -> Sequence[PurgeJob]:
+        """Jobs a crash or a failed batch left behind; `run` resumes each one."""
+        return self._repository.list_unfinished_purge_jobs()
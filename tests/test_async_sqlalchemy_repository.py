@@ -0,0 +1,172 @@
+"""Paridad entre el repositorio SQLAlchemy async (aiosqlite) y el síncrono."""
+
+import asyncio
+import inspect
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.sqlalchemy import Base
+from src.infrastructure.sqlalchemy.async_plant_repository import (
+    AsyncSqlAlchemyPlantRepository,
+)
+from src.infrastructure.sqlalchemy.async_unit_of_work import AsyncSqlAlchemyUnitOfWork
+from src.infrastructure.sqlalchemy.models import PlantModel
+from src.infrastructure.sqlalchemy.plant_repository import SqlAlchemyPlantRepository
+from src.infrastructure.sqlalchemy.session import build_async_session_factory
+from src.use_cases.ports.plant_repository import AsyncPlantDataRepository
+from src.use_cases.ports.unit_of_work import AsyncUnitOfWork
+
+NOW = datetime(2024, 5, 1, 12, 0, 0)
+
+
+def _enable_foreign_keys(dbapi_connection, _record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+@pytest.fixture()
+def sync_repo(tmp_path):
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'sync.db'}", future=True)
+    event.listen(engine, "connect", _enable_foreign_keys)
+    Base.metadata.create_all(engine)
+    try:
+        yield SqlAlchemyPlantRepository(
+            sessionmaker(engine, expire_on_commit=False, future=True),
+            clock=lambda: NOW,
+        )
+    finally:
+        engine.dispose()
+
+
+@pytest.fixture()
+def async_engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'async.db'}")
+    event.listen(engine.sync_engine, "connect", _enable_foreign_keys)
+
+    async def create_schema():
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+    asyncio.run(create_schema())
+    try:
+        yield engine
+    finally:
+        asyncio.run(engine.dispose())
+
+
+@pytest.fixture()
+def async_session_factory(async_engine):
+    return build_async_session_factory(async_engine)
+
+
+@pytest.fixture()
+def async_repo(async_session_factory):
+    return AsyncSqlAlchemyPlantRepository(async_session_factory, clock=lambda: NOW)
+
+
+async def _scenario(repo):
+    """Misma secuencia de operaciones sobre cualquiera de los dos repositorios."""
+    results = []
+
+    async def step(value):
+        if inspect.isawaitable(value):
+            value = await value
+        results.append(value)
+        return value
+
+    plant = await step(repo.create_plant(name="Central", location="Norte"))
+    await step(repo.create_plant(name="Backup"))
+    area = await step(repo.create_area(plant.id, name="Área 1"))
+    await step(
+        repo.create_area_batch(plant.id, [{"name": "Área 2"}, {"name": "Área 3"}])
+    )
+    await step(repo.create_area(9999, name="Sin planta"))
+    equipment = await step(repo.create_equipment(area.id, name="Compresor"))
+    await step(repo.create_equipment_batch(area.id, [{"name": "Bomba"}]))
+    system = await step(repo.create_system(equipment.id, name="Lubricación"))
+    await step(repo.create_system_batch(equipment.id, [{"name": "Eléctrico"}]))
+    await step(repo.update_plant(plant.id, location="Sur"))
+    await step(repo.update_area(area.id, name="Área 1B"))
+    await step(repo.update_equipment(equipment.id, status="mantenimiento"))
+    await step(repo.update_system(system.id, name="Lubricación B"))
+    await step(repo.update_system(9999, name="Nada"))
+    await step(
+        repo.set_plant_status(plant.id, {"planta": "inactiva", "area": "mantenimiento"})
+    )
+    await step(repo.set_area_status(area.id, {"equipo": "operativo"}))
+    await step(repo.set_equipment_status(equipment.id, {"sistema": "mantenimiento"}))
+    await step(repo.list_plants())
+    await step(repo.list_plants_page(limit=1))
+    await step(repo.list_areas_page(plant.id, limit=2, after=area.id))
+    await step(repo.list_equipment(area.id))
+    await step(repo.list_systems_page(equipment.id, limit=5))
+    await step(repo.get_areas_by_ids([area.id, 9999]))
+    await step(repo.get_equipment_by_ids([equipment.id]))
+    await step(repo.get_systems_by_ids([system.id]))
+    await step(repo.get_plant_tree(plant.id))
+    await step(repo.get_plant_versions())
+    await step(repo.delete_system(system.id))
+    await step(repo.delete_equipment(equipment.id))
+    await step(repo.get_system(system.id))
+    job = await step(repo.hide_plant(plant.id))
+    await step(repo.get_plant(plant.id))
+    while job.status != "completado":
+        job = await step(repo.purge_plant_batch(job.id, batch_size=1))
+    await step(repo.get_purge_job(job.id))
+    await step(repo.delete_area(area.id))
+    await step(repo.get_plant_versions([plant.id]))
+    return results
+
+
+def test_async_repository_matches_sync_results(sync_repo, async_repo):
+    sync_results = asyncio.run(_scenario(sync_repo))
+    async_results = asyncio.run(_scenario(async_repo))
+
+    assert async_results == sync_results
+
+
+def test_async_repository_implements_async_ports(async_repo, async_session_factory):
+    async def run():
+        async with AsyncSqlAlchemyUnitOfWork(async_session_factory) as uow:
+            return isinstance(uow, AsyncUnitOfWork)
+
+    assert isinstance(async_repo, AsyncPlantDataRepository)
+    assert asyncio.run(run())
+
+
+def test_unit_of_work_commits_repository_writes(async_repo, async_session_factory):
+    async def run():
+        async with AsyncSqlAlchemyUnitOfWork(async_session_factory) as uow:
+            plant = await async_repo.create_plant(name="Central", session=uow.session)
+            await async_repo.create_area(plant.id, name="Área", session=uow.session)
+        return await async_repo.get_plant_tree(plant.id)
+
+    tree = asyncio.run(run())
+
+    assert tree.plant.name == "Central"
+    assert [node.area.name for node in tree.areas] == ["Área"]
+
+
+def test_unit_of_work_rolls_back_on_exception(async_repo, async_session_factory):
+    async def run():
+        with pytest.raises(RuntimeError):
+            async with AsyncSqlAlchemyUnitOfWork(async_session_factory) as uow:
+                await async_repo.create_plant(name="Temporal", session=uow.session)
+                raise RuntimeError("Force rollback")
+
+        async with async_session_factory() as session:
+            return await session.scalar(select(func.count()).select_from(PlantModel))
+
+    assert asyncio.run(run()) == 0
+
+
+def test_unit_of_work_session_outside_context_raises(async_session_factory):
+    uow = AsyncSqlAlchemyUnitOfWork(async_session_factory)
+
+    with pytest.raises(RuntimeError):
+        uow.session
@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
+import json
+import threading
+import time
+from datetime import timedelta
+
 import pytest
 from flask import Flask
+from flask_jwt_extended import JWTManager
+from werkzeug.exceptions import ServiceUnavailable, TooManyRequests, Unauthorized
+from werkzeug.security import generate_password_hash
 
-from src.infrastructure.flask.auth import AuthClaims, AuthService, ScopeAuthorizer
+from src.infrastructure.http.auth import AuthClaims, AuthService, ScopeAuthorizer
 from src.infrastructure.flask.routes import build_blueprint
+from src.infrastructure.login_throttle import LoginThrottle
+from src.infrastructure.password_hashing import PasswordHashPool
+from src.infrastructure.user_repository import InMemoryUserRepository
 from src.interface_adapters.gateways.in_memory_plant_repository import (
     InMemoryPlantRepository,
 )
@@ -50,6 +61,11 @@ def flask_app(auth_service: AuthService) -> Flask:
     )
 
     app = Flask(__name__)
+    app.config["JWT_SECRET_KEY"] = auth_service.secret_key
+    app.config["JWT_ACCESS_TOKEN_EXPIRES"] = timedelta(
+        seconds=auth_service.token_ttl_seconds
+    )
+    JWTManager(app)
     app.register_blueprint(
         build_blueprint(
             repository,
@@ -72,6 +88,12 @@ def _auth_headers(auth_service: AuthService, username: str) -> dict[str, str]:
     return {"Authorization": f"Bearer {token}"}
 
 
+@pytest.fixture(autouse=True)
+def app_context(flask_app: Flask):
+    with flask_app.app_context():
+        yield
+
+
 def test_login_returns_token_and_claims(client):
     response = client.post(
         "/api/auth/login", json={"username": "admin", "password": "admin"}
@@ -83,11 +105,472 @@ def test_login_returns_token_and_claims(client):
     assert body["user"]["role"] == "administrador"
 
 
+def test_login_returns_refresh_token_and_expiry(client):
+    response = client.post(
+        "/api/auth/login", json={"username": "admin", "password": "admin"}
+    )
+
+    body = response.get_json()
+    assert body["expires_in"] == 3600
+    assert body["refresh_token"].count(".") == 2
+
+
+def test_refresh_rotates_tokens_without_credentials(client):
+    login = client.post(
+        "/api/auth/login", json={"username": "admin", "password": "admin"}
+    ).get_json()
+
+    response = client.post(
+        "/api/auth/refresh", json={"refresh_token": login["refresh_token"]}
+    )
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["refresh_token"] != login["refresh_token"]
+    tree = client.get(
+        "/api/plantas/1/arbol",
+        headers={"Authorization": f"Bearer {body['token']}"},
+    )
+    assert tree.status_code == 200
+
+
+def test_reused_refresh_token_revokes_the_session(client):
+    login = client.post(
+        "/api/auth/login", json={"username": "admin", "password": "admin"}
+    ).get_json()
+    rotated = client.post(
+        "/api/auth/refresh", json={"refresh_token": login["refresh_token"]}
+    ).get_json()
+
+    reused = client.post(
+        "/api/auth/refresh", json={"refresh_token": login["refresh_token"]}
+    )
+    latest = client.post(
+        "/api/auth/refresh", json={"refresh_token": rotated["refresh_token"]}
+    )
+
+    assert reused.status_code == 401
+    assert latest.status_code == 401
+
+
+def test_refresh_rejects_tampered_tokens(auth_service):
+    session = auth_service.login("admin", "admin")
+    family, generation, signature = session.refresh_token.split(".")
+
+    with pytest.raises(Unauthorized):
+        auth_service.refresh(f"{family}.{int(generation) + 1}.{signature}")
+    with pytest.raises(Unauthorized):
+        auth_service.refresh("sin-formato")
+    assert auth_service.refresh(session.refresh_token).claims.username == "admin"
+
+
+def test_repeated_login_failures_are_throttled_before_hashing(client):
+    for _ in range(5):
+        response = client.post(
+            "/api/auth/login", json={"username": "admin", "password": "mala"}
+        )
+        assert response.status_code == 401
+
+    blocked = client.post(
+        "/api/auth/login", json={"username": "admin", "password": "admin"}
+    )
+
+    assert blocked.status_code == 429
+    assert int(blocked.headers["Retry-After"]) > 0
+
+
+def test_login_throttle_counts_per_ip_and_resets_users_on_success():
+    now = [0.0]
+    throttle = LoginThrottle(
+        max_failures_per_user=2,
+        max_failures_per_ip=3,
+        window_seconds=60,
+        clock=lambda: now[0],
+    )
+    throttle.record_failure("admin", "10.0.0.1")
+    throttle.record_success("admin")
+    for username in ("a", "b", "c"):
+        throttle.record_failure(username, "10.0.0.1")
+
+    throttle.check("admin", "10.0.0.2")
+    with pytest.raises(TooManyRequests):
+        throttle.check("admin", "10.0.0.1")
+    now[0] = 61.0
+    throttle.check("admin", "10.0.0.1")
+
+
+def test_saturated_hash_pool_returns_service_unavailable(monkeypatch):
+    release = threading.Event()
+    monkeypatch.setattr(
+        "src.infrastructure.password_hashing.check_password_hash",
+        lambda _hash, _password: release.wait(5),
+    )
+    pool = PasswordHashPool(workers=1, max_pending=0)
+    busy = threading.Thread(target=pool.verify, args=("hash", "clave"))
+    busy.start()
+    try:
+        time.sleep(0.05)
+        with pytest.raises(ServiceUnavailable):
+            pool.verify("hash", "clave")
+    finally:
+        release.set()
+        busy.join()
+
+    assert pool.verify("hash", "clave") is True
+    pool.shutdown()
+
+
+def test_hash_pool_rejects_logins_that_wait_too_long_for_a_turn(monkeypatch):
+    release = threading.Event()
+    monkeypatch.setattr(
+        "src.infrastructure.password_hashing.check_password_hash",
+        lambda _hash, _password: release.wait(5),
+    )
+    # El cupo de espera alcanza, pero el servidor no puede dejar el hilo parado.
+    pool = PasswordHashPool(workers=1, max_pending=16, wait_seconds=0.1)
+    busy = threading.Thread(target=pool.verify, args=("hash", "clave"))
+    busy.start()
+    try:
+        time.sleep(0.05)
+        started = time.monotonic()
+        with pytest.raises(ServiceUnavailable):
+            pool.verify("hash", "clave")
+        assert time.monotonic() - started < 1
+    finally:
+        release.set()
+        busy.join()
+
+    assert pool.verify("hash", "clave") is True
+    pool.shutdown()
+
+
 def test_rejects_requests_without_token(client):
     response = client.get("/api/plantas")
     assert response.status_code == 401
 
 
+def test_plant_tree_returns_nested_hierarchy(client, auth_service):
+    headers = _auth_headers(auth_service, "superadmin")
+    response = client.get("/api/plantas/1/arbol", headers=headers)
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["nombre"] == "Planta Norte"
+    assert [area["id"] for area in body["areas"]] == [101, 102]
+    compressor = body["areas"][0]["equipos"][0]
+    assert compressor["id"] == 1001
+    assert [system["id"] for system in compressor["sistemas"]] == [5001]
+
+
+def test_plant_tree_applies_scope_filtering(client, auth_service):
+    admin = client.get(
+        "/api/plantas/1/arbol", headers=_auth_headers(auth_service, "admin")
+    ).get_json()
+    maquinista = client.get(
+        "/api/plantas/1/arbol", headers=_auth_headers(auth_service, "maquinista")
+    ).get_json()
+    invitado = client.get(
+        "/api/plantas/1/arbol", headers=_auth_headers(auth_service, "invitado")
+    ).get_json()
+
+    assert [area["id"] for area in admin["areas"]] == [101]
+    assert [eq["id"] for eq in maquinista["areas"][0]["equipos"]] == [1001]
+    assert len(maquinista["areas"]) == 1
+    assert {area["id"] for area in invitado["areas"]} == {101, 102}
+    assert all(
+        eq["sistemas"] == []
+        for area in invitado["areas"]
+        for eq in area["equipos"]
+    )
+
+
+def test_plant_tree_missing_plant_returns_404(client, auth_service):
+    headers = _auth_headers(auth_service, "superadmin")
+    response = client.get("/api/plantas/999/arbol", headers=headers)
+    assert response.status_code == 404
+
+
+def test_list_areas_paginates_with_opaque_cursor(client, auth_service):
+    headers = _auth_headers(auth_service, "superadmin")
+
+    first = client.get("/api/plantas/1/areas?limite=1", headers=headers).get_json()
+    second = client.get(
+        f"/api/plantas/1/areas?limite=1&despues={first['siguiente']}",
+        headers=headers,
+    ).get_json()
+
+    assert [area["id"] for area in first["items"]] == [101]
+    assert [area["id"] for area in second["items"]] == [102]
+    assert second["siguiente"] is None
+
+
+def test_paginated_areas_are_scoped_before_the_limit(client, auth_service):
+    headers = _auth_headers(auth_service, "admin")
+
+    page = client.get("/api/plantas/1/areas?limite=1", headers=headers).get_json()
+
+    # El área 102 queda fuera del alcance: no hay una página siguiente vacía.
+    assert [area["id"] for area in page["items"]] == [101]
+    assert page["siguiente"] is None
+
+
+def test_pagination_rejects_invalid_arguments(client, auth_service):
+    headers = _auth_headers(auth_service, "superadmin")
+
+    bad_limit = client.get("/api/plantas?limite=0", headers=headers)
+    bad_cursor = client.get("/api/plantas?despues=no-es-cursor", headers=headers)
+
+    assert bad_limit.status_code == 400
+    assert bad_cursor.status_code == 400
+
+
+def test_matching_if_none_match_returns_304(client, auth_service):
+    headers = _auth_headers(auth_service, "admin")
+    first = client.get("/api/plantas/1/areas", headers=headers)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"] == "private, no-cache"
+
+    cached = client.get(
+        "/api/plantas/1/areas", headers={**headers, "If-None-Match": etag}
+    )
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+    assert cached.data == b""
+
+
+def test_etag_depends_on_caller_scope(client, auth_service):
+    admin_headers = _auth_headers(auth_service, "admin")
+    admin = client.get("/api/plantas/1/arbol", headers=admin_headers)
+    guest_headers = _auth_headers(auth_service, "invitado")
+    other = client.get(
+        "/api/plantas/1/arbol",
+        headers={**guest_headers, "If-None-Match": admin.headers["ETag"]},
+    )
+    assert other.status_code == 200
+    assert other.headers["ETag"] != admin.headers["ETag"]
+
+
+def test_etag_changes_after_write_in_subtree(client, auth_service):
+    headers = _auth_headers(auth_service, "maquinista")
+    first = client.get("/api/equipos/1001/sistemas", headers=headers)
+    etag = first.headers["ETag"]
+
+    client.put("/api/equipos/1001", headers=headers, json={"nombre": "Compresor B"})
+
+    after = client.get(
+        "/api/equipos/1001/sistemas", headers={**headers, "If-None-Match": etag}
+    )
+    assert after.status_code == 200
+    assert after.headers["ETag"] != etag
+
+
+def test_change_feed_returns_scoped_changes_after_cursor(client, auth_service):
+    admin = _auth_headers(auth_service, "admin")
+    start = client.get("/api/cambios", headers=admin).get_json()
+    assert start["items"] == []
+
+    superadmin = _auth_headers(auth_service, "superadmin")
+    client.put("/api/areas/101", headers=superadmin, json={"nombre": "Producción"})
+    client.put("/api/areas/102", headers=superadmin, json={"nombre": "Depósito"})
+    client.put("/api/areas/101", headers=superadmin, json={"estado": "mantenimiento"})
+
+    response = client.get(
+        f"/api/cambios?desde={start['siguiente']}", headers=admin
+    )
+    body = response.get_json()
+    assert response.status_code == 200
+    assert [(item["entidad"], item["entidadId"]) for item in body["items"]] == [
+        ("area", 101)
+    ]
+    assert body["items"][0]["datos"]["estado"] == "mantenimiento"
+    assert body["hayMas"] is False
+
+    again = client.get(f"/api/cambios?desde={body['siguiente']}", headers=admin)
+    assert again.get_json()["items"] == []
+
+
+def test_event_stream_replays_from_last_event_id(client, auth_service):
+    admin = _auth_headers(auth_service, "admin")
+    cursor = client.get("/api/cambios", headers=admin).get_json()["siguiente"]
+    superadmin = _auth_headers(auth_service, "superadmin")
+    client.put("/api/areas/102", headers=superadmin, json={"nombre": "Depósito"})
+    client.put("/api/areas/101", headers=superadmin, json={"nombre": "Producción"})
+
+    response = client.get(
+        "/api/eventos", headers={**admin, "Last-Event-ID": cursor}, buffered=False
+    )
+    chunks = iter(response.response)
+    try:
+        assert response.mimetype == "text/event-stream"
+        assert next(chunks).startswith(b"retry:")
+        replayed = next(chunks).decode()
+    finally:
+        response.close()
+
+    assert replayed.count("event: cambio") == 1
+    assert '"entidadId": 101' in replayed
+
+
+def test_export_streams_scoped_ndjson(client, auth_service):
+    response = client.get(
+        "/api/export?formato=ndjson", headers=_auth_headers(auth_service, "maquinista")
+    )
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+    assert {row["tipo"] for row in rows if row["tipo"] != "planta"} == {
+        "area",
+        "equipo",
+        "sistema",
+    }
+    assert [row["id"] for row in rows if row["tipo"] == "area"] == [101]
+    assert [row["id"] for row in rows if row["tipo"] == "equipo"] == [1001]
+
+
+def test_export_csv_has_header_and_rejects_unknown_format(client, auth_service):
+    headers = _auth_headers(auth_service, "superadmin")
+    response = client.get("/api/export?formato=csv", headers=headers)
+    lines = response.get_data(as_text=True).splitlines()
+
+    assert lines[0] == "tipo,id,nombre,estado,ubicacion,plantaId,areaId,equipoId"
+    assert len(lines) == 1 + 3 + 5 + 3 + 1
+    assert client.get("/api/export?formato=xml", headers=headers).status_code == 400
+
+
+def test_batch_create_returns_every_created_entity(client, auth_service):
+    headers = _auth_headers(auth_service, "admin")
+    response = client.post(
+        "/api/areas/101/equipos:lote",
+        headers=headers,
+        json=[{"nombre": "Bomba 1"}, {"nombre": "Bomba 2", "estado": "mantenimiento"}],
+    )
+
+    assert response.status_code == 201
+    body = response.get_json()
+    assert [item["nombre"] for item in body] == ["Bomba 1", "Bomba 2"]
+    assert {item["areaId"] for item in body} == {101}
+
+    invalid = client.post(
+        "/api/areas/101/equipos:lote", headers=headers, json=[{"nombre": ""}]
+    )
+    assert invalid.status_code == 400
+    assert "0.nombre" in invalid.get_json()["message"]
+    repeated = client.post(
+        "/api/areas/101/equipos:lote",
+        headers=headers,
+        json=[{"nombre": "Bomba"}, {"nombre": "Bomba"}],
+    )
+    assert repeated.status_code == 400
+    forbidden = client.post(
+        "/api/areas/301/equipos:lote", headers=headers, json=[{"nombre": "Bomba"}]
+    )
+    assert forbidden.status_code == 403
+
+
+def test_patch_updates_only_the_sent_fields(client, auth_service):
+    headers = _auth_headers(auth_service, "admin")
+    response = client.patch(
+        "/api/areas/101", headers=headers, json={"estado": "mantenimiento"}
+    )
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert (body["nombre"], body["estado"]) == ("Área de Producción", "mantenimiento")
+    assert client.patch("/api/areas/101", headers=headers, json={}).status_code == 400
+
+
+def test_status_cascade_returns_counts_per_level(client, auth_service):
+    headers = _auth_headers(auth_service, "admin")
+    response = client.put(
+        "/api/areas/101/estado?cascada=true",
+        headers=headers,
+        json={"estado": "mantenimiento"},
+    )
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["plantaId"] == 1
+    assert set(body["actualizados"]) == {"area", "equipo", "sistema"}
+    systems = client.get("/api/equipos/1001/sistemas", headers=headers).get_json()
+    assert {system["estado"] for system in systems} == {"mantenimiento"}
+
+    invalid = client.put(
+        "/api/plantas/1/estado?cascada=true",
+        headers=_auth_headers(auth_service, "superadmin"),
+        json={"estado": "inactiva"},
+    )
+    assert invalid.status_code == 400
+    forbidden = client.put(
+        "/api/areas/301/estado", headers=headers, json={"estado": "mantenimiento"}
+    )
+    assert forbidden.status_code == 403
+
+
+def test_import_upserts_rows_and_reports_errors_by_line(client, auth_service):
+    headers = _auth_headers(auth_service, "superadmin")
+    body = "\n".join(
+        [
+            json.dumps({"tipo": "planta", "nombre": "Planta Sur"}),
+            json.dumps({"tipo": "area", "nombre": "Secado", "planta": "Planta Sur"}),
+            "{roto",
+            json.dumps({"tipo": "area", "nombre": "Corte", "planta": "Inexistente"}),
+            json.dumps({"tipo": "equipo", "nombre": "Horno", "planta": "Planta Sur"}),
+        ]
+    )
+
+    response = client.post(
+        "/api/import", data=body, headers=headers, content_type="application/x-ndjson"
+    )
+
+    assert response.status_code == 200
+    report = response.get_json()
+    assert report["procesadas"] == 5
+    assert report["guardadas"] == {"planta": 1, "area": 1, "equipo": 0, "sistema": 0}
+    assert [error["linea"] for error in report["errores"]] == [3, 4, 5]
+    assert report["totalErrores"] == 3
+
+    csv_body = "tipo,nombre,estado,planta\narea,Secado,mantenimiento,Planta Sur\n"
+    response = client.post("/api/import?formato=csv", data=csv_body, headers=headers)
+    assert response.get_json()["guardadas"]["area"] == 1
+
+
+def test_import_requires_superadmin(client, auth_service):
+    response = client.post(
+        "/api/import", data="", headers=_auth_headers(auth_service, "admin")
+    )
+    assert response.status_code == 403
+
+
+def test_async_plant_delete_returns_job_and_hides_subtree(client, auth_service):
+    headers = _auth_headers(auth_service, "superadmin")
+
+    response = client.delete("/api/plantas/1?async=true", headers=headers)
+
+    assert response.status_code == 202
+    job = response.get_json()
+    assert job["plantaId"] == 1
+    assert response.headers["Location"].endswith(f"/api/borrados/{job['id']}")
+    assert client.get("/api/plantas/1", headers=headers).status_code == 404
+    assert client.get("/api/plantas/1/arbol", headers=headers).status_code == 404
+
+    for _ in range(100):
+        status = client.get(f"/api/borrados/{job['id']}", headers=headers).get_json()
+        if status["estado"] == "completado":
+            break
+        time.sleep(0.01)
+    assert status["eliminados"] == {"sistema": 1, "equipo": 2, "area": 2, "planta": 1}
+    assert status["finalizado"] is not None
+
+    missing = client.delete("/api/plantas/1?async=true", headers=headers)
+    assert missing.status_code == 404
+    forbidden = client.get(
+        f"/api/borrados/{job['id']}", headers=_auth_headers(auth_service, "admin")
+    )
+    assert forbidden.status_code == 403
+
+
 def test_accepts_lowercase_bearer_token(client, auth_service):
     headers = {"Authorization": f"bearer {auth_service.issue_token('admin', 'admin')}"}
 
@@ -127,6 +610,38 @@ def test_maquinista_can_manage_scoped_equipment(client, auth_service):
     assert forbidden.status_code == 403
 
 
+def test_scope_checks_use_bulk_lookups_when_available():
+    repository = InMemoryPlantRepository()
+    bulk_calls: list[set[int]] = []
+
+    def get_areas(ids):
+        bulk_calls.append(set(ids))
+        return repository.get_areas_by_ids(ids)
+
+    def fail_single_lookup(_id):  # pragma: no cover - no debe invocarse
+        raise AssertionError("lookup individual inesperado")
+
+    scope = ScopeAuthorizer(
+        get_area=fail_single_lookup,
+        get_equipment=fail_single_lookup,
+        get_system=fail_single_lookup,
+        get_areas=get_areas,
+        get_equipment_many=repository.get_equipment_by_ids,
+    )
+    admin = AuthClaims(
+        username="admin", role="administrador", areas=[101, 201, 9999], equipos=[]
+    )
+    maquinista = AuthClaims(
+        username="maquinista", role="maquinista", areas=[], equipos=[1001, 2001]
+    )
+
+    scope.ensure_can_create_area(admin, 2)
+    scoped = scope.filter_areas(maquinista, 1, repository.list_areas(1))
+
+    assert bulk_calls == [{101, 201, 9999}]
+    assert [area.id for area in scoped] == [101]
+
+
 def test_filter_areas_ignores_missing_equipment_in_claims():
     repository = InMemoryPlantRepository()
     scope = ScopeAuthorizer(
@@ -146,3 +661,75 @@ def test_filter_areas_ignores_missing_equipment_in_claims():
     scoped = scope.filter_areas(claims, 1, areas)
 
     assert {area.id for area in scoped} == {101}
+
+
+def test_verified_tokens_are_served_from_the_claims_cache():
+    service = AuthService(secret_key="test-secret", token_ttl_seconds=3600)
+    token = service.issue_token("admin", "admin")
+
+    first = service.decode_token(token)
+    second = service.decode_token(token)
+
+    assert second is first
+    assert first.areas == frozenset({101, 201})
+    stats = service.claims_cache_stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+
+def test_claims_cache_skips_invalid_tokens_and_honours_expiry():
+    service = AuthService(secret_key="test-secret", token_ttl_seconds=1)
+    token = service.issue_token("admin", "admin")
+
+    with pytest.raises(Unauthorized):
+        service.decode_token(token[:-2] + "xx")
+    service.decode_token(token)
+    time.sleep(1.1)
+
+    with pytest.raises(Unauthorized, match="Token expirado"):
+        service.decode_token(token)
+    assert service.claims_cache_stats().size == 0
+
+
+def test_claims_cache_can_be_disabled():
+    service = AuthService(secret_key="test-secret", claims_cache_size=0)
+    token = service.issue_token("admin", "admin")
+
+    assert service.decode_token(token) == service.decode_token(token)
+    assert service.claims_cache_stats() is None
+
+
+def test_demo_users_are_hashed_on_first_lookup():
+    repo = InMemoryUserRepository.with_defaults()
+
+    assert repo._users == {}
+    admin = repo.get_by_username("admin")
+
+    assert set(repo._users) == {"admin"}
+    assert repo.verify_credentials("admin", "admin") is admin
+    assert {user.username for user in repo.list_users()} == {
+        "superadmin",
+        "admin",
+        "maquinista",
+        "invitado",
+    }
+
+
+def test_demo_password_hashes_are_computed_in_the_hash_pool(monkeypatch):
+    threads = []
+
+    def recording_generate(password):
+        threads.append(threading.current_thread().name)
+        return generate_password_hash(password)
+
+    monkeypatch.setattr("src.infrastructure.user_repository._DEMO_PASSWORD_HASHES", {})
+    monkeypatch.setattr(
+        "src.infrastructure.password_hashing.generate_password_hash",
+        recording_generate,
+    )
+    service = AuthService(secret_key="test-secret")
+
+    service.issue_token("admin", "admin")
+    service.issue_token("admin", "admin")
+
+    assert len(threads) == 1
+    assert threads[0].startswith("password-hash")
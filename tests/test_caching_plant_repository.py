@@ -0,0 +1,238 @@
+"""Pruebas del decorador de caché sobre PlantDataRepository."""
+
+from __future__ import annotations
+
+from collections import Counter
+
+import pytest
+
+from src.entities.inventory import ImportRow
+from src.interface_adapters.gateways.caching_plant_repository import (
+    CachingPlantRepository,
+)
+from src.interface_adapters.gateways.in_memory_plant_repository import (
+    InMemoryPlantRepository,
+)
+
+
+class CountingRepository:
+    """Envuelve el repositorio en memoria contando las llamadas reales."""
+
+    def __init__(self) -> None:
+        self.inner = InMemoryPlantRepository()
+        self.calls: Counter[str] = Counter()
+
+    def __getattr__(self, name):
+        target = getattr(self.inner, name)
+
+        def wrapper(*args, **kwargs):
+            self.calls[name] += 1
+            return target(*args, **kwargs)
+
+        return wrapper
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def counting() -> CountingRepository:
+    return CountingRepository()
+
+
+@pytest.fixture()
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture()
+def cached(counting, clock) -> CachingPlantRepository:
+    return CachingPlantRepository(counting, ttl_seconds=10, clock=clock)
+
+
+def test_repeated_gets_hit_the_cache_until_ttl_expires(cached, counting, clock):
+    first = cached.get_area(101)
+    second = cached.get_area(101)
+    clock.now = 11
+    third = cached.get_area(101)
+
+    assert first == second == third
+    assert counting.calls["get_area"] == 2
+    assert cached.stats.hits == 1
+    assert cached.stats.misses == 2
+
+
+def test_missing_ids_are_negatively_cached_until_created(cached, counting):
+    assert cached.get_plant(4) is None
+    assert cached.get_plant(4) is None
+    assert counting.calls["get_plant"] == 1
+
+    created = cached.create_plant(name="Planta Oeste")
+
+    assert created.id == 4
+    assert cached.get_plant(4) == created
+    assert [plant.id for plant in cached.list_plants()][-1] == 4
+
+
+def test_updates_invalidate_entity_listing_and_tree(cached):
+    cached.get_equipment(1001)
+    cached.list_equipment(101)
+    cached.get_area(101)
+    cached.get_plant_tree(1)
+
+    cached.update_equipment(1001, name="Compresor renovado")
+
+    assert cached.get_equipment(1001).name == "Compresor renovado"
+    assert cached.list_equipment(101)[0].name == "Compresor renovado"
+    tree = cached.get_plant_tree(1)
+    assert tree.areas[0].equipment[0].equipment.name == "Compresor renovado"
+
+
+def test_delete_plant_drops_cascaded_descendants(cached):
+    assert cached.get_area(101) is not None
+    assert cached.get_equipment(1001) is not None
+    assert cached.get_system(5001) is not None
+    assert len(cached.list_systems(1001)) == 1
+
+    assert cached.delete_plant(1) is True
+
+    assert cached.get_area(101) is None
+    assert cached.get_equipment(1001) is None
+    assert cached.get_system(5001) is None
+    assert cached.list_systems(1001) == []
+    assert cached.get_plant_tree(1) is None
+
+
+def test_delete_area_drops_descendants_without_loading_the_tree(cached, counting):
+    assert cached.get_equipment(1001) is not None
+    assert cached.get_system(5001) is not None
+    assert cached.get_plant_tree(1) is not None
+    counting.calls.clear()
+
+    assert cached.delete_area(101) is True
+
+    assert counting.calls["get_plant_tree"] == 0
+    assert cached.get_equipment(1001) is None
+    assert cached.get_system(5001) is None
+    assert [node.area.id for node in cached.get_plant_tree(1).areas] == [102]
+
+
+def test_writes_in_a_unit_of_work_are_forgotten_after_commit(counting, clock):
+    pending = []
+    cached = CachingPlantRepository(
+        counting,
+        ttl_seconds=10,
+        clock=clock,
+        after_commit=lambda _session, callback: pending.append(callback),
+    )
+    cached.get_area(101)
+
+    cached.update_area(101, name="Producción 2", session=object())
+    # Antes del commit, otro lector todavía debe ver (y cachear) lo confirmado.
+    assert cached.get_area(101).name != "Producción 2"
+
+    for callback in pending:
+        callback()
+    assert cached.get_area(101).name == "Producción 2"
+
+
+def test_reads_after_an_import_see_the_imported_rows(cached):
+    assert [area.name for area in cached.list_areas(1)] == [
+        "Área de Producción",
+        "Área de Almacenamiento",
+    ]
+    assert cached.get_plant(4) is None
+
+    errors = cached.upsert_rows(
+        [
+            ImportRow(1, "planta", "Planta Oeste", "operativa", location="Oeste"),
+            ImportRow(2, "area", "Área Nueva", "operativa", plant_name="Planta Norte"),
+        ]
+    )
+
+    assert errors == []
+    assert "Área Nueva" in [area.name for area in cached.list_areas(1)]
+    assert cached.get_plant(4).name == "Planta Oeste"
+    assert len(cached.list_plants()) == 4
+
+
+def test_delete_equipment_forgets_its_systems_without_listing_them(
+    cached, counting
+):
+    assert cached.get_system(5001) is not None
+    assert 1001 in [item.id for item in cached.list_equipment(101)]
+    counting.calls.clear()
+
+    assert cached.delete_equipment(1001) is True
+
+    assert counting.calls["list_systems"] == 0
+    assert cached.get_system(5001) is None
+    assert cached.get_equipment(1001) is None
+    assert 1001 not in [item.id for item in cached.list_equipment(101)]
+
+
+def test_hide_plant_drops_the_whole_plant_subtree(cached):
+    assert cached.get_system(5001) is not None
+    assert len(cached.list_plants()) == 3
+
+    job = cached.hide_plant(1)
+
+    assert job.plant_id == 1
+    assert cached.get_system(5001) is None
+    assert cached.get_plant_tree(1) is None
+    assert [plant.id for plant in cached.list_plants()] == [2, 3]
+    assert cached.purge_plant_batch(job.id, batch_size=10).deleted == {
+        "sistema": 1,
+        "equipo": 2,
+        "area": 2,
+        "planta": 1,
+    }
+
+
+def test_status_cascade_drops_the_whole_plant_subtree(cached):
+    assert cached.get_system(5001).status == "operativo"
+    cached.get_plant_tree(1)
+
+    result = cached.set_plant_status(
+        1, {"planta": "mantenimiento", "sistema": "mantenimiento"}
+    )
+
+    assert result.updated["sistema"] >= 1
+    assert cached.get_system(5001).status == "mantenimiento"
+    assert cached.get_plant_tree(1).plant.status == "mantenimiento"
+
+
+def test_bulk_lookup_only_fetches_uncached_ids(cached, counting):
+    cached.get_area(101)
+
+    found = cached.get_areas_by_ids([101, 201, 9999])
+    again = cached.get_areas_by_ids([101, 201, 9999])
+
+    assert {area.id for area in found} == {101, 201}
+    assert {area.id for area in again} == {101, 201}
+    assert counting.calls["get_areas_by_ids"] == 1
+
+
+def test_calls_with_explicit_session_bypass_cache(cached, counting):
+    cached.get_area(101, session=object())
+    cached.get_area(101, session=object())
+
+    assert counting.calls["get_area"] == 2
+    assert cached.stats.size == 0
+
+
+def test_lru_bound_evicts_oldest_entries(counting, clock):
+    cached = CachingPlantRepository(counting, max_entries=2, clock=clock)
+
+    cached.get_plant(1)
+    cached.get_plant(2)
+    cached.get_plant(3)
+    cached.get_plant(1)
+
+    assert counting.calls["get_plant"] == 4
+    assert cached.stats.evictions == 2
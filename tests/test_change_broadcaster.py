@@ -0,0 +1,88 @@
+"""Reparto de cambios a suscriptores del stream de eventos."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+from src.infrastructure.fastapi.events import _listen, _receive
+from src.interface_adapters.gateways.change_broadcaster import ChangeBroadcaster
+from src.interface_adapters.gateways.in_memory_plant_repository import (
+    InMemoryPlantRepository,
+)
+
+
+def test_poll_fans_out_only_new_changes():
+    repository = InMemoryPlantRepository()
+    repository.update_area(101, name="Antes de suscribir")
+    broadcaster = ChangeBroadcaster(repository, poll_seconds=60)
+    first = broadcaster.subscribe(None)
+    second = broadcaster.subscribe(None)
+
+    repository.update_area(101, name="Producción")
+    repository.update_equipment(1001, status="mantenimiento")
+    assert broadcaster.poll_once() == 2
+
+    for subscription in (first, second):
+        changes = subscription.receive(timeout=0)
+        assert [(c.entity_type, c.entity_id) for c in changes] == [
+            ("area", 101),
+            ("equipo", 1001),
+        ]
+    broadcaster.unsubscribe(first)
+    broadcaster.unsubscribe(second)
+
+
+def test_slow_subscriber_overflows_without_blocking_others():
+    repository = InMemoryPlantRepository()
+    broadcaster = ChangeBroadcaster(repository, poll_seconds=60, queue_size=2)
+    slow = broadcaster.subscribe(None)
+
+    for name in ("A", "B", "C"):
+        repository.update_plant(1, name=f"Planta {name}")
+    broadcaster.poll_once()
+
+    assert slow.overflowed
+    assert len(slow.receive(timeout=0)) == 2
+    slow.resume()
+    assert not slow.overflowed
+    broadcaster.unsubscribe(slow)
+
+
+def test_subscribe_rejects_clients_over_capacity():
+    broadcaster = ChangeBroadcaster(
+        InMemoryPlantRepository(), poll_seconds=60, max_subscribers=1
+    )
+    subscription = broadcaster.subscribe(None)
+
+    assert broadcaster.subscribe(None) is None
+    broadcaster.unsubscribe(subscription)
+    assert broadcaster.subscriber_count == 0
+
+
+def test_async_consumer_waits_without_polling_and_wakes_on_new_changes():
+    repository = InMemoryPlantRepository()
+    broadcaster = ChangeBroadcaster(repository, poll_seconds=60)
+    subscription = broadcaster.subscribe(None)
+
+    def write() -> None:
+        repository.update_area(101, name="Producción")
+        broadcaster.wake()
+
+    async def scenario():
+        ready = _listen(subscription)
+        idle = await _receive(subscription, ready, 0.05)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        loop.call_later(0.05, threading.Thread(target=write).start)
+        changes = await _receive(subscription, ready, 5)
+        return idle, changes, loop.time() - started
+
+    try:
+        idle, changes, elapsed = asyncio.run(scenario())
+    finally:
+        broadcaster.unsubscribe(subscription)
+
+    assert idle == []
+    assert [(c.entity_type, c.entity_id) for c in changes] == [("area", 101)]
+    assert elapsed < 1
@@ -0,0 +1,96 @@
+"""Señal de invalidación entre workers mediante `entity_versions`."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.sqlalchemy import Base
+from src.infrastructure.sqlalchemy.change_watcher import PlantVersionWatcher
+from src.infrastructure.sqlalchemy.plant_repository import SqlAlchemyPlantRepository
+from src.infrastructure.sqlalchemy.unit_of_work import SqlAlchemyUnitOfWork
+from src.interface_adapters.gateways.caching_plant_repository import (
+    CachingPlantRepository,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'versions.db'}", future=True)
+    Base.metadata.create_all(engine)
+    try:
+        yield sessionmaker(engine, expire_on_commit=False, future=True)
+    finally:
+        engine.dispose()
+
+
+def test_watcher_reports_changed_plant_subtrees(session_factory):
+    clock = FakeClock()
+    repo = SqlAlchemyPlantRepository(session_factory)
+    watcher = PlantVersionWatcher(session_factory, min_interval_seconds=1, clock=clock)
+    north = repo.create_plant(name="Norte")
+    south = repo.create_plant(name="Sur")
+    area = repo.create_area(north.id, name="Área")
+    equipment = repo.create_equipment(area.id, name="Equipo")
+
+    assert watcher.poll() == set()
+
+    clock.now = 2
+    repo.create_system(equipment.id, name="Sistema")
+    assert watcher.poll() == {north.id}
+
+    clock.now = 2.5
+    repo.update_plant(south.id, name="Sur 2")
+    assert watcher.poll() == set()
+
+    clock.now = 4
+    assert watcher.poll() == {south.id}
+
+    clock.now = 6
+    repo.delete_plant(north.id)
+    assert watcher.poll() == {north.id}
+
+
+def test_version_bump_rolls_back_with_the_unit_of_work(session_factory):
+    clock = FakeClock()
+    repo = SqlAlchemyPlantRepository(session_factory)
+    watcher = PlantVersionWatcher(session_factory, min_interval_seconds=0, clock=clock)
+    plant = repo.create_plant(name="Norte")
+    watcher.poll()
+
+    with SqlAlchemyUnitOfWork(session_factory) as uow:
+        repo.update_plant(plant.id, name="Temporal", session=uow.session)
+        uow.rollback()
+
+    assert watcher.poll() == set()
+
+
+def test_other_worker_writes_invalidate_local_cache(session_factory):
+    clock = FakeClock()
+    worker_a = CachingPlantRepository(SqlAlchemyPlantRepository(session_factory))
+    worker_b = SqlAlchemyPlantRepository(session_factory)
+    watcher = PlantVersionWatcher(session_factory, min_interval_seconds=0, clock=clock)
+    north = worker_b.create_plant(name="Norte")
+    south = worker_b.create_plant(name="Sur")
+    area = worker_b.create_area(north.id, name="Área")
+    watcher.poll()
+
+    assert worker_a.get_area(area.id).name == "Área"
+    assert worker_a.get_plant(south.id).name == "Sur"
+
+    worker_b.update_area(area.id, name="Área remota")
+    worker_a.invalidate_plants(watcher.poll())
+
+    assert worker_a.get_area(area.id).name == "Área remota"
+    assert worker_a.stats.hits == 0
+    worker_a.get_plant(south.id)
+    assert worker_a.stats.hits == 1
@@ -2,6 +2,7 @@ import unittest
 
 from src.entities.area import Area
 from src.entities.equipment import Equipment
+from src.entities.status_cascade import cascade_statuses
 from src.entities.system import System
 
 
@@ -46,5 +47,26 @@ class EntityRenameValidationTestCase(unittest.TestCase):
             system.rename("\t")
 
 
+
+class StatusCascadeTestCase(unittest.TestCase):
+    def test_cascade_uses_each_level_spelling(self) -> None:
+        self.assertEqual(
+            cascade_statuses("area", "operativa"),
+            {"area": "operativa", "equipo": "operativo", "sistema": "operativo"},
+        )
+
+    def test_without_cascade_only_the_root_level_is_returned(self) -> None:
+        self.assertEqual(
+            cascade_statuses("planta", "inactiva", cascade=False),
+            {"planta": "inactiva"},
+        )
+
+    def test_rejects_statuses_without_equivalent_below(self) -> None:
+        with self.assertRaises(ValueError):
+            cascade_statuses("planta", "inactiva")
+        with self.assertRaises(ValueError):
+            cascade_statuses("equipo", "operativa")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,286 @@
+"""Paridad entre el front end FastAPI y los blueprints Flask."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from flask import Flask
+from werkzeug.exceptions import HTTPException
+
+from src.infrastructure.fastapi.error_handlers import register_error_handlers
+from src.infrastructure.fastapi.middleware import (
+    CorsMiddleware,
+    ProxyHeadersMiddleware,
+)
+from src.infrastructure.fastapi.routes import build_router
+from src.infrastructure.http.auth import AuthService
+from src.infrastructure.flask.error_handlers import (
+    handle_http_exception,
+    handle_unexpected_exception,
+)
+from src.infrastructure.flask.routes import build_blueprint
+from src.interface_adapters.gateways.in_memory_plant_repository import (
+    InMemoryPlantRepository,
+)
+from src.shared.config import get_trusted_proxy_hops
+
+SECRET = "parity-secret-key-of-at-least-32-bytes"
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+class DummyUnitOfWork:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def commit(self):  # pragma: no cover - no-op en memoria
+        return None
+
+    def rollback(self):  # pragma: no cover - no-op en memoria
+        return None
+
+    @property
+    def session(self):  # pragma: no cover - no session para repos en memoria
+        return None
+
+
+class _FlaskClient:
+    def __init__(self) -> None:
+        app = Flask(__name__)
+        app.register_blueprint(
+            build_blueprint(
+                InMemoryPlantRepository(),
+                DummyUnitOfWork,
+                auth_service=AuthService(secret_key=SECRET),
+            )
+        )
+        app.register_error_handler(HTTPException, handle_http_exception)
+        app.register_error_handler(Exception, handle_unexpected_exception)
+        self.client = app.test_client()
+
+    def request(self, method, path, *, headers=None, json_body=None, data=None):
+        response = self.client.open(
+            path, method=method, headers=headers or {}, json=json_body, data=data
+        )
+        return response.status_code, response.headers, response.get_data()
+
+
+class _FastAPIClient:
+    def __init__(self) -> None:
+        app = FastAPI()
+        app.include_router(
+            build_router(
+                InMemoryPlantRepository(),
+                DummyUnitOfWork,
+                auth_service=AuthService(secret_key=SECRET),
+            )
+        )
+        register_error_handlers(app)
+        app.add_middleware(CorsMiddleware, cors_origins=["*"])
+        self.client = TestClient(app, raise_server_exceptions=False)
+
+    def request(self, method, path, *, headers=None, json_body=None, data=None):
+        response = self.client.request(
+            method, path, headers=headers or {}, json=json_body, content=data
+        )
+        return response.status_code, response.headers, response.content
+
+
+@pytest.fixture()
+def clients():
+    return _FlaskClient(), _FastAPIClient()
+
+
+def _token(username: str) -> dict[str, str]:
+    token = AuthService(secret_key=SECRET).issue_token(username, username)
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _same(clients, method, path, **kwargs):
+    flask_client, fastapi_client = clients
+    flask_status, flask_headers, flask_body = flask_client.request(method, path, **kwargs)
+    api_status, api_headers, api_body = fastapi_client.request(method, path, **kwargs)
+
+    assert api_status == flask_status, (method, path, flask_body, api_body)
+    if flask_body:
+        if flask_headers.get("Content-Type", "").startswith("application/json"):
+            assert json.loads(api_body) == json.loads(flask_body), (method, path)
+        else:
+            assert api_body == flask_body, (method, path)
+    return flask_status, flask_headers, api_headers, flask_body
+
+
+def test_crud_sequence_matches_flask(clients):
+    admin = _token("superadmin")
+    _same(clients, "GET", "/api/plantas", headers=admin)
+    _same(clients, "GET", "/api/plantas?limit=1", headers=admin)
+    _same(clients, "GET", "/api/plantas/1/arbol", headers=admin)
+    _same(
+        clients,
+        "POST",
+        "/api/plantas",
+        headers=admin,
+        json_body={"nombre": "Planta Sur", "ubicacion": "Rosario"},
+    )
+    _same(
+        clients,
+        "PATCH",
+        "/api/plantas/1",
+        headers=admin,
+        json_body={"ubicacion": "Córdoba"},
+    )
+    _same(clients, "GET", "/api/plantas/1/areas", headers=admin)
+    _same(clients, "DELETE", "/api/sistemas/5001", headers=admin)
+    _same(clients, "GET", "/api/equipos/1001/sistemas", headers=admin)
+    _same(clients, "GET", "/api/cambios", headers=admin)
+
+
+def test_errors_match_flask(clients):
+    admin = _token("superadmin")
+    status, *_ = _same(clients, "GET", "/api/plantas")
+    assert status == 401
+    _same(clients, "GET", "/api/plantas", headers={"Authorization": "Bearer x.y.z"})
+    _same(clients, "GET", "/api/plantas/999", headers=admin)
+    _same(clients, "GET", "/api/plantas?limit=abc", headers=admin)
+    _same(clients, "POST", "/api/plantas", headers=admin, json_body={"nombre": ""})
+    _same(
+        clients,
+        "POST",
+        "/api/plantas",
+        headers={**admin, "Content-Type": "text/plain"},
+        data=b"hola",
+    )
+    status, *_ = _same(
+        clients,
+        "POST",
+        "/api/plantas",
+        headers=_token("admin"),
+        json_body={"nombre": "Otra"},
+    )
+    assert status == 403
+    _same(clients, "GET", "/api/no-existe", headers=admin)
+    _same(clients, "PUT", "/api/plantas", headers=admin, json_body={})
+
+
+def test_etag_and_not_modified_match_flask(clients):
+    admin = _token("superadmin")
+    status, flask_headers, api_headers, _ = _same(
+        clients, "GET", "/api/plantas/1", headers=admin
+    )
+    assert status == 200
+    etag = flask_headers["ETag"]
+    assert api_headers["ETag"] == etag
+    assert api_headers["Cache-Control"] == flask_headers["Cache-Control"]
+
+    status, *_ = _same(
+        clients, "GET", "/api/plantas/1", headers={**admin, "If-None-Match": etag}
+    )
+    assert status == 304
+
+
+def test_async_delete_points_to_the_same_job(clients):
+    admin = _token("superadmin")
+    flask_client, fastapi_client = clients
+    path = "/api/plantas/2?async=true"
+    flask_status, flask_headers, flask_body = flask_client.request(
+        "DELETE", path, headers=admin
+    )
+    api_status, api_headers, api_body = fastapi_client.request(
+        "DELETE", path, headers=admin
+    )
+
+    assert flask_status == api_status == 202
+    assert api_headers["Location"].endswith(flask_headers["Location"])
+    flask_job, api_job = json.loads(flask_body), json.loads(api_body)
+    flask_job.pop("creado")
+    api_job.pop("creado")
+    assert api_job == flask_job
+
+
+def test_export_and_import_match_flask(clients):
+    admin = _token("superadmin")
+    _same(clients, "GET", "/api/export", headers=admin)
+    _same(clients, "GET", "/api/export?formato=csv", headers=admin)
+    _same(clients, "GET", "/api/export?formato=xml", headers=admin)
+
+    rows = (
+        b'{"tipo": "planta", "planta": "Planta Oeste", "nombre": "Planta Oeste"}\n'
+        b"no es json\n"
+    )
+    _same(
+        clients,
+        "POST",
+        "/api/import",
+        headers={**admin, "Content-Type": "application/x-ndjson"},
+        data=rows,
+    )
+    _same(clients, "GET", "/api/plantas", headers=admin)
+
+
+def test_options_preflight_gets_cors_headers():
+    response = _FastAPIClient().client.options(
+        "/api/plantas", headers={"Origin": "https://example.com"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["Access-Control-Allow-Origin"] == "*"
+    assert "PATCH" in response.headers["Access-Control-Allow-Methods"]
+
+
+def test_proxy_headers_use_the_trusted_hop(monkeypatch):
+    seen = []
+
+    async def app(scope, receive, send):
+        seen.append((scope["client"][0], scope["scheme"]))
+        await send({"type": "http.response.start", "status": 204, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    client = TestClient(ProxyHeadersMiddleware(app, hops=1))
+    client.get(
+        "/",
+        headers={
+            "X-Forwarded-For": "203.0.113.9, 198.51.100.7",
+            "X-Forwarded-Proto": "https",
+        },
+    )
+    client.get("/")
+
+    # Sólo cuenta el valor que agregó el proxy de confianza, no el del cliente.
+    assert seen == [("198.51.100.7", "https"), ("testclient", "http")]
+
+    monkeypatch.setenv("TRUSTED_PROXY_HOPS", "2")
+    assert get_trusted_proxy_hops() == 2
+    monkeypatch.delenv("TRUSTED_PROXY_HOPS")
+    assert get_trusted_proxy_hops() == 0
+
+
+def test_fastapi_front_end_does_not_import_flask():
+    script = textwrap.dedent(
+        """
+        import sys
+        import src.infrastructure.fastapi.app
+
+        print(sorted(
+            name for name in sys.modules
+            if name == "flask" or name.startswith(("flask.", "src.infrastructure.flask"))
+        ))
+        """
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "[]"
@@ -2,7 +2,7 @@ from flask import Flask
 from werkzeug.exceptions import HTTPException
 
 from src.infrastructure.flask.routes import build_blueprint
-from src.infrastructure.flask.auth import AuthService, ScopeAuthorizer
+from src.infrastructure.http.auth import AuthService, ScopeAuthorizer
 from src.infrastructure.flask.error_handlers import (
     handle_http_exception,
     handle_unexpected_exception,
@@ -37,6 +37,9 @@ class BaseRepository:
     def get_plant(self, plant_id, *, session=None):
         return None
 
+    def get_plant_versions(self, plant_ids=None, *, session=None):
+        return {}
+
     def create_plant(self, *, name, location=None, status=None, session=None):
         raise NotImplementedError
 
@@ -99,6 +102,11 @@ class ErroringRepository(BaseRepository):
         raise RuntimeError("boom")
 
 
+class ErroringRevisionRepository(BaseRepository):
+    def get_plant_versions(self, plant_ids=None, *, session=None):
+        raise RuntimeError("boom")
+
+
 class OKRepository(BaseRepository):
     pass
 
@@ -151,4 +159,17 @@ def test_unexpected_error_returns_internal_server_error_message():
     response = client.get("/api/plantas", headers=headers)
 
     assert response.status_code == 500
-    assert response.get_json() == {"message": "Internal server error"}
+    assert response.get_json() == {"message": "Error interno del servidor"}
+
+
+def test_revision_lookup_error_returns_internal_server_error_message():
+    app = build_app(ErroringRevisionRepository())
+    client = app.test_client()
+    headers = {
+        "Authorization": f"Bearer {app.config['auth_service'].issue_token('superadmin', 'superadmin')}"
+    }
+
+    response = client.get("/api/plantas", headers=headers)
+
+    assert response.status_code == 500
+    assert response.get_json() == {"message": "Error interno del servidor"}
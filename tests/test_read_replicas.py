@@ -0,0 +1,107 @@
+"""Ruteo de lecturas a réplicas con dos archivos SQLite (primario y réplica)."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine, insert
+
+from src.infrastructure.sqlalchemy import (
+    Base,
+    PlantModel,
+    SqlAlchemyPlantRepository,
+    SqlAlchemyUnitOfWork,
+)
+from src.infrastructure.sqlalchemy.session import ReplicaSet, build_session_factory
+
+
+def _engine(path, plant_name):
+    engine = create_engine(f"sqlite+pysqlite:///{path}", future=True)
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(insert(PlantModel).values(name=plant_name))
+    return engine
+
+
+@pytest.fixture()
+def primary(tmp_path):
+    engine = _engine(tmp_path / "primary.db", "Primaria")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture()
+def replica(tmp_path):
+    engine = _engine(tmp_path / "replica.db", "Réplica")
+    yield engine
+    engine.dispose()
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _names(plants):
+    return sorted(plant.name for plant in plants)
+
+
+def test_reads_go_to_the_replica_and_units_of_work_to_the_primary(primary, replica):
+    session_factory = build_session_factory(primary, replicas=ReplicaSet([replica]))
+    repo = SqlAlchemyPlantRepository(session_factory)
+
+    assert _names(repo.list_plants()) == ["Réplica"]
+
+    with SqlAlchemyUnitOfWork(session_factory) as uow:
+        assert _names(repo.list_plants(session=uow.session)) == ["Primaria"]
+        repo.create_plant(name="Nueva", session=uow.session)
+
+    assert _names(repo.list_plants()) == ["Réplica"]
+
+
+def test_reads_after_a_write_stick_to_the_primary(primary, replica):
+    session_factory = build_session_factory(primary, replicas=ReplicaSet([replica]))
+    request_session = session_factory()
+    repo = SqlAlchemyPlantRepository(
+        session_factory, current_session=lambda: request_session
+    )
+    try:
+        assert _names(repo.list_plants()) == ["Réplica"]
+
+        repo.create_plant(name="Nueva")
+
+        assert _names(repo.list_plants()) == ["Nueva", "Primaria"]
+    finally:
+        request_session.close()
+
+
+def test_unhealthy_replicas_leave_the_rotation_until_they_recover(
+    primary, replica, tmp_path
+):
+    down = create_engine(
+        f"sqlite+pysqlite:///{tmp_path / 'missing' / 'replica.db'}", future=True
+    )
+    clock = FakeClock()
+    replicas = ReplicaSet([down, replica], check_interval_seconds=5, clock=clock)
+
+    assert replicas.choose() is replica
+    assert replicas.healthy == [replica]
+    assert {replicas.choose() for _ in range(3)} == {replica}
+
+    repo = SqlAlchemyPlantRepository(
+        build_session_factory(primary, replicas=ReplicaSet([down]))
+    )
+    assert _names(repo.list_plants()) == ["Primaria"]
+
+    (tmp_path / "missing").mkdir()
+    Base.metadata.create_all(down)
+    clock.now = 4
+    assert replicas.healthy == [replica]
+    replicas.choose()
+    assert replicas.healthy == [replica]
+    clock.now = 6
+    replicas.choose()
+    assert replicas.healthy == [down, replica]
+    down.dispose()
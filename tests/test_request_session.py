@@ -0,0 +1,89 @@
+"""Una petición HTTP debe reutilizar una sola sesión y conexión de base."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from flask import Flask
+from flask_jwt_extended import JWTManager
+from sqlalchemy import create_engine, event
+
+from src.infrastructure.http.auth import AuthService
+from src.infrastructure.flask.db_session import RequestSessionScope
+from src.infrastructure.flask.routes import build_blueprint
+from src.infrastructure.sqlalchemy import (
+    Base,
+    SqlAlchemyPlantRepository,
+    SqlAlchemyUnitOfWork,
+)
+from src.infrastructure.sqlalchemy.session import build_session_factory
+
+
+@pytest.fixture()
+def engine(tmp_path):
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'request.db'}", future=True)
+    Base.metadata.create_all(engine)
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+@pytest.fixture()
+def app(engine) -> Flask:
+    session_factory = build_session_factory(engine)
+    request_sessions = RequestSessionScope(session_factory)
+    repository = SqlAlchemyPlantRepository(
+        session_factory, current_session=request_sessions.current
+    )
+    auth_service = AuthService(secret_key="request-session-secret")
+
+    app = Flask("request-session")
+    app.config["JWT_SECRET_KEY"] = auth_service.secret_key
+    app.config["JWT_ACCESS_TOKEN_EXPIRES"] = timedelta(seconds=3600)
+    app.config["auth_service"] = auth_service
+    app.config["repository"] = repository
+    JWTManager(app)
+    request_sessions.init_app(app)
+    app.register_blueprint(
+        build_blueprint(
+            repository,
+            lambda: SqlAlchemyUnitOfWork(
+                session_factory, current_session=request_sessions.current
+            ),
+            auth_service=auth_service,
+        )
+    )
+    return app
+
+
+def _headers(app: Flask) -> dict[str, str]:
+    with app.app_context():
+        token = app.config["auth_service"].issue_token("superadmin", "superadmin")
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_mutating_request_checks_out_a_single_connection(app, engine):
+    repository: SqlAlchemyPlantRepository = app.config["repository"]
+    plant = repository.create_plant(name="Planta")
+    area = repository.create_area(plant.id, name="Área")
+    equipment = repository.create_equipment(area.id, name="Equipo")
+    headers = _headers(app)
+    client = app.test_client()
+
+    checkouts: list[object] = []
+    event.listen(engine, "checkout", lambda *args: checkouts.append(args))
+    update = client.put(
+        f"/api/equipos/{equipment.id}", headers=headers, json={"nombre": "Equipo 2"}
+    )
+    update_checkouts = len(checkouts)
+    create = client.post(
+        f"/api/plantas/{plant.id}/areas", headers=headers, json={"nombre": "Nueva"}
+    )
+
+    assert update.status_code == 200
+    assert update_checkouts == 1
+    assert create.status_code == 201
+    assert len(checkouts) == 2
+    assert repository.get_equipment(equipment.id).name == "Equipo 2"
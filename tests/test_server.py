@@ -0,0 +1,277 @@
+"""Servidor de producción: hilos acotados, workers pre-forkeados y apagado."""
+
+from __future__ import annotations
+
+import http.client
+import os
+import signal
+import socket
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from flask import Flask
+from flask_jwt_extended import JWTManager
+
+from src.infrastructure.http.auth import AuthService
+from src.infrastructure.flask.routes import build_blueprint
+from src.infrastructure.flask.server import ThreadPoolWSGIServer
+from src.infrastructure.sqlalchemy.config import DBConfig
+from src.interface_adapters.gateways.in_memory_plant_repository import (
+    InMemoryPlantRepository,
+)
+from src.shared import config
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _get(port: int, path: str = "/") -> tuple[int, str]:
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    try:
+        connection.request("GET", path)
+        response = connection.getresponse()
+        return response.status, response.read().decode()
+    finally:
+        connection.close()
+
+
+def _free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def test_thread_pool_server_bounds_concurrent_requests():
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def app(environ, start_response):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.1)
+        with lock:
+            running -= 1
+        start_response("200 OK", [("Content-Type", "text/plain")])
+        return [b"ok"]
+
+    server = ThreadPoolWSGIServer("127.0.0.1", 0, app, threads=2)
+    serving = threading.Thread(target=server.serve_forever, daemon=True)
+    serving.start()
+    try:
+        results: list[int] = []
+        clients = [
+            threading.Thread(target=lambda: results.append(_get(server.port)[0]))
+            for _ in range(6)
+        ]
+        for client in clients:
+            client.start()
+        for client in clients:
+            client.join(10)
+    finally:
+        server.shutdown()
+        serving.join(5)
+        server.server_close()
+
+    assert results == [200] * 6
+    assert peak == 2
+    assert server.wait_for_requests(5)
+
+
+class _NoUnitOfWork:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+def _open_event_stream(port: int, token: str) -> socket.socket:
+    stream = socket.create_connection(("127.0.0.1", port), timeout=10)
+    stream.sendall(
+        (
+            "GET /api/eventos HTTP/1.1\r\n"
+            "Host: 127.0.0.1\r\n"
+            f"Authorization: Bearer {token}\r\n\r\n"
+        ).encode()
+    )
+    received = b""
+    while b"retry:" not in received:
+        chunk = stream.recv(4096)
+        assert chunk, "el stream cerró antes de empezar"
+        received += chunk
+    return stream
+
+
+def test_event_streams_do_not_starve_rest_requests():
+    auth_service = AuthService(secret_key="test-secret", token_ttl_seconds=3600)
+    app = Flask(__name__)
+    app.config["JWT_SECRET_KEY"] = auth_service.secret_key
+    JWTManager(app)
+    app.register_blueprint(
+        build_blueprint(
+            InMemoryPlantRepository(),
+            _NoUnitOfWork,
+            auth_service=auth_service,
+            event_heartbeat_seconds=60,
+        )
+    )
+    with app.app_context():
+        token = auth_service.issue_token("admin", "admin")
+
+    server = ThreadPoolWSGIServer("127.0.0.1", 0, app, threads=1)
+    serving = threading.Thread(target=server.serve_forever, daemon=True)
+    serving.start()
+    streams: list[socket.socket] = []
+    try:
+        streams = [_open_event_stream(server.port, token) for _ in range(3)]
+
+        connection = http.client.HTTPConnection("127.0.0.1", server.port, timeout=10)
+        try:
+            connection.request(
+                "GET", "/api/plantas", headers={"Authorization": f"Bearer {token}"}
+            )
+            response = connection.getresponse()
+            response.read()
+        finally:
+            connection.close()
+        assert response.status == 200
+    finally:
+        server.shutdown()
+        serving.join(5)
+        started = time.monotonic()
+        server.server_close()
+        assert server.wait_for_requests(5)
+        for stream in streams:
+            stream.close()
+
+    # Los streams cierran al apagar, sin esperar al próximo heartbeat.
+    assert time.monotonic() - started < 5
+
+
+_PREFORK_SCRIPT = textwrap.dedent(
+    """
+    import os, sys
+    from src.infrastructure.flask.server import serve
+
+    def app_factory():
+        parent = os.getppid()
+
+        def app(environ, start_response):
+            start_response("200 OK", [("Content-Type", "text/plain")])
+            return [f"{os.getpid()} {parent}".encode()]
+
+        return app
+
+    serve(
+        app_factory,
+        host="127.0.0.1",
+        port=int(sys.argv[1]),
+        workers=2,
+        threads=2,
+        reuse_port=sys.argv[2] == "1",
+        graceful_timeout=5,
+    )
+    """
+)
+
+
+def _worker_pids(port: int, expected: int, timeout: float = 10.0) -> set[int]:
+    seen: set[int] = set()
+    deadline = time.monotonic() + timeout
+    while len(seen) < expected and time.monotonic() < deadline:
+        try:
+            _, body = _get(port)
+        except OSError:
+            time.sleep(0.05)
+            continue
+        seen.add(int(body.split()[0]))
+    return seen
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requiere os.fork")
+@pytest.mark.parametrize("reuse_port", [True, False])
+def test_prefork_workers_are_replaced_and_stop_gracefully(reuse_port):
+    if reuse_port and not hasattr(socket, "SO_REUSEPORT"):
+        pytest.skip("sin SO_REUSEPORT")
+    port = _free_port()
+    master = subprocess.Popen(
+        [sys.executable, "-c", _PREFORK_SCRIPT, str(port), "1" if reuse_port else "0"],
+        cwd=PROJECT_ROOT,
+    )
+    try:
+        workers = _worker_pids(port, expected=2)
+        assert len(workers) == 2
+        assert master.pid not in workers
+
+        victim = next(iter(workers))
+        os.kill(victim, signal.SIGKILL)
+        replaced = set()
+        deadline = time.monotonic() + 10
+        while not replaced and time.monotonic() < deadline:
+            replaced = _worker_pids(port, expected=2, timeout=1) - workers
+
+        assert replaced
+
+        master.send_signal(signal.SIGTERM)
+        assert master.wait(timeout=10) == 0
+    finally:
+        if master.poll() is None:
+            master.kill()
+            master.wait()
+
+
+def test_db_pool_is_trimmed_to_the_worker_threads():
+    base = DBConfig(pool_size=20, max_overflow=30)
+
+    small = base.for_worker(4)
+    assert (small.pool_size, small.max_overflow) == (6, 0)
+
+    roomy = DBConfig(pool_size=5, max_overflow=10).for_worker(8)
+    assert (roomy.pool_size, roomy.max_overflow) == (5, 5)
+    assert roomy.host == base.host
+
+
+def test_server_config_reads_workers_and_threads(monkeypatch):
+    monkeypatch.setenv("SERVER_WORKERS", "3")
+    monkeypatch.setenv("SERVER_THREADS", "16")
+    monkeypatch.setenv("SERVER_REUSE_PORT", "false")
+    monkeypatch.delenv("SERVER_PORT", raising=False)
+    monkeypatch.setenv("FLASK_PORT", "5000")
+
+    values = config.get_server_config()
+
+    assert values["workers"] == 3
+    assert values["threads"] == 16
+    assert values["reuse_port"] is False
+    assert values["port"] == 5000
+
+    monkeypatch.setenv("SERVER_THREADS", "muchos")
+    with pytest.raises(RuntimeError):
+        config.get_server_config()
+
+
+def test_importing_the_app_module_has_no_side_effects():
+    script = textwrap.dedent(
+        """
+        import sys
+        import src.infrastructure.flask.app as module
+
+        print(hasattr(module, "app"), "sqlalchemy.dialects.postgresql" in sys.modules)
+        """
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        cwd=PROJECT_ROOT,
+        check=True,
+    )
+
+    assert result.stdout.split() == ["False", "False"]
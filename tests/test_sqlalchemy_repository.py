@@ -1,10 +1,28 @@
+from datetime import datetime, timedelta
+
 import pytest
-from sqlalchemy import create_engine, func, select
+from sqlalchemy import create_engine, event, func, select
 from sqlalchemy.orm import Session, sessionmaker
 
+from src.entities.change import utc_now
+from src.entities.inventory import ImportRow, ImportRowError, InventoryScope
+from src.entities.status_cascade import cascade_statuses
 from src.infrastructure.sqlalchemy import Base
-from src.infrastructure.sqlalchemy.models import AreaModel, EquipmentModel, PlantModel, SystemModel
+from src.infrastructure.sqlalchemy.models import (
+    AreaModel,
+    ChangeLogModel,
+    EquipmentModel,
+    PlantModel,
+    SystemModel,
+)
 from src.infrastructure.sqlalchemy.plant_repository import SqlAlchemyPlantRepository
+from src.infrastructure.sqlalchemy.refresh_token_store import (
+    SqlAlchemyRefreshTokenStore,
+)
+from src.infrastructure.sqlalchemy.unit_of_work import SqlAlchemyUnitOfWork
+from src.interface_adapters.gateways.purge_runner import PurgeRunner
+from src.use_cases.import_inventory import ImportInventoryUseCase
+from src.use_cases.purge_plant import PurgePlantUseCase
 
 
 @pytest.fixture()
@@ -82,3 +100,685 @@ def test_equipment_and_system_crud_with_cascades(session_factory, engine):
 
     with Session(engine) as db:
         assert db.scalar(select(func.count()).select_from(PlantModel)) == 0
+
+
+def test_plant_tree_loads_hierarchy_with_fixed_statements(session_factory, engine):
+    repo = SqlAlchemyPlantRepository(session_factory)
+    plant = repo.create_plant(name="Planta Árbol")
+    for area_index in range(3):
+        area = repo.create_area(plant.id, name=f"Área {area_index}")
+        for eq_index in range(4):
+            equipment = repo.create_equipment(area.id, name=f"Equipo {eq_index}")
+            repo.create_system(equipment.id, name="Sistema")
+
+    statements: list[str] = []
+
+    def count_statement(*_args):
+        statements.append(_args[2])
+
+    event.listen(engine, "before_cursor_execute", count_statement)
+    try:
+        tree = repo.get_plant_tree(plant.id)
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+
+    assert len(statements) == 4
+    assert tree.plant.name == "Planta Árbol"
+    assert [node.area.name for node in tree.areas] == ["Área 0", "Área 1", "Área 2"]
+    assert all(len(node.equipment) == 4 for node in tree.areas)
+    assert all(
+        [system.name for system in eq.systems] == ["Sistema"]
+        for node in tree.areas
+        for eq in node.equipment
+    )
+    assert repo.get_plant_tree(9999) is None
+
+
+def test_keyset_pages_follow_cursor_without_gaps(session_factory):
+    repo = SqlAlchemyPlantRepository(session_factory)
+    plant = repo.create_plant(name="Planta Paginada")
+    other = repo.create_plant(name="Otra planta")
+    created = [repo.create_area(plant.id, name=f"Área {index}") for index in range(5)]
+    repo.create_area(other.id, name="Área ajena")
+
+    first = repo.list_areas_page(plant.id, limit=2)
+    second = repo.list_areas_page(plant.id, limit=2, after=first.next_after)
+    last = repo.list_areas_page(plant.id, limit=2, after=second.next_after)
+
+    seen = [area.id for page in (first, second, last) for area in page.items]
+    assert seen == [area.id for area in created]
+    assert first.next_after == created[1].id
+    assert last.next_after is None
+    assert repo.list_plants_page(limit=5).next_after is None
+
+
+def test_keyset_page_applies_the_id_filter_before_the_limit(session_factory):
+    repo = SqlAlchemyPlantRepository(session_factory)
+    plant = repo.create_plant(name="Planta Paginada")
+    created = [repo.create_area(plant.id, name=f"Área {index}") for index in range(5)]
+    allowed = {created[1].id, created[3].id, created[4].id}
+
+    first = repo.list_areas_page(plant.id, limit=2, ids=allowed)
+    second = repo.list_areas_page(
+        plant.id, limit=2, after=first.next_after, ids=allowed
+    )
+
+    assert [area.id for area in first.items] == [created[1].id, created[3].id]
+    assert [area.id for area in second.items] == [created[4].id]
+    assert second.next_after is None
+    assert repo.list_areas_page(plant.id, limit=2, ids=set()).items == []
+
+
+def test_bulk_lookups_issue_a_single_query(session_factory, engine):
+    repo = SqlAlchemyPlantRepository(session_factory)
+    plant = repo.create_plant(name="Planta Bulk")
+    areas = [repo.create_area(plant.id, name=f"Área {index}") for index in range(50)]
+    equipment = repo.create_equipment(areas[0].id, name="Equipo")
+    system = repo.create_system(equipment.id, name="Sistema")
+
+    statements: list[str] = []
+
+    def count_statement(*_args):
+        statements.append(_args[2])
+
+    event.listen(engine, "before_cursor_execute", count_statement)
+    try:
+        found = repo.get_areas_by_ids([area.id for area in areas] + [9999])
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+
+    assert len(statements) == 1
+    assert {area.id for area in found} == {area.id for area in areas}
+    assert [eq.id for eq in repo.get_equipment_by_ids([equipment.id])] == [equipment.id]
+    assert [sys.id for sys in repo.get_systems_by_ids([system.id, 42])] == [system.id]
+    assert repo.get_areas_by_ids([]) == []
+
+
+def test_batch_create_uses_a_single_insert_per_level(session_factory, engine):
+    repo = SqlAlchemyPlantRepository(session_factory)
+    plant = repo.create_plant(name="Planta Lote")
+    area = repo.create_area(plant.id, name="Área X")
+
+    statements: list[str] = []
+
+    def count_statement(*_args):
+        statements.append(_args[2])
+
+    event.listen(engine, "before_cursor_execute", count_statement)
+    try:
+        created = repo.create_equipment_batch(
+            area.id,
+            [{"name": f"Equipo {index}"} for index in range(20)]
+            + [{"name": "Equipo roto", "status": "mantenimiento"}],
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+
+    assert [item.name for item in created][:2] == ["Equipo 0", "Equipo 1"]
+    assert created[-1].status == "mantenimiento"
+    assert len([sql for sql in statements if sql.startswith("INSERT INTO equipment")]) == 1
+    assert len([sql for sql in statements if sql.startswith("INSERT INTO change_log")]) == 1
+
+    systems = repo.create_system_batch(created[0].id, [{"name": "S1"}, {"name": "S2"}])
+    assert [system.equipment_id for system in systems] == [created[0].id] * 2
+    changes = repo.list_changes(limit=100).items
+    assert (changes[-1].plant_id, changes[-1].area_id, changes[-1].equipment_id) == (
+        plant.id,
+        area.id,
+        created[0].id,
+    )
+    assert repo.get_plant_versions()[plant.id] == 4
+    assert repo.create_area_batch(9999, [{"name": "Sin planta"}]) is None
+
+
+def test_cascading_status_updates_each_level_with_one_statement(
+    session_factory, engine
+):
+    repo = SqlAlchemyPlantRepository(session_factory)
+    plant = repo.create_plant(name="Planta A")
+    other = repo.create_plant(name="Planta B")
+    area = repo.create_area(plant.id, name="Área X")
+    equipment = repo.create_equipment(area.id, name="Compresor")
+    repo.create_system_batch(equipment.id, [{"name": "S1"}, {"name": "S2"}])
+    untouched = repo.create_area(other.id, name="Área Y")
+    _, before = repo.get_change_bounds()
+
+    statements: list[str] = []
+
+    def count_statement(*_args):
+        statements.append(_args[2])
+
+    event.listen(engine, "before_cursor_execute", count_statement)
+    try:
+        result = repo.set_plant_status(
+            plant.id, cascade_statuses("planta", "mantenimiento")
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+
+    assert result.updated == {"planta": 1, "area": 1, "equipo": 1, "sistema": 2}
+    assert len([sql for sql in statements if sql.startswith("UPDATE systems")]) == 1
+    assert {system.status for system in repo.list_systems(equipment.id)} == {
+        "mantenimiento"
+    }
+    assert repo.get_area(untouched.id).status == "operativa"
+    assert len(repo.list_changes(limit=100, after=before).items) == 5
+
+    again = repo.set_area_status(area.id, cascade_statuses("area", "mantenimiento"))
+    assert again.updated == {"area": 0, "equipo": 0, "sistema": 0}
+    assert repo.set_equipment_status(9999, {"equipo": "operativo"}) is None
+
+
+def test_update_is_a_single_statement_without_prior_select(session_factory, engine):
+    repo = SqlAlchemyPlantRepository(session_factory)
+    plant = repo.create_plant(name="Planta A", location="Norte")
+
+    statements: list[str] = []
+
+    def count_statement(*_args):
+        statements.append(_args[2])
+
+    event.listen(engine, "before_cursor_execute", count_statement)
+    try:
+        updated = repo.update_plant(plant.id, status="mantenimiento")
+        missing = repo.update_plant(9999, status="mantenimiento")
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+
+    assert (updated.name, updated.location, updated.status) == (
+        "Planta A",
+        "Norte",
+        "mantenimiento",
+    )
+    assert missing is None
+    plant_statements = [sql for sql in statements if "plants" in sql]
+    # El id inexistente se confirma con una lectura por clave primaria.
+    assert len(plant_statements) == 3
+    assert plant_statements[0].startswith("UPDATE plants SET status=?")
+    assert plant_statements[1].startswith("UPDATE plants SET status=?")
+    assert plant_statements[2].startswith("SELECT")
+
+
+def test_update_without_changes_writes_nothing(session_factory):
+    repo = SqlAlchemyPlantRepository(session_factory)
+    plant = repo.create_plant(name="Planta A", location="Norte")
+    area = repo.create_area(plant.id, name="Área X")
+    versions = repo.get_plant_versions([plant.id])
+    changes = repo.list_changes(limit=100)
+
+    same_plant = repo.update_plant(plant.id, name="Planta A", status="operativa")
+    empty_patch = repo.update_plant(plant.id)
+    same_area = repo.update_area(area.id, name="Área X")
+
+    assert (same_plant.name, same_plant.location) == ("Planta A", "Norte")
+    assert empty_patch.name == "Planta A"
+    assert same_area.name == "Área X"
+    assert repo.get_plant_versions([plant.id]) == versions
+    assert repo.list_changes(limit=100) == changes
+
+
+def test_update_without_returning_fetches_by_primary_key(session_factory, engine):
+    repo = SqlAlchemyPlantRepository(session_factory)
+    plant = repo.create_plant(name="Planta A")
+    area = repo.create_area(plant.id, name="Área X")
+    engine.dialect.update_returning = False
+    try:
+        updated = repo.update_area(area.id, name="Área Y")
+        missing = repo.update_area(9999, name="Área Z")
+    finally:
+        engine.dialect.update_returning = True
+
+    assert (updated.name, updated.plant_id) == ("Área Y", plant.id)
+    assert missing is None
+
+
+def test_delete_relies_on_database_cascades(session_factory, engine):
+    def enable_foreign_keys(dbapi_connection, _record):
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+    event.listen(engine, "connect", enable_foreign_keys)
+    engine.dispose()
+    Base.metadata.create_all(engine)
+
+    repo = SqlAlchemyPlantRepository(session_factory)
+    plant = repo.create_plant(name="Planta A")
+    area = repo.create_area(plant.id, name="Área X")
+    equipment = repo.create_equipment_batch(
+        area.id, [{"name": f"Equipo {index}"} for index in range(10)]
+    )
+    repo.create_system_batch(equipment[0].id, [{"name": "S1"}, {"name": "S2"}])
+
+    statements: list[str] = []
+
+    def count_statement(*_args):
+        statements.append(_args[2])
+
+    event.listen(engine, "before_cursor_execute", count_statement)
+    try:
+        assert repo.delete_plant(plant.id) is True
+        assert repo.delete_plant(plant.id) is False
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+
+    assert not [sql for sql in statements if sql.startswith("SELECT")]
+    with Session(engine) as db:
+        for model in (AreaModel, EquipmentModel, SystemModel):
+            assert db.scalar(select(func.count()).select_from(model)) == 0
+    assert repo.list_changes(limit=100).items[-1].action == "eliminado"
+
+
+def test_hidden_plant_is_purged_bottom_up_in_batches(session_factory):
+    repo = SqlAlchemyPlantRepository(session_factory)
+    plant = repo.create_plant(name="Planta A")
+    kept = repo.create_plant(name="Planta B")
+    area = repo.create_area(plant.id, name="Área X")
+    equipment = repo.create_equipment_batch(
+        area.id, [{"name": f"Equipo {index}"} for index in range(3)]
+    )
+    system = repo.create_system_batch(
+        equipment[0].id, [{"name": f"S{index}"} for index in range(5)]
+    )[0]
+
+    job = repo.hide_plant(plant.id)
+
+    assert job.status == "pendiente"
+    assert repo.hide_plant(plant.id) is None
+    assert [listed.id for listed in repo.list_plants()] == [kept.id]
+    assert repo.get_plant(plant.id) is None
+    assert repo.get_plant_tree(plant.id) is None
+    assert repo.get_area(area.id) is None
+    assert repo.get_equipment(equipment[0].id) is None
+    assert repo.get_system(system.id) is None
+    assert repo.list_systems(equipment[0].id) == []
+    assert repo.create_area(plant.id, name="Área Y") is None
+    assert [row.id for row in repo.iter_inventory()] == [kept.id]
+    assert repo.list_changes(limit=100).items[-1].action == "eliminado"
+
+    progress = []
+    while not job.finished:
+        job = repo.purge_plant_batch(job.id, batch_size=2)
+        progress.append(dict(job.deleted))
+
+    assert progress[0] == {"sistema": 2, "equipo": 0, "area": 0, "planta": 0}
+    assert progress[3] == {"sistema": 5, "equipo": 2, "area": 0, "planta": 0}
+    assert job.deleted == {"sistema": 5, "equipo": 3, "area": 1, "planta": 1}
+    assert job.finished_at is not None
+    assert repo.get_purge_job(job.id).status == "completado"
+    assert repo.delete_plant(plant.id) is False
+    assert repo.get_plant(kept.id) is not None
+
+
+def test_writes_inside_a_hidden_plant_are_rejected(session_factory):
+    repo = SqlAlchemyPlantRepository(session_factory)
+    plant = repo.create_plant(name="Planta A")
+    area = repo.create_area(plant.id, name="Área X")
+    equipment = repo.create_equipment(area.id, name="Compresor")
+    system = repo.create_system(equipment.id, name="Lubricación")
+    job = repo.hide_plant(plant.id)
+    changes = len(repo.list_changes(limit=100).items)
+
+    assert repo.update_plant(plant.id, name="Nueva") is None
+    assert repo.update_area(area.id, name="Área Y") is None
+    assert repo.update_equipment(equipment.id, status="mantenimiento") is None
+    assert repo.update_system(system.id, name="Otra") is None
+    assert repo.delete_system(system.id) is False
+    assert repo.delete_equipment(equipment.id) is False
+    assert repo.delete_area(area.id) is False
+    assert len(repo.list_changes(limit=100).items) == changes
+
+    while not job.finished:
+        job = repo.purge_plant_batch(job.id, batch_size=10)
+    assert job.deleted == {"sistema": 1, "equipo": 1, "area": 1, "planta": 1}
+
+
+def test_status_cascades_inside_a_hidden_plant_are_rejected(session_factory):
+    repo = SqlAlchemyPlantRepository(session_factory)
+    plant = repo.create_plant(name="Planta A")
+    area = repo.create_area(plant.id, name="Área X")
+    equipment = repo.create_equipment(area.id, name="Compresor")
+    repo.create_system(equipment.id, name="Lubricación")
+    repo.hide_plant(plant.id)
+    changes = len(repo.list_changes(limit=100).items)
+    versions = repo.get_plant_versions([plant.id])
+
+    plant_statuses = cascade_statuses("planta", "mantenimiento")
+    area_statuses = cascade_statuses("area", "mantenimiento")
+    equipment_statuses = cascade_statuses("equipo", "mantenimiento")
+
+    assert repo.set_plant_status(plant.id, plant_statuses) is None
+    assert repo.set_area_status(area.id, area_statuses) is None
+    assert repo.set_equipment_status(equipment.id, equipment_statuses) is None
+    assert len(repo.list_changes(limit=100).items) == changes
+    assert repo.get_plant_versions([plant.id]) == versions
+
+
+class _FailingPurgeRepository:
+    def __init__(self, inner: SqlAlchemyPlantRepository) -> None:
+        self.fail_purge_job = inner.fail_purge_job
+
+    def purge_plant_batch(self, *_args, **_kwargs):
+        raise ConnectionError("conexión perdida")
+
+
+def test_purge_use_case_commits_each_batch_and_records_failures(session_factory):
+    repo = SqlAlchemyPlantRepository(session_factory)
+    plant = repo.create_plant(name="Planta A")
+    area = repo.create_area(plant.id, name="Área X")
+    repo.create_equipment_batch(area.id, [{"name": f"E{index}"} for index in range(4)])
+    pauses = []
+    use_case = PurgePlantUseCase(
+        repo,
+        lambda: SqlAlchemyUnitOfWork(session_factory),
+        batch_size=3,
+        pause_seconds=0.5,
+        sleep=pauses.append,
+    )
+
+    job = use_case.run(use_case.start(plant.id).id)
+
+    assert job.deleted == {"sistema": 0, "equipo": 4, "area": 1, "planta": 1}
+    assert pauses == [0.5, 0.5, 0.5]
+    assert use_case.start(plant.id) is None
+
+    other = repo.create_plant(name="Planta B")
+    job = use_case.start(other.id)
+    broken = PurgePlantUseCase(
+        _FailingPurgeRepository(repo), lambda: SqlAlchemyUnitOfWork(session_factory)
+    )
+    with pytest.raises(ConnectionError):
+        broken.run(job.id)
+    failed = repo.get_purge_job(job.id)
+    assert (failed.status, failed.error) == ("fallido", "ConnectionError")
+    assert use_case.run(job.id).status == "completado"
+
+
+class _FailingSecondBatchRepository:
+    """Borra el primer lote y pierde la conexión en el segundo."""
+
+    def __init__(self, inner: SqlAlchemyPlantRepository) -> None:
+        self._inner = inner
+        self.hide_plant = inner.hide_plant
+        self.fail_purge_job = inner.fail_purge_job
+        self.batches = 0
+
+    def purge_plant_batch(self, *args, **kwargs):
+        self.batches += 1
+        if self.batches == 2:
+            raise ConnectionError("conexión perdida")
+        return self._inner.purge_plant_batch(*args, **kwargs)
+
+
+def test_purge_runner_resumes_jobs_left_by_a_failed_batch(tmp_path):
+    # El runner usa su propio hilo: hace falta una base compartida en archivo.
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'purge.db'}", future=True)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(engine, expire_on_commit=False, future=True)
+    repo = SqlAlchemyPlantRepository(session_factory)
+    plant = repo.create_plant(name="Planta A")
+    area = repo.create_area(plant.id, name="Área X")
+    repo.create_equipment_batch(area.id, [{"name": f"E{index}"} for index in range(4)])
+    uow_factory = lambda: SqlAlchemyUnitOfWork(session_factory)  # noqa: E731
+    broken = PurgePlantUseCase(
+        _FailingSecondBatchRepository(repo), uow_factory, batch_size=2
+    )
+    job = broken.start(plant.id)
+    with pytest.raises(ConnectionError):
+        broken.run(job.id)
+    assert [left.id for left in repo.list_unfinished_purge_jobs()] == [job.id]
+
+    runner = PurgeRunner(PurgePlantUseCase(repo, uow_factory, batch_size=2))
+    runner.resume()
+
+    assert runner.join(timeout=5)
+    resumed = repo.get_purge_job(job.id)
+    assert resumed.status == "completado"
+    assert resumed.deleted == {"sistema": 0, "equipo": 4, "area": 1, "planta": 1}
+    assert repo.list_unfinished_purge_jobs() == []
+    assert repo.create_plant(name="Planta A").name == "Planta A"
+    engine.dispose()
+
+
+def test_writes_append_change_log_with_ancestors(session_factory):
+    repo = SqlAlchemyPlantRepository(session_factory)
+    plant = repo.create_plant(name="Planta A")
+    area = repo.create_area(plant.id, name="Área X")
+    equipment = repo.create_equipment(area.id, name="Compresor")
+    system = repo.create_system(equipment.id, name="Sistema A")
+    repo.update_system(system.id, status="mantenimiento")
+    repo.delete_equipment(equipment.id)
+
+    changes = repo.list_changes(limit=100).items
+
+    assert [(c.entity_type, c.action) for c in changes] == [
+        ("planta", "creado"),
+        ("area", "creado"),
+        ("equipo", "creado"),
+        ("sistema", "creado"),
+        ("sistema", "actualizado"),
+        ("equipo", "eliminado"),
+    ]
+    updated_system = changes[4]
+    assert (updated_system.plant_id, updated_system.area_id) == (plant.id, area.id)
+    assert updated_system.equipment_id == equipment.id
+    assert updated_system.snapshot.status == "mantenimiento"
+    assert changes[-1].snapshot is None
+
+
+def test_change_log_is_rolled_back_with_the_write(session_factory):
+    repo = SqlAlchemyPlantRepository(session_factory)
+    plant = repo.create_plant(name="Planta A")
+
+    with session_factory() as db:
+        repo.create_area(plant.id, name="Área X", session=db)
+        db.rollback()
+
+    assert [c.entity_type for c in repo.list_changes(limit=10).items] == ["planta"]
+
+
+def test_compaction_keeps_the_newest_entry(session_factory):
+    now = datetime(2026, 1, 10)
+    repo = SqlAlchemyPlantRepository(session_factory, clock=lambda: now)
+    plant = repo.create_plant(name="Planta A")
+    repo.update_plant(plant.id, name="Planta B")
+
+    removed = repo.compact_changes(before=now + timedelta(days=1))
+
+    oldest, newest = repo.get_change_bounds()
+    assert removed == 1
+    assert oldest == newest == 2
+
+
+def test_change_feed_waits_for_ids_of_transactions_still_open(session_factory):
+    now = datetime(2024, 5, 1, 12, 0, 0)
+    clock = [now]
+    repo = SqlAlchemyPlantRepository(session_factory, clock=lambda: clock[0])
+    plant = repo.create_plant(name="Planta A")
+    _, cursor = repo.get_change_bounds()
+    late = {
+        "entity_type": "planta",
+        "entity_id": plant.id,
+        "action": "actualizado",
+        "plant_id": plant.id,
+        "recorded_at": now,
+    }
+    with session_factory.begin() as db:
+        # El id siguiente quedó tomado por una transacción que aún no confirmó.
+        db.add(ChangeLogModel(id=cursor + 2, **late))
+
+    assert repo.list_changes(limit=10, after=cursor).items == []
+    assert repo.get_change_bounds()[1] == cursor
+
+    with session_factory.begin() as db:
+        db.add(ChangeLogModel(id=cursor + 1, **late))
+    assert [c.id for c in repo.list_changes(limit=10, after=cursor).items] == [
+        cursor + 1,
+        cursor + 2,
+    ]
+
+    with session_factory.begin() as db:
+        db.add(ChangeLogModel(id=cursor + 4, **late))
+    assert repo.list_changes(limit=10, after=cursor + 2).items == []
+    clock[0] = now + timedelta(seconds=6)
+    # Pasada la ventana, el hueco es un rollback y no frena el feed.
+    assert [c.id for c in repo.list_changes(limit=10, after=cursor + 2).items] == [
+        cursor + 4
+    ]
+    assert repo.get_change_bounds()[1] == cursor + 4
+
+
+def test_iter_inventory_streams_flat_rows_with_ancestors(session_factory):
+    repo = SqlAlchemyPlantRepository(session_factory)
+    plant = repo.create_plant(name="Planta A", location="Norte")
+    area = repo.create_area(plant.id, name="Área X")
+    equipment = repo.create_equipment(area.id, name="Compresor")
+    system = repo.create_system(equipment.id, name="Sistema A")
+
+    rows = list(repo.iter_inventory(batch_size=1))
+
+    assert [(row.entity_type, row.id) for row in rows] == [
+        ("planta", plant.id),
+        ("area", area.id),
+        ("equipo", equipment.id),
+        ("sistema", system.id),
+    ]
+    assert rows[0].location == "Norte"
+    assert (rows[-1].plant_id, rows[-1].area_id, rows[-1].equipment_id) == (
+        plant.id,
+        area.id,
+        equipment.id,
+    )
+
+
+def test_iter_inventory_filters_the_scope_in_each_query(session_factory, engine):
+    repo = SqlAlchemyPlantRepository(session_factory)
+    plant = repo.create_plant(name="Planta A")
+    area = repo.create_area(plant.id, name="Área X")
+    other_area = repo.create_area(plant.id, name="Área Y")
+    equipment = repo.create_equipment(area.id, name="Compresor")
+    repo.create_equipment(area.id, name="Bomba")
+    repo.create_equipment(other_area.id, name="Caldera")
+    system = repo.create_system(equipment.id, name="Sistema A")
+    scope = InventoryScope(
+        area_ids=frozenset({area.id}), equipment_ids=frozenset({equipment.id})
+    )
+
+    statements: list[str] = []
+
+    def record_statement(*args):
+        statements.append(args[2])
+
+    event.listen(engine, "before_cursor_execute", record_statement)
+    try:
+        rows = list(repo.iter_inventory(scope=scope))
+    finally:
+        event.remove(engine, "before_cursor_execute", record_statement)
+
+    assert [(row.entity_type, row.id) for row in rows] == [
+        ("planta", plant.id),
+        ("area", area.id),
+        ("equipo", equipment.id),
+        ("sistema", system.id),
+    ]
+    assert sum(" IN (" in sql for sql in statements) == 3
+    assert list(repo.iter_inventory(scope=InventoryScope(area_ids=frozenset()))) == [
+        rows[0]
+    ]
+
+
+def test_upsert_rows_is_idempotent_and_reports_missing_parents(session_factory):
+    repo = SqlAlchemyPlantRepository(session_factory)
+    rows = [
+        ImportRow(1, "planta", "Planta A", "operativa", location="Norte"),
+        ImportRow(2, "area", "Área X", "operativa", plant_name="Planta A"),
+        ImportRow(
+            3, "equipo", "Compresor", "operativo", plant_name="Planta A", area_name="Área X"
+        ),
+        ImportRow(
+            4,
+            "sistema",
+            "Sistema A",
+            "operativo",
+            plant_name="Planta A",
+            area_name="Área X",
+            equipment_name="Compresor",
+        ),
+        ImportRow(5, "area", "Área Y", "operativa", plant_name="Planta Z"),
+    ]
+
+    errors = repo.upsert_rows(rows)
+    assert errors == [ImportRowError(5, "Planta no encontrada: Planta Z")]
+    _, newest = repo.get_change_bounds()
+
+    assert repo.upsert_rows(rows) == errors
+    assert repo.get_change_bounds()[1] == newest
+
+    repo.upsert_rows([ImportRow(1, "planta", "Planta A", "inactiva")])
+    tree = repo.get_plant_tree(1)
+    assert (tree.plant.status, tree.plant.location) == ("inactiva", "Norte")
+    assert tree.areas[0].equipment[0].systems[0].name == "Sistema A"
+    assert [change.action for change in repo.list_changes(limit=10).items] == [
+        "creado",
+        "creado",
+        "creado",
+        "creado",
+        "actualizado",
+    ]
+
+
+def test_upsert_rows_rejects_plants_being_purged(session_factory):
+    repo = SqlAlchemyPlantRepository(session_factory)
+    plant = repo.create_plant(name="Planta P")
+    repo.create_area(plant.id, name="Área X")
+    job = repo.hide_plant(plant.id)
+    _, newest = repo.get_change_bounds()
+
+    errors = repo.upsert_rows(
+        [
+            ImportRow(1, "planta", "Planta P", "inactiva"),
+            ImportRow(2, "area", "Área Nueva", "operativa", plant_name="Planta P"),
+        ]
+    )
+
+    assert errors == [
+        ImportRowError(1, "Planta en eliminación: Planta P"),
+        ImportRowError(2, "Planta en eliminación: Planta P"),
+    ]
+    assert repo.get_change_bounds()[1] == newest
+    while not job.finished:
+        job = repo.purge_plant_batch(job.id, batch_size=10)
+    assert job.deleted == {"sistema": 0, "equipo": 0, "area": 1, "planta": 1}
+
+
+def test_import_use_case_commits_each_chunk(session_factory):
+    repo = SqlAlchemyPlantRepository(session_factory)
+    use_case = ImportInventoryUseCase(
+        repo, lambda: SqlAlchemyUnitOfWork(session_factory), chunk_size=2
+    )
+
+    report = use_case.execute(
+        [
+            ImportRow(1, "planta", "Planta A"),
+            ImportRow(2, "area", "Área X", plant_name="Planta A"),
+            ImportRow(3, "equipo", "Compresor", plant_name="Planta A", area_name="Área X"),
+            ImportRow(4, "equipo", "Bomba", "roto", plant_name="Planta A", area_name="Área X"),
+            ImportRow(5, "sistema", "Sistema A", plant_name="Planta A"),
+        ]
+    )
+
+    assert report.processed == 5
+    assert report.saved == {"planta": 1, "area": 1, "equipo": 1, "sistema": 0}
+    assert [error.line for error in report.errors] == [4, 5]
+    assert repo.list_equipment(1)[0].status == "operativo"
+
+
+def test_refresh_token_store_rotates_once_and_revokes_on_reuse(session_factory):
+    store = SqlAlchemyRefreshTokenStore(session_factory)
+    now = utc_now()
+    store.start("familia", "admin", now + timedelta(days=1))
+    store.start("vencida", "admin", now - timedelta(days=1))
+
+    assert store.rotate("familia", 0, now=now) == "admin"
+    assert store.rotate("familia", 1, now=now) == "admin"
+    assert store.rotate("familia", 0, now=now) is None
+    assert store.rotate("familia", 2, now=now) is None
+    assert store.rotate("vencida", 0, now=now) is None
@@ -4,6 +4,7 @@ from sqlalchemy import create_engine, func, select
 from sqlalchemy.orm import Session, sessionmaker
 
 from src.infrastructure.sqlalchemy.models import Base, PlantModel
+from src.infrastructure.sqlalchemy.session import run_after_commit
 from src.infrastructure.sqlalchemy.unit_of_work import SqlAlchemyUnitOfWork
 
 
@@ -40,6 +41,34 @@ class SqlAlchemyUnitOfWorkTestCase(unittest.TestCase):
             count = check_session.scalar(select(func.count()).select_from(PlantModel))
             self.assertEqual(count, 0)
 
+    def test_ambient_session_is_committed_but_not_closed(self) -> None:
+        ambient = self.session_factory()
+        uow = SqlAlchemyUnitOfWork(self.session_factory, current_session=lambda: ambient)
+
+        with uow as active:
+            self.assertIs(active.session, ambient)
+            active.session.add(PlantModel(name="Compartida", location="", status="operativa"))
+
+        plant = ambient.scalars(select(PlantModel)).one()
+        self.assertEqual(plant.name, "Compartida")
+        ambient.close()
+
+    def test_after_commit_callbacks_run_only_when_the_transaction_commits(self) -> None:
+        ran: list[str] = []
+
+        with self.assertRaises(RuntimeError):
+            with SqlAlchemyUnitOfWork(self.session_factory) as active:
+                active.session.add(PlantModel(name="Fallida", location="", status="operativa"))
+                run_after_commit(active.session, lambda: ran.append("fallida"))
+                raise RuntimeError("Force rollback")
+
+        with SqlAlchemyUnitOfWork(self.session_factory) as active:
+            active.session.add(PlantModel(name="Confirmada", location="", status="operativa"))
+            run_after_commit(active.session, lambda: ran.append("confirmada"))
+            self.assertEqual(ran, [])
+
+        self.assertEqual(ran, ["confirmada"])
+
 
 if __name__ == "__main__":
     unittest.main()
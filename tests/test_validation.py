@@ -9,7 +9,7 @@ from flask import Flask
 from flask.testing import FlaskClient
 from flask_jwt_extended import JWTManager
 
-from src.infrastructure.flask.auth import AuthService, ScopeAuthorizer
+from src.infrastructure.http.auth import AuthService, ScopeAuthorizer
 from src.infrastructure.flask.routes import build_blueprint
 from src.interface_adapters.gateways.in_memory_plant_repository import (
     InMemoryPlantRepository,
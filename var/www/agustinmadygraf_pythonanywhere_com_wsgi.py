@@ -13,4 +13,7 @@ if PROJECT_ROOT not in sys.path:
 # Carga el archivo .env antes de importar la app
 load_dotenv(os.path.join(PROJECT_ROOT, '.env'))
 
-from src.infrastructure.flask.app import app as application
+from src.infrastructure.flask.app import create_app
+
+# La app se construye aquí: importar el módulo de la app no tiene efectos.
+application = create_app()